@@ -89,10 +89,22 @@ def asmp_file():
 
 def dyn_lapse_params():
     """Dynamic lapse parameters"""
-    return pd.read_excel(
-        asmp_file(),
-        sheet_name="DynLapse",
-        index_col=0)
+    return base_data.read_excel(asmp_file(), "DynLapse")
+
+
+def lapse_array():
+    """Lapse tables as a Numpy array
+
+    Returns :func:`lapse_tables` as a 2-D Numpy array
+    to look up lapse rates by integer positions.
+    The rows are the lapse IDs in the order of the columns of
+    :func:`lapse_tables`, and the columns are the durations from 0.
+    A column of NaN is appended at the right end
+    for the IDs and durations not found in the table.
+    """
+    table = lapse_tables()
+    table = table.reindex(range(table.index.max() + 1)).T.values
+    return np.hstack([table, np.full((len(table), 1), np.nan)])
 
 
 def lapse_len():
@@ -102,10 +114,22 @@ def lapse_len():
 
 def lapse_tables():
     """Lapse rate assumptions"""
-    return pd.read_excel(
-        asmp_file(),
-        sheet_name="Lapse",
-        index_col=0)
+    return base_data.read_excel(asmp_file(), "Lapse")
+
+
+def mort_scalar_array():
+    """Mortality scalar tables as a Numpy array
+
+    Returns :func:`mort_scalar_tables` as a 2-D Numpy array
+    to look up mortality scalars by integer positions.
+    The rows are the mortality scalar IDs in the order of the columns of
+    :func:`mort_scalar_tables`, and the columns are the durations from 0.
+    A column of NaN is appended at the right end
+    for the IDs and durations not found in the table.
+    """
+    table = mort_scalar_tables()
+    table = table.reindex(range(table.index.max() + 1)).T.values
+    return np.hstack([table, np.full((len(table), 1), np.nan)])
 
 
 def mort_scalar_len():
@@ -115,10 +139,7 @@ def mort_scalar_len():
 
 def mort_scalar_tables():
     """Mortality scalar tables"""
-    df = pd.read_excel(
-        asmp_file(),
-        sheet_name="Mortality",
-        index_col=0)
+    df = base_data.read_excel(asmp_file(), "Mortality")
     return df
 
 
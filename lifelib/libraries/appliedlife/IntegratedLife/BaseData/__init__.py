@@ -96,38 +96,49 @@ _spaces = []
 
 def const_params():
     """Constant parameters"""
-    return pd.read_excel(_model.path.parent / parameter_file,
-                         sheet_name="ConstParams",
-                         index_col="parameter")
+    return read_excel(_model.path.parent / parameter_file, "ConstParams", "parameter")
 
 
 def param_list():
     """List of fixed parameters"""
-    return pd.read_excel(_model.path.parent / parameter_file,
-                         sheet_name="ParamList",
-                         index_col="parameter")
+    return read_excel(_model.path.parent / parameter_file, "ParamList", "parameter")
 
 
 def product_params(space_name: str):
     """Product parameters"""
-    return pd.read_excel(_model.path.parent / parameter_file,
-                         sheet_name=space_name,
-                         index_col=[0, 1])
+    return read_excel(_model.path.parent / parameter_file, space_name, (0, 1))
+
+
+def read_excel(file, sheet_name, index_col=0, dtype=None):
+    """Reads a sheet of an Excel file
+
+    Reads the sheet ``sheet_name`` of ``file`` by ``read_excel``
+    of the ``input_cache`` Reference of the model if it is set,
+    or by :func:`pandas.read_excel` otherwise.
+    All the Excel files of the model are read through this Cells.
+
+    ``index_col`` is passed as a list when it is a tuple,
+    and ``dtype`` is given as a tuple of pairs of
+    column names and types, as the arguments of Cells must be hashable.
+    The DataFrame returned is cached and shared by the callers,
+    so the callers should not change it in place.
+    """
+    if isinstance(index_col, tuple):
+        index_col = list(index_col)
+    return (input_cache or pd).read_excel(
+        file, sheet_name=sheet_name, index_col=index_col,
+        dtype=dict(dtype) if dtype else None)
 
 
 def run_params():
     """Run parameters"""
-    return pd.read_excel(_model.path.parent / parameter_file,
-                         sheet_name="RunParams",
-                         index_col="run_id",
-                         dtype={"date_id": object, "asmp_id": object})
+    return read_excel(_model.path.parent / parameter_file, "RunParams", "run_id",
+                      (("date_id", object), ("asmp_id", object)))
 
 
 def space_params():
     """Space parameters"""
-    return pd.read_excel(_model.path.parent / parameter_file,
-                         sheet_name="SpaceParams",
-                         index_col="space")
+    return read_excel(_model.path.parent / parameter_file, "SpaceParams", "space")
 
 
 def stacked_surr_charge_tables():
@@ -135,6 +146,21 @@ def stacked_surr_charge_tables():
     return surr_charge_tables().stack().swaplevel(0, 1).sort_index()
 
 
+def surr_charge_array():
+    """Surrender charge tables as a Numpy array
+
+    Returns :func:`surr_charge_tables` as a 2-D Numpy array
+    to look up surrender charge rates by integer positions.
+    The rows are the surrender charge IDs in the order of the columns of
+    :func:`surr_charge_tables`, and the columns are the durations from 0.
+    A column of zeros is appended at the right end
+    for the IDs and durations not found in the table.
+    """
+    table = surr_charge_tables()
+    table = table.reindex(range(table.index.max() + 1), fill_value=0).T.values
+    return np.hstack([table, np.zeros((len(table), 1))])
+
+
 def surr_charge_len():
     """Duration length of the surrender charge table"""
     return len(surr_charge_tables())
@@ -144,7 +170,7 @@ def surr_charge_tables():
     """Surrender charge tables"""
     dir_ = _model.path.parent / const_params().at["table_dir", "value"]
     file = const_params().at["spec_tables", "value"]
-    return pd.read_excel(dir_ / file, sheet_name="SurrCharge", index_col=0)
+    return read_excel(dir_ / file, "SurrCharge")
 
 
 # ---------------------------------------------------------------------------
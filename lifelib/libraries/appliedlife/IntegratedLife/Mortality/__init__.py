@@ -158,20 +158,13 @@ def select_duration_len():
 
 def select_table(table_id: str):
     """Reads a select mortality table with the given table ID"""
-    df = pd.read_excel(
-        mort_file(),
-        sheet_name=table_id,
-        index_col=0)
-    df.columns = range(len(df.columns))
-    return df
+    df = base_data.read_excel(mort_file(), table_id)
+    return df.set_axis(range(len(df.columns)), axis=1)
 
 
 def table_defs():
     """Table definitions"""
-    df = pd.read_excel(
-        mort_file(), 
-        sheet_name="TableDefs",
-        index_col=0)
+    df = base_data.read_excel(mort_file(), "TableDefs")
 
     return df.loc[df["is_used"] == True]
 
@@ -183,12 +176,8 @@ def table_last_age():
 
 def ultimate_tables():
     """Reads the ultimate mortality tables"""
-    df = pd.read_excel(
-        mort_file(),
-        sheet_name="Ultimate",
-        index_col=0)
-    df.index.name = "att_age"
-    return df
+    df = base_data.read_excel(mort_file(), "Ultimate")
+    return df.rename_axis("att_age")
 
 
 def unified_table():
@@ -199,6 +188,26 @@ def unified_table():
         )
 
 
+def unified_array():
+    """Unified mortality table as a Numpy array
+
+    Returns :func:`unified_table` as a 3-D Numpy array
+    to look up mortality rates by integer positions.
+    The first axis is the table IDs in the order of :func:`table_defs`,
+    the second axis is the attained ages from 0,
+    and the third axis is the durations from 0.
+    The rates not found in :func:`unified_table` are NaN.
+    A row of NaN is appended after the oldest age of each table
+    for the ages and durations not found in the table.
+    """
+    table = unified_table()
+    ages = range(table.index.get_level_values("att_age").max() + 2)
+    durs = range(table.index.get_level_values("duration").max() + 1)
+
+    index = pd.MultiIndex.from_product([table_defs().index, ages, durs])
+    return table.reindex(index).values.reshape(-1, len(ages), len(durs))
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -7,6 +7,21 @@ defined in the :mod:`~appliedlife.IntegratedLife.Run` space.
 This space defines main projection logic that is
 common for all products.
 
+The model points are projected under all the scenarios
+in :func:`scen_index` at once.
+The policy attributes, such as :func:`age_at_entry` and
+:func:`sum_assured`, and the assumptions that do not depend
+on the scenarios, such as :func:`mort_rate`, are 1-D arrays
+with one element per model point in :func:`model_point`.
+:func:`inv_return_mth` returns a 2-D array
+whose rows are the scenarios and whose columns are the model points,
+and the Cells depending on it, such as :func:`av_pp_at`
+and the present values such as :func:`pv_net_cf`,
+are calculated by broadcasting the 1-D arrays against it,
+so the policy attributes are not repeated for each scenario.
+The result Cells, such as :func:`result_pv`, broadcast the arrays
+to :func:`proj_shape` and lay them out in rows
+by model point and scenario, as indexed by :func:`model_point_index`.
 
 .. seealso
 
@@ -127,7 +142,8 @@ def av_change(t):
         * :func:`net_cf`
 
     """
-    return av_at(t+1, 'BEF_MAT') - av_at(t, 'BEF_MAT')
+    return (av_at(t+1, 'BEF_MAT') - av_at(t, 'BEF_MAT')).astype(
+        value_dtype(), copy=False)
 
 
 def av_pp_at(t, timing):
@@ -228,8 +244,20 @@ def base_lapse_rate(t):
 
         :func:`duration`
 
+    The rates are picked up from
+    :func:`~appliedlife.IntegratedLife.Assumptions.lapse_array`
+    by integer positions with ``np.take``, computed from
+    :func:`lapse_table_pos` and the durations capped
+    as in :func:`lapse_rate_key`.
+
     """
-    return asmp_data(asmp_id()).stacked_lapse_tables().reindex(lapse_rate_key(t)).values
+    table = asmp_data(asmp_id()).lapse_array()
+    dur_idx = np.minimum(duration(t), asmp_data(asmp_id()).lapse_len())
+
+    is_valid = (lapse_table_pos() >= 0) & (dur_idx >= 0) & (dur_idx < table.shape[1] - 1)
+    pos = np.where(is_valid, lapse_table_pos() * table.shape[1] + dur_idx, table.size - 1)
+
+    return np.take(table, pos)
 
 
 def base_mort_rate(t):
@@ -245,10 +273,25 @@ def base_mort_rate(t):
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
+    The rates are picked up from
+    :func:`~appliedlife.IntegratedLife.Mortality.unified_array`
+    by integer positions with ``np.take``, computed from
+    :func:`mort_table_pos`, the attained ages and the durations capped
+    as in :func:`mort_rate_key`.
+
     """
-    return mort_data.unified_table().reindex(
-        mort_rate_key(t)
-        ).values
+    table = mort_data.unified_array()
+    n_table, n_age, n_dur = table.shape
+
+    age_idx = age(t)
+    dur_idx = np.minimum(
+        duration(t), mort_data.select_duration_len().values[mort_table_pos()])
+
+    is_valid = ((mort_table_pos() >= 0) & (age_idx >= 0) & (age_idx < n_age - 1)
+                & (dur_idx >= 0) & (dur_idx < n_dur))
+    pos = (mort_table_pos() * n_age + age_idx) * n_dur + dur_idx
+
+    return np.take(table, np.where(is_valid, pos, table.size - 1))
 
 
 def check_av_roll_fwd():
@@ -288,7 +331,8 @@ def check_av_roll_fwd():
               - claims_from_av(t, "LAPSE")
               - claims_from_av(t, "MATURITY"))
 
-        cols.append(av_at(t+1, "BEF_MAT") - av)
+        diff = av_at(t+1, "BEF_MAT") - av
+        cols.append(np.broadcast_to(diff, proj_shape()).T.ravel())
 
     return np.column_stack(cols)
 
@@ -309,7 +353,8 @@ def check_margin():
     """
     cols = []
     for t in range(max_proj_len()):
-        cols.append(net_cf(t) - margin_expense(t) - margin_guarantee(t))
+        diff = net_cf(t) - margin_expense(t) - margin_guarantee(t)
+        cols.append(np.broadcast_to(diff, proj_shape()).T.ravel())
 
     return np.column_stack(cols)
 
@@ -327,7 +372,8 @@ def check_pv_net_cf():
         * :func:`pv_net_cf`
 
     """
-    return pv_net_cf() - sum(net_cf(t) * disc_factors(t) for t in range(max_proj_len()))
+    diff = pv_net_cf() - sum(net_cf(t) * disc_factors(t) for t in range(max_proj_len()))
+    return np.broadcast_to(diff, proj_shape()).T.ravel()
 
 
 def claim_net_pp(t, kind):
@@ -419,13 +465,15 @@ def claims(t, kind=None):
     """
 
     if kind == "DEATH":
-        return claim_pp(t, "DEATH") * pols_death(t)
+        return (claim_pp(t, "DEATH") * pols_death(t)).astype(value_dtype(), copy=False)
 
     elif kind == "LAPSE":
-        return claims_from_av(t, "LAPSE") - surr_charge(t)
+        return (claims_from_av(t, "LAPSE") - surr_charge(t)).astype(
+            value_dtype(), copy=False)
 
     elif kind == "MATURITY":
-        return claim_pp(t, "MATURITY") * pols_maturity(t)
+        return (claim_pp(t, "MATURITY") * pols_maturity(t)).astype(
+            value_dtype(), copy=False)
 
     elif kind is None:
         return sum(claims(t, k) for k in ["DEATH", "LAPSE", "MATURITY"])
@@ -474,13 +522,16 @@ def claims_from_av(t, kind):
     """
 
     if kind == "DEATH":
-        return av_pp_at(t, "MID_MTH") * pols_death(t)
+        return (av_pp_at(t, "MID_MTH") * pols_death(t)).astype(
+            value_dtype(), copy=False)
 
     elif kind == "LAPSE":
-        return av_pp_at(t, "MID_MTH") * pols_lapse(t)
+        return (av_pp_at(t, "MID_MTH") * pols_lapse(t)).astype(
+            value_dtype(), copy=False)
 
     elif kind == "MATURITY":
-        return av_pp_at(t, "BEF_PREM") * pols_maturity(t)
+        return (av_pp_at(t, "BEF_PREM") * pols_maturity(t)).astype(
+            value_dtype(), copy=False)
 
     else:
         raise ValueError("invalid kind")
@@ -498,7 +549,7 @@ def claims_over_av(t, kind):
         * :func:`coi`
 
     """
-    return claims(t, kind) - claims_from_av(t, kind)
+    return (claims(t, kind) - claims_from_av(t, kind)).astype(value_dtype(), copy=False)
 
 
 def coi(t):
@@ -513,7 +564,7 @@ def coi(t):
         * :func:`coi_pp`
 
     """
-    return coi_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (coi_pp(t) * pols_if_at(t, "BEF_DECR")).astype(value_dtype(), copy=False)
 
 
 def coi_pp(t):
@@ -564,7 +615,7 @@ def commissions(t):
         * :func:`duration`
 
     """
-    return commission_rate() * premiums(t)
+    return (commission_rate() * premiums(t)).astype(value_dtype(), copy=False)
 
 
 def csv_pp(t):
@@ -728,8 +779,9 @@ def expenses(t):
         * :func:`pols_if_at`
     """
 
-    return expense_acq() * pols_new_biz(t) \
-        + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t)
+    result = (expense_acq() * pols_new_biz(t)
+        + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t))
+    return result.astype(value_dtype(), copy=False)
 
 
 def fixed_params():
@@ -814,8 +866,9 @@ def inv_income(t):
         * :func:`pols_lapse`
 
     """
-    return (inv_income_pp(t) * pols_if_at(t+1, "BEF_MAT")
+    result = (inv_income_pp(t) * pols_if_at(t+1, "BEF_MAT")
             + 0.5 * inv_income_pp(t) * (pols_death(t) + pols_lapse(t)))
+    return result.astype(value_dtype(), copy=False)
 
 
 def inv_income_pp(t):
@@ -837,26 +890,42 @@ def inv_income_pp(t):
 def inv_return_mth(t):
     """Rate of investment return
 
-    Rate of monthly investment return for :attr:`scen_id` and ``t``
-    read from :func:`inv_return_table`
+    Rates of monthly investment return at ``t`` as a 2-D array
+    whose rows are the scenarios in :func:`scen_index` and
+    whose columns are the model points.
+    Each model point earns the return on the index
+    in its ``fund_index`` column.
+
+    If a scenario store is given to
+    :attr:`~appliedlife.IntegratedLife.Scenarios.scen_file`,
+    the log returns at ``t`` are read from the store.
+    The scenarios can be limited to a subset by assigning it
+    to :func:`scen_index` as its input value.
 
     .. seealso::
 
-        * :func:`inv_return_table`
-        * :attr:`scen_id`
+        * :func:`scen_index`
+        * :func:`model_point`
 
     """
     sens = fixed_params()["sens_int_rate"]
-    ret_t = scen_data(date_id(), sens).return_mth().loc(axis=0)[:, t]
-
-    ret_t = pd.DataFrame(
-            np.tile(ret_t.values, (len(model_point_table_ext()), 1)),
-            index=model_point_index(),
-            columns=ret_t.columns
-        )
+    scens = scen_data(date_id(), sens)
+
+    if scens.scen_file is None:
+        ret_t = scens.return_mth().loc(axis=0)[:, t]
+        rows = ret_t.index.get_level_values("scen").get_indexer(scen_index())
+        if (rows < 0).any():
+            raise ValueError("scen_index not in the scenarios")
+        columns, values = ret_t.columns, ret_t.values[rows]
+    else:
+        store = scens.scen_store_data()
+        columns = store.columns
+        values = np.exp(store.at_step(t, scen_index())) - 1
 
-    fund_indexer = ret_t.columns.get_indexer(model_point()['fund_index'])
-    return ret_t.values[np.arange(len(ret_t)), fund_indexer]
+    fund_indexer = columns.get_indexer(model_point()['fund_index'])
+    if (fund_indexer < 0).any():
+        raise ValueError("fund_index not in the scenarios")
+    return values[:, fund_indexer]
 
 
 def is_lapse_dynamic():
@@ -896,7 +965,12 @@ def lapse_rate(t):
 
 
 def lapse_rate_key(t):
-    """Index keys to retrieve lapse rates for time t"""
+    """Index keys to retrieve lapse rates for time t
+
+    .. note::
+       This cells is not used by default.
+       The lapse rates are looked up by integer positions instead.
+    """
     duration_cap = asmp_data(asmp_id()).lapse_len()
 
     return pd.MultiIndex.from_arrays(
@@ -904,6 +978,18 @@ def lapse_rate_key(t):
         names = ["lapse_id", "duration"])
 
 
+def lapse_table_pos():
+    """Positions of the lapse IDs of the model points
+
+    Returns the positions of the ``lapse_id`` column of :func:`model_point`
+    in the rows of
+    :func:`~appliedlife.IntegratedLife.Assumptions.lapse_array`,
+    or -1 for the IDs not found.
+    """
+    ids = asmp_data(asmp_id()).lapse_tables().columns
+    return ids.get_indexer(model_point()["lapse_id"])
+
+
 def load_prem_rate():
     """Rate of premium loading
 
@@ -929,7 +1015,8 @@ def maint_fee(t):
         * :func:`maint_fee_pp`
 
     """
-    return maint_fee_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (maint_fee_pp(t) * pols_if_at(t, "BEF_DECR")).astype(
+        value_dtype(), copy=False)
 
 
 def maint_fee_pp(t):
@@ -1034,9 +1121,14 @@ def model_point():
             def model_point():
                 return model_point_table[model_point_table_ext()["age_at_entry"] >= 40]
 
-    Note that the shape of the returned DataFrame must be the
+    Note that the columns of the returned DataFrame must be the
     same as the original DataFrame, i.e. :func:`model_point_table_ext`.
 
+    Each model point appears once in the DataFrame
+    however many scenarios are projected.
+    The scenarios are broadcast against the model points
+    by the Cells that depend on them. See :func:`proj_shape`.
+
     When selecting only one model point, make sure the
     returned object is a DataFrame, not a Series, as seen in the example
     above where ``model_point_table_ext().loc[1:1]`` is specified
@@ -1048,21 +1140,19 @@ def model_point():
     .. seealso::
 
         * :func:`model_point_table_ext`
+        * :func:`model_point_index`
 
     """
-    mps = model_point_table_ext()
-    res = pd.DataFrame(
-            np.repeat(mps.values, len(scen_index()), axis=0),
-            index=model_point_index(),
-            columns=mps.columns
-        )
-
-    return res.astype(mps.dtypes)
+    return model_point_table_ext()
 
 
 def model_point_index():
-    """Index for model points"""
-    mps = model_point_table_ext()
+    """Index of the results by model point and scenario
+
+    The product of the index of :func:`model_point` and :func:`scen_index`.
+    The rows of :func:`result_pv` are indexed with it.
+    """
+    mps = model_point()
     return pd.MultiIndex.from_product(
             [mps.index, scen_index()],
             names = mps.index.names + scen_index().names
@@ -1096,7 +1186,12 @@ def mort_rate(t):
 
 
 def mort_rate_key(t):
-    """Index keys to retrieve mortality rates for time t"""
+    """Index keys to retrieve mortality rates for time t
+
+    .. note::
+       This cells is not used by default.
+       The mortality rates are looked up by integer positions instead.
+    """
     duration_cap = mort_data.select_duration_len().reindex(mort_table_id()).values
 
     return pd.MultiIndex.from_arrays(
@@ -1113,7 +1208,7 @@ def mort_rate_mth(t):
        * :func:`mort_rate`
 
     """
-    return 1-(1- mort_rate(t))**(1/12)
+    return (1-(1- mort_rate(t))**(1/12)).astype(value_dtype(), copy=False)
 
 
 def mort_scalar(t):
@@ -1127,12 +1222,29 @@ def mort_scalar(t):
 
         :func:`duration`
 
+    The scalars are picked up from
+    :func:`~appliedlife.IntegratedLife.Assumptions.mort_scalar_array`
+    by integer positions with ``np.take``, computed from
+    :func:`mort_scalar_pos` and the durations capped
+    as in :func:`mort_scalar_key`.
+
     """
-    return asmp_data(asmp_id()).stacked_mort_scalar_tables().reindex(mort_scalar_key(t)).values
+    table = asmp_data(asmp_id()).mort_scalar_array()
+    dur_idx = np.minimum(duration(t), asmp_data(asmp_id()).mort_scalar_len())
+
+    is_valid = (mort_scalar_pos() >= 0) & (dur_idx >= 0) & (dur_idx < table.shape[1] - 1)
+    pos = np.where(is_valid, mort_scalar_pos() * table.shape[1] + dur_idx, table.size - 1)
+
+    return np.take(table, pos)
 
 
 def mort_scalar_key(t):
-    """Index keys to retrieve mortality scalars for all model points at time t"""
+    """Index keys to retrieve mortality scalars for all model points at time t
+
+    .. note::
+       This cells is not used by default.
+       The mortality scalars are looked up by integer positions instead.
+    """
 
     duration_cap = asmp_data(asmp_id()).mort_scalar_len()
 
@@ -1141,6 +1253,18 @@ def mort_scalar_key(t):
         names = ["mort_scalar_id", "duration"])
 
 
+def mort_scalar_pos():
+    """Positions of the mortality scalar IDs of the model points
+
+    Returns the positions of the ``mort_scalar_id`` column of
+    :func:`model_point` in the rows of
+    :func:`~appliedlife.IntegratedLife.Assumptions.mort_scalar_array`,
+    or -1 for the IDs not found.
+    """
+    ids = asmp_data(asmp_id()).mort_scalar_tables().columns
+    return ids.get_indexer(model_point()["mort_scalar_id"])
+
+
 def mort_table_id():
     """Mortality table IDs"""
     return np.where(model_point()["sex"] == "M", 
@@ -1148,6 +1272,16 @@ def mort_table_id():
                     model_point()["mort_table_female"])
 
 
+def mort_table_pos():
+    """Positions of the mortality table IDs of the model points
+
+    Returns the positions of :func:`mort_table_id` in the first axis of
+    :func:`~appliedlife.IntegratedLife.Mortality.unified_array`,
+    or -1 for the IDs not found.
+    """
+    return mort_data.table_defs().index.get_indexer(mort_table_id())
+
+
 def net_amt_at_risk(t):
     """Net amount at risk per policy
 
@@ -1178,8 +1312,9 @@ def net_cf(t):
         * :func:`commissions`
 
     """
-    return (premiums(t)
+    result = (premiums(t)
             + inv_income(t) - claims(t) - expenses(t) - commissions(t) - av_change(t))
+    return result.astype(value_dtype(), copy=False)
 
 
 def policy_term():
@@ -1198,7 +1333,8 @@ def pols_death(t):
 
     Number of policies decreased by death between ``t`` and ``t+1``
     """
-    return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
+    return (pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)).astype(
+        value_dtype(), copy=False)
 
 
 def pols_if(t):
@@ -1260,15 +1396,22 @@ def pols_if_at(t, timing):
         if t == 0:
             return pols_if_init()
         else:
-            return pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)
+            return (pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)).astype(
+                value_dtype(), copy=False)
 
     elif timing == "BEF_NB":
 
-        return pols_if_at(t, "BEF_MAT") - pols_maturity(t)
+        pols = pols_if_at(t, "BEF_MAT") - pols_maturity(t)
+        if pols.dtype.kind == "f":
+            pols = pols.astype(value_dtype(), copy=False)
+        return pols
 
     elif timing == "BEF_DECR":
 
-        return pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+        pols = pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+        if pols.dtype.kind == "f":
+            pols = pols.astype(value_dtype(), copy=False)
+        return pols
 
     else:
         raise ValueError("invalid timing")
@@ -1293,7 +1436,9 @@ def pols_lapse(t):
         * :func:`lapse_rate`
 
     """
-    return (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12))
+    result = (
+        (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12)))
+    return result.astype(value_dtype(), copy=False)
 
 
 def pols_maturity(t):
@@ -1305,7 +1450,10 @@ def pols_maturity(t):
 
     otherwise ``0``.
     """
-    return (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+    pols = (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+    if pols.dtype.kind == "f":
+        pols = pols.astype(value_dtype(), copy=False)
+    return pols
 
 
 def pols_new_biz(t):
@@ -1339,7 +1487,8 @@ def prem_to_av(t):
         * :func:`pols_if_at`
 
     """
-    return  prem_to_av_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (prem_to_av_pp(t) * pols_if_at(t, "BEF_DECR")).astype(
+        value_dtype(), copy=False)
 
 
 def prem_to_av_pp(t):
@@ -1400,7 +1549,29 @@ def premiums(t):
         * :func:`pols_if_at`
 
     """
-    return premium_pp(t) * pols_if_at(t, "BEF_DECR")
+    prems = premium_pp(t) * pols_if_at(t, "BEF_DECR")
+    if prems.dtype.kind == "f":
+        prems = prems.astype(value_dtype(), copy=False)
+    return prems
+
+
+def proj_shape():
+    """Shape of the arrays by scenario and model point
+
+    The tuple of the number of the scenarios in :func:`scen_index`
+    and the number of the model points in :func:`model_point`.
+    The arrays returned by the Cells parameterized by ``t``
+    are broadcast to this shape, as 2-D arrays
+    whose rows are the scenarios, when their values
+    are output by model point and scenario.
+
+    .. seealso::
+
+        * :func:`inv_return_mth`
+        * :func:`model_point_index`
+
+    """
+    return (len(scen_index()), len(model_point()))
 
 
 def proj_len():
@@ -1598,12 +1769,15 @@ def result_cf():
 
     t_len = range(max_proj_len())
 
+    def total(x):
+        return np.broadcast_to(x, proj_shape()).sum(dtype=np.float64)
+
     data = {
-        "Premiums": [sum(premiums(t)) for t in t_len],
-        "Claims": [sum(claims(t)) for t in t_len],
-        "Expenses": [sum(expenses(t)) for t in t_len],
-        "Commissions": [sum(commissions(t)) for t in t_len],
-        "Net Cashflow": [sum(net_cf(t)) for t in t_len]
+        "Premiums": [total(premiums(t)) for t in t_len],
+        "Claims": [total(claims(t)) for t in t_len],
+        "Expenses": [total(expenses(t)) for t in t_len],
+        "Commissions": [total(commissions(t)) for t in t_len],
+        "Net Cashflow": [total(net_cf(t)) for t in t_len]
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1624,12 +1798,15 @@ def result_pols():
 
     t_len = range(max_proj_len())
 
+    def total(x):
+        return np.broadcast_to(x, proj_shape()).sum(dtype=np.float64)
+
     data = {
-        "pols_if": [sum(pols_if(t)) for t in t_len],
-        "pols_maturity": [sum(pols_maturity(t)) for t in t_len],
-        "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
-        "pols_death": [sum(pols_death(t)) for t in t_len],
-        "pols_lapse": [sum(pols_lapse(t)) for t in t_len]
+        "pols_if": [total(pols_if(t)) for t in t_len],
+        "pols_maturity": [total(pols_maturity(t)) for t in t_len],
+        "pols_new_biz": [total(pols_new_biz(t)) for t in t_len],
+        "pols_death": [total(pols_death(t)) for t in t_len],
+        "pols_lapse": [total(pols_lapse(t)) for t in t_len]
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1660,7 +1837,9 @@ def result_pv():
             "Net Cashflow": pv_net_cf()
         }
 
-    return pd.DataFrame(data, index=model_point().index)
+    data = {k: np.broadcast_to(v, proj_shape()).T.ravel() for k, v in data.items()}
+
+    return pd.DataFrame(data, index=model_point_index())
 
 
 def result_sample(point_id=1, scen=1):
@@ -1720,8 +1899,9 @@ def result_sample(point_id=1, scen=1):
         ]
 
 
-    iloc = model_point_index().get_loc((point_id, scen))
-    t_len = proj_len()[iloc] 
+    col = model_point().index.get_loc(point_id)
+    row = scen_index().get_loc(scen)
+    t_len = proj_len()[col]
 
     data = {}
     for item in items:
@@ -1738,7 +1918,8 @@ def result_sample(point_id=1, scen=1):
         else:
             cells = _space._cells[name]
             if isinstance(cells(0, *args), (np.ndarray, pd.Series)):
-                val = [cells(t, *args)[iloc] for t in range(t_len)]
+                val = [np.broadcast_to(cells(t, *args), proj_shape())[row, col]
+                       for t in range(t_len)]
             else:
                 val = [cells(t, *args) for t in range(t_len)]
 
@@ -1756,7 +1937,12 @@ def result_sample(point_id=1, scen=1):
 
 def scen_index():
     sens = fixed_params()["sens_int_rate"]
-    return scen_data(date_id(), sens).return_mth().loc(axis=0)[:, 0].index.get_level_values('scen')
+    scens = scen_data(date_id(), sens)
+
+    if scens.scen_file is None:
+        return scens.return_mth().loc(axis=0)[:, 0].index.get_level_values('scen')
+    else:
+        return scens.scen_store_data().scen_ids
 
 
 def sex():
@@ -1794,7 +1980,8 @@ def surr_charge(t):
         * :func:`disc_factors`
 
     """
-    return surr_charge_rate(t) * av_pp_at(t, "MID_MTH") * pols_lapse(t)
+    return (surr_charge_rate(t) * av_pp_at(t, "MID_MTH") * pols_lapse(t)).astype(
+        value_dtype(), copy=False)
 
 
 def surr_charge_id():
@@ -1814,7 +2001,12 @@ def surr_charge_id():
 
 
 def surr_charge_key(t):
-    """Index keys to retrieve surrender charge rates at time t"""
+    """Index keys to retrieve surrender charge rates at time t
+
+    .. note::
+       This cells is not used by default.
+       The surrender charge rates are looked up by integer positions instead.
+    """
     duration_cap = base_data.surr_charge_len()
 
     return pd.MultiIndex.from_arrays(
@@ -1836,10 +2028,50 @@ def surr_charge_rate(t):
         * :func:`disc_factors`
         * :func:`surr_charge_max_idx`
         * :func:`surr_charge_table_stacked`
+
+    The rates are picked up from
+    :func:`~appliedlife.IntegratedLife.BaseData.surr_charge_array`
+    by integer positions with ``np.take``, computed from
+    :func:`surr_charge_table_pos` and the durations capped
+    as in :func:`surr_charge_key`.
+
+    """
+    table = base_data.surr_charge_array()
+    dur_idx = np.minimum(duration(t), base_data.surr_charge_len())
+
+    is_valid = (surr_charge_table_pos() >= 0) & (dur_idx >= 0) & (dur_idx < table.shape[1] - 1)
+    pos = np.where(is_valid, surr_charge_table_pos() * table.shape[1] + dur_idx, table.size - 1)
+
+    return np.take(table, pos)
+
+
+def surr_charge_table_pos():
+    """Positions of the surrender charge IDs of the model points
+
+    Returns the positions of :func:`surr_charge_id` in the rows of
+    :func:`~appliedlife.IntegratedLife.BaseData.surr_charge_array`,
+    or -1 for the IDs not found.
     """
-    return base_data.stacked_surr_charge_tables().reindex(
-        surr_charge_key(t), fill_value=0).set_axis(
-        model_point().index).values
+    ids = base_data.surr_charge_tables().columns
+    return ids.get_indexer(surr_charge_id())
+
+
+def value_dtype():
+    """The Numpy data type of the cached decrement and cashflow values
+
+    Returns ``np.float64`` if the ``precision`` Reference of the model
+    is ``"float64"``, ``np.float32`` if it is ``"float32"``,
+    and raises an error otherwise.
+    The decrement and cashflow Cells convert their values
+    to this type by ``astype(value_dtype(), copy=False)``
+    if the values are floats.
+    """
+    if precision == "float64":
+        return np.float64
+    elif precision == "float32":
+        return np.float32
+    else:
+        raise ValueError("invalid precision")
 
 
 # ---------------------------------------------------------------------------
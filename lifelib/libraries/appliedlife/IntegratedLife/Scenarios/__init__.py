@@ -33,6 +33,31 @@ Attributes:
 
     base_data: Reference to the :mod:`~appliedlife.IntegratedLife.BaseData` space
 
+    scen_file: Path to a scenario store of the index returns.
+        ``None`` by default.
+
+        With ``None``, :func:`log_return_mth` generates the scenarios.
+        Otherwise, the log returns are read from the scenario store
+        at the path, relative to the scenario directory specified by
+        the constant parameter "scen_dir" if not absolute.
+        The path can contain ``{date_id}`` and ``{sens_id}``,
+        which are replaced with :attr:`date_id` and :attr:`sens_id`.
+        The store is a directory holding the returns
+        in a memory-mapped Numpy file, written from :func:`log_return_mth`
+        by :func:`lifelib.runners.write_scenarios`::
+
+            >>> from lifelib.runners import write_scenarios
+
+            >>> write_scenarios(
+            ...     "scenarios/index_202312_BASE",
+            ...     m.Scenarios['202312', 'BASE'].log_return_mth())
+
+            >>> m.Scenarios.scen_file = "index_{date_id}_{sens_id}"
+
+        :func:`~appliedlife.IntegratedLife.ProductBase.inv_return_mth`
+        reads the returns at each step from the store
+        without building :func:`return_mth` as a DataFrame.
+
 
 Example:
 
@@ -179,9 +204,7 @@ def index_params():
     file_name: str = base_data.const_params().at["scen_param_file", "value"]
 
     file = _model.path.parent / dir_name / file_name
-    df = pd.read_excel(file,
-                         sheet_name="Params",
-                         index_col=0)
+    df = base_data.read_excel(file, "Params")
 
     return df.T.astype(
         {"currency": "object", 
@@ -201,7 +224,11 @@ def log_return_mth():
     Generates monthly risk-neutral log returns of fund indexes,
     Returns a DataFrame with columns of fund IDs
     and with a MultiIndex with two levels, scenario ID and time in month.
+    If :attr:`scen_file` is given, the returns are read from
+    :func:`scen_store_data` instead.
     """
+    if scen_file is not None:
+        return scen_store_data().to_frame()
 
     # Initialize random number generator
     rng = np.random.default_rng(12345)
@@ -238,6 +265,25 @@ def scen_index():
     names=["scen", "t"])
 
 
+def scen_store_data():
+    """Scenario store of the index returns
+
+    Opens the scenario store at :attr:`scen_file`
+    and returns it as a :class:`~lifelib.runners.ScenarioStore`.
+    The values stay on disk until they are read.
+    :mod:`lifelib.runners` is imported only when this Cells is
+    evaluated, so the model does not need it
+    while :attr:`scen_file` is ``None``.
+    """
+    from lifelib.runners.scenario_store import ScenarioStore
+
+    dir_name: str = base_data.const_params().at["scen_dir", "value"]
+    file_name = scen_file.format(date_id=date_id, sens_id=sens_id)
+
+    path = _model.path.parent / dir_name / file_name
+    return ScenarioStore(path)
+
+
 def scen_len():
     """The length of scenarios in years"""
     return len(spot_rates())
@@ -245,7 +291,10 @@ def scen_len():
 
 def scen_size():
     """The number of scenarios"""
-    return 100
+    if scen_file is None:
+        return 100
+    else:
+        return scen_store_data().scen_count
 
 
 def spot_rates():
@@ -264,7 +313,7 @@ def spot_rates():
     file_prefix: str = base_data.const_params().at["scen_file_prefix", "value"]
 
     path = _model.path.parent / dir_name / f"{file_prefix}_{date_id}.xlsx"
-    return pd.read_excel(path, sheet_name=sens_id, index_col=0)
+    return base_data.read_excel(path, sens_id)
 
 
 # ---------------------------------------------------------------------------
@@ -274,4 +323,6 @@ base_data = ("Interface", ("..", "BaseData"), "auto")
 
 date_id = "202312"
 
-sens_id = "BASE"
\ No newline at end of file
+sens_id = "BASE"
+
+scen_file = None
\ No newline at end of file
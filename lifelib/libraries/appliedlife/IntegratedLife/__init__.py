@@ -19,4 +19,8 @@ _spaces = [
 
 np = ("Module", "numpy")
 
-pd = ("Module", "pandas")
\ No newline at end of file
+pd = ("Module", "pandas")
+
+input_cache = None
+
+precision = "float64"
\ No newline at end of file
@@ -172,6 +172,43 @@ def age_at_entry():
     return model_point()["age_at_entry"]
 
 
+def calendar():
+    """Integer calendar of the model points
+
+    Returns a DataFrame indexed with model point ID, whose columns
+    hold the calendar attributes of the model points as integers,
+    calculated once from :func:`issue_date` and :func:`payment_freq`:
+
+    ``issue_month``
+        The issue month as the number of months since January 1970.
+        Compared with :func:`step_month` to calculate :func:`duration_m`.
+
+    ``issue_day``
+        The day of the month of the issue date,
+        i.e. the day of the month of the policy anniversaries
+        and the premium due dates.
+
+    ``pay_interval``
+        The interval between premium payments in months,
+        i.e. ``12 // payment_freq()``.
+
+    The Cells reading this calendar, such as :func:`duration_m`
+    and :func:`last_part`, calculate with integer arrays instead of
+    carrying out the date arithmetic of the model points at each step.
+
+    .. seealso::
+
+        * :func:`issue_date`
+        * :func:`payment_freq`
+        * :func:`step_month`
+    """
+    iss = issue_date()
+    return pd.DataFrame({
+        "issue_month": (iss.dt.year.astype(np.int64) - 1970) * 12 + iss.dt.month - 1,
+        "issue_day": iss.dt.day.astype(np.int64),
+        "pay_interval": 12 // payment_freq()})
+
+
 def check_pay_count():
     """Check :func:`pay_count`.
 
@@ -389,12 +426,10 @@ def duration_m(i):
 
     .. seealso:: 
 
-        * :func:`issue_date`
-        * :func:`date_`
+        * :func:`calendar`
+        * :func:`step_month`
     """
-    iss = issue_date()
-
-    return  date_(i).year * 12 + date_(i).month - iss.dt.year * 12 - iss.dt.month
+    return step_month(i) - calendar()["issue_month"]
 
 
 def duration_y(i):
@@ -573,17 +608,32 @@ def last_part(i, freq_id='ANV'):
     If 'PREM' is given to ``freq_id``,
     the lengh of time in months till the next payment date is returned.
 
+    The lengths are calculated from :func:`duration_m` and :func:`calendar`
+    in the same way as :func:`next_anniversary` calculates the dates.
+
     .. seealso::
 
         * :func:`next_part`
         * :func:`next_anniversary`
         * :func:`months_in_step`
+        * :func:`calendar`
 
     """
-    anv = next_anniversary(i, freq_id)
-    diff_m = anv.dt.year * 12 + anv.dt.month - date_(i).year * 12 - date_(i).month
-    stub_m = (anv.dt.day - 1) / anv.dt.days_in_month
-    return (diff_m - 1 + stub_m).mask(date_(i+1) < next_anniversary(i, freq_id), months_in_step(i))
+    if freq_id == 'ANV':
+        interval = 12
+    elif freq_id == 'PREM':
+        interval = calendar()["pay_interval"]
+    else:
+        raise ValueError('invalid freq_id')
+
+    diff_m = interval - (duration_m(i) % interval)
+
+    month = (step_month(i) + diff_m).to_numpy().astype('datetime64[M]')
+    days = (month + 1).astype('datetime64[D]') - month.astype('datetime64[D]')
+    days = days.astype(np.int64)
+
+    stub_m = (np.minimum(calendar()["issue_day"], days) - 1) / days
+    return (diff_m - 1 + stub_m).mask(months_in_step(i) < diff_m, months_in_step(i))
 
 
 def loading_prem():
@@ -695,8 +745,9 @@ def months_in_step(i):
     .. see also:
 
         * :func:`date_`
+        * :func:`step_month`
     """
-    return date_(i+1).year * 12 + date_(i+1).month - date_(i).year * 12 - date_(i).month
+    return step_month(i+1) - step_month(i)
 
 
 def mort_rate(i):
@@ -773,6 +824,11 @@ def next_anniversary(i, freq_id='ANV'):
     based on the premium payment cycle calculated
     from :func:`payment_freq` and :func:`issue_date`.
 
+    .. note::
+       This cells is not used by default.
+       :func:`last_part` calculates the lengths of time to these dates
+       from :func:`calendar`.
+
     .. seealso::
 
         * :func:`date_`
@@ -896,10 +952,11 @@ def pay_count(i, j=None):
         return pay_count(i, 'LAST') + pay_count(i, 'NEXT')
 
     else:
-        paid_next = (duration_m(i+1) % 12) // (12 // payment_freq()) + 1
+        pay_interval = calendar()["pay_interval"]
+        paid_next = (duration_m(i+1) % 12) // pay_interval + 1
 
         if j == 'LAST':
-            paid_last = (duration_m(i) % 12) // (12 // payment_freq()) + 1
+            paid_last = (duration_m(i) % 12) // pay_interval + 1
             paid_next = paid_next.where(duration_y(i) == duration_y(i+1), payment_freq())
 
             return is_paying(i) * (paid_next - paid_last)
@@ -942,7 +999,7 @@ def payment_lag(i, j):
         * :func:`payment_freq`
     """
     max = np.maximum
-    pay_interval = 12 // payment_freq()
+    pay_interval = calendar()["pay_interval"]
 
     if j == 'LAST':
         return last_part(i, freq_id='PREM') + max(pay_count(i, 'LAST') - 1, 0) * pay_interval / 2
@@ -1497,6 +1554,21 @@ def sex():
     return model_point()["sex"]
 
 
+def step_month(i):
+    """Month of :func:`date_(i)<date_>` as an integer
+
+    Returns the month of :func:`date_(i)<date_>` as the number of
+    months since January 1970, in the same way as ``issue_month``
+    in :func:`calendar`.
+
+    .. seealso::
+
+        * :func:`date_`
+        * :func:`calendar`
+    """
+    return (date_(i).year - 1970) * 12 + date_(i).month - 1
+
+
 def step_to_month(i):
     """Returns the number of months for step ``i``
 
@@ -168,6 +168,68 @@ Attributes:
            * :func:`mort_rate`
            * :func:`mort_rate_mth`
 
+    engine: The calculation engine as a string,
+        either ``"recursive"`` or ``"grid"``. ``"recursive"`` by default.
+
+        With ``"recursive"``, the present values and the result tables
+        are calculated from the Cells parameterized by ``t``,
+        such as :func:`premiums` and :func:`pols_if_at`,
+        which are evaluated recursively one step at a time.
+
+        With ``"grid"``, they are calculated from the Cells
+        whose names end with ``_grid``, such as :func:`premiums_grid`
+        and :func:`pols_if_at_grid`. Each of them returns
+        a 2-D Numpy array of all the model points by all the months
+        calculated in one pass without recursion.
+        The ``"grid"`` engine creates far fewer cached values,
+        and runs much faster for a large number of model points::
+
+            >>> Projection.engine = "grid"
+
+            >>> Projection.result_pv()
+
+        The two engines produce the same results within floating-point
+        tolerance. Note that the ``_grid`` Cells implement
+        the default formulas, so a change made to a Cells
+        such as :func:`lapse_rate` needs to be made to its
+        ``_grid`` counterpart too for the change to take effect
+        in the ``"grid"`` engine.
+
+        .. seealso::
+
+           * :func:`use_grid`
+           * :func:`pols_if_at_grid`
+
+    precision: The precision of the cached decrement and cashflow values
+        as a string, either ``"float64"`` or ``"float32"``.
+        ``"float64"`` by default.
+
+        With ``"float32"``, the monthly mortality rates,
+        the numbers of policies and the cashflows, parameterized by ``t``
+        or calculated by the ``"grid"`` :attr:`engine`,
+        are held as 32-bit floats, and the durations and ages
+        of the ``"grid"`` :attr:`engine` as 32-bit integers,
+        which halves the memory they take in the cache.
+        The annual mortality and lapse rates stay in 64-bit floats,
+        as converting them to monthly rates in 32-bit floats
+        would lose precision.
+        The Cells convert their values to :func:`value_dtype`
+        by ``astype(value_dtype(), copy=False)``, which does not copy
+        the values in 64-bit floats.
+        The present values and the totals in
+        :func:`result_cf` and :func:`result_pols` are
+        accumulated in 64-bit floats.
+        :func:`lifelib.runners.precision_drift` compares the results
+        with those in full precision::
+
+            >>> from lifelib.runners import precision_drift
+
+            >>> drift, nbytes = precision_drift(Projection)
+
+        .. seealso::
+
+           * :func:`value_dtype`
+
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
 
@@ -220,6 +282,33 @@ def age_at_entry():
     return model_point()["age_at_entry"]
 
 
+def age_grid():
+    """Attained ages of all the model points at all time steps
+
+    The 2-D counterpart of :func:`age` used by the ``"grid"``
+    :attr:`engine`. Returns a Numpy array of the attained ages
+    whose rows are the model points
+    and whose columns are the months
+    from 0 to :func:`max_proj_len` - 1. Defined as::
+
+        age_at_entry().values[:, None] + duration_grid()
+
+    The ages are converted to 32-bit integers
+    if :attr:`precision` is not ``"float64"``.
+
+    .. seealso::
+
+        * :func:`age`
+        * :func:`duration_grid`
+
+    """
+    ages = age_at_entry().values[:, None] + duration_grid()
+    if precision == "float64":
+        return ages
+    else:
+        return ages.astype(np.int32)
+
+
 def claim_pp(t):
     """Claim per policy
 
@@ -241,7 +330,24 @@ def claims(t):
         * :func:`pols_death`
 
     """
-    return claim_pp(t) * pols_death(t)
+    return (claim_pp(t) * pols_death(t)).astype(value_dtype(), copy=False)
+
+
+def claims_grid():
+    """Claims of all the model points at all time steps
+
+    The 2-D counterpart of :func:`claims` used by the ``"grid"``
+    :attr:`engine`, defined as :func:`sum_assured` times
+    :func:`pols_death_grid`, following the default :func:`claim_pp`.
+
+    .. seealso::
+
+        * :func:`claims`
+        * :func:`pols_death_grid`
+
+    """
+    return (sum_assured().values[:, None] * pols_death_grid()).astype(
+        value_dtype(), copy=False)
 
 
 def commissions(t):
@@ -258,6 +364,21 @@ def commissions(t):
     return (duration(t) == 0) * premiums(t)
 
 
+def commissions_grid():
+    """Commissions of all the model points at all time steps
+
+    The 2-D counterpart of :func:`commissions` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso::
+
+        * :func:`commissions`
+        * :func:`premiums_grid`
+
+    """
+    return (duration_grid() == 0) * premiums_grid()
+
+
 def disc_factors():
     """Discount factors.
 
@@ -296,6 +417,18 @@ def duration(t):
     return duration_mth(t) //12
 
 
+def duration_grid():
+    """Durations in years of all the model points at all time steps
+
+    The 2-D counterpart of :func:`duration` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`duration_mth_grid`
+
+    """
+    return duration_mth_grid() // 12
+
+
 def duration_mth(t):
     """Duration of model points at ``t`` in months
 
@@ -317,6 +450,30 @@ def duration_mth(t):
         return duration_mth(t-1) + 1
 
 
+def duration_mth_grid():
+    """Durations in months of all the model points at all time steps
+
+    The 2-D counterpart of :func:`duration_mth` used by the ``"grid"``
+    :attr:`engine`. Returns a Numpy array whose rows are the model points
+    and whose columns are the months from 0 to :func:`max_proj_len` - 1.
+    Instead of incrementing :func:`duration_mth` by 1 step by step,
+    the entire array is calculated at once as::
+
+        duration_mth(0).values[:, None] + np.arange(max_proj_len())
+
+    The durations are converted to 32-bit integers
+    if :attr:`precision` is not ``"float64"``.
+
+    .. seealso:: :func:`duration_mth`
+
+    """
+    durations = duration_mth(0).values[:, None] + np.arange(max_proj_len())
+    if precision == "float64":
+        return durations
+    else:
+        return durations.astype(np.int32)
+
+
 def expense_acq():
     """Acquisition expense per policy
 
@@ -357,6 +514,26 @@ def expenses(t):
         + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t)
 
 
+def expenses_grid():
+    """Expenses of all the model points at all time steps
+
+    The 2-D counterpart of :func:`expenses` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso::
+
+        * :func:`expenses`
+        * :func:`pols_new_biz_grid`
+        * :func:`pols_if_at_grid`
+
+    """
+    inf_factors = (1 + inflation_rate())**(np.arange(max_proj_len())/12)
+    inf_factors = inf_factors.astype(value_dtype(), copy=False)
+
+    return expense_acq() * pols_new_biz_grid() \
+        + pols_if_at_grid("BEF_DECR") * expense_maint()/12 * inf_factors
+
+
 def inflation_factor(t):
     """The inflation factor at time t
 
@@ -388,6 +565,21 @@ def lapse_rate(t):
     return np.maximum(0.1 - 0.02 * duration(t), 0.02)
 
 
+def lapse_rate_grid():
+    """Lapse rates of all the model points at all time steps
+
+    The 2-D counterpart of :func:`lapse_rate` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso::
+
+        * :func:`lapse_rate`
+        * :func:`duration_grid`
+
+    """
+    return np.maximum(0.1 - 0.02 * duration_grid(), 0.02)
+
+
 def loading_prem():
     """Loading per premium
 
@@ -453,24 +645,61 @@ def mort_rate(t):
     The index of the Series is ``point_id``,
     copied from :func:`model_point`.
 
+    The rates are picked up from :func:`mort_table_array`
+    by integer positions with ``np.take``, instead of
+    reindexing :func:`mort_table_reindexed` with a MultiIndex
+    of the ages and durations.
+    The position of each model point is the attained age
+    offset by the youngest age in :attr:`mort_table`,
+    times the number of the columns,
+    plus the duration capped at 5.
+    The pairs of ages and durations not found in the table,
+    such as negative durations of future new business,
+    are pointed to the row of zeros at the bottom of
+    :func:`mort_table_array`.
+
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_table_array`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
+    table = mort_table_array()
+    age_idx = age(t).values - mort_table.index.min()
+    dur_idx = np.minimum(duration(t).values, 5)
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
+    is_valid = (age_idx >= 0) & (age_idx < table.shape[0] - 1) & (dur_idx >= 0)
+    pos = np.where(is_valid, age_idx * table.shape[1] + dur_idx, table.size - 1)
+
+    return pd.Series(np.take(table, pos), index=model_point().index)
 
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
 
-    mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-    return mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index)
+def mort_rate_grid():
+    """Mortality rates of all the model points at all time steps
+
+    The 2-D counterpart of :func:`mort_rate` used by the ``"grid"``
+    :attr:`engine`.
+    The annual mortality rates are picked up from
+    :func:`mort_table_array` at once
+    by the integer positions of the attained ages and the durations
+    of all the model points at all the time steps.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`age_grid`
+        * :func:`duration_grid`
+
+    """
+    table = mort_table_array()
+    age_idx = age_grid() - mort_table.index.min()
+    dur_idx = np.minimum(duration_grid(), 5)
+
+    is_valid = (age_idx >= 0) & (age_idx < table.shape[0] - 1) & (dur_idx >= 0)
+    pos = np.where(is_valid, age_idx * table.shape[1] + dur_idx, table.size - 1)
+
+    return np.take(table, pos)
 
 
 def mort_rate_mth(t):
@@ -482,7 +711,42 @@ def mort_rate_mth(t):
        * :func:`mort_rate`
 
     """
-    return 1-(1- mort_rate(t))**(1/12)
+    return (1-(1- mort_rate(t))**(1/12)).astype(value_dtype(), copy=False)
+
+
+def mort_rate_mth_grid():
+    """Monthly mortality rates of all the model points at all time steps
+
+    The 2-D counterpart of :func:`mort_rate_mth` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`mort_rate_grid`
+
+    """
+    return (1-(1- mort_rate_grid())**(1/12)).astype(value_dtype(), copy=False)
+
+
+def mort_table_array():
+    """Mortality table as a Numpy array
+
+    Returns :attr:`mort_table` as a 2-D Numpy array
+    to look up mortality rates by integer positions.
+    The rows are the ages from the youngest to the oldest age
+    in :attr:`mort_table`, and the columns are the durations from 0 to 5.
+    A row of zeros is appended at the bottom
+    for the ages and durations not found in the table.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`mort_rate_grid`
+
+    """
+    table = mort_table.rename(columns=int).sort_index(axis=1)
+    table = table.reindex(
+        range(table.index.min(), table.index.max() + 1), fill_value=0)
+
+    return np.vstack([table.values, np.zeros((1, table.shape[1]))])
 
 
 def mort_table_reindexed():
@@ -490,6 +754,8 @@ def mort_table_reindexed():
 
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
+    Not used by :func:`mort_rate`, which looks up
+    :func:`mort_table_array` instead.
 
     """
     result = []
@@ -519,6 +785,18 @@ def net_cf(t):
     return premiums(t) - claims(t) - expenses(t) - commissions(t)
 
 
+def net_cf_grid():
+    """Net cashflows of all the model points at all time steps
+
+    The 2-D counterpart of :func:`net_cf` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`net_cf`
+
+    """
+    return premiums_grid() - claims_grid() - expenses_grid() - commissions_grid()
+
+
 def net_premium_pp():
     """Net premium per policy
 
@@ -550,11 +828,39 @@ def policy_term():
     return model_point()["policy_term"]
 
 
+def policy_count():
+    """The policy counts of the model points.
+
+    The ``policy_count`` column of the DataFrame returned by
+    :func:`model_point`, converted to :func:`value_dtype`
+    if :attr:`precision` is not ``"float64"``.
+    Unlike the other values, which are converted only if
+    they are floats, the integer counts are converted to floats,
+    as the numbers of policies decrease by fractions.
+    """
+    if precision == "float64":
+        return model_point()["policy_count"]
+    else:
+        return model_point()["policy_count"].astype(value_dtype())
+
+
 def pols_death(t):
     """Number of death occurring at time t"""
     return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
 
 
+def pols_death_grid():
+    """Number of deaths of all the model points at all time steps
+
+    The 2-D counterpart of :func:`pols_death` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`pols_death`
+
+    """
+    return pols_if_at_grid("BEF_DECR") * mort_rate_mth_grid()
+
+
 def pols_if(t):
     """Number of policies in-force
 
@@ -628,13 +934,78 @@ def pols_if_at(t, timing):
         raise ValueError("invalid timing")
 
 
+def pols_if_at_grid(timing):
+    """Number of policies in-force of all the model points at all time steps
+
+    The 2-D counterpart of :func:`pols_if_at` used by the ``"grid"``
+    :attr:`engine`. ``timing`` takes the same values as
+    :func:`pols_if_at`.
+
+    Rather than recursing over ``t``, the numbers of policies
+    are calculated from the cumulative survival factors
+    in :func:`pols_surv_grid`.
+    ``"BEF_DECR"`` is the ``policy_count`` times :func:`pols_surv_grid`
+    while the model point is issued and not matured.
+    ``"BEF_MAT"`` is :func:`pols_if_init` at time 0,
+    and ``"BEF_DECR"`` after lapse and death
+    in the previous month thereafter.
+
+    .. seealso::
+
+        * :func:`pols_if_at`
+        * :func:`pols_surv_grid`
+
+    """
+    dur_mth = duration_mth_grid()
+    pols_count = policy_count().values[:, None]
+
+    if timing == "BEF_MAT":
+
+        is_if = np.empty(dur_mth.shape, dtype=bool)
+        is_if[:, 0] = dur_mth[:, 0] > 0
+        is_if[:, 1:] = pols_is_if_grid()[:, :-1]
+
+        return pols_count * pols_surv_grid() * is_if
+
+    elif timing == "BEF_NB":
+
+        return pols_if_at_grid("BEF_MAT") - pols_maturity_grid()
+
+    elif timing == "BEF_DECR":
+
+        return pols_count * pols_surv_grid() * pols_is_if_grid()
+
+    else:
+        raise ValueError("invalid timing")
+
+
 def pols_if_init():
     """Initial number of policies in-force
 
     Number of in-force policies at time 0 referenced from
     :func:`pols_if_at(0, "BEF_MAT")<pols_if_at>`.
     """
-    return model_point()["policy_count"].where(duration_mth(0) > 0, other=0)
+    return policy_count().where(duration_mth(0) > 0, other=0)
+
+
+def pols_is_if_grid():
+    """Whether the model points are in-force after new business
+
+    Returns a boolean Numpy array of model points by months, which
+    is ``True`` if the model point has been issued
+    and has not matured by the time.
+
+    .. seealso::
+
+        * :func:`pols_if_at_grid`
+        * :func:`duration_mth_grid`
+
+    """
+    dur_mth = duration_mth_grid()
+    is_matured = np.logical_or.accumulate(
+        dur_mth == policy_term().values[:, None] * 12, axis=1)
+
+    return (dur_mth >= 0) & ~is_matured
 
 
 def pols_lapse(t):
@@ -645,7 +1016,23 @@ def pols_lapse(t):
         * :func:`lapse_rate`
 
     """
-    return (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12))
+    result = ((pols_if_at(t, "BEF_DECR") - pols_death(t)) * (
+        1-(1 - lapse_rate(t))**(1/12)))
+    return result.astype(value_dtype(), copy=False)
+
+
+def pols_lapse_grid():
+    """Number of lapses of all the model points at all time steps
+
+    The 2-D counterpart of :func:`pols_lapse` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`pols_lapse`
+
+    """
+    result = ((pols_if_at_grid("BEF_DECR") - pols_death_grid()) * (
+        1-(1 - lapse_rate_grid())**(1/12)))
+    return result.astype(value_dtype(), copy=False)
 
 
 def pols_maturity(t):
@@ -660,6 +1047,19 @@ def pols_maturity(t):
     return (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
 
 
+def pols_maturity_grid():
+    """Number of maturing policies of all the model points at all time steps
+
+    The 2-D counterpart of :func:`pols_maturity` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`pols_maturity`
+
+    """
+    return (duration_mth_grid() == policy_term().values[:, None] * 12
+            ) * pols_if_at_grid("BEF_MAT")
+
+
 def pols_new_biz(t):
     """Number of new business policies
 
@@ -676,7 +1076,50 @@ def pols_new_biz(t):
         * :func:`model_point`
 
     """
-    return model_point()['policy_count'].where(duration_mth(t) == 0, other=0)
+    return policy_count().where(duration_mth(t) == 0, other=0)
+
+
+def pols_new_biz_grid():
+    """Number of new business policies of all the model points at all time steps
+
+    The 2-D counterpart of :func:`pols_new_biz` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso:: :func:`pols_new_biz`
+
+    """
+    return policy_count().values[:, None] * (
+        duration_mth_grid() == 0)
+
+
+def pols_surv_grid():
+    """Cumulative survival factors of all the model points
+
+    Returns a Numpy array of model points by months. Each element is
+    the product of the monthly probabilities of staying in-force
+    against lapse and death, ``(1 - q) * (1 - w)``, from the month of issue
+    up to but excluding the month, where ``q`` is :func:`mort_rate_mth_grid`
+    and ``w`` is the monthly lapse rate converted from
+    :func:`lapse_rate_grid`.
+    The factors are calculated at once by a cumulative product
+    along the time axis instead of being rolled forward step by step.
+    Months before issue do not decrement the factors.
+
+    .. seealso::
+
+        * :func:`pols_if_at_grid`
+        * :func:`mort_rate_mth_grid`
+        * :func:`lapse_rate_grid`
+
+    """
+    prob_stay = np.where(
+        duration_mth_grid() >= 0,
+        (1 - mort_rate_mth_grid().astype(np.float64)) * (1 - lapse_rate_grid())**(1/12),
+        1)
+
+    result = np.ones(prob_stay.shape, dtype=value_dtype())
+    result[:, 1:] = np.cumprod(prob_stay[:, :-1], axis=1)
+    return result
 
 
 def premium_pp():
@@ -725,7 +1168,23 @@ def premiums(t):
         * :func:`pols_if_at`
 
     """
-    return premium_pp() * pols_if_at(t, "BEF_DECR")
+    return (premium_pp() * pols_if_at(t, "BEF_DECR")).astype(value_dtype(), copy=False)
+
+
+def premiums_grid():
+    """Premium income of all the model points at all time steps
+
+    The 2-D counterpart of :func:`premiums` used by the ``"grid"``
+    :attr:`engine`.
+
+    .. seealso::
+
+        * :func:`premiums`
+        * :func:`premium_pp`
+
+    """
+    return (premium_pp().values[:, None] * pols_if_at_grid("BEF_DECR")).astype(
+        value_dtype(), copy=False)
 
 
 def proj_len():
@@ -757,9 +1216,13 @@ def pv_claims():
     .. seealso::
 
         * :func:`claims`
+        * :func:`claims_grid`
 
     """
-    cl = np.array(list(claims(t) for t in range(max_proj_len()))).transpose()
+    if use_grid():
+        cl = claims_grid()
+    else:
+        cl = np.array(list(claims(t) for t in range(max_proj_len()))).transpose()
 
     return cl @ disc_factors()[:max_proj_len()]
 
@@ -769,10 +1232,14 @@ def pv_commissions():
 
     .. seealso::
 
-        * :func:`expenses`
+        * :func:`commissions`
+        * :func:`commissions_grid`
 
     """
-    result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
+    if use_grid():
+        result = commissions_grid()
+    else:
+        result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -783,9 +1250,13 @@ def pv_expenses():
     .. seealso::
 
         * :func:`expenses`
+        * :func:`expenses_grid`
 
     """
-    result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
+    if use_grid():
+        result = expenses_grid()
+    else:
+        result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -818,7 +1289,10 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
+    if use_grid():
+        result = pols_if_at_grid("BEF_DECR")
+    else:
+        result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -829,9 +1303,13 @@ def pv_premiums():
     .. seealso::
 
         * :func:`premiums`
+        * :func:`premiums_grid`
 
     """
-    result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
+    if use_grid():
+        result = premiums_grid()
+    else:
+        result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -839,6 +1317,9 @@ def pv_premiums():
 def result_cf():
     """Result table of cashflows
 
+    When :attr:`engine` is ``"grid"``, the cashflows are
+    the sums of the 2-D arrays over the model points.
+
     .. seealso::
 
        * :func:`premiums`
@@ -851,13 +1332,22 @@ def result_cf():
 
     t_len = range(max_proj_len())
 
-    data = {
-        "Premiums": [sum(premiums(t)) for t in t_len],
-        "Claims": [sum(claims(t)) for t in t_len],
-        "Expenses": [sum(expenses(t)) for t in t_len],
-        "Commissions": [sum(commissions(t)) for t in t_len],
-        "Net Cashflow": [sum(net_cf(t)) for t in t_len]
-    }
+    if use_grid():
+        data = {
+            "Premiums": premiums_grid().sum(axis=0, dtype=np.float64),
+            "Claims": claims_grid().sum(axis=0, dtype=np.float64),
+            "Expenses": expenses_grid().sum(axis=0, dtype=np.float64),
+            "Commissions": commissions_grid().sum(axis=0, dtype=np.float64),
+            "Net Cashflow": net_cf_grid().sum(axis=0, dtype=np.float64)
+        }
+    else:
+        data = {
+            "Premiums": [sum(premiums(t).astype(np.float64)) for t in t_len],
+            "Claims": [sum(claims(t).astype(np.float64)) for t in t_len],
+            "Expenses": [sum(expenses(t).astype(np.float64)) for t in t_len],
+            "Commissions": [sum(commissions(t).astype(np.float64)) for t in t_len],
+            "Net Cashflow": [sum(net_cf(t).astype(np.float64)) for t in t_len]
+        }
 
     return pd.DataFrame(data, index=t_len)
 
@@ -865,6 +1355,9 @@ def result_cf():
 def result_pols():
     """Result table of policy decrement
 
+    When :attr:`engine` is ``"grid"``, the numbers of policies are
+    the sums of the 2-D arrays over the model points.
+
     .. seealso::
 
        * :func:`pols_if`
@@ -877,13 +1370,22 @@ def result_pols():
 
     t_len = range(max_proj_len())
 
-    data = {
-        "pols_if": [sum(pols_if(t)) for t in t_len],
-        "pols_maturity": [sum(pols_maturity(t)) for t in t_len],
-        "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
-        "pols_death": [sum(pols_death(t)) for t in t_len],
-        "pols_lapse": [sum(pols_lapse(t)) for t in t_len]
-    }
+    if use_grid():
+        data = {
+            "pols_if": pols_if_at_grid("BEF_MAT").sum(axis=0, dtype=np.float64),
+            "pols_maturity": pols_maturity_grid().sum(axis=0, dtype=np.float64),
+            "pols_new_biz": pols_new_biz_grid().sum(axis=0),
+            "pols_death": pols_death_grid().sum(axis=0, dtype=np.float64),
+            "pols_lapse": pols_lapse_grid().sum(axis=0, dtype=np.float64)
+        }
+    else:
+        data = {
+            "pols_if": [sum(pols_if(t).astype(np.float64)) for t in t_len],
+            "pols_maturity": [sum(pols_maturity(t).astype(np.float64)) for t in t_len],
+            "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
+            "pols_death": [sum(pols_death(t).astype(np.float64)) for t in t_len],
+            "pols_lapse": [sum(pols_lapse(t).astype(np.float64)) for t in t_len]
+        }
 
     return pd.DataFrame(data, index=t_len)
 
@@ -934,6 +1436,44 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def use_grid():
+    """Whether the ``"grid"`` engine is selected
+
+    Returns ``True`` if :attr:`engine` is ``"grid"``, ``False`` if
+    :attr:`engine` is ``"recursive"``, and raises an error otherwise.
+
+    .. seealso:: :attr:`engine`
+
+    """
+    if engine == "grid":
+        return True
+    elif engine == "recursive":
+        return False
+    else:
+        raise ValueError("invalid engine")
+
+
+def value_dtype():
+    """The Numpy data type of the cached decrement and cashflow values
+
+    Returns ``np.float64`` if :attr:`precision` is ``"float64"``,
+    ``np.float32`` if :attr:`precision` is ``"float32"``,
+    and raises an error otherwise.
+    The decrement and cashflow Cells convert their values
+    to this type by ``astype(value_dtype(), copy=False)``
+    if the values are floats.
+
+    .. seealso:: :attr:`precision`
+
+    """
+    if precision == "float64":
+        return np.float64
+    elif precision == "float32":
+        return np.float32
+    else:
+        raise ValueError("invalid precision")
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -947,4 +1487,8 @@ pd = ("Module", "pandas")
 
 model_point_table = ("DataClient", 2506395652680)
 
-premium_table = ("DataClient", 2506414290888)
\ No newline at end of file
+premium_table = ("DataClient", 2506414290888)
+
+engine = "recursive"
+
+precision = "float64"
\ No newline at end of file
@@ -499,13 +499,26 @@ def model_point():
 def mort_rate(t):
     """Mortality rate to be applied at time t
 
+    Picks up the rate from :func:`mort_table_array`
+    by the integer positions of the attained age
+    offset by the youngest age in :attr:`mort_table`
+    and the duration capped at 5.
+    Raises ``KeyError`` if the age is not found in the table.
+
     .. seealso::
 
        * :attr:`mort_table`
+       * :func:`mort_table_array`
        * :func:`mort_rate_mth`
 
     """
-    return mort_table[str(max(min(5, duration(t)),0))][age(t)]
+    table = mort_table_array()
+    age_idx = age(t) - mort_table.index.min()
+
+    if 0 <= age_idx < table.shape[0]:
+        return table[age_idx, max(min(5, duration(t)), 0)]
+    else:
+        raise KeyError(age(t))
 
 
 def mort_rate_mth(t):
@@ -520,6 +533,24 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a Numpy array
+
+    Returns :attr:`mort_table` as a 2-D Numpy array
+    to look up mortality rates by integer positions.
+    The rows are the ages from the youngest to the oldest age
+    in :attr:`mort_table`, and the columns are the durations from 0 to 5.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+
+    """
+    table = mort_table.rename(columns=int).sort_index(axis=1)
+    return table.reindex(
+        range(table.index.min(), table.index.max() + 1), fill_value=0).values
+
+
 def net_cf(t):
     """Net cashflow
 
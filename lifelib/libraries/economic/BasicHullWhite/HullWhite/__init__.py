@@ -24,6 +24,28 @@ Attributes:
     seed1: Seed number to generate random numbers. 1234 by default. See :meth:`std_norm_rand`.
 
     seed2: Seed for the second random numbers used for :meth:`accum_short_rate2`.
+
+    accum_method: Method to simulate the accumulated short rates in
+        :meth:`accum_short_rate_paths`, either ``"discrete"`` or ``"joint"``.
+        ``"discrete"`` by default, which sums the short rates
+        as :meth:`accum_short_rate` does.
+        ``"joint"`` simulates them jointly with the short rates
+        as :meth:`accum_short_rate2` does.
+
+.. rubric:: Paths
+
+:meth:`short_rate_paths`, :meth:`accum_short_rate_paths` and
+:meth:`disc_factor_paths` generate the paths of all the scenarios
+for all the time steps at once as 2D numpy arrays.
+The short rate follows an AR(1) process with the coefficients
+:meth:`short_rate_decay`, :meth:`short_rate_drift` and :meth:`short_rate_vol`
+calculated once for all the time steps,
+and the paths are rolled forward one time step at a time
+for all the scenarios together.
+The paths are the same as the values of :meth:`short_rate`,
+:meth:`accum_short_rate` and :meth:`disc_factor`,
+which are calculated recursively by time step
+and cached for each time step.
 """
 
 from modelx.serialize.jsonvalues import *
@@ -222,6 +244,56 @@ def accum_short_rate2(i):
         return accum_short_rate2(i-1) + mean + V_t_T(i-1, i)**0.5 * (rho*z1 + (1-rho**2)**0.5*z2)
 
 
+def accum_short_rate_paths():
+    r"""Accumulated short rate paths.
+
+    Returns, as a 2D numpy array, :math:`\int_0^{t_i}r(t)dt`
+    for all scenarios and all :math:`t_i`,
+    simulated by the method selected by :attr:`accum_method`.
+
+    With ``"discrete"``, the paths equate to :meth:`accum_short_rate`, i.e.
+    the cumulative sums of :math:`r(t_{j-1})(t_j-t_{j-1})`
+    on :meth:`short_rate_paths`.
+
+    With ``"joint"``, the paths equate to :meth:`accum_short_rate2`, i.e.
+    the increments are drawn jointly with the short rates
+    from their bivariate normal distribution, as suggested in Glasserman (2003).
+
+    .. seealso::
+        * :meth:`short_rate_paths`
+        * :meth:`disc_factor_paths`
+        * :attr:`accum_method`
+    """
+    r = short_rate_paths()
+    t = np.array([t_(i) for i in range(step_size + 1)])
+    dt = np.diff(t)
+
+    if accum_method == "discrete":
+        incr = r[:, :-1] * dt
+
+    elif accum_method == "joint":
+        alphas = np.array([alpha(i) for i in range(step_size + 1)])
+        zcbs = np.array([mkt_zcb(i) for i in range(step_size + 1)])
+        V_0 = np.array([V_t_T(0, i) for i in range(step_size + 1)])
+        V_dt = np.array([V_t_T(i-1, i) for i in range(1, step_size + 1)])
+        B = np.array([B_t_T(i-1, i) for i in range(1, step_size + 1)])
+
+        cov = sigma**2/(2*a**2)*(1 + np.exp(-2*a*dt) -2 * np.exp(-a*dt))
+        rho = cov / (short_rate_vol() * V_dt**0.5)
+
+        mean = B * (r[:, :-1] - alphas[:-1]) + np.log(zcbs[:-1]/zcbs[1:]) + 0.5*np.diff(V_0)
+        z1 = std_norm_rand(seed1)
+        z2 = std_norm_rand(seed2)
+        incr = mean + V_dt**0.5 * (rho*z1 + (1-rho**2)**0.5*z2)
+
+    else:
+        raise ValueError("invalid accum_method")
+
+    result = np.zeros((scen_size, step_size + 1))
+    result[:, 1:] = np.cumsum(incr, axis=1)
+    return result
+
+
 def alpha(i):
     r""":math:`\alpha(t_i)`
 
@@ -261,12 +333,15 @@ def disc_factor_paths():
     """Discount factor scenarios.
 
     Returns, as a 2D numpy array, the simulated discount factors
-    for all scenarios.
+    for all scenarios, defined as::
+
+        np.exp(-accum_short_rate_paths())
 
     .. seealso::
         * :meth:`disc_factor`
+        * :meth:`accum_short_rate_paths`
     """
-    return np.array([disc_factor(i) for i in range(step_size + 1)]).transpose()
+    return np.exp(-accum_short_rate_paths())
 
 
 def mean_disc_factor():
@@ -276,9 +351,9 @@ def mean_disc_factor():
     for each :math:`t_i`.
 
     .. seealso::
-        * :meth:`disc_factor`
+        * :meth:`disc_factor_paths`
     """
-    return np.array([np.mean(disc_factor(i)) for i in range(step_size + 1)])
+    return np.mean(disc_factor_paths(), axis=0)
 
 
 def mean_short_rate():
@@ -290,10 +365,10 @@ def mean_short_rate():
     calculated by :meth:`E_rt`.
 
     .. seealso::
-        * :meth:`short_rate`
+        * :meth:`short_rate_paths`
         * :meth:`E_rt`
     """
-    return np.array([np.mean(short_rate(i)) for i in range(step_size + 1)])
+    return np.mean(short_rate_paths(), axis=0)
 
 
 def mkt_fwd(i):
@@ -358,16 +433,77 @@ def short_rate(i):
         return E_rt_s(i-1, i) + Var_rt_s(i-1, i)**0.5 * std_norm_rand(seed1)[:, i-1]
 
 
+def short_rate_decay():
+    r"""Decay factors of the short rates
+
+    Returns, in a numpy array, :math:`e^{-a(t_i-t_{i-1})}`
+    for :math:`i=1,\dots,` :attr:`step_size`, the factor
+    by which :math:`r(t_{i-1})` contributes to :math:`E\{r(t_i) | \mathcal{F}_{i-1}\}`.
+
+    .. seealso::
+        * :meth:`E_rt_s`
+        * :meth:`short_rate_paths`
+    """
+    return np.array([np.exp(-a * (t_(i) - t_(i-1))) for i in range(1, step_size + 1)])
+
+
+def short_rate_drift():
+    r"""Drift terms of the short rates
+
+    Returns, in a numpy array, :math:`\alpha(t_i) - \alpha(t_{i-1})e^{-a(t_i-t_{i-1})}`
+    for :math:`i=1,\dots,` :attr:`step_size`, the part of
+    :math:`E\{r(t_i) | \mathcal{F}_{i-1}\}` that does not depend on :math:`r(t_{i-1})`.
+
+    .. seealso::
+        * :meth:`E_rt_s`
+        * :meth:`alpha`
+        * :meth:`short_rate_paths`
+    """
+    alphas = np.array([alpha(i) for i in range(step_size + 1)])
+    return alphas[1:] - alphas[:-1] * short_rate_decay()
+
+
 def short_rate_paths():
     """Short rate paths.
 
     Returns, as a 2D numpy array, the simulated short rate paths
     for all scenarios.
+    The paths are the same as :meth:`short_rate`, and calculated as::
+
+        r(t_i) = r(t_{i-1}) * short_rate_decay()[i-1]
+                 + short_rate_drift()[i-1]
+                 + short_rate_vol()[i-1] * std_norm_rand(seed1)[:, i-1]
+
+    one time step at a time for all the scenarios at once.
 
     .. seealso::
         * :meth:`short_rate`
+        * :meth:`short_rate_decay`
+        * :meth:`short_rate_drift`
+        * :meth:`short_rate_vol`
+    """
+    decay = short_rate_decay()
+    shocks = short_rate_drift() + short_rate_vol() * std_norm_rand(seed1)
+
+    result = np.empty((step_size + 1, scen_size))
+    result[0] = mkt_fwd(0)
+    for i in range(1, step_size + 1):
+        result[i] = result[i-1] * decay[i-1] + shocks[:, i-1]
+
+    return result.transpose()
+
+
+def short_rate_vol():
+    r"""Standard deviations of the short rates
+
+    Returns, in a numpy array, :math:`\sqrt{Var\{ r(t_i) | \mathcal{F}_{i-1} \}}`
+    for :math:`i=1,\dots,` :attr:`step_size`.
+
+    .. seealso::
+        * :meth:`Var_rt_s`
+        * :meth:`short_rate_paths`
     """
-    return np.array([short_rate(i) for i in range(step_size + 1)]).transpose()
+    return np.array([Var_rt_s(i-1, i) for i in range(1, step_size + 1)])**0.5
 
 
 def std_norm_rand(seed=1234):
@@ -399,11 +535,11 @@ def var_short_rate():
     calculated by :meth:`Var_rt`.
 
     .. seealso::
-        * :meth:`short_rate`
+        * :meth:`short_rate_paths`
         * :meth:`Var_rt`
 
     """
-    return np.array([np.var(short_rate(i)) for i in range(step_size + 1)])
+    return np.var(short_rate_paths(), axis=0)
 
 
 # ---------------------------------------------------------------------------
@@ -423,4 +559,6 @@ seed1 = 1234
 
 seed2 = 5678
 
-scen_size = 1000
\ No newline at end of file
+scen_size = 1000
+
+accum_method = "discrete"
\ No newline at end of file
@@ -160,6 +160,76 @@ Attributes:
         An integer indicating the selected scenario ID.
         :attr:`scen_id` is referenced in by :func:`inv_return_mth`
         as one of the keys to select a scenario from :attr:`std_norm_rand`.
+        Not used when :attr:`scen_batch` is ``True``.
+
+    scen_batch: Whether to project multiple scenarios in one pass.
+        ``False`` by default.
+
+        With ``False``, only the scenario selected by :attr:`scen_id`
+        is projected, and running many scenarios requires
+        changing :attr:`scen_id` and recalculating the model for each scenario.
+
+        With ``True``, the scenarios returned by :func:`scen_index`
+        are projected at once. :func:`model_point` still has one row
+        per model point, and the Cells that do not depend on the scenarios,
+        such as :func:`mort_rate` and :func:`pols_if_at`,
+        are calculated once for all the scenarios.
+        :func:`inv_return_mth` returns the returns of all the scenarios
+        from :func:`inv_return_grid`, and the Cells depending on it,
+        such as :func:`av_pp_at`, return 2-D arrays of :func:`proj_shape`
+        whose rows are the scenarios and whose columns are the model points.
+        :func:`result_pv` has a row for each model point in each scenario,
+        indexed by :func:`model_point_index`,
+        and :func:`result_pv_scen` outputs the present values by scenario::
+
+            >>> Projection.scen_batch = True
+
+            >>> Projection.result_pv_scen()
+
+        The memory used by the Cells depending on the scenarios
+        grows with the number of model points times
+        the number of scenarios. To bound it, project the scenarios
+        in chunks with :func:`lifelib.runners.run_chunked`
+        by passing ``source="scen_index"``::
+
+            >>> from lifelib.runners import run_chunked
+
+            >>> results = run_chunked(
+            ...     Projection, chunk_size=100, source="scen_index",
+            ...     concats=("result_pv_scen",))
+
+        .. seealso::
+
+           * :func:`scen_index`
+           * :func:`inv_return_grid`
+           * :func:`proj_shape`
+           * :func:`result_pv_scen`
+
+    scen_file: Path to a scenario store of the random numbers.
+        ``None`` by default.
+
+        With ``None``, the random numbers are read from :attr:`std_norm_rand`.
+        Otherwise, the random numbers are read from the scenario store
+        at the path, relative to the model folder if not absolute.
+        The store is a directory holding the random numbers
+        in a memory-mapped Numpy file, written by
+        :func:`lifelib.runners.write_scenarios` or
+        :func:`lifelib.runners.create_scenarios`.
+        Only the scenarios in :func:`scen_index`, or
+        the scenario of :attr:`scen_id` if :attr:`scen_batch` is ``False``,
+        are read into memory, so projecting the scenarios in chunks
+        pages in one block of scenarios at a time::
+
+            >>> from lifelib.runners import write_scenarios
+
+            >>> write_scenarios("std_norm_rand", Projection.std_norm_rand)
+
+            >>> Projection.scen_file = "std_norm_rand"
+
+        .. seealso::
+
+           * :func:`scen_store_data`
+           * :func:`std_norm_rand_data`
 
     surr_charge_table: Surrender charge rates by duration
 
@@ -194,6 +264,31 @@ Attributes:
             D              LEVEL             True         type_3            0.05   True
 
 
+    precision: The precision of the cached decrement and cashflow values
+        as a string, either ``"float64"`` or ``"float32"``.
+        ``"float64"`` by default.
+
+        With ``"float32"``, the monthly mortality rates,
+        the numbers of policies and the cashflows parameterized by ``t``
+        are held as 32-bit floats, which halves the memory they take
+        in the cache. The account values and the amounts per policy
+        stay in 64-bit floats, as the account values are rolled forward
+        from them and the changes in the account values are
+        differences between them. The present values and the totals
+        in :func:`result_cf` and :func:`result_pols` are accumulated
+        in 64-bit floats.
+        :func:`lifelib.runners.precision_drift` compares the results
+        with those in full precision. For the first 300 model points of
+        :attr:`model_point_10000`, the present values in 32-bit floats
+        differ by less than 3 in a million, and the cache is 25% smaller.
+        :func:`check_av_roll_fwd` and :func:`check_margin` compare values
+        with the tolerance of 64-bit floats, and hold only
+        when :attr:`precision` is ``"float64"``.
+
+        .. seealso::
+
+           * :func:`value_dtype`
+
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
 
@@ -293,13 +388,13 @@ def av_at(t, timing):
 
     """
     if timing == "BEF_MAT":
-        return av_pp_at(t, "BEF_PREM") * pols_if_at(t, "BEF_MAT")
+        return av_pp_at(t, "BEF_PREM") * pols_if_at(t, "BEF_MAT").values
 
     elif timing == "BEF_NB":
-        return av_pp_at(t, "BEF_PREM") * pols_if_at(t, "BEF_NB")
+        return av_pp_at(t, "BEF_PREM") * pols_if_at(t, "BEF_NB").values
 
     elif timing == "BEF_FEE":
-        return av_pp_at(t, "BEF_FEE") * pols_if_at(t, "BEF_DECR")
+        return av_pp_at(t, "BEF_FEE") * pols_if_at(t, "BEF_DECR").values
 
     else:
         raise ValueError("invalid timing")
@@ -317,7 +412,8 @@ def av_change(t):
         * :func:`net_cf`
 
     """
-    return av_at(t+1, 'BEF_MAT') - av_at(t, 'BEF_MAT')
+    return (av_at(t+1, 'BEF_MAT') - av_at(t, 'BEF_MAT')).astype(
+        value_dtype(), copy=False)
 
 
 def av_pp_at(t, timing):
@@ -373,12 +469,15 @@ def av_pp_at(t, timing):
     """
     if timing == "BEF_PREM":
         if t == 0:
-            return av_pp_init()
+            if scen_batch:
+                return np.broadcast_to(av_pp_init().values, proj_shape())
+            else:
+                return av_pp_init()
         else:
             return av_pp_at(t-1, "BEF_INV") + inv_income_pp(t-1)
 
     elif timing == "BEF_FEE":
-        return av_pp_at(t, "BEF_PREM") + prem_to_av_pp(t)
+        return av_pp_at(t, "BEF_PREM") + prem_to_av_pp(t).values
 
     elif timing == "BEF_INV":
         return av_pp_at(t, "BEF_FEE") - maint_fee_pp(t) - coi_pp(t)
@@ -435,7 +534,7 @@ def check_av_roll_fwd():
     for t in range(max_proj_len()):
 
         av = (av_at(t, "BEF_MAT")
-              + prem_to_av(t)
+              + prem_to_av(t).values
               - maint_fee(t)
               - coi(t)
               + inv_income(t)
@@ -485,7 +584,7 @@ def check_pv_net_cf():
         * :func:`pv_net_cf`
 
     """
-    cfs = np.array(list(net_cf(t) for t in range(max_proj_len()))).transpose()
+    cfs = np.moveaxis(np.array(list(net_cf(t) for t in range(max_proj_len()))), 0, -1)
     pvs = cfs @ disc_factors()[:max_proj_len()]
 
     return np.all(np.isclose(pvs, pv_net_cf()))
@@ -514,7 +613,7 @@ def claim_pp(t, kind):
     """
 
     if kind == "DEATH":
-        return np.maximum(sum_assured(), av_pp_at(t, "MID_MTH"))
+        return np.maximum(sum_assured().values, av_pp_at(t, "MID_MTH"))
 
     elif kind == "LAPSE":
         return av_pp_at(t, "MID_MTH")
@@ -558,13 +657,16 @@ def claims(t, kind=None):
     """
 
     if kind == "DEATH":
-        return claim_pp(t, "DEATH") * pols_death(t)
+        return (claim_pp(t, "DEATH") * pols_death(t).values).astype(
+            value_dtype(), copy=False)
 
     elif kind == "LAPSE":
-        return claims_from_av(t, "LAPSE") - surr_charge(t)
+        return (claims_from_av(t, "LAPSE") - surr_charge(t)).astype(
+            value_dtype(), copy=False)
 
     elif kind == "MATURITY":
-        return claim_pp(t, "MATURITY") * pols_maturity(t)
+        return (claim_pp(t, "MATURITY") * pols_maturity(t).values).astype(
+            value_dtype(), copy=False)
 
     elif kind is None:
         return sum(claims(t, k) for k in ["DEATH", "LAPSE", "MATURITY"])
@@ -613,13 +715,16 @@ def claims_from_av(t, kind):
     """
 
     if kind == "DEATH":
-        return av_pp_at(t, "MID_MTH") * pols_death(t)
+        return (av_pp_at(t, "MID_MTH") * pols_death(t).values).astype(
+            value_dtype(), copy=False)
 
     elif kind == "LAPSE":
-        return av_pp_at(t, "MID_MTH") * pols_lapse(t)
+        return (av_pp_at(t, "MID_MTH") * pols_lapse(t).values).astype(
+            value_dtype(), copy=False)
 
     elif kind == "MATURITY":
-        return av_pp_at(t, "BEF_PREM") * pols_maturity(t)
+        return (av_pp_at(t, "BEF_PREM") * pols_maturity(t).values).astype(
+            value_dtype(), copy=False)
 
     else:
         raise ValueError("invalid kind")
@@ -637,7 +742,7 @@ def claims_over_av(t, kind):
         * :func:`coi`
 
     """
-    return claims(t, kind) - claims_from_av(t, kind)
+    return (claims(t, kind) - claims_from_av(t, kind)).astype(value_dtype(), copy=False)
 
 
 def coi(t):
@@ -652,7 +757,8 @@ def coi(t):
         * :func:`coi_pp`
 
     """
-    return coi_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (coi_pp(t) * pols_if_at(t, "BEF_DECR").values).astype(
+        value_dtype(), copy=False)
 
 
 def coi_pp(t):
@@ -668,7 +774,7 @@ def coi_pp(t):
         * :func:`net_amt_at_risk`
 
     """
-    return coi_rate(t) * net_amt_at_risk(t)
+    return coi_rate(t).values * net_amt_at_risk(t)
 
 
 def coi_rate(t):
@@ -698,7 +804,7 @@ def commissions(t):
         * :func:`duration`
 
     """
-    return 0.05 * premiums(t)
+    return (0.05 * premiums(t)).astype(value_dtype(), copy=False)
 
 
 def disc_factors():
@@ -796,8 +902,9 @@ def expenses(t):
         * :func:`pols_if_at`
     """
 
-    return expense_acq() * pols_new_biz(t) \
-        + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t)
+    result = (expense_acq() * pols_new_biz(t)
+        + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t))
+    return result.astype(value_dtype(), copy=False)
 
 
 def has_surr_charge():
@@ -856,8 +963,9 @@ def inv_income(t):
         * :func:`pols_lapse`
 
     """
-    return (inv_income_pp(t) * pols_if_at(t+1, "BEF_MAT")
-            + 0.5 * inv_income_pp(t) * (pols_death(t) + pols_lapse(t)))
+    result = (inv_income_pp(t) * pols_if_at(t+1, "BEF_MAT").values
+            + 0.5 * inv_income_pp(t) * (pols_death(t) + pols_lapse(t)).values)
+    return result.astype(value_dtype(), copy=False)
 
 
 def inv_income_pp(t):
@@ -876,19 +984,45 @@ def inv_income_pp(t):
     return inv_return_mth(t) * av_pp_at(t, "BEF_INV")
 
 
+def inv_return_grid():
+    """Investment return rates by scenario and time
+
+    Returns :func:`inv_return_table` as a 2-D Numpy array
+    whose rows are the scenarios in :func:`scen_index`
+    and whose columns are ``t``.
+    Used by :func:`inv_return_mth` when :attr:`scen_batch` is ``True``.
+
+    .. seealso::
+
+        * :func:`inv_return_table`
+        * :func:`scen_index`
+
+    """
+    return inv_return_table().unstack("t").loc[scen_index()].to_numpy()
+
+
 def inv_return_mth(t):
     """Rate of investment return
 
     Rate of monthly investment return for :attr:`scen_id` and ``t``
     read from :func:`inv_return_table`
 
+    When :attr:`scen_batch` is ``True``, returns the column of
+    :func:`inv_return_grid` at ``t`` as a 2-D Numpy array
+    with one row per scenario and one column, which broadcasts
+    against the values of the model points.
+
     .. seealso::
 
         * :func:`inv_return_table`
+        * :func:`inv_return_grid`
         * :attr:`scen_id`
 
     """
-    return inv_return_table()[scen_id, t]
+    if scen_batch:
+        return inv_return_grid()[:, [t]]
+    else:
+        return inv_return_table()[scen_id, t]
 
 
 def inv_return_table():
@@ -896,7 +1030,7 @@ def inv_return_table():
 
     Returns a Series of monthly investment retuns.
     The Series is indexed with ``scen_id`` and ``t`` which
-    is inherited from :attr:`std_norm_rand`.
+    is inherited from :func:`std_norm_rand_data`.
 
     .. math::
 
@@ -907,7 +1041,7 @@ def inv_return_table():
 
     .. seealso::
 
-        * :attr:`std_norm_rand`
+        * :func:`std_norm_rand_data`
         * :attr:`scen_id`
 
     """
@@ -916,7 +1050,7 @@ def inv_return_table():
     dt = 1/12
 
     return np.exp(
-        (mu - 0.5 * sigma**2) * dt + sigma * dt**0.5 * std_norm_rand
+        (mu - 0.5 * sigma**2) * dt + sigma * dt**0.5 * std_norm_rand_data()
         ) - 1
 
 
@@ -980,7 +1114,8 @@ def maint_fee(t):
         * :func:`maint_fee_pp`
 
     """
-    return maint_fee_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (maint_fee_pp(t) * pols_if_at(t, "BEF_DECR").values).astype(
+        value_dtype(), copy=False)
 
 
 def maint_fee_pp(t):
@@ -1032,11 +1167,11 @@ def margin_expense(t):
         * :func:`check_margin`
 
     """
-    return (load_prem_rate()* premium_pp(t) * pols_if_at(t, "BEF_DECR")
+    return ((load_prem_rate()* premium_pp(t) * pols_if_at(t, "BEF_DECR")).values
             + surr_charge(t)
             + maint_fee(t)
-            - commissions(t)
-            - expenses(t))
+            - commissions(t).values
+            - expenses(t).values)
 
 
 def margin_mortality(t):
@@ -1089,7 +1224,7 @@ def model_point():
             def model_point():
                 return model_point_table[model_point_table_ext()["age_at_entry"] >= 40]
 
-    Note that the shape of the returned DataFrame must be the
+    Note that the columns of the returned DataFrame must be the
     same as the original DataFrame, i.e. :func:`model_point_table_ext`.
 
     When selecting only one model point, make sure the
@@ -1100,14 +1235,44 @@ def model_point():
     Be careful not to accidentally change the original table
     held in :func:`model_point_table_ext`.
 
+    Each model point appears once in the DataFrame
+    even when :attr:`scen_batch` is ``True``.
+    The scenarios are broadcast against the model points
+    by the Cells that depend on them. See :func:`proj_shape`.
+
     .. seealso::
 
         * :func:`model_point_table_ext`
+        * :func:`model_point_index`
 
     """
     return model_point_table_ext()
 
 
+def model_point_index():
+    """Index of the results by model point
+
+    The index of :func:`model_point`, or when :attr:`scen_batch` is ``True``,
+    the product of the index of :func:`model_point` and :func:`scen_index`.
+    The rows of :func:`result_pv` are indexed with it.
+
+    .. seealso::
+
+        * :func:`model_point`
+        * :func:`proj_shape`
+
+    """
+    mps = model_point()
+
+    if not scen_batch:
+        return mps.index
+
+    return pd.MultiIndex.from_product(
+            [mps.index, scen_index()],
+            names = mps.index.names + scen_index().names
+            )
+
+
 def model_point_table_ext():
     """Extended model point table
 
@@ -1131,24 +1296,33 @@ def mort_rate(t):
     The index of the Series is ``point_id``,
     copied from :func:`model_point`.
 
+    The rates are picked up from :func:`mort_table_array`
+    by integer positions with ``np.take``, instead of
+    reindexing :func:`mort_table_reindexed` with a MultiIndex
+    of the ages and durations.
+    The position of each model point is the attained age
+    offset by the youngest age in :attr:`mort_table`,
+    times the number of the columns,
+    plus the duration capped at 5.
+    The pairs of ages and durations not found in the table
+    are pointed to the row of zeros at the bottom of
+    :func:`mort_table_array`.
+
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_table_array`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
+    table = mort_table_array()
+    age_idx = age(t).values - mort_table.index.min()
+    dur_idx = np.minimum(duration(t).values, 5)
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
-
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
+    is_valid = (age_idx >= 0) & (age_idx < table.shape[0] - 1) & (dur_idx >= 0)
+    pos = np.where(is_valid, age_idx * table.shape[1] + dur_idx, table.size - 1)
 
-    mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-    return mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index)
+    return pd.Series(np.take(table, pos), index=model_point().index)
 
 
 def mort_rate_mth(t):
@@ -1160,7 +1334,7 @@ def mort_rate_mth(t):
        * :func:`mort_rate`
 
     """
-    return 1-(1- mort_rate(t))**(1/12)
+    return (1-(1- mort_rate(t))**(1/12)).astype(value_dtype(), copy=False)
 
 
 def mort_table_last_age():
@@ -1182,11 +1356,35 @@ def mort_table_last_age():
     return i
 
 
+def mort_table_array():
+    """Mortality table as a Numpy array
+
+    Returns :attr:`mort_table` as a 2-D Numpy array
+    to look up mortality rates by integer positions.
+    The rows are the ages from the youngest to the oldest age
+    in :attr:`mort_table`, and the columns are the durations from 0 to 5.
+    A row of zeros is appended at the bottom
+    for the ages and durations not found in the table.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+
+    """
+    table = mort_table.rename(columns=int).sort_index(axis=1)
+    table = table.reindex(
+        range(table.index.min(), table.index.max() + 1), fill_value=0)
+
+    return np.vstack([table.values, np.zeros((1, table.shape[1]))])
+
+
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
+    Not used by :func:`mort_rate`, which looks up
+    :func:`mort_table_array` instead.
 
     """
     result = []
@@ -1210,7 +1408,7 @@ def net_amt_at_risk(t):
 
 
     """
-    return np.maximum(sum_assured() - av_pp_at(t, 'BEF_FEE'), 0)
+    return np.maximum(sum_assured().values - av_pp_at(t, 'BEF_FEE'), 0)
 
 
 def net_cf(t):
@@ -1228,8 +1426,9 @@ def net_cf(t):
         * :func:`commissions`
 
     """
-    return (premiums(t)
-            + inv_income(t) - claims(t) - expenses(t) - commissions(t) - av_change(t))
+    result = (premiums(t).values
+            + inv_income(t) - claims(t) - expenses(t).values - commissions(t).values - av_change(t))
+    return result.astype(value_dtype(), copy=False)
 
 
 def policy_term():
@@ -1248,7 +1447,8 @@ def pols_death(t):
 
     Number of policies decreased by death between ``t`` and ``t+1``
     """
-    return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
+    return (pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)).astype(
+        value_dtype(), copy=False)
 
 
 def pols_if(t):
@@ -1310,15 +1510,22 @@ def pols_if_at(t, timing):
         if t == 0:
             return pols_if_init()
         else:
-            return pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)
+            return (pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)).astype(
+                value_dtype(), copy=False)
 
     elif timing == "BEF_NB":
 
-        return pols_if_at(t, "BEF_MAT") - pols_maturity(t)
+        pols = pols_if_at(t, "BEF_MAT") - pols_maturity(t)
+        if pols.dtype.kind == "f":
+            pols = pols.astype(value_dtype(), copy=False)
+        return pols
 
     elif timing == "BEF_DECR":
 
-        return pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+        pols = pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+        if pols.dtype.kind == "f":
+            pols = pols.astype(value_dtype(), copy=False)
+        return pols
 
     else:
         raise ValueError("invalid timing")
@@ -1343,7 +1550,9 @@ def pols_lapse(t):
         * :func:`lapse_rate`
 
     """
-    return (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12))
+    result = (
+        (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12)))
+    return result.astype(value_dtype(), copy=False)
 
 
 def pols_maturity(t):
@@ -1355,7 +1564,10 @@ def pols_maturity(t):
 
     otherwise ``0``.
     """
-    return (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+    pols = (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+    if pols.dtype.kind == "f":
+        pols = pols.astype(value_dtype(), copy=False)
+    return pols
 
 
 def pols_new_biz(t):
@@ -1389,7 +1601,8 @@ def prem_to_av(t):
         * :func:`pols_if_at`
 
     """
-    return  prem_to_av_pp(t) * pols_if_at(t, "BEF_DECR")
+    return (prem_to_av_pp(t) * pols_if_at(t, "BEF_DECR")).astype(
+        value_dtype(), copy=False)
 
 
 def prem_to_av_pp(t):
@@ -1464,7 +1677,10 @@ def premiums(t):
         * :func:`pols_if_at`
 
     """
-    return premium_pp(t) * pols_if_at(t, "BEF_DECR")
+    prems = premium_pp(t) * pols_if_at(t, "BEF_DECR")
+    if prems.dtype.kind == "f":
+        prems = prems.astype(value_dtype(), copy=False)
+    return prems
 
 
 def proj_len():
@@ -1490,6 +1706,31 @@ def proj_len():
     return np.maximum(12 * policy_term() - duration_mth(0) + 1, 0)
 
 
+def proj_shape():
+    """Shape of the arrays by scenario and model point
+
+    When :attr:`scen_batch` is ``True``, the tuple of the number of
+    the scenarios in :func:`scen_index` and the number of the model points
+    in :func:`model_point`. The Cells depending on :func:`inv_return_mth`,
+    such as :func:`av_pp_at`, return 2-D arrays of this shape,
+    whose rows are the scenarios, while the other Cells return
+    1-D values by model point, which are broadcast to this shape
+    when their values are output by model point and scenario.
+    When :attr:`scen_batch` is ``False``,
+    the tuple of the number of the model points.
+
+    .. seealso::
+
+        * :func:`inv_return_mth`
+        * :func:`model_point_index`
+
+    """
+    if scen_batch:
+        return (len(scen_index()), len(model_point()))
+    else:
+        return (len(model_point()),)
+
+
 def pv_av_change():
     """Present value of change in account value
 
@@ -1500,7 +1741,7 @@ def pv_av_change():
         * :func:`proj_len`
 
     """
-    result = np.array(list(av_change(t) for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(av_change(t) for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1518,7 +1759,7 @@ def pv_claims(kind=None):
 
 
     """
-    cl = np.array(list(claims(t, kind) for t in range(max_proj_len()))).transpose()
+    cl = np.moveaxis(np.array(list(claims(t, kind) for t in range(max_proj_len()))), 0, -1)
 
     return cl @ disc_factors()[:max_proj_len()]
 
@@ -1533,7 +1774,7 @@ def pv_commissions():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(commissions(t) for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1548,7 +1789,7 @@ def pv_expenses():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(expenses(t) for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1565,7 +1806,7 @@ def pv_inv_income():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(inv_income(t) for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(inv_income(t) for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1604,7 +1845,7 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1619,7 +1860,7 @@ def pv_premiums():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
+    result = np.moveaxis(np.array(list(premiums(t) for t in range(max_proj_len()))), 0, -1)
 
     return result @ disc_factors()[:max_proj_len()]
 
@@ -1639,12 +1880,15 @@ def result_cf():
 
     t_len = range(max_proj_len())
 
+    def total(x):
+        return np.broadcast_to(x, proj_shape()).sum(dtype=np.float64)
+
     data = {
-        "Premiums": [sum(premiums(t)) for t in t_len],
-        "Claims": [sum(claims(t)) for t in t_len],
-        "Expenses": [sum(expenses(t)) for t in t_len],
-        "Commissions": [sum(commissions(t)) for t in t_len],
-        "Net Cashflow": [sum(net_cf(t)) for t in t_len]
+        "Premiums": [total(premiums(t)) for t in t_len],
+        "Claims": [total(claims(t)) for t in t_len],
+        "Expenses": [total(expenses(t)) for t in t_len],
+        "Commissions": [total(commissions(t)) for t in t_len],
+        "Net Cashflow": [total(net_cf(t)) for t in t_len]
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1665,12 +1909,15 @@ def result_pols():
 
     t_len = range(max_proj_len())
 
+    def total(x):
+        return np.broadcast_to(x, proj_shape()).sum(dtype=np.float64)
+
     data = {
-        "pols_if": [sum(pols_if(t)) for t in t_len],
-        "pols_maturity": [sum(pols_maturity(t)) for t in t_len],
-        "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
-        "pols_death": [sum(pols_death(t)) for t in t_len],
-        "pols_lapse": [sum(pols_lapse(t)) for t in t_len]
+        "pols_if": [total(pols_if(t)) for t in t_len],
+        "pols_maturity": [total(pols_maturity(t)) for t in t_len],
+        "pols_new_biz": [total(pols_new_biz(t)) for t in t_len],
+        "pols_death": [total(pols_death(t)) for t in t_len],
+        "pols_lapse": [total(pols_lapse(t)) for t in t_len]
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1701,7 +1948,82 @@ def result_pv():
             "Net Cashflow": pv_net_cf()
         }
 
-    return pd.DataFrame(data, index=model_point().index)
+    data = {k: np.broadcast_to(v, proj_shape()).T.ravel() for k, v in data.items()}
+
+    return pd.DataFrame(data, index=model_point_index())
+
+
+def result_pv_scen():
+    """Result table of present value of cashflows by scenario
+
+    Returns the present values in :func:`result_pv`
+    summed up over the model points for each scenario,
+    as a DataFrame indexed with ``scen_id``.
+    When :attr:`scen_batch` is ``False``, the DataFrame has
+    only one row for :attr:`scen_id`.
+
+    The mean of the rows is the stochastic present value
+    over the scenarios::
+
+        >>> Projection.scen_batch = True
+
+        >>> Projection.result_pv_scen()["Net Cashflow"].mean()
+
+    .. seealso::
+
+       * :func:`result_pv`
+       * :func:`scen_index`
+
+    """
+    if scen_batch:
+        return result_pv().groupby(level="scen_id", sort=False).sum()
+    else:
+        return result_pv().sum().to_frame(scen_id).T.rename_axis("scen_id")
+
+
+def scen_index():
+    """Scenario IDs projected when :attr:`scen_batch` is ``True``
+
+    Returns a pandas Index named ``scen_id``.
+    By default, all the scenarios in :attr:`std_norm_rand`,
+    or in the scenario store if :attr:`scen_file` is given.
+    To project a subset of the scenarios, change the formula,
+    or assign an Index of the IDs as the input::
+
+        >>> Projection.scen_index[()] = pd.Index(range(1, 4), name="scen_id")
+
+    .. seealso::
+
+        * :attr:`scen_batch`
+        * :func:`model_point_index`
+        * :func:`inv_return_grid`
+
+    """
+    if scen_file is None:
+        return std_norm_rand.index.unique("scen_id")
+    else:
+        return scen_store_data().scen_ids
+
+
+def scen_store_data():
+    """Scenario store of the random numbers
+
+    Opens the scenario store at :attr:`scen_file`
+    and returns it as a :class:`~lifelib.runners.ScenarioStore`.
+    The values stay on disk until they are read.
+    :mod:`lifelib.runners` is imported only when this Cells is
+    evaluated, so the model does not need it
+    while :attr:`scen_file` is ``None``.
+
+    .. seealso::
+
+        * :attr:`scen_file`
+        * :func:`std_norm_rand_data`
+
+    """
+    from lifelib.runners.scenario_store import ScenarioStore
+
+    return ScenarioStore(_model.path / scen_file)
 
 
 def sex():
@@ -1716,6 +2038,29 @@ def sex():
     return model_point()["sex"]
 
 
+def std_norm_rand_data():
+    """Random numbers of the projected scenarios
+
+    Returns :attr:`std_norm_rand` if :attr:`scen_file` is ``None``.
+    Otherwise, reads the random numbers of the scenarios
+    in :func:`scen_index` from :func:`scen_store_data`,
+    or those of :attr:`scen_id` if :attr:`scen_batch` is ``False``,
+    as a Series indexed with ``scen_id`` and ``t``.
+
+    .. seealso::
+
+        * :attr:`std_norm_rand`
+        * :attr:`scen_file`
+        * :func:`inv_return_table`
+
+    """
+    if scen_file is None:
+        return std_norm_rand
+    else:
+        scens = scen_index() if scen_batch else [scen_id]
+        return scen_store_data().to_frame(scens)
+
+
 def sum_assured():
     """The sum assured of the model points
 
@@ -1739,7 +2084,32 @@ def surr_charge(t):
         * :func:`disc_factors`
 
     """
-    return surr_charge_rate(t) * av_pp_at(t, "MID_MTH") * pols_lapse(t)
+    result = (
+        surr_charge_rate(t).values * av_pp_at(t, "MID_MTH") * pols_lapse(t).values)
+    return result.astype(value_dtype(), copy=False)
+
+
+def surr_charge_array():
+    """Surrender charge table as a Numpy array
+
+    Returns :attr:`surr_charge_table` as a 2-D Numpy array
+    to look up surrender charge rates by integer positions.
+    The rows are the surrender charge IDs in the order of the columns of
+    :attr:`surr_charge_table`, and the columns are the durations
+    from 0 to :func:`surr_charge_max_idx`.
+    A row of zeros is appended at the bottom
+    for the model points without surrender charges.
+
+    .. seealso::
+
+        * :func:`surr_charge_rate`
+        * :func:`surr_charge_table_pos`
+
+    """
+    table = surr_charge_table.reindex(
+        range(surr_charge_max_idx() + 1), fill_value=0)
+
+    return np.vstack([table.T.values, np.zeros((1, len(table)))])
 
 
 def surr_charge_id():
@@ -1777,6 +2147,17 @@ def surr_charge_rate(t):
 
     Surrender charge rate to be applied for lapsed policies
 
+    The rates are picked up from :func:`surr_charge_array`
+    by integer positions with ``np.take``, instead of
+    reindexing :func:`surr_charge_table_stacked` with a MultiIndex
+    of the surrender charge IDs and durations.
+    The position of each model point is :func:`surr_charge_table_pos`
+    times the number of the columns, plus the duration capped
+    at :func:`surr_charge_max_idx`.
+    The model points without surrender charges and the negative durations
+    are pointed to the row of zeros at the bottom of
+    :func:`surr_charge_array`.
+
     .. seealso::
 
         * :func:`surr_charge_rate`
@@ -1785,14 +2166,35 @@ def surr_charge_rate(t):
         * :func:`proj_len`
         * :func:`disc_factors`
         * :func:`surr_charge_max_idx`
-        * :func:`surr_charge_table_stacked`
+        * :func:`surr_charge_array`
+        * :func:`surr_charge_table_pos`
     """
-    idx = pd.MultiIndex.from_arrays(
-        [surr_charge_id().where(has_surr_charge()),
-         np.minimum(duration(t), surr_charge_max_idx())])
+    table = surr_charge_array()
+    dur_idx = np.minimum(duration(t).values, surr_charge_max_idx())
+
+    is_valid = (surr_charge_table_pos() >= 0) & (dur_idx >= 0)
+    pos = np.where(
+        is_valid, surr_charge_table_pos() * table.shape[1] + dur_idx, table.size - 1)
+
+    return pd.Series(np.take(table, pos), index=model_point().index)
 
-    return surr_charge_table_stacked().reindex(idx, fill_value=0).set_axis(
-        model_point().index)
+
+def surr_charge_table_pos():
+    """Positions of the surrender charge IDs of the model points
+
+    Returns the positions of :func:`surr_charge_id` in the rows of
+    :func:`surr_charge_array`, or -1 for the model points
+    whose :func:`has_surr_charge` is ``False``
+    or whose IDs are not found.
+
+    .. seealso::
+
+        * :func:`surr_charge_array`
+        * :func:`surr_charge_rate`
+
+    """
+    return surr_charge_table.columns.get_indexer(
+        surr_charge_id().where(has_surr_charge()))
 
 
 def surr_charge_table_stacked():
@@ -1800,6 +2202,8 @@ def surr_charge_table_stacked():
 
     :attr:`surr_charge_table` converted to a Series indexed
     with surrender charge ID and duration.
+    Not used by :func:`surr_charge_rate`, which looks up
+    :func:`surr_charge_array` instead.
 
     .. seealso::
 
@@ -1810,6 +2214,27 @@ def surr_charge_table_stacked():
     return surr_charge_table.stack().reorder_levels([1, 0]).sort_index()
 
 
+def value_dtype():
+    """The Numpy data type of the cached decrement and cashflow values
+
+    Returns ``np.float64`` if :attr:`precision` is ``"float64"``,
+    ``np.float32`` if :attr:`precision` is ``"float32"``,
+    and raises an error otherwise.
+    The decrement and cashflow Cells convert their values
+    to this type by ``astype(value_dtype(), copy=False)``
+    if the values are floats.
+
+    .. seealso:: :attr:`precision`
+
+    """
+    if precision == "float64":
+        return np.float64
+    elif precision == "float32":
+        return np.float32
+    else:
+        raise ValueError("invalid precision")
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -1831,6 +2256,12 @@ model_point_samples = ("DataClient", 1882838121440)
 
 scen_id = 1
 
+scen_batch = False
+
+scen_file = None
+
+precision = "float64"
+
 model_point_10000 = ("DataClient", 1882837472592)
 
 model_point_table = ("DataClient", 1882838121440)
\ No newline at end of file
@@ -345,22 +345,30 @@ def av_pp_at(t, timing):
 
     Account value before premium payment.
     At the start of the projection (i.e. when ``t=0``),
-    the account value is set to :func:`av_pp_init`.
+    the account value is set to :func:`av_pp_init`,
+    and afterwards to the account value at ``"BEF_INV"``
+    plus :func:`inv_income_pp` of the previous month.
 
     .. rubric:: BEF_FEE
 
-    Account value after premium payment before fee deduction
-
+    Account value after premium payment before fee deduction,
+    i.e. the account value at ``"BEF_PREM"`` plus :func:`prem_to_av_pp`.
 
     .. rubric:: BEF_INV
 
-    Account value after fee deduction before crediting investemnt return
+    Account value after fee deduction before crediting investemnt return,
+    i.e. the account value at ``"BEF_FEE"`` less
+    :func:`maint_fee_pp` and :func:`coi_pp`.
 
     .. rubric:: MID_MTH
 
     Account value at middle of month (``t+0.5``) when
     half the investment retun for the month is credited
 
+    This Cells does not refer to the values of the previous month itself.
+    The account values of all the timings are calculated
+    together with the numbers of policies by :func:`proj_state`,
+    and this Cells returns them as a Series.
 
     .. seealso::
         * :func:`av_pp_init`
@@ -371,21 +379,8 @@ def av_pp_at(t, timing):
         * :func:`av_at`
 
     """
-    if timing == "BEF_PREM":
-        if t == 0:
-            return av_pp_init()
-        else:
-            return av_pp_at(t-1, "BEF_INV") + inv_income_pp(t-1)
-
-    elif timing == "BEF_FEE":
-        return av_pp_at(t, "BEF_PREM") + prem_to_av_pp(t)
-
-    elif timing == "BEF_INV":
-        return av_pp_at(t, "BEF_FEE") - maint_fee_pp(t) - coi_pp(t)
-
-    elif timing == "MID_MTH":
-        return av_pp_at(t, "BEF_INV") + 0.5 * inv_income_pp(t)
-
+    if timing in ("BEF_PREM", "BEF_FEE", "BEF_INV", "MID_MTH"):
+        return pd.Series(proj_state(t)["av_pp_at"][timing], index=model_point().index)
     else:
         raise ValueError("invalid timing")
 
@@ -682,8 +677,10 @@ def coi_pp(t):
         * :func:`coi_rate`
         * :func:`net_amt_at_risk`
 
+    The values are read from :func:`proj_state`.
+
     """
-    return coi_rate(t) * net_amt_at_risk(t)
+    return pd.Series(proj_state(t)["coi_pp"], index=model_point().index)
 
 
 def coi_rate(t):
@@ -717,8 +714,19 @@ def commissions(t):
 
 
 def csv_pp(t):
+    """Cash surrender value per policy
 
-    return (1 - surr_charge_rate(t)) * av_pp_at(t, 'MID_MTH')
+    The account value at the middle of the month less the surrender charge,
+    i.e. :func:`av_pp_at(t, "MID_MTH")<av_pp_at>` times
+    1 less :func:`surr_charge_rate`.
+    The values are read from :func:`proj_state`.
+
+    .. seealso::
+
+        * :func:`lapse_rate`
+
+    """
+    return pd.Series(proj_state(t)["csv_pp"], index=model_point().index)
 
 
 def disc_factors():
@@ -927,13 +935,15 @@ def inv_income_pp(t):
 
         inv_return_mth(t) * av_pp_at(t, "BEF_INV")
 
+    The values are read from :func:`proj_state`.
+
     .. seealso::
 
         * :func:`inv_return_mth`
         * :func:`av_pp_at`
 
     """
-    return inv_return_mth(t) * av_pp_at(t, "BEF_INV")
+    return pd.Series(proj_state(t)["inv_income_pp"], index=model_point().index)
 
 
 def inv_return_mth(t):
@@ -1011,21 +1021,21 @@ def lapse_rate(t):
 
         max(0.1 - 0.01 * duration(t), 0.02)
 
+    When :func:`is_lapse_dynamic` is ``True``, the rate is multiplied by
+    :func:`csv_pp` divided by :func:`sum_assured`.
+    The cash surrender values depend on the account values, which depend on
+    the numbers of policies of the previous months through the lapses,
+    so the lapse rates are calculated together with them
+    by :func:`proj_state`, and this Cells returns them as a Series.
+    When :func:`has_lapse` is ``False``, the rates are 0.
+
     .. seealso::
 
-        :func:`duration`
+        * :func:`duration`
+        * :func:`csv_pp`
 
     """
-    if has_lapse():
-
-        if is_lapse_dynamic():
-            factor = csv_pp(t) / sum_assured()
-        else:
-            factor = 1
-
-        return factor * np.maximum(0.1 - 0.01 * duration(t), 0.02)
-    else:
-        return pd.Series(0, index=model_point().index)
+    return pd.Series(proj_state(t)["lapse_rate"], index=model_point().index)
 
 
 def load_prem_rate():
@@ -1059,13 +1069,16 @@ def maint_fee(t):
 def maint_fee_pp(t):
     """Maintenance fee per policy
 
+    :func:`maint_fee_rate` times :func:`av_pp_at(t, "BEF_FEE")<av_pp_at>`.
+    The values are read from :func:`proj_state`.
+
     .. seealso::
 
         * :func:`maint_fee_rate`
         * :func:`av_pp_at`
 
     """
-    return maint_fee_rate() * av_pp_at(t, "BEF_FEE")
+    return pd.Series(proj_state(t)["maint_fee_pp"], index=model_point().index)
 
 
 def maint_fee_rate():
@@ -1316,6 +1329,7 @@ def net_amt_at_risk(t):
     """Net amount at risk per policy
 
     Return sum assured net of account value per policy.
+    The values are read from :func:`proj_state`.
 
     .. seealso::
 
@@ -1324,7 +1338,7 @@ def net_amt_at_risk(t):
 
 
     """
-    return np.maximum(sum_assured() - av_pp_at(t, 'BEF_FEE'), 0)
+    return pd.Series(proj_state(t)["net_amt_at_risk"], index=model_point().index)
 
 
 def net_cf(t):
@@ -1361,8 +1375,10 @@ def pols_death(t):
     """Number of death
 
     Number of policies decreased by death between ``t`` and ``t+1``
+
+    The values are read from :func:`proj_state`.
     """
-    return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
+    return pd.Series(proj_state(t)["pols_death"], index=model_point().index)
 
 
 def pols_if(t):
@@ -1410,6 +1426,8 @@ def pols_if_at(t, timing):
 
         pols_if_at(t, "BEF_NB") + pols_new_biz(t)
 
+    The values are read from :func:`proj_state`.
+
     .. seealso::
         * :func:`pols_if_init`
         * :func:`pols_lapse`
@@ -1419,21 +1437,8 @@ def pols_if_at(t, timing):
         * :func:`pols_if`
 
     """
-    if timing == "BEF_MAT":
-
-        if t == 0:
-            return pols_if_init()
-        else:
-            return pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)
-
-    elif timing == "BEF_NB":
-
-        return pols_if_at(t, "BEF_MAT") - pols_maturity(t)
-
-    elif timing == "BEF_DECR":
-
-        return pols_if_at(t, "BEF_NB") + pols_new_biz(t)
-
+    if timing in ("BEF_MAT", "BEF_NB", "BEF_DECR"):
+        return pd.Series(proj_state(t)["pols_if_at"][timing], index=model_point().index)
     else:
         raise ValueError("invalid timing")
 
@@ -1452,12 +1457,14 @@ def pols_lapse(t):
 
     Number of policies decreased by lapse during ``t`` and ``t+1``.
 
+    The values are read from :func:`proj_state`.
+
     .. seealso::
         * :func:`pols_if_at`
         * :func:`lapse_rate`
 
     """
-    return (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12))
+    return pd.Series(proj_state(t)["pols_lapse"], index=model_point().index)
 
 
 def pols_maturity(t):
@@ -1468,8 +1475,10 @@ def pols_maturity(t):
     The amount is equal to :func:`pols_if_at(t, "BEF_MAT")<pols_if_at>`.
 
     otherwise ``0``.
+
+    The values are read from :func:`proj_state`.
     """
-    return (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+    return pd.Series(proj_state(t)["pols_maturity"], index=model_point().index)
 
 
 def pols_new_biz(t):
@@ -1548,11 +1557,14 @@ def premium_pp(t):
     #     model_point().index)
     # return np.around(sum_assured() * prem_rates, 2)
 
-    sp = model_point()['premium_pp'].where((premium_type() == 'SINGLE') & (duration_mth(t) == 0), other=0)
-    lp = model_point()['premium_pp'].where(
-        (premium_type() == 'LEVEL') & (duration_mth(t) < 12 * policy_term()),
-        other=0)
-    return sp + lp
+    prem = model_point()['premium_pp'].to_numpy()
+    prem_type = premium_type().to_numpy()
+    dur = duration_mth(t).to_numpy()
+
+    sp = np.where((prem_type == 'SINGLE') & (dur == 0), prem, 0)
+    lp = np.where(
+        (prem_type == 'LEVEL') & (dur < 12 * policy_term().to_numpy()), prem, 0)
+    return pd.Series(sp + lp, index=model_point().index)
 
 
 def premium_type():
@@ -1604,6 +1616,100 @@ def proj_len():
     return np.maximum(12 * policy_term() - duration_mth(0) + 1, 0)
 
 
+def proj_state(t):
+    """Projected state of the model points at ``t``
+
+    Advances the account values, the fees and charges deducted from them,
+    the cash surrender values, the lapse rates and the numbers of
+    policies of all the model points in all the scenarios
+    from ``t-1`` to ``t`` in one step on Numpy arrays,
+    and returns them in a dict.
+    When :func:`is_lapse_dynamic` is ``True``, the lapse rates depend on
+    the account values through the cash surrender values, so the account
+    values and the numbers of policies are calculated together
+    month by month.
+
+    The dict has the following keys:
+
+        * ``"av_pp_at"``: dict of the account values per policy
+          by the ``timing`` of :func:`av_pp_at`
+        * ``"maint_fee_pp"``
+        * ``"net_amt_at_risk"``
+        * ``"coi_pp"``
+        * ``"inv_income_pp"``
+        * ``"csv_pp"``
+        * ``"lapse_rate"``
+        * ``"pols_if_at"``: dict of the numbers of policies in-force
+          by the ``timing`` of :func:`pols_if_at`
+        * ``"pols_maturity"``
+        * ``"pols_death"``
+        * ``"pols_lapse"``
+
+    The Cells of the same names return the values as Series
+    indexed with the index of :func:`model_point`, for inspection.
+    The formulas of the values are described in the Cells.
+
+    .. seealso::
+        * :func:`av_pp_at`
+        * :func:`pols_if_at`
+        * :func:`lapse_rate`
+        * :func:`scen_row`
+
+    """
+    if t == 0:
+        av_bef_prem = np.asarray(av_pp_init())
+        pols_bef_mat = np.asarray(pols_if_init())
+    else:
+        prev = proj_state(t-1)
+        av_bef_prem = prev["av_pp_at"]["BEF_INV"] + prev["inv_income_pp"]
+        pols_bef_mat = (prev["pols_if_at"]["BEF_DECR"]
+                        - prev["pols_lapse"] - prev["pols_death"])
+
+    sa = np.asarray(sum_assured())
+
+    av_bef_fee = av_bef_prem + np.asarray(prem_to_av_pp(t))
+    maint_fee = maint_fee_rate() * av_bef_fee
+    net_amt = np.maximum(sa - av_bef_fee, 0)
+    coi = coi_rate(t) * net_amt
+    av_bef_inv = av_bef_fee - maint_fee - coi
+    inv_income = np.asarray(inv_return_mth(t))[scen_row()] * av_bef_inv
+    av_mid_mth = av_bef_inv + 0.5 * inv_income
+    csv = (1 - np.asarray(surr_charge_rate(t))) * av_mid_mth
+
+    pols_mat = (np.asarray(duration_mth(t)) == np.asarray(policy_term()) * 12) * pols_bef_mat
+    pols_bef_nb = pols_bef_mat - pols_mat
+    pols_bef_decr = pols_bef_nb + np.asarray(pols_new_biz(t))
+    pols_dth = pols_bef_decr * np.asarray(mort_rate_mth(t))
+
+    if has_lapse():
+        if is_lapse_dynamic():
+            factor = csv / sa
+        else:
+            factor = 1
+        rate = factor * np.maximum(0.1 - 0.01 * np.asarray(duration(t)), 0.02)
+    else:
+        rate = np.zeros(len(sa), dtype=np.int64)
+
+    return {
+        "av_pp_at": {"BEF_PREM": av_bef_prem,
+                     "BEF_FEE": av_bef_fee,
+                     "BEF_INV": av_bef_inv,
+                     "MID_MTH": av_mid_mth},
+        "maint_fee_pp": maint_fee,
+        "net_amt_at_risk": net_amt,
+        "coi_pp": coi,
+        "inv_income_pp": inv_income,
+        "csv_pp": csv,
+        "lapse_rate": rate,
+        "pols_if_at": {"BEF_MAT": pols_bef_mat,
+                       "BEF_NB": pols_bef_nb,
+                       "BEF_DECR": pols_bef_decr},
+        "pols_maturity": pols_mat,
+        "pols_death": pols_dth,
+        "pols_lapse": (pols_bef_decr - pols_dth) * (1-(1 - rate)**(1/12))
+    }
+
+
 def pv_av_change():
     """Present value of change in account value
 
@@ -1864,6 +1970,17 @@ def scen_index():
     return std_norm_rand()[:, 0].index
 
 
+def scen_row():
+    """Positions of the scenarios of the model points
+
+    Returns a Numpy array of the positions in :func:`scen_index`
+    of the ``scen_id`` of the rows in :func:`model_point`.
+    Used by :func:`proj_state` to read the investment return
+    of each row from :func:`inv_return_mth`.
+    """
+    return scen_index().get_indexer(model_point().index.get_level_values("scen_id"))
+
+
 def sex():
     """The sex of the model points
 
@@ -828,8 +828,8 @@ def formula_option_put(t):
     mps = mps.loc[cond]
 
     T = t / 12
-    S = av_at(0, 'BEF_FEE')[:, 1][cond]
-    X = (sum_assured() * pols_maturity(t))[:, 1][cond]
+    S = av_at(0, 'BEF_FEE').reshape(point_size(), -1)[:, 0][cond]
+    X = (sum_assured() * pols_maturity(t)).reshape(point_size(), -1)[:, 0][cond]
     sigma = 0.03
     r = 0.02
     N = stats.norm.cdf
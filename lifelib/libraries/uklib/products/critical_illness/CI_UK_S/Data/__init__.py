@@ -96,6 +96,32 @@ def lapse_table():
         input_dir() / lapse_table_file, index_col="policy_year")     # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "ci_rate_table": ("ci_rate_file", ["sex", "smoker", "age"], True),
+            "lapse_table": ("lapse_table_file", "policy_year")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "contract_type": "str",
+                "age_at_entry": "int64", "sex": "str", "smoker": "str",
+                "sum_assured": "float64", "policy_term": "int64", "cover_basis": "str",
+                "life_basis": "str", "joint_age": "float64", "joint_sex": "str",
+                "joint_smoker": "str", "premium_guarantee": "str",
+                "premium_mth": "float64", "premium_mode": "str",
+                "children_cover": "bool", "indexation": "bool",
+                "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -121,6 +121,33 @@ def lapse_table():
         input_dir() / lapse_table_file, index_col="policy_year")     # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "inception_table": (
+                "inception_file", ["sex", "occ_class", "deferred_weeks", "age"], True),
+            "termination_table": ("termination_file", "claim_duration_year"),
+            "mort_table": ("mort_table_file", ["sex", "age"], True),
+            "lapse_table": ("lapse_table_file", "policy_year")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "entry_age": "int64",
+                "sex": "str", "occ_class": "int64", "benefit_mth": "float64",
+                "earnings_annual": "float64", "deferred_weeks": "int64",
+                "expiry_age": "int64", "escalation": "str", "premium_mth": "float64",
+                "premium_basis": "str", "status": "str", "recovery_basis": "str",
+                "claim_duration_months": "int64", "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -90,6 +90,34 @@ def mort_table():
         input_dir() / mort_table_file, index_col=["sex", "age"]).sort_index()
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["sex", "age"], True)},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "purchase_price": "float64",
+                "annuitant_age": "int64", "annuitant_sex": "str",
+                "rating_multiplier": "float64", "dependant_present": "bool",
+                "dependant_age": "float64", "dependant_sex": "str",
+                "dependant_rating": "float64", "dependant_pct": "float64",
+                "overlap": "bool", "annual_income": "float64", "frequency": "int64",
+                "timing": "str", "proportion": "bool", "escalation_type": "str",
+                "escalation_rate": "float64", "guarantee_months": "int64",
+                "vp_pct": "float64", "vp_basis": "str", "mort_basis": "str",
+                "death_mth_1": "float64", "death_mth_2": "float64",
+                "start_year": "int64", "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
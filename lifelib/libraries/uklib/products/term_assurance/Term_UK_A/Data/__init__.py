@@ -96,6 +96,34 @@ def lapse_table():
         input_dir() / lapse_table_file, index_col="policy_year")     # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["sex", "smoker", "age"]),
+            "select_factor_table": ("select_factor_file", "duration"),
+            "lapse_table": ("lapse_table_file", "policy_year")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "shape": "str",
+                "age_at_entry": "int64", "sex": "str", "smoker": "str",
+                "policy_term": "int64", "sum_assured": "float64",
+                "fib_income": "float64", "sched_rate": "float64",
+                "joint_first_death": "bool", "joint_age": "float64",
+                "joint_sex": "str", "joint_smoker": "str", "indexation": "bool",
+                "wop": "bool", "premium_mth": "float64", "premium_mode": "str",
+                "mort_basis": "str", "pols_if_init": "float64",
+                "duration_inforce": "int64", "fib_commute_rate": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
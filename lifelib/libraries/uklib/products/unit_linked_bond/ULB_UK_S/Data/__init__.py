@@ -102,6 +102,31 @@ def surr_table():
         input_dir() / surr_table_file, index_col="policy_year")      # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["sex", "age"], True),
+            "surr_table": ("surr_table_file", "policy_year")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "lives": "str", "premium": "float64",
+                "n_segments": "int64", "db_uplift": "float64", "amc_rate": "float64",
+                "further_costs_rate": "float64", "tax_provision_rate": "float64",
+                "wd_pattern": "str", "wd_rate_custom": "float64",
+                "oac_rate": "float64", "gmdb_flag": "bool", "uf_init": "float64",
+                "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
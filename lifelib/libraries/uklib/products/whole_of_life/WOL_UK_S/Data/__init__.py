@@ -103,6 +103,30 @@ def lapse_table():
         index_col=["cell", "policy_year"]).sort_index()
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["basis", "sex", "smoker", "age"], True),
+            "lapse_table": ("lapse_table_file", ["cell", "policy_year"], True)},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "cell": "str",
+                "entry_age": "int64", "sex": "str", "smoker": "str",
+                "sum_assured": "float64", "premium_mth": "float64",
+                "escalation": "str", "cessation_months": "int64",
+                "moratorium_months": "int64", "variant_adb_2x": "bool",
+                "variant_paid_up": "bool", "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
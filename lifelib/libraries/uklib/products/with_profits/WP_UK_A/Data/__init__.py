@@ -101,6 +101,33 @@ def lapse_table():
         index_col=["chassis", "policy_year"]).sort_index()
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["sex", "age"], True),
+            "lapse_table": ("lapse_table_file", ["chassis", "policy_year"], True)},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "chassis": "str",
+                "age_at_entry": "int64", "sex": "str", "duration_inforce": "int64",
+                "premium_single": "float64", "premium_regular": "float64",
+                "sum_assured": "float64", "policy_term": "int64", "units": "float64",
+                "unit_price_init": "float64", "attaching_bonus": "float64",
+                "asset_share_init": "float64", "smoothed_payout_init": "float64",
+                "guarantee_dates": "float64", "wd_rate": "float64", "tax_basis": "str",
+                "fund_return": "float64", "bonus_rate": "float64",
+                "pols_if_init": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -230,6 +230,37 @@ def test_inputs_are_read_once_not_once_per_model_point(name):
     assert all(n == 1 for n in counts.values()), counts
 
 
+def test_the_input_schema_matches_the_readers(name):
+    """``Data.input_schema()`` declares every reader as the reader reads its file.
+
+    ``lifelib.runners.load_inputs`` reads the files by the schema instead of the readers,
+    so a schema out of step with a reader would silently replace the reader's table.
+    The tables loaded by the schema must equal the readers' own, less the ``provenance``
+    columns, with the same index and the same column types.
+    """
+    import pandas as pd
+
+    from lifelib.runners import load_inputs, unload_inputs
+
+    model = mx.read_model(model_path(name), name=name + "_schema")
+    try:
+        data = model.Data
+        tables = data.input_schema()["tables"]
+        files = {r for r in data.refs if r.endswith("_file")}
+        assert {spec[0] for spec in tables.values()} == files
+        expected = {reader: getattr(data, reader)() for reader in tables}
+        model.clear_all()
+
+        load_inputs(data)
+        for reader, table in expected.items():
+            pd.testing.assert_frame_equal(
+                getattr(data, reader)(),
+                table.drop(columns="provenance", errors="ignore"), obj=reader)
+        unload_inputs(data)
+    finally:
+        model.close()
+
+
 # ---------------------------------------------------------------------------
 # Documentation
 
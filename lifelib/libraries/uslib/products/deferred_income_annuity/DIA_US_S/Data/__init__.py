@@ -139,6 +139,41 @@ def rop_factor_table():
         index_col=["issue_age", "sex", "deferral_years"])
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "premium_schedule_table": ("premium_schedule_file", None),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "improvement_scale": ("improvement_scale_file", ["age", "sex"]),
+            "payout_factor_table": (
+                "payout_factor_file", ["income_start_age", "sex", "payout_form"]),
+            "rop_factor_table": (
+                "rop_factor_file", ["issue_age", "sex", "deferral_years"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "issue_age": "int64",
+                "sex": "str", "joint": "bool", "joint_age": "float64",
+                "joint_sex": "str", "survivor_pct": "float64",
+                "reduction_trigger": "str", "market_type": "str", "income_form": "str",
+                "db_form": "str", "certain_period": "int64",
+                "income_start_mth": "int64", "frequency": "int64", "timing": "str",
+                "cola_rate": "float64", "issue_year": "int64",
+                "pols_if_init": "float64", "mort_basis": "str", "factor_basis": "str",
+                "purchase_rate_dp": "float64", "adjust_mth": "float64",
+                "adjust_start_mth": "float64", "accel_mth": "float64",
+                "commute_mth": "float64", "commute_frac": "float64",
+                "other_qlac_premium": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
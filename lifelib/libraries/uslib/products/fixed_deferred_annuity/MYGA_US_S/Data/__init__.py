@@ -45,6 +45,13 @@ Three of these carry a compound key. ``surr_charge_table`` is indexed by
 ``withdrawal_table`` by ``(wd_schedule_id, t)``, both read as step functions of ``t`` so
 a scenario or a withdrawal programme is a handful of rows rather than one row per month.
 
+Those few rows are searched every projected month, so each of the three tables is also
+compiled, one key at a time, into a NumPy array by month or contract year:
+``rate_path(scenario_id, name)`` carries each rate forward to the next row, while
+``withdrawal_path(wd_schedule_id)`` and ``surr_charge_path(schedule)`` are 0 wherever the
+file has no row. Each is computed once per key, and ``Projection`` reads a single
+element of it.
+
 To swap in a licensed mortality basis — the 2012 IAM Basic table with Projection Scale G2
 and the VM-22 Table 6.7 factors that the notes prescribe and that may not be redistributed
 here — replace ``mort_table.csv`` with a same-schema file, or point ``mort_table_file`` at
@@ -126,6 +133,63 @@ def mva_factor_table():
         input_dir() / mva_factor_file, index_col="years_remaining")  # noqa: F821
 
 
+def rate_path(scenario_id, name):
+    """Column ``name`` of the rate scenario ``scenario_id`` by month, forward-filled."""
+    series = rate_scenario().loc[scenario_id, name]
+    return series.reindex(range(int(series.index.max()) + 1)).ffill().to_numpy()
+
+
+def withdrawal_path(wd_schedule_id):
+    """The scheduled withdrawals of ``wd_schedule_id`` by month; 0 where there is no row."""
+    table = withdrawal_table()
+    if wd_schedule_id not in table.index.unique("wd_schedule_id"):
+        return np.zeros(0)                                           # noqa: F821
+    series = table.loc[wd_schedule_id, "wd_amount"]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def surr_charge_path(schedule):
+    """The surrender charge rates of ``schedule`` by contract year; 0 where there is no row."""
+    table = surr_charge_table()
+    if schedule not in table.index.unique("schedule"):
+        return np.zeros(0)                                           # noqa: F821
+    series = table.loc[schedule, "surr_charge_rate"]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "surr_charge_table": ("surr_charge_file", ["schedule", "contract_year"]),
+            "surr_charge_age_cap_table": ("surr_charge_age_cap_file", "age"),
+            "rate_scenario": ("rate_scenario_file", ["scenario_id", "t"]),
+            "withdrawal_table": ("withdrawal_file", ["wd_schedule_id", "t"]),
+            "mva_factor_table": ("mva_factor_file", "years_remaining")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "tax_status": "str", "premium": "int64",
+                "pols_if_init": "int64", "guar_period": "int64",
+                "declared_rate_initial": "float64", "gmir": "float64",
+                "mgsv_rate": "float64", "mgsv_annual_charge": "float64",
+                "mgsv_wd_convention": "str", "renewal_architecture": "str",
+                "free_wd_rule": "str", "free_wd_rate": "float64",
+                "free_wd_mva_exempt": "bool", "mva_family": "str",
+                "mva_cap_rule": "str", "mva_ref_yield_at_issue": "float64",
+                "premium_tax_rate": "float64", "tax_basis_initial": "int64",
+                "scenario_id": "str", "wd_schedule_id": "str"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -143,4 +207,6 @@ withdrawal_file = "withdrawal_table.csv"
 
 mva_factor_file = "mva_factor_table.csv"
 
-pd = ("Module", "pandas")
\ No newline at end of file
+pd = ("Module", "pandas")
+
+np = ("Module", "numpy")
\ No newline at end of file
@@ -511,9 +511,11 @@ def scenario_rate(t, name):
     Each row of *rate_scenario.csv* states the level that holds from its own month until
     the next row of the same scenario, so a flat path is one row.
     """
-    sub = data.rate_scenario().loc[scenario_id()]                    # noqa: F821
-    months = [i for i in sub.index if i <= max(t, 0)]
-    return float(sub.loc[max(months), name])
+    path = data.rate_path(scenario_id(), name)                       # noqa: F821
+    value = float(path[min(max(t, 0), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise ValueError("no rate row at or before month %d" % t)
+    return value
 
 
 def market_rate(t):
@@ -596,9 +598,8 @@ def wd_scheduled_pp(t):
     """The gross withdrawal scheduled for month t in *withdrawal_table.csv*, else zero."""
     if t < 1:
         return 0.0
-    table = data.withdrawal_table()                                  # noqa: F821
-    key = (wd_schedule_id(), t)
-    return float(table.loc[key, "wd_amount"]) if key in table.index else 0.0
+    path = data.withdrawal_path(wd_schedule_id())                    # noqa: F821
+    return float(path[t]) if t < len(path) else 0.0
 
 
 def wd_pp(t):
@@ -803,11 +804,11 @@ def surr_charge_rate(t):
     schedule = surr_charge_id(t)
     if schedule == "none" or in_gp_window(t):
         return 0.0
-    key = (schedule, surr_charge_year(t))
-    table = data.surr_charge_table()                                 # noqa: F821
-    if key not in table.index:
+    path = data.surr_charge_path(schedule)                           # noqa: F821
+    year = surr_charge_year(t)
+    if not 0 <= year < len(path):
         return 0.0
-    return min(float(table.loc[key, "surr_charge_rate"]), surr_charge_age_cap(t))
+    return min(float(path[year]), surr_charge_age_cap(t))
 
 
 def mva_term(t):
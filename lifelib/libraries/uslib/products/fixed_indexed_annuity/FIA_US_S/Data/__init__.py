@@ -56,6 +56,14 @@ single schedule pair and both are read at the same key. ``payout_rate_table`` is
 rather than keyed: each row gives an inclusive attained-age band and the single-life and
 joint-life percentages, the joint column being the single column less 0.50% [S1][S3].
 
+Four of the tables are also kept in a compiled form, an array with one element per
+anniversary, contract year or attained age from 0, so that ``Projection`` reads a rate
+by position rather than by searching the rows each year: ``rate_path(scenario_id,
+name)``, ``rollup_path(rollup_id)``, ``payout_rate_path(column)`` and
+``withdrawal_path(wd_schedule_id)``. Each is evaluated once per key. The step functions
+are filled forward from each row; a rollup schedule and the payout bands are 0 where no
+row applies, and a scenario takes its first row's level before that row.
+
 To swap in the prescribed annuitant mortality — the 2012 IAM/IAR family with Projection
 Scale G2 [REG-R59][REG-R60], which may not be redistributed here — replace
 ``mort_table.csv`` with a same-schema file, or point ``mort_table_file`` at a different
@@ -153,6 +161,81 @@ def withdrawal_table():
         index_col=["wd_schedule_id", "t"])
 
 
+def rate_path(scenario_id, name):
+    """Column ``name`` of the scenario ``scenario_id`` by anniversary.
+
+    Filled forward from each row, and backward from the first row to anniversary 0.
+    """
+    series = rate_scenario().loc[scenario_id, name]
+    series = series.reindex(range(int(series.index.max()) + 1))
+    return series.ffill().bfill().to_numpy()
+
+
+def rollup_path(rollup_id):
+    """The rollup rate of schedule ``rollup_id`` by contract year; 0 before its first row."""
+    series = rollup_table().loc[rollup_id, "rollup_rate"]
+    series = series.reindex(range(int(series.index.max()) + 1)).ffill()
+    return series.fillna(0.0).to_numpy()
+
+
+def payout_rate_path(column):
+    """Column ``column`` of the payout bands by attained age; 0 where no band applies.
+
+    Runs to the upper age of the last band, which holds above it. Where bands overlap,
+    the first in the file applies, as it does in a search of the rows.
+    """
+    table = payout_rate_table()
+    path = np.zeros(int(table["age_hi"].iloc[-1]) + 1)               # noqa: F821
+    for _, row in table.iloc[::-1].iterrows():
+        path[int(row["age_lo"]):int(row["age_hi"]) + 1] = float(row[column])
+    return path
+
+
+def withdrawal_path(wd_schedule_id):
+    """The ad hoc withdrawals of ``wd_schedule_id`` by anniversary; 0 where there is no row."""
+    table = withdrawal_table()
+    if wd_schedule_id not in table.index.unique("wd_schedule_id"):
+        return np.zeros(0)                                           # noqa: F821
+    series = table.loc[wd_schedule_id, "wd_amount"]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "surr_charge_table": ("surr_charge_file", "contract_year"),
+            "rollup_table": ("rollup_file", ["rollup_id", "contract_year"]),
+            "payout_rate_table": ("payout_rate_file", None),
+            "rate_scenario": ("rate_scenario_file", ["scenario_id", "t"]),
+            "withdrawal_table": ("withdrawal_file", ["wd_schedule_id", "t"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "tax_status": "str", "premium": "int64",
+                "pols_if_init": "int64", "entry_year": "int64",
+                "av_initial": "float64", "bb_initial": "float64",
+                "rb_initial": "float64", "mgv_initial": "float64",
+                "lw_initial": "float64", "phase_initial": "str",
+                "payout_rate_initial": "float64", "bonus_rate": "float64",
+                "alloc_indexed": "float64", "glwb_elected": "bool",
+                "glwb_basis": "str", "joint_age": "float64",
+                "income_start_age": "int64", "utilization_intensity": "float64",
+                "credit_method": "str", "cap_rate": "float64",
+                "stack_factor": "float64", "av_int_factor": "float64",
+                "rollup_id": "str", "mva_ref_yield_at_issue": "float64",
+                "scenario_id": "str", "wd_schedule_id": "str"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -170,4 +253,6 @@ rate_scenario_file = "rate_scenario.csv"
 
 withdrawal_file = "withdrawal_table.csv"
 
-pd = ("Module", "pandas")
\ No newline at end of file
+pd = ("Module", "pandas")
+
+np = ("Module", "numpy")
\ No newline at end of file
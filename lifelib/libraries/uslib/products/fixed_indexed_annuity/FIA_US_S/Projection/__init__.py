@@ -666,10 +666,8 @@ def scenario_value(t, name):
     until the next row of the same scenario, so a flat path is one row.  Anniversaries
     before the first row take the first row's level.
     """
-    sub = data.rate_scenario().loc[scenario_id()]                    # noqa: F821
-    keys = [i for i in sub.index if i <= max(t, 0)]
-    key = max(keys) if keys else min(sub.index)
-    return float(sub.loc[key, name])
+    path = data.rate_path(scenario_id(), name)                       # noqa: F821
+    return float(path[min(max(t, 0), len(path) - 1)])
 
 
 def index_level(t):
@@ -953,11 +951,8 @@ def rollup_rate(t):
     """
     if t < 1:
         return 0.0
-    sub = data.rollup_table().loc[rollup_id()]                       # noqa: F821
-    keys = [y for y in sub.index if y <= policy_year(t)]
-    if not keys:
-        return 0.0
-    return float(sub.loc[max(keys), "rollup_rate"])
+    path = data.rollup_path(rollup_id())                             # noqa: F821
+    return float(path[min(policy_year(t), len(path) - 1)])
 
 
 def payout_rate(a, basis):
@@ -973,12 +968,8 @@ def payout_rate(a, basis):
         column = "payout_rate_joint"
     else:
         raise ValueError("invalid glwb_basis")
-    table = data.payout_rate_table()                                 # noqa: F821
-    for _, row in table.iterrows():
-        if int(row["age_lo"]) <= a <= int(row["age_hi"]):
-            return float(row[column])
-    last = table.iloc[-1]
-    return float(last[column]) if a > int(last["age_hi"]) else 0.0
+    path = data.payout_rate_path(column)                             # noqa: F821
+    return float(path[min(a, len(path) - 1)]) if a >= 0 else 0.0
 
 
 def payout_rate_locked(t):
@@ -1280,9 +1271,8 @@ def wd_scheduled_pp(t):
     """
     if t < 1:
         return 0.0
-    table = data.withdrawal_table()                                  # noqa: F821
-    key = (wd_schedule_id(), t)
-    return float(table.loc[key, "wd_amount"]) if key in table.index else 0.0
+    path = data.withdrawal_path(wd_schedule_id())                    # noqa: F821
+    return float(path[t]) if t < len(path) else 0.0
 
 
 def wd_pp(t):
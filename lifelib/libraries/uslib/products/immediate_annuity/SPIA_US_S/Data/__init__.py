@@ -93,6 +93,36 @@ def surr_charge_table():
         input_dir() / surr_charge_file, index_col="policy_year")     # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "improvement_scale": ("improvement_scale_file", ["age", "sex"]),
+            "surr_charge_table": ("surr_charge_file", "policy_year")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "premium": "int64",
+                "premium_tax_rate": "float64", "annual_income": "int64", "form": "str",
+                "joint": "bool", "primary_age": "int64", "primary_sex": "str",
+                "joint_age": "float64", "joint_sex": "str", "survivor_pct": "float64",
+                "reduction_trigger": "str", "certain_months": "int64",
+                "frequency": "int64", "timing": "str", "cola_rate": "float64",
+                "commutation_enabled": "bool",
+                "issue_state_excludes_withdrawal": "bool", "qualified": "bool",
+                "rating_factor": "float64", "annuity_year": "int64",
+                "pols_if_init": "float64", "mort_basis": "str",
+                "death_mth_1": "float64", "death_mth_2": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
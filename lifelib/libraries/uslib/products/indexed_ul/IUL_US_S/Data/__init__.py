@@ -133,6 +133,41 @@ def surr_charge_table():
     return pd.read_csv(input_dir() / surr_charge_file, index_col="surr_charge_id")  # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "coi_rates": (
+                "coi_rates_file", ["sex", "rate_class", "age_at_entry", "policy_year"]),
+            "corridor_factors": ("corridor_file", "age"),
+            "mort_table": ("mort_table_file", "age"),
+            "class_factor_table": ("class_factor_file", "rate_class"),
+            "lapse_table": ("lapse_table_file", "policy_year"),
+            "surr_charge_table": ("surr_charge_file", "surr_charge_id")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "rate_class": "str", "sum_assured": "float64",
+                "db_option": "str", "qual_test": "str", "premium_type": "str",
+                "premium_mode": "str", "premium_pp_ann": "float64",
+                "load_prem_rate": "float64", "index_alloc_rate": "float64",
+                "av_pp_init": "float64", "loan_bal_init": "float64",
+                "wd_pp": "float64", "wd_first_year": "int64",
+                "loan_new_pp_ann": "float64", "loan_first_year": "int64",
+                "pols_if_init": "float64", "duration_mth": "int64",
+                "has_surr_charge": "bool", "surr_charge_id": "str",
+                "mnlp_rate": "float64", "gsp": "float64", "glp": "float64",
+                "seven_pay_prem": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
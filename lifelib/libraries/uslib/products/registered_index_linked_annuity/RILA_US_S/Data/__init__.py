@@ -54,6 +54,14 @@ declared Cap, Step and Edge rates at 1, 3 and 6 years [S1][S2]; and ``lapse_tabl
 contract year, read as a step function so the notes' three-row reference shape stays
 three rows.
 
+The step-function and keyed tables are read for every month of the projection, so
+next to each reader is a Cells compiling the table, for one key, into a NumPy array
+with one element per month or contract year from 0, computed once per key:
+``market_path(scenario_id, name)`` forward-fills a market scenario column,
+``lapse_path()`` the base surrender rates, and ``withdrawal_path(wd_schedule_id)`` and
+``surr_charge_path()`` hold 0 where the table has no row. ``Projection`` indexes into
+them instead of searching the tables.
+
 To swap in the prescribed mortality basis — the 2012 IAM **Basic** table (VM-M §2.C) with
 generational Projection Scale G2 [REG-R59], which may not be redistributed here — replace
 ``mort_table.csv`` with a same-schema file, or point ``mort_table_file`` at a different
@@ -143,6 +151,69 @@ def withdrawal_table():
         index_col=["wd_schedule_id", "t"])
 
 
+def market_path(scenario_id, name):
+    """Column ``name`` of the market scenario ``scenario_id`` by month.
+
+    Forward-filled from each row to the next, up to the scenario's last row.
+    """
+    series = market_scenario().loc[scenario_id, name]
+    return series.reindex(range(int(series.index.max()) + 1)).ffill().to_numpy()
+
+
+def surr_charge_path():
+    """The withdrawal charge rates by complete contract years; 0 where there is no row."""
+    series = surr_charge_table()["surr_charge_rate"]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def lapse_path():
+    """The base annual surrender rates by contract year, forward-filled.
+
+    Contract years before the first row are ``nan``, which ``Projection`` rejects.
+    """
+    series = lapse_table()["lapse_rate_base"]
+    return series.reindex(range(int(series.index.max()) + 1)).ffill().to_numpy()
+
+
+def withdrawal_path(wd_schedule_id):
+    """The scheduled withdrawals of ``wd_schedule_id`` by month; 0 where there is no row."""
+    table = withdrawal_table()
+    if wd_schedule_id not in table.index.unique("wd_schedule_id"):
+        return np.zeros(0)                                           # noqa: F821
+    series = table.loc[wd_schedule_id, "wd_amount"]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "market_scenario": ("market_scenario_file", ["scenario_id", "t"]),
+            "surr_charge_table": ("surr_charge_file", "contract_year"),
+            "guar_min_rate_table": ("guar_min_rate_file", "term_years"),
+            "lapse_table": ("lapse_file", "contract_year"),
+            "withdrawal_table": ("withdrawal_file", ["wd_schedule_id", "t"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "premium": "int64", "pols_if_init": "int64",
+                "term_years": "int64", "buffer": "float64", "crediting_type": "str",
+                "declared_cap": "float64", "declared_step": "float64",
+                "declared_edge": "float64", "participation": "float64",
+                "floor_rate": "float64", "iv_family": "str", "amort_rule": "str",
+                "nge_reset": "bool", "wd_rate_ann": "float64", "scenario_id": "str",
+                "wd_schedule_id": "str"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -160,4 +231,6 @@ lapse_file = "lapse_table.csv"
 
 withdrawal_file = "withdrawal_table.csv"
 
-pd = ("Module", "pandas")
\ No newline at end of file
+pd = ("Module", "pandas")
+
+np = ("Module", "numpy")
\ No newline at end of file
@@ -608,9 +608,11 @@ def market_state(t, name):
     path is therefore piecewise constant between the scenario's own anchor months; that is
     a property of the deterministic scenario, not of the model.
     """
-    sub = data.market_scenario().loc[scenario_id()]                  # noqa: F821
-    months = [i for i in sub.index if i <= max(t, 0)]
-    return float(sub.loc[max(months), name])
+    path = data.market_path(scenario_id(), name)                     # noqa: F821
+    value = float(path[min(max(t, 0), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise ValueError("no market row at or before month %d" % t)
+    return value
 
 
 def index_level(t):
@@ -1463,9 +1465,8 @@ def wd_scheduled_pp(t):
     """The gross withdrawal scheduled for month t in *withdrawal_table.csv*, else zero."""
     if t < 1:
         return 0.0
-    table = data.withdrawal_table()                                  # noqa: F821
-    key = (wd_schedule_id(), t)
-    return float(table.loc[key, "wd_amount"]) if key in table.index else 0.0
+    path = data.withdrawal_path(wd_schedule_id())                    # noqa: F821
+    return float(path[t]) if t < len(path) else 0.0
 
 
 def wd_behavioral_pp(t):
@@ -1524,11 +1525,9 @@ def surr_charge_rate(t):
     7 - the first with a zero charge - is also the first year following a 6-year Term End
     Date on this chassis, which is why the charge-expiry shock lapse is applied there.
     """
-    table = data.surr_charge_table()                                 # noqa: F821
+    path = data.surr_charge_path()                                   # noqa: F821
     key = duration(t)
-    if key not in table.index:
-        return 0.0
-    return float(table.loc[key, "surr_charge_rate"])
+    return float(path[key]) if 0 <= key < len(path) else 0.0
 
 
 def wd_charge_pp(t):
@@ -1657,9 +1656,11 @@ def lapse_rate_base(t):
     shock enters separately as :func:`lapse_rate_sc_mult`, so the two are multiplicative
     and neither is baked into the other.
     """
-    table = data.lapse_table()                                       # noqa: F821
-    years = [i for i in table.index if i <= policy_year(t)]
-    return float(table.loc[max(years), "lapse_rate_base"])
+    path = data.lapse_path()                                         # noqa: F821
+    value = float(path[min(policy_year(t), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise ValueError("no lapse row at or before year %d" % policy_year(t))
+    return value
 
 
 def lapse_shock_year():
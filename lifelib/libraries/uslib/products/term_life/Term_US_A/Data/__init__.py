@@ -92,6 +92,32 @@ def shock_lapse_table():
     return pd.read_csv(input_dir() / shock_lapse_file)               # noqa: F821
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "premium_rates": (
+                "premium_rates_file", ["plan", "sex", "rate_class", "band", "policy_year"]),
+            "mort_table": ("mort_table_file", "age"),
+            "class_factor_table": ("class_factor_file", "rate_class"),
+            "shock_lapse_table": ("shock_lapse_file", None)},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "rate_class": "str", "plan": "str",
+                "sum_assured": "float64", "premium_mode": "str",
+                "pols_if_init": "float64", "duration_inforce": "int64",
+                "plt_mort_factor_override": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
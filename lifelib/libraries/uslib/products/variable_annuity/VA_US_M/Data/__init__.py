@@ -0,0 +1,290 @@
+"""Input data and product parameters of the vectorized projection.
+
+The same eight input CSVs as :mod:`.VA_US_S` reads, from the same files in the model
+folder's parent directory, ``products/variable_annuity/``, with the same reader Cells and
+filename References, so the two editions of the model project the same contracts on the
+same assumptions. They are read here, **once per model**, and referenced from
+:mod:`~.VA_US_M.Projection` as ``data``, which turns the tables into the dense arrays it
+indexes month by month:
+
+=========================  ==============================  ==========================
+Reference                  Cells                           File
+=========================  ==============================  ==========================
+model_point_file           model_point_table()             model_point_table.csv
+mort_table_file            mort_table()                    mort_table.csv
+fund_file                  fund_table()                    fund_table.csv
+return_scenario_file       return_scenario()               return_scenario.csv
+rate_scenario_file         rate_scenario()                 rate_scenario.csv
+gawa_pct_file              gawa_pct_table()                gawa_pct_table.csv
+cdsc_file                  cdsc_table()                    cdsc_table.csv
+transaction_file           transaction_table()             transaction_table.csv
+=========================  ==============================  ==========================
+
+The keys of the tables and how they are read are documented in :mod:`~.VA_US_S.Data`.
+:func:`lifelib.runners.load_inputs` reads them as for the other models.
+
+The product parameters, such as ``gwb_cap`` and ``lapse_rate_sc``, are References of
+this Space with the names and values of the References of :mod:`~.VA_US_S.Projection`,
+read by :mod:`~.VA_US_M.Projection` as ``data.gwb_cap``. modelx tracks them like any
+other Reference, so assigning a new value clears the Cells that use it. A parameter
+is changed in both models; the reconciliation test fails if the two disagree.
+
+Like :mod:`.VA_US_S`, **the model is not portable on its own**: it needs the CSVs
+beside its folder.
+"""
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = []
+
+_allow_none = None
+
+_spaces = []
+
+# ---------------------------------------------------------------------------
+# Cells
+
+def input_dir():
+    """The directory holding the input CSVs: the model folder's parent.
+
+    The path is resolved at run time from where the model was read, following
+    ``annuallife.TradLife_A``.
+    """
+    return _model.path.parent                                        # noqa: F821
+
+
+def model_point_table():
+    """The model point table, read from *model_point_table.csv*."""
+    return pd.read_csv(input_dir() / model_point_file, index_col="point_id")  # noqa: F821
+
+
+def mort_table():
+    """Annual mortality by attained age and sex, read from *mort_table.csv*."""
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / mort_table_file, index_col=["age", "sex"])     # noqa: F821
+
+
+def fund_table():
+    """Subaccount allocations and fund expense ratios, from *fund_table.csv*."""
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / fund_file, index_col=["fund_set", "sub_id"])   # noqa: F821
+
+
+def return_scenario():
+    """Gross subaccount returns, read from *return_scenario.csv*.
+
+    Indexed by ``(scenario_id, sub_id, t)`` and read as a step function of ``t``: each
+    row states the monthly gross fund return that holds from that month until the next
+    row for the same scenario and subaccount.
+    """
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / return_scenario_file,                          # noqa: F821
+        index_col=["scenario_id", "sub_id", "t"])
+
+
+def rate_scenario():
+    """The exogenous market rate series, read from *rate_scenario.csv*.
+
+    Indexed by ``(scenario_id, t)`` and read as a step function of ``t``. It carries the
+    quarterly average of daily VIX-squared driving the optional non-discretionary fee
+    reset [S4][S6] and the 10-year Constant Maturity Treasury rate driving the optional
+    formula-linked GMDB roll-up [S7]. Neither is used by the base run.
+    """
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / rate_scenario_file,                            # noqa: F821
+        index_col=["scenario_id", "t"])
+
+
+def gawa_pct_table():
+    """The GAWA% grid by attained age band, read from *gawa_pct_table.csv*.
+
+    Indexed by ``(gawa_grid, age_from)``; the applicable row is the highest ``age_from``
+    at or below the attained age at the first withdrawal [S3].
+    """
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / gawa_pct_file, index_col=["gawa_grid", "age_from"])  # noqa: F821
+
+
+def cdsc_table():
+    """The withdrawal charge scale, read from *cdsc_table.csv*.
+
+    Indexed by ``(cdsc_schedule, completed_years)``, where the key is completed years
+    **since receipt of the premium being withdrawn**, not the contract year [S2].
+    """
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / cdsc_file,                                     # noqa: F821
+        index_col=["cdsc_schedule", "completed_years"])
+
+
+def transaction_table():
+    """Scheduled policyholder transactions, read from *transaction_table.csv*.
+
+    Indexed by ``(txn_id, t)`` with a gross premium and a gross withdrawal per month; a
+    month with no row takes neither. Scheduled withdrawals are **added to** the
+    utilization withdrawal the base run derives from the GLWB, which is how the excess
+    algebra is exercised.
+    """
+    return pd.read_csv(                                              # noqa: F821
+        input_dir() / transaction_file, index_col=["txn_id", "t"])   # noqa: F821
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "fund_table": ("fund_file", ["fund_set", "sub_id"]),
+            "return_scenario": (
+                "return_scenario_file", ["scenario_id", "sub_id", "t"]),
+            "rate_scenario": ("rate_scenario_file", ["scenario_id", "t"]),
+            "gawa_pct_table": ("gawa_pct_file", ["gawa_grid", "age_from"]),
+            "cdsc_table": ("cdsc_file", ["cdsc_schedule", "completed_years"]),
+            "transaction_table": ("transaction_file", ["txn_id", "t"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "designated_lives": "str", "tax_status": "str",
+                "premium": "int64", "pols_if_init": "int64",
+                "premium_tax_rate": "float64", "fund_set": "str", "glwb_option": "str",
+                "glwb_stepup_basis": "str", "gmdb_option": "str",
+                "cdsc_schedule": "str", "fee_reset_rule": "str", "rollup_rule": "str",
+                "wd_start_age": "int64", "wd_intensity": "float64",
+                "scenario_id": "str", "txn_id": "str", "duration_mth_init": "int64",
+                "av_init": "int64", "gwb_init": "int64", "gawa_init": "int64",
+                "gawa_pct_init": "int64", "bb_init": "int64", "rb_init": "int64",
+                "np_init": "int64", "rp_init": "int64", "adj_init": "int64",
+                "bonus_end_init": "int64"}}}
+
+
+# ---------------------------------------------------------------------------
+# References
+
+model_point_file = "model_point_table.csv"
+
+mort_table_file = "mort_table.csv"
+
+fund_file = "fund_table.csv"
+
+return_scenario_file = "return_scenario.csv"
+
+rate_scenario_file = "rate_scenario.csv"
+
+gawa_pct_file = "gawa_pct_table.csv"
+
+cdsc_file = "cdsc_table.csv"
+
+transaction_file = "transaction_table.csv"
+
+omega_age = 120
+
+asset_charge_me = 0.01
+
+asset_charge_admin = 0.003
+
+phi_glwb_curr = 0.0125
+
+phi_glwb_max = 0.03
+
+phi_gmdb_curr = 0.009
+
+fee_increase_max = 0.0025
+
+fee_reset_years = 5
+
+maint_fee = 35.0
+
+maint_fee_waiver_av = 50000.0
+
+free_wd_rate = 0.1
+
+surr_charge_years = 7
+
+bonus_pct = 0.06
+
+bonus_period_years = 10
+
+bonus_restart_age = 81
+
+gwb_cap = 10000000.0
+
+gwb_adj_pct = 1.05
+
+gwb_adj_age = 70
+
+gwb_adj_min_year = 12
+
+rollup_pct_young = 0.06
+
+rollup_pct_old = 0.05
+
+rollup_age_split = 70
+
+gmdb_growth_cutoff_age = 80
+
+forlife_age = 60
+
+av_depletion_threshold = 0.005
+
+lapse_rate_sc = 0.04
+
+lapse_rate_shock = 0.25
+
+lapse_rate_ult = 0.15
+
+lapse_itm_upper = 1.0
+
+lapse_itm_lower = 0.5
+
+lapse_itm_mult_coef = 1.25
+
+lapse_itm_threshold = 1.1
+
+lapse_wd_year_factor = 0.6
+
+vix_fee_coef = 0.0005
+
+vix_divisor = 33.0
+
+vix_offset = 10.0
+
+vix_band = 0.004
+
+vix_corridor_lo = 0.006
+
+vix_corridor_hi = 0.025
+
+cmt_spread = 0.01
+
+cmt_spread_predraw = 0.015
+
+cmt_round_step = 0.001
+
+cmt_floor = 0.04
+
+cmt_cap = 0.08
+
+expense_maint = 100.0
+
+expense_base_year = 2015
+
+valuation_year = 2026
+
+expense_av_rate = 0.0007
+
+inflation_rate = 0.025
+
+expense_acq = 0.0
+
+comm_rate_acq = 0.0
+
+pd = ("Module", "pandas")
\ No newline at end of file
@@ -0,0 +1,1842 @@
+# modelx: pseudo-python
+# This file is part of a modelx model.
+# It can be imported as a Python module, but functions defined herein
+# are model formulas and may not be executable as standard Python.
+
+"""The vectorized projection of :mod:`~.VA_US_M`.
+
+The Space is **not** parameterized. It projects every row of :func:`model_point` at once,
+and each cells parameterized by ``t`` returns a NumPy array with one element per row —
+or, for the subaccount-level cells, a 2-D array with one row per model point and one
+column per subaccount in :func:`sub_ids`::
+
+    >>> Projection.av_pp(27)               # contract values of all the model points
+    >>> Projection.sa_pp(27)               # shape (model points, subaccounts)
+    >>> Projection.result_cf()             # cash flows summed over the model points
+
+Every cells of the same name in :mod:`.VA_US_S` has the same meaning and the same
+formula here, written over arrays: the processing order within the month, the timing
+arguments, the guarantee events and the projection horizon are exactly those documented
+in the ``Projection`` docstring of :mod:`.VA_US_S`, and are not repeated here. What this
+docstring records is how the scalar formulas were turned into array formulas.
+
+.. rubric:: Branches become masks
+
+A scalar formula that returns early — ``if depleted_flag(t - 1): return gwb_pp(t - 1)``,
+``if not is_anniv(t): return r`` — is written as an ``np.where`` between the two
+branches, both computed for every model point. Each contract therefore takes the branch
+its own state selects, while the arithmetic runs once per month for the whole block. The
+anniversary events, the quarterly rider fees, the first-withdrawal test, the excess
+algebra, the depletion routine and the $10,000,000 cap are all masks of this kind.
+Divisions whose scalar form is guarded by ``if base > 0.0`` divide by a base that is
+replaced by 1 where it is not positive, so no masked-out element raises a warning.
+
+Five scalar cells take an argument that is a policy month, an amount or an age rather
+than a projection month: ``t_of_month(m)``, ``gawa_pct_at_age(a)``, ``lapse_itm_mult(m)``,
+``fee_rate_vix_raw(phi_0, vix_sq_avg)`` and ``fee_rate_vix_clip(prior, raw)``. Arrays
+cannot be Cells arguments, so ``gawa_pct_at_age`` becomes :func:`gawa_pct_age` ``(t)``,
+read at the attained age of month ``t`` as every scalar call site does, and the other
+four are written inline where they are used.
+
+.. rubric:: Contracts on different clocks
+
+Model points may enter at different policy months and run to different horizons, so the
+calendar is per contract: :func:`duration_mth`, :func:`policy_year` and the anniversary
+flags are arrays, and :func:`proj_len` is an array whose maximum,
+:func:`max_proj_len`, is the length of the shared ``t`` axis. Beyond its own horizon a
+contract is out of force and every one of its cash flows is zero.
+
+Three scalar cells read the state at a month that differs from contract to contract:
+:func:`rb_prior_anniv_pp` reads the Benefit Base at the preceding anniversary,
+:func:`is_wd_year` looks ahead to the end of the contract year, and :func:`phi_glwb`
+reads the VIX-formula rate of the current contract quarter. Each gathers the values from
+the few distinct months involved, one array per month. :func:`is_wd_year` reads
+:func:`has_wd_in_year`, the year-to-date withdrawal flag, at the end of the contract
+year; the bonus reads the same flag at the anniversary itself, which avoids making the
+month's own bonus depend on later months.
+
+.. rubric:: Input tables become dense arrays
+
+The step-function and banded lookups of :mod:`.VA_US_S` search the input tables once
+per contract per month. Here each table is unstacked once into a dense array — returns by
+scenario, subaccount and policy month; rates by scenario and policy month; the GAWA% by
+grid and age; the CDSC by schedule and completed years; mortality by age and sex;
+transactions by programme and policy month — and every month is a single fancy-indexing
+gather with row positions computed once per model point. Subaccounts are the union of
+the subaccounts of the allocation sets in use; a contract whose set does not hold a
+subaccount carries it with a zero allocation and a zero return, so it stays empty.
+
+.. rubric:: Parameters
+
+The product parameters, such as ``gwb_cap`` and ``lapse_rate_sc``, are References of
+:mod:`~.VA_US_M.Data` with the names and values of those of :mod:`~.VA_US_S.Projection`,
+read here as ``data.gwb_cap``.
+
+.. rubric:: Scenarios and model points
+
+Each row of :func:`model_point` names its own ``scenario_id``, so a stochastic run is
+a model point table in which each contract is repeated once per scenario. For
+large tables, project the rows in chunks with :func:`lifelib.runners.run_chunked`,
+which assigns each chunk to :func:`model_point` in turn and sums :func:`result_cf`
+across the chunks.
+
+.. rubric:: Results
+
+:func:`result_cf` and :func:`result_pols` sum the cash flows and the in-force movements
+over the model points, indexed by ``t`` from 0 to :func:`max_proj_len`. The per-contract
+values are the cells themselves. The three checks take no argument and return one
+``bool`` covering every model point and every month, with the signed per-month residuals
+available as arrays.
+"""
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = []
+
+_allow_none = None
+
+_spaces = []
+
+# ---------------------------------------------------------------------------
+# Cells
+
+def model_point():
+    """The model points to project, one row per contract, as a DataFrame.
+
+    All of :func:`~.VA_US_M.Data.model_point_table` by default. Assign a DataFrame of the
+    same columns to this cells as its input value to project a selection of rows, a
+    chunk of a larger table, or a table repeating each contract once per scenario.
+    """
+    return data.model_point_table()                                  # noqa: F821
+
+
+def point_count():
+    """The number of model points projected."""
+    return len(model_point())
+
+
+def policy_id():
+    """The contract identifiers of the model points."""
+    return model_point()["policy_id"].to_numpy()
+
+
+def age_at_entry():
+    """x: the issue ages (ANB) of the model points."""
+    return model_point()["age_at_entry"].to_numpy(dtype=int)
+
+
+def sex():
+    """The sex of the Designated Life of each model point, M or F."""
+    return model_point()["sex"].to_numpy()
+
+
+def designated_lives():
+    """``single`` or ``joint``, reported only as in :mod:`.VA_US_S`."""
+    return model_point()["designated_lives"].to_numpy()
+
+
+def tax_status():
+    """``NQ`` or ``Q``, reported only as in :mod:`.VA_US_S`."""
+    return model_point()["tax_status"].to_numpy()
+
+
+def pols_if_init():
+    """l(0): in-force at entry of each model point."""
+    return model_point()["pols_if_init"].to_numpy(dtype=float)
+
+
+def premium_tax_rate():
+    """tau: the premium tax rate of each model point, 0% **[std]**."""
+    return model_point()["premium_tax_rate"].to_numpy(dtype=float)
+
+
+def premium_single():
+    """The single purchase payments, paid at ``t = 0``."""
+    return model_point()["premium"].to_numpy(dtype=float)
+
+
+def fund_set():
+    """The keys into *fund_table.csv* naming each contract's subaccount allocation."""
+    return model_point()["fund_set"].to_numpy()
+
+
+def sub_ids():
+    """The subaccounts of the allocation sets in use, in file order.
+
+    The union over the model points, so that the subaccount axis of every 2-D cells is
+    the same for all of them. A subaccount outside a contract's own set has a zero
+    allocation in :func:`alloc` and stays empty.
+    """
+    table = data.fund_table()                                        # noqa: F821
+    used = table.index.get_level_values("fund_set").isin(fund_set())
+    return list(table[used].index.unique("sub_id"))
+
+
+def alloc():
+    """alloc[i]: the allocation of net premium, shape (model points, subaccounts)."""
+    table = data.fund_table()["alloc"].unstack("sub_id")             # noqa: F821
+    return table.reindex(index=fund_set(), columns=sub_ids()).fillna(0.0).to_numpy()
+
+
+def fund_expense_rate():
+    """e_i: the annual fund expense ratios, shape (model points, subaccounts)."""
+    table = data.fund_table()["fund_expense"].unstack("sub_id")      # noqa: F821
+    return table.reindex(index=fund_set(), columns=sub_ids()).fillna(0.0).to_numpy()
+
+
+def glwb_option():
+    """The GLWB elections, each a key into the GAWA% grid."""
+    return model_point()["glwb_option"].to_numpy()
+
+
+def stepup_basis():
+    """``annual_CV`` or ``highest_quarterly_CV`` for each model point."""
+    return model_point()["glwb_stepup_basis"].to_numpy()
+
+
+def gmdb_option():
+    """``rollup``, ``HQAV`` or ``basic`` for each model point."""
+    return model_point()["gmdb_option"].to_numpy()
+
+
+def cdsc_schedule():
+    """The keys into *cdsc_table.csv* naming each contract's withdrawal charge scale."""
+    return model_point()["cdsc_schedule"].to_numpy()
+
+
+def fee_reset_rule():
+    """``none``, ``quinquennial`` or ``vix`` for each model point."""
+    return model_point()["fee_reset_rule"].to_numpy()
+
+
+def rollup_rule():
+    """``fixed`` or ``cmt_linked`` for each model point."""
+    return model_point()["rollup_rule"].to_numpy()
+
+
+def wd_start_age():
+    """The attained ages at which GLWB withdrawals begin; 0 never withdraws."""
+    return model_point()["wd_start_age"].to_numpy(dtype=int)
+
+
+def wd_intensity():
+    """The fractions of the annual limit withdrawn once activated."""
+    return model_point()["wd_intensity"].to_numpy(dtype=float)
+
+
+def scenario_id():
+    """The scenario each model point runs on, a key into the two scenario tables."""
+    return model_point()["scenario_id"].to_numpy()
+
+
+def txn_id():
+    """The scheduled transaction programmes, keys into *transaction_table.csv*."""
+    return model_point()["txn_id"].to_numpy()
+
+
+def duration_mth_init():
+    """Policy months already elapsed at ``t = 0``; 0 for an at-issue cell."""
+    return model_point()["duration_mth_init"].to_numpy(dtype=int)
+
+
+def is_inforce():
+    """True for the model points entering mid-contract rather than at issue."""
+    return duration_mth_init() > 0
+
+
+def av_pp_init():
+    """AV carried into ``t = 0``, split across subaccounts by :func:`alloc`."""
+    return model_point()["av_init"].to_numpy(dtype=float)
+
+
+def gwb_pp_init():
+    """GWB carried into ``t = 0``."""
+    return model_point()["gwb_init"].to_numpy(dtype=float)
+
+
+def gawa_pp_init():
+    """GAWA carried into ``t = 0``."""
+    return model_point()["gawa_init"].to_numpy(dtype=float)
+
+
+def gawa_pct_init():
+    """The GAWA% already locked at ``t = 0``; 0 when no withdrawal has been taken."""
+    return model_point()["gawa_pct_init"].to_numpy(dtype=float)
+
+
+def has_wd_init():
+    """Whether a withdrawal had already been taken before ``t = 0``."""
+    return gawa_pct_init() > 0.0
+
+
+def bb_pp_init():
+    """Bonus Base carried into ``t = 0``."""
+    return model_point()["bb_init"].to_numpy(dtype=float)
+
+
+def rb_pp_init():
+    """GMDB Benefit Base carried into ``t = 0``."""
+    return model_point()["rb_init"].to_numpy(dtype=float)
+
+
+def np_pp_init():
+    """Cumulative Net Premiums carried into ``t = 0``."""
+    return model_point()["np_init"].to_numpy(dtype=float)
+
+
+def rp_pp_init():
+    """Remaining Premium carried into ``t = 0``."""
+    return model_point()["rp_init"].to_numpy(dtype=float)
+
+
+def adj_pp_init():
+    """GWB Adjustment carried into ``t = 0``."""
+    return model_point()["adj_init"].to_numpy(dtype=float)
+
+
+def bonus_end_init():
+    """The contract year the Bonus Period ends, carried into ``t = 0``."""
+    return model_point()["bonus_end_init"].to_numpy(dtype=int)
+
+
+def policy_term():
+    """Contract terms in years: entry age to ``omega_age`` **[std]**."""
+    return data.omega_age - age_at_entry()                  # noqa: F821
+
+
+def proj_len():
+    """Projection lengths in months from ``t = 0``, one per model point."""
+    return 12 * policy_term() - duration_mth_init()
+
+
+def max_proj_len():
+    """The longest projection: the last ``t`` any model point reaches."""
+    return int(proj_len().max())
+
+
+def month_count():
+    """The number of policy months the dense input grids cover.
+
+    One more than the last policy month any model point reaches, ``12 x policy_term``.
+    Lookups past the last column read the last column, which is what a step function
+    does.
+    """
+    return int((12 * policy_term()).max()) + 1
+
+
+def duration_mth(t):
+    """The policy months at projection month t: ``duration_mth_init() + t``."""
+    return duration_mth_init() + t
+
+
+def policy_year(t):
+    """y(t) = ceil(policy month / 12): the contract years; 0 at issue."""
+    return (duration_mth(t) + 11) // 12
+
+
+def duration(t):
+    """Completed contract years at month t, ``policy_year(t) - 1``, floored at 0."""
+    return np.maximum(0, policy_year(t) - 1)                         # noqa: F821
+
+
+def age(t):
+    """a(t) = x + y - 1: the attained ages (ANB) during month t."""
+    return age_at_entry() + duration(t)
+
+
+def age_at_anniv(t):
+    """The attained ages just after the Contract Anniversary at the end of month t."""
+    return age_at_entry() + policy_year(t)
+
+
+def contract_quarter(t):
+    """k(t) = ceil(policy month / 3): the contract quarters containing month t."""
+    return (duration_mth(t) + 2) // 3
+
+
+def is_anniv(t):
+    """True where month t ends at a Contract Anniversary."""
+    return (t >= 1) & (t <= proj_len()) & (duration_mth(t) % 12 == 0)
+
+
+def is_quarterly_anniv(t):
+    """True where month t ends at a Contract Quarterly Anniversary **[std]**."""
+    return (t >= 1) & (t <= proj_len()) & (duration_mth(t) % 3 == 0)
+
+
+def is_year_start(t):
+    """True where month t is the first month of a contract year."""
+    return (t >= 1) & ((duration_mth(t) - 1) % 12 == 0)
+
+
+def phase(t):
+    """ACCUM, DEPLETED or EXPIRED at month t, one per model point."""
+    return np.where(t > proj_len(), "EXPIRED",                       # noqa: F821
+                    np.where(depleted_flag(t), "DEPLETED", "ACCUM"))  # noqa: F821
+
+
+def inv_return_grid():
+    """Gross fund returns as a dense table by scenario and subaccount, and policy month.
+
+    :func:`~.VA_US_M.Data.return_scenario` unstacked by month and filled forward, so
+    each row states the return in force at every policy month up to
+    :func:`month_count`. Months before a series' first row are ``nan``.
+    """
+    table = data.return_scenario()["gross_return"].unstack("t")      # noqa: F821
+    table = table.reindex(columns=range(month_count()))
+    return table.ffill(axis=1)
+
+
+def inv_return_rows():
+    """The rows of :func:`inv_return_grid` for each model point and subaccount.
+
+    Shape (model points, subaccounts); -1 for a subaccount outside the contract's
+    allocation set. A subaccount in the set with no series in the scenario raises
+    ``KeyError``.
+    """
+    subs = sub_ids()
+    keys = pd.MultiIndex.from_arrays(                                # noqa: F821
+        [np.repeat(scenario_id(), len(subs)),                        # noqa: F821
+         np.tile(subs, point_count())])                              # noqa: F821
+    rows = inv_return_grid().index.get_indexer(keys).reshape(point_count(), len(subs))
+    table = data.fund_table()["alloc"].unstack("sub_id")             # noqa: F821
+    in_set = table.reindex(index=fund_set(), columns=subs).notna().to_numpy()
+    if (in_set & (rows < 0)).any():
+        raise KeyError("scenario_id not in return_scenario")
+    return np.where(in_set, rows, -1)                                # noqa: F821
+
+
+def inv_return_mth(t):
+    """r_i(t): gross monthly fund returns, shape (model points, subaccounts).
+
+    Read off :func:`inv_return_grid` at the **policy** month, as a step function.
+    A month before the first row of a series raises ``ValueError``, as in :mod:`.VA_US_S`.
+    """
+    grid = inv_return_grid()
+    rows = inv_return_rows()
+    month = np.clip(np.maximum(duration_mth(t), 0), 0, grid.shape[1] - 1)  # noqa: F821
+    values = grid.to_numpy()[np.maximum(rows, 0), month[:, np.newaxis]]  # noqa: F821
+    values = np.where(rows >= 0, values, 0.0)                        # noqa: F821
+    missing = np.isnan(values).any(axis=1)                           # noqa: F821
+    if missing.any():
+        raise ValueError("no return row at or before month %d" % month[missing].min())
+    return values
+
+
+def rate_grid(name):
+    """Column ``name`` of the rate scenarios as a dense table by scenario and policy month."""
+    table = data.rate_scenario()[name].unstack("t")                  # noqa: F821
+    return table.reindex(columns=range(month_count())).ffill(axis=1)
+
+
+def rate_rows():
+    """The rows of :func:`rate_grid` for each model point's scenario."""
+    rows = rate_grid("vix_sq").index.get_indexer(scenario_id())
+    if (rows < 0).any():
+        raise KeyError("scenario_id not in rate_scenario")
+    return rows
+
+
+def scenario_rate(t, name):
+    """Step-function lookup of column ``name`` in each model point's rate scenario."""
+    grid = rate_grid(name)
+    month = np.clip(np.maximum(duration_mth(t), 0), 0, grid.shape[1] - 1)  # noqa: F821
+    return grid.to_numpy()[rate_rows(), month]
+
+
+def vix_sq(k):
+    """The quarterly average of daily VIX-squared for contract quarter k.
+
+    Read at the last month of the quarter, policy month ``3k``, which is the same for
+    every model point.
+    """
+    grid = rate_grid("vix_sq")
+    month = min(max(3 * k, 0), grid.shape[1] - 1)
+    return grid.to_numpy()[rate_rows(), month]
+
+
+def cmt10(t):
+    """The 20-day average 10-year CMT rate at month t, used by ``cmt_linked`` only."""
+    return scenario_rate(t, "cmt10")
+
+
+def unit_growth(t):
+    """The monthly unit value factors, shape (model points, subaccounts).
+
+    ``(1 + r_i(t)) x (1 - e_i/12) x (1 - (m + alpha)/12)``, as in :mod:`.VA_US_S`.
+    """
+    return ((1.0 + inv_return_mth(t))
+            * (1.0 - fund_expense_rate() / 12.0)
+            * (1.0 - (data.asset_charge_me                  # noqa: F821
+                      + data.asset_charge_admin) / 12.0))   # noqa: F821
+
+
+def sa_pp_at(t, timing):
+    """SA_i at month t read at ``timing``, shape (model points, subaccounts).
+
+    A withdrawal and a unit cancellation both scale the subaccounts by
+    ``(1 - amount / AV)``. Contracts depleted before month t, or past their horizon,
+    hold nothing.
+    """
+    if t < 0:
+        return np.zeros((point_count(), len(sub_ids())))             # noqa: F821
+    if t == 0:
+        return alloc() * (av_pp_init() + prem_to_av_pp(0))[:, np.newaxis]  # noqa: F821
+    live = ~depleted_flag(t - 1) & (t <= proj_len())
+    sa = np.where(live[:, np.newaxis], sa_pp(t - 1), 0.0)            # noqa: F821
+    if timing == "BEF_PREM":
+        return sa
+    sa = sa + alloc() * prem_to_av_pp(t)[:, np.newaxis]              # noqa: F821
+    if timing == "BEF_WD":
+        return sa
+    base = av_pp_at(t, "BEF_WD")
+    ratio = 1.0 - wd_pp(t) / np.where(base > 0.0, base, 1.0)         # noqa: F821
+    sa = np.where((base > 0.0)[:, np.newaxis], sa * ratio[:, np.newaxis], 0.0)  # noqa: F821
+    if timing == "BEF_INV":
+        return sa
+    sa = sa * unit_growth(t)
+    if timing == "BEF_FEE":
+        return sa
+    base = av_pp_at(t, "BEF_FEE")
+    ratio = 1.0 - charge_pp(t) / np.where(base > 0.0, base, 1.0)     # noqa: F821
+    sa = np.where((base > 0.0)[:, np.newaxis], sa * ratio[:, np.newaxis], 0.0)  # noqa: F821
+    if timing == "EOM":
+        return sa
+    raise ValueError("invalid timing")
+
+
+def sa_pp(t):
+    """SA_i(t): subaccount values at the end of month t, shape (model points, subaccounts)."""
+    return sa_pp_at(t, "EOM")
+
+
+def av_pp_at(t, timing):
+    """AV at month t read at ``timing``: the sum over subaccounts."""
+    return sa_pp_at(t, timing).sum(axis=1)
+
+
+def av_pp(t):
+    """AV(t): the contract values at the end of month t."""
+    return av_pp_at(t, "EOM")
+
+
+def sa_weight(t):
+    """w_i(t): the value weights read at ``BEF_FEE``, shape (model points, subaccounts)."""
+    base = av_pp_at(t, "BEF_FEE")
+    weight = sa_pp_at(t, "BEF_FEE") / np.where(base > 0.0, base, 1.0)[:, np.newaxis]  # noqa: F821
+    return np.where((base > 0.0)[:, np.newaxis], weight, 0.0)        # noqa: F821
+
+
+def gross_inv_income_pp(t):
+    """The gross fund return over month t, before any charge."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    income = (sa_pp_at(t, "BEF_INV") * inv_return_mth(t)).sum(axis=1)
+    return np.where(depleted_flag(t - 1), 0.0, income)               # noqa: F821
+
+
+def fund_expense_pp(t):
+    """The funds' own expense collected inside the unit value; not insurer revenue."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    expense = (sa_pp_at(t, "BEF_INV") * (1.0 + inv_return_mth(t))
+               * fund_expense_rate() / 12.0).sum(axis=1)
+    return np.where(depleted_flag(t - 1), 0.0, expense)              # noqa: F821
+
+
+def asset_charge_pp(t):
+    """The M&E and administrative asset charge collected inside the unit value."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    rate = (data.asset_charge_me                            # noqa: F821
+            + data.asset_charge_admin) / 12.0               # noqa: F821
+    charge = (sa_pp_at(t, "BEF_INV") * (1.0 + inv_return_mth(t))
+              * (1.0 - fund_expense_rate() / 12.0) * rate).sum(axis=1)
+    return np.where(depleted_flag(t - 1), 0.0, charge)               # noqa: F821
+
+
+def inv_income_pp(t):
+    """The change in AV over month t from investment, ``AV(BEF_FEE) - AV(BEF_INV)``."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return av_pp_at(t, "BEF_FEE") - av_pp_at(t, "BEF_INV")
+
+
+def txn_grid(name):
+    """Column ``name`` of the transaction table as a dense table by programme and month.
+
+    Unlike the scenario tables this is not a step function: a month with no row takes
+    no transaction, so missing months are 0.
+    """
+    table = data.transaction_table()[name].unstack("t")              # noqa: F821
+    return table.reindex(columns=range(month_count())).fillna(0.0)
+
+
+def txn_rows():
+    """The rows of :func:`txn_grid` for each model point's programme.
+
+    -1 for a ``txn_id`` with no rows, which takes no transactions as in VA_US_S.
+    """
+    return txn_grid("prem_amount").index.get_indexer(txn_id())
+
+
+def txn_amount(t, name):
+    """The amount in column ``name`` scheduled for month t, else zero."""
+    grid = txn_grid(name)
+    rows = txn_rows()
+    month = duration_mth(t)
+    valid = (rows >= 0) & (month >= 0) & (month < grid.shape[1])
+    values = grid.to_numpy()[rows, np.clip(month, 0, grid.shape[1] - 1)]  # noqa: F821
+    return np.where(valid, values, 0.0)                              # noqa: F821
+
+
+def prem_scheduled_pp(t):
+    """The gross premiums scheduled for month t in *transaction_table.csv*, else zero."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return txn_amount(t, "prem_amount")
+
+
+def premium_pp(t):
+    """P(t): the gross premiums paid at BOM of month t."""
+    if t == 0:
+        return premium_single() + prem_scheduled_pp(t)
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    stopped = (t > proj_len()) | depleted_flag(t - 1)
+    return np.where(stopped, 0.0, prem_scheduled_pp(t))              # noqa: F821
+
+
+def prem_to_av_pp(t):
+    """P(t)(1 - tau): the net premiums that buy units and raise the guarantee bases."""
+    return premium_pp(t) * (1.0 - premium_tax_rate())
+
+
+def wd_scheduled_pp(t):
+    """The gross withdrawals scheduled for month t in *transaction_table.csv*, else zero."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return txn_amount(t, "wd_amount")
+
+
+def is_wd_month(t):
+    """True where the GLWB utilization withdrawal falls in month t."""
+    if t < 1:
+        return np.zeros(point_count(), dtype=bool)                   # noqa: F821
+    return ((t <= proj_len()) & (wd_start_age() > 0)
+            & ~depleted_flag(t - 1) & is_year_start(t)
+            & (age(t) >= wd_start_age()))
+
+
+def is_wd_taken(t):
+    """True where any withdrawal is taken in month t, before its amount is known."""
+    if t < 1:
+        return np.zeros(point_count(), dtype=bool)                   # noqa: F821
+    return ((t <= proj_len()) & ~depleted_flag(t - 1)
+            & ((wd_scheduled_pp(t) > 0.0) | is_wd_month(t)))
+
+
+def has_wd_by(t):
+    """True where a withdrawal has been taken at or before month t."""
+    if t < 1:
+        return has_wd_init()
+    return has_wd_by(t - 1) | is_wd_taken(t)
+
+
+def is_first_wd(t):
+    """True in the month of each contract's first withdrawal."""
+    if t < 1:
+        return np.zeros(point_count(), dtype=bool)                   # noqa: F821
+    return is_wd_taken(t) & ~has_wd_by(t - 1)
+
+
+def has_wd_in_year(t):
+    """True where a withdrawal has been taken in the contract year, up to month t.
+
+    Resets at each contract year start. Read at the anniversary it is the
+    no-withdrawal-in-the-year test of the bonus; read at the end of the year it is
+    :func:`is_wd_year`.
+    """
+    if t < 1:
+        return np.zeros(point_count(), dtype=bool)                   # noqa: F821
+    return is_wd_taken(t) | (~is_year_start(t) & has_wd_in_year(t - 1))
+
+
+def is_wd_year(t):
+    """True where any withdrawal falls in the contract year containing month t.
+
+    :func:`has_wd_in_year` read at the last month of the contract year, which lies up to
+    eleven months ahead of t and differs between contracts on different clocks.
+    """
+    year = policy_year(t)
+    last = 12 * year - duration_mth_init()
+    result = np.zeros(point_count(), dtype=bool)                     # noqa: F821
+    for u in np.unique(last[year > 0]):                              # noqa: F821
+        mask = (last == u) & (year > 0)
+        result[mask] = has_wd_in_year(int(u))[mask]
+    return result
+
+
+def gawa_pct_grid():
+    """The GAWA% grid as a dense table by ``glwb_option`` and attained age.
+
+    Each band holds from its ``age_from`` to the next; ages below the lowest band are 0.
+    """
+    table = data.gawa_pct_table()["gawa_pct"].unstack("age_from")    # noqa: F821
+    table = table.reindex(columns=range(data.omega_age + 2))  # noqa: F821
+    return table.ffill(axis=1).fillna(0.0)
+
+
+def gawa_pct_rows():
+    """The rows of :func:`gawa_pct_grid` for each model point's ``glwb_option``."""
+    rows = gawa_pct_grid().index.get_indexer(glwb_option())
+    if (rows < 0).any():
+        raise KeyError("glwb_option not in gawa_pct_table")
+    return rows
+
+
+def gawa_pct_age(t):
+    """g(a(t)): the GAWA% at the attained age of month t.
+
+    The scalar model's ``gawa_pct_at_age(a)`` is only ever called at ``age(t)``.
+    """
+    grid = gawa_pct_grid()
+    ages = np.clip(age(t), 0, grid.shape[1] - 1)                     # noqa: F821
+    return grid.to_numpy()[gawa_pct_rows(), ages]
+
+
+def wd_limit_pp(t):
+    """L(t) = max(GAWA, RMD): the annual withdrawal limits governing month t."""
+    return np.where(is_first_wd(t),                                  # noqa: F821
+                    gawa_pct_age(t) * gwb_pp_at(t, "BEF_WD"),
+                    gawa_pp_at(t, "BEF_WD"))
+
+
+def wd_glwb_pp(t):
+    """The GLWB utilization withdrawals: ``wd_intensity x L(t)`` once activated."""
+    return np.where(is_wd_month(t), wd_intensity() * wd_limit_pp(t), 0.0)  # noqa: F821
+
+
+def wd_pp_due(t):
+    """The gross withdrawals requested at BOM of month t, before capping at AV."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    stopped = (t > proj_len()) | depleted_flag(t - 1)
+    return np.where(stopped, 0.0, wd_scheduled_pp(t) + wd_glwb_pp(t))  # noqa: F821
+
+
+def wd_pp(t):
+    """W(t): the gross amounts removed from the contract values at BOM of month t."""
+    return np.minimum(wd_pp_due(t), av_pp_at(t, "BEF_WD"))           # noqa: F821
+
+
+def sum_wd_pp(t):
+    """SumW_y: cumulative withdrawals in the current contract year, including W(t)."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    prev = np.where(is_year_start(t), 0.0, sum_wd_pp(t - 1))         # noqa: F821
+    return prev + wd_pp(t)
+
+
+def wd_excess_pp(t):
+    """E(t): the portion of the withdrawals above the GLWB annual limit."""
+    wd = wd_pp(t)
+    over = sum_wd_pp(t) - wd_limit_pp(t)
+    return np.where((wd > 0.0) & (over > 0.0), np.minimum(wd, over), 0.0)  # noqa: F821
+
+
+def wd_nonexcess_pp(t):
+    """N(t) = W(t) - E(t): the guaranteed portions of the withdrawals."""
+    return wd_pp(t) - wd_excess_pp(t)
+
+
+def cv_pre_excess_pp(t):
+    """CV_pre: the contract values after the non-excess portions have been deducted."""
+    return av_pp_at(t, "BEF_WD") - wd_nonexcess_pp(t)
+
+
+def excess_factor(t):
+    """``1 - E(t)/CV_pre``: the pro-rata factors applied to GWB, GAWA and BB."""
+    base = cv_pre_excess_pp(t)
+    factor = 1.0 - wd_excess_pp(t) / np.where(base > 0.0, base, 1.0)  # noqa: F821
+    return np.where(base > 0.0, np.maximum(0.0, factor), 0.0)        # noqa: F821
+
+
+def free_wd_allow(t):
+    """The charge-free amounts at month t: ``max(earnings, 10% x RP)``."""
+    if t >= 1:
+        rp = rp_pp(t - 1) + premium_pp(t)
+    else:
+        rp = rp_pp_init()
+    earnings = np.maximum(0.0, av_pp_at(t, "BEF_WD") - rp)           # noqa: F821
+    return np.maximum(earnings, data.free_wd_rate * rp)     # noqa: F821
+
+
+def free_wd_avail(t):
+    """The free-withdrawal allowances still unused in the contract year at BOM of month t."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    used = np.where(is_year_start(t), 0.0, free_wd_used_cum_pp(t - 1))  # noqa: F821
+    return np.maximum(0.0, free_wd_allow(t) - used)                  # noqa: F821
+
+
+def wd_free_pp(t):
+    """The free-allowance portions of month t's withdrawals: ``min(FW, E(t))``."""
+    return np.minimum(free_wd_avail(t), wd_excess_pp(t))             # noqa: F821
+
+
+def free_wd_used_cum_pp(t):
+    """The free allowance consumed so far in the contract year, including month t."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    prev = np.where(is_year_start(t), 0.0, free_wd_used_cum_pp(t - 1))  # noqa: F821
+    return prev + wd_free_pp(t)
+
+
+def wd_exempt_pp(t):
+    """The portions of W(t) bearing no withdrawal charge at all."""
+    return np.minimum(wd_pp(t), wd_nonexcess_pp(t) + free_wd_avail(t))  # noqa: F821
+
+
+def wd_chargeable_pp(t):
+    """The portions of W(t) exposed to the CDSC."""
+    return wd_pp(t) - wd_exempt_pp(t)
+
+
+def surr_charge_grid():
+    """The CDSC scales as a dense table by ``cdsc_schedule`` and completed years.
+
+    Filled forward, so a schedule shorter than the longest one holds its last rate, as
+    the scalar model's ``min(duration(t), last year)`` does.
+    """
+    table = data.cdsc_table()["surr_charge_rate"].unstack("completed_years")  # noqa: F821
+    table = table.reindex(columns=range(int(table.columns.max()) + 1))
+    return table.ffill(axis=1)
+
+
+def surr_charge_rows():
+    """The rows of :func:`surr_charge_grid` for each model point's ``cdsc_schedule``."""
+    return surr_charge_grid().index.get_indexer(cdsc_schedule())
+
+
+def surr_charge_rate(t):
+    """The CDSC rates at month t, read off the **contract duration**."""
+    grid = surr_charge_grid()
+    years = np.minimum(duration(t), grid.shape[1] - 1)               # noqa: F821
+    return grid.to_numpy()[surr_charge_rows(), years]
+
+
+def wd_charge_pp(t):
+    """c(t): the withdrawal charges on month t's withdrawals."""
+    return surr_charge_rate(t) * wd_chargeable_pp(t)
+
+
+def wd_payment_pp(t):
+    """The cash paid on month t's withdrawals, ``W(t) - c(t)``."""
+    return wd_pp(t) - wd_charge_pp(t)
+
+
+def surr_free_pp(t):
+    """The charge-free amounts left for a full surrender at the end of month t."""
+    rp = rp_pp(t)
+    earnings = np.maximum(0.0, av_pp(t) - rp)                        # noqa: F821
+    allow = np.maximum(earnings, data.free_wd_rate * rp)    # noqa: F821
+    return np.maximum(0.0, allow - free_wd_used_cum_pp(t))           # noqa: F821
+
+
+def surr_chargeable_pp(t):
+    """The Remaining Premium withdrawn on a full surrender, net of the free amount."""
+    return np.minimum(rp_pp(t), np.maximum(0.0, av_pp(t) - surr_free_pp(t)))  # noqa: F821
+
+
+def surr_charge_pp(t):
+    """The CDSC on a full surrender at the end of month t."""
+    return surr_charge_rate(t) * surr_chargeable_pp(t)
+
+
+def surr_benefit_pp(t):
+    """Surrender proceeds: ``AV(t)`` less the CDSC, with no nonforfeiture floor."""
+    return av_pp(t) - surr_charge_pp(t)
+
+
+def phi_glwb(t):
+    """phi_G: the annual GLWB rider charge rates in force in month t.
+
+    The ``vix`` rate is that of each contract's current quarter, gathered from
+    :func:`phi_glwb_vix` for the distinct quarters in month t.
+    """
+    rule = fee_reset_rule()
+    if not np.isin(rule, ["none", "quinquennial", "vix"]).all():     # noqa: F821
+        raise ValueError("invalid fee_reset_rule")
+    steps = duration(t) // data.fee_reset_years             # noqa: F821
+    rate = np.where(                                                 # noqa: F821
+        rule == "quinquennial",
+        np.minimum(data.phi_glwb_max,                       # noqa: F821
+                   data.phi_glwb_curr                       # noqa: F821
+                   + data.fee_increase_max * steps),        # noqa: F821
+        data.phi_glwb_curr)                                 # noqa: F821
+    is_vix = rule == "vix"
+    if is_vix.any():
+        k = contract_quarter(t)
+        for q in np.unique(k[is_vix]):                               # noqa: F821
+            mask = is_vix & (k == q)
+            rate[mask] = phi_glwb_vix(int(q))[mask]
+    return rate
+
+
+def phi_glwb_vix(k):
+    """The VIX-formula GLWB charge rates in contract quarter k [S4][S6].
+
+    ``phi_0 + 0.05% x [vix_sq / 33 - 10]``, clipped to the +/-0.40% band around the
+    prior quarter's rate and to the [0.60%, 2.50%] corridor. The scalar model's
+    ``fee_rate_vix_raw`` and ``fee_rate_vix_clip`` are written inline.
+    """
+    if k <= 1:
+        return np.full(point_count(), data.phi_glwb_curr)   # noqa: F821
+    prior = phi_glwb_vix(k - 1)
+    raw = data.phi_glwb_curr + data.vix_fee_coef * (  # noqa: F821
+        vix_sq(k) / data.vix_divisor - data.vix_offset)  # noqa: F821
+    band = data.vix_band                                    # noqa: F821
+    lo = np.maximum(data.vix_corridor_lo, prior - band)     # noqa: F821
+    hi = np.minimum(data.vix_corridor_hi, prior + band)     # noqa: F821
+    return np.minimum(hi, np.maximum(lo, raw))                       # noqa: F821
+
+
+def phi_gmdb(t):
+    """phi_D: the annual GMDB rider charge rates; zero on the ``basic`` death benefit."""
+    return np.where(gmdb_option() == "basic", 0.0,                   # noqa: F821
+                    data.phi_gmdb_curr)                     # noqa: F821
+
+
+def rollup_pct():
+    """rho at election: 6.00% at age 69 or younger, 5.00% from 70 [S3]."""
+    return np.where(age_at_entry() >= data.rollup_age_split,  # noqa: F821
+                    data.rollup_pct_old,                    # noqa: F821
+                    data.rollup_pct_young)                  # noqa: F821
+
+
+def rollup_rate(t):
+    """rho(t): the GMDB roll-up percentages credited at the anniversary ending month t."""
+    rule = rollup_rule()
+    if not np.isin(rule, ["fixed", "cmt_linked"]).all():             # noqa: F821
+        raise ValueError("invalid rollup_rule")
+    rate = rollup_pct()
+    is_cmt = rule == "cmt_linked"
+    if is_cmt.any():
+        spread = np.where(has_wd_by(t), data.cmt_spread,    # noqa: F821
+                          data.cmt_spread_predraw)          # noqa: F821
+        raw = cmt10(t) + spread
+        step = data.cmt_round_step                          # noqa: F821
+        rounded = np.floor(raw / step + 0.5) * step                  # noqa: F821
+        cmt = np.maximum(data.cmt_floor,                    # noqa: F821
+                         np.minimum(data.cmt_cap, rounded))  # noqa: F821
+        rate = np.where(is_cmt, cmt, rate)                           # noqa: F821
+    return rate
+
+
+def fee_glwb_pp_due(t):
+    """Fee_G = (phi_G/4) x GWB at a Contract Quarterly Anniversary, on the **benefit base**."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    due = ~depleted_flag(t - 1) & is_quarterly_anniv(t)
+    return np.where(due, (phi_glwb(t) / 4.0) * gwb_pp_at(t, "BEF_ANNIV"), 0.0)  # noqa: F821
+
+
+def fee_gmdb_pp_due(t):
+    """Fee_D = (phi_D/4) x RB at a Contract Quarterly Anniversary."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    due = ~depleted_flag(t - 1) & is_quarterly_anniv(t)
+    return np.where(due, (phi_gmdb(t) / 4.0) * rb_pp_at(t, "BEF_ANNIV"), 0.0)  # noqa: F821
+
+
+def maint_fee_pp_due(t):
+    """f_c: the $35 annual contract fee, waived at a contract value of $50,000 or more."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    due = ~depleted_flag(t - 1) & is_anniv(t)
+    after_riders = (av_pp_at(t, "BEF_FEE")
+                    - fee_glwb_pp_due(t) - fee_gmdb_pp_due(t))
+    fee = np.where(after_riders >= data.maint_fee_waiver_av,  # noqa: F821
+                   0.0, data.maint_fee)                     # noqa: F821
+    return np.where(due, fee, 0.0)                                   # noqa: F821
+
+
+def charge_pp_due(t):
+    """The total unit cancellations due at EOM before capping at the contract values."""
+    return fee_glwb_pp_due(t) + fee_gmdb_pp_due(t) + maint_fee_pp_due(t)
+
+
+def charge_scale(t):
+    """The fractions of the charges due that the contract values can actually pay."""
+    due = charge_pp_due(t)
+    scale = av_pp_at(t, "BEF_FEE") / np.where(due > 0.0, due, 1.0)   # noqa: F821
+    return np.where(due > 0.0, np.minimum(1.0, scale), 0.0)          # noqa: F821
+
+
+def fee_glwb_pp(t):
+    """The GLWB rider fees actually collected in month t."""
+    return fee_glwb_pp_due(t) * charge_scale(t)
+
+
+def fee_gmdb_pp(t):
+    """The GMDB rider fees actually collected in month t."""
+    return fee_gmdb_pp_due(t) * charge_scale(t)
+
+
+def maint_fee_pp(t):
+    """The annual contract fees actually collected in month t."""
+    return maint_fee_pp_due(t) * charge_scale(t)
+
+
+def charge_pp(t):
+    """The total unit cancellations at EOM of month t: the two rider fees and f_c."""
+    return charge_pp_due(t) * charge_scale(t)
+
+
+def charge_income_pp(t):
+    """Insurer charge income per contract in month t, excluding the funds' own expense."""
+    return asset_charge_pp(t) + charge_pp(t)
+
+
+def gwb_pp_at(t, timing):
+    """GWB at month t read at ``BEF_PREM``, ``BEF_WD`` or ``BEF_ANNIV``."""
+    if t < 1:
+        return gwb_pp_init()
+    prev = gwb_pp(t - 1)
+    if timing == "BEF_PREM":
+        return prev
+    depleted = depleted_flag(t - 1)
+    g = np.minimum(data.gwb_cap, prev + prem_to_av_pp(t))   # noqa: F821
+    if timing == "BEF_WD":
+        return np.where(depleted, prev, g)                           # noqa: F821
+    wd = wd_pp(t)
+    within = np.maximum(g - wd, 0.0)                                 # noqa: F821
+    beyond = np.maximum((g - wd_nonexcess_pp(t)) * excess_factor(t), 0.0)  # noqa: F821
+    g = np.where(wd > 0.0,                                           # noqa: F821
+                 np.where(sum_wd_pp(t) <= wd_limit_pp(t), within, beyond), g)  # noqa: F821
+    if timing == "BEF_ANNIV":
+        return np.where(depleted, prev, g)                           # noqa: F821
+    raise ValueError("invalid timing")
+
+
+def bb_pp_bef_anniv(t):
+    """The Bonus Base carried into the anniversary events of month t."""
+    if t < 1:
+        return bb_pp_init()
+    prev = bb_pp(t - 1)
+    b = np.minimum(data.gwb_cap, prev + prem_to_av_pp(t))   # noqa: F821
+    excess = (wd_pp(t) > 0.0) & (sum_wd_pp(t) > wd_limit_pp(t))
+    b = np.where(excess, np.minimum(gwb_pp_at(t, "BEF_ANNIV"), b), b)  # noqa: F821
+    return np.where(depleted_flag(t - 1), prev, b)                   # noqa: F821
+
+
+def bonus_pp(t):
+    """The GLWB bonuses credited at the Contract Anniversary ending month t.
+
+    ``b x BB`` unless a withdrawal was taken in the contract year or the year is past the
+    Bonus Period. The withdrawal test reads :func:`has_wd_in_year` at month t, which at
+    an anniversary covers the whole contract year.
+    """
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    credited = (is_anniv(t) & ~depleted_flag(t - 1)
+                & (policy_year(t) <= bonus_end(t - 1)) & ~has_wd_in_year(t))
+    return np.where(credited,                                        # noqa: F821
+                    data.bonus_pct * bb_pp_bef_anniv(t), 0.0)  # noqa: F821
+
+
+def gwb_pp_aft_bonus(t):
+    """GWB after anniversary sub-step 3, the GLWB bonus."""
+    return gwb_pp_at(t, "BEF_ANNIV") + bonus_pp(t)
+
+
+def stepup_base_pp(t):
+    """The contract values the step-up test is made against.
+
+    ``annual_CV``: the contract value at the anniversary. ``highest_quarterly_CV``: the
+    highest contract value over the four most recent Contract Quarterly Anniversaries.
+    """
+    basis = stepup_basis()
+    if not np.isin(basis, ["annual_CV", "highest_quarterly_CV"]).all():  # noqa: F821
+        raise ValueError("invalid stepup_basis")
+    highest = np.maximum.reduce(                                     # noqa: F821
+        [av_pp(t - 3 * j) for j in range(0, 4) if t - 3 * j >= 0])
+    return np.where(basis == "annual_CV", av_pp(t), highest)         # noqa: F821
+
+
+def is_stepup(t):
+    """True where the anniversary step-up fires: the contract value exceeds the GWB."""
+    return is_anniv(t) & (stepup_base_pp(t) > gwb_pp_aft_bonus(t))
+
+
+def gwb_pp_aft_stepup(t):
+    """GWB after anniversary sub-step 4, the step-up, bonus first **[std]**."""
+    aft_bonus = gwb_pp_aft_bonus(t)
+    return np.where(is_anniv(t),                                     # noqa: F821
+                    np.maximum(aft_bonus, stepup_base_pp(t)), aft_bonus)  # noqa: F821
+
+
+def gwb_adj_year():
+    """The contract years of the GWB Adjustment Date.
+
+    The later of the anniversary on or after the Designated Life's 70th birthday and the
+    12th Contract Anniversary.
+    """
+    return np.maximum(data.gwb_adj_min_year,                # noqa: F821
+                      data.gwb_adj_age - age_at_entry())    # noqa: F821
+
+
+def is_gwb_adj_date(t):
+    """True at the Contract Anniversary that is the GWB Adjustment Date."""
+    return is_anniv(t) & (policy_year(t) == gwb_adj_year())
+
+
+def adj_pp_bef_anniv(t):
+    """ADJ carried into the anniversary events of month t, voided by any withdrawal."""
+    if t < 1:
+        return adj_pp_init()
+    rate = np.where(duration_mth(t) <= 12, data.gwb_adj_pct, 1.0)  # noqa: F821
+    return np.where(has_wd_by(t), 0.0, adj_pp(t - 1) + rate * prem_to_av_pp(t))  # noqa: F821
+
+
+def adj_pp(t):
+    """ADJ(t): the GWB Adjustment amounts at the end of month t; 0 once terminated."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return adj_pp_init() + data.gwb_adj_pct * prem_to_av_pp(0)  # noqa: F821
+    ended = is_gwb_adj_date(t) | (policy_year(t) > gwb_adj_year())
+    return np.where(ended, 0.0, adj_pp_bef_anniv(t))                 # noqa: F821
+
+
+def gwb_pp(t):
+    """GWB(t): the Guaranteed Withdrawal Balances at the end of month t.
+
+    The GWB Adjustment Date test and the $10,000,000 cap finish the anniversary events.
+    Depleted contracts run the balance down by each payment unless the For Life
+    Guarantee is in effect.
+    """
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return np.minimum(data.gwb_cap,                     # noqa: F821
+                          gwb_pp_init() + prem_to_av_pp(0))          # noqa: F821
+    prev = gwb_pp(t - 1)
+    run_down = np.where(forlife_flag(), prev,                        # noqa: F821
+                        np.maximum(0.0, prev - glwb_payment_pp(t)))  # noqa: F821
+    g = gwb_pp_aft_stepup(t)
+    adjust = is_gwb_adj_date(t) & ~has_wd_by(t)
+    g = np.where(adjust, np.maximum(g, adj_pp_bef_anniv(t)), g)      # noqa: F821
+    g = np.minimum(data.gwb_cap, g)                         # noqa: F821
+    return np.where(depleted_flag(t - 1), run_down, g)               # noqa: F821
+
+
+def bb_pp(t):
+    """BB(t): the Bonus Bases at the end of month t."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return np.minimum(data.gwb_cap,                     # noqa: F821
+                          bb_pp_init() + prem_to_av_pp(0))           # noqa: F821
+    b = bb_pp_bef_anniv(t)
+    b = np.where(is_stepup(t), np.maximum(gwb_pp_aft_stepup(t), b), b)  # noqa: F821
+    b = np.minimum(data.gwb_cap, b)                         # noqa: F821
+    return np.where(depleted_flag(t - 1), bb_pp(t - 1), b)           # noqa: F821
+
+
+def bonus_end(t):
+    """The contract years in which the Bonus Periods end.
+
+    Restarting on each Bonus-Base-increasing step-up on or before the anniversary
+    following the Designated Life's 80th birthday.
+    """
+    if t <= 0:
+        return np.where(is_inforce(), bonus_end_init(),              # noqa: F821
+                        data.bonus_period_years)            # noqa: F821
+    restart = (is_stepup(t)                                          # noqa: F821
+               & (age_at_anniv(t) <= data.bonus_restart_age)  # noqa: F821
+               & (gwb_pp_aft_stepup(t) > bb_pp_bef_anniv(t)))
+    return np.where(restart, policy_year(t) + data.bonus_period_years, bonus_end(t - 1))  # noqa: F821
+
+
+def gawa_pct_fixed(t):
+    """The GAWA% locked at the first withdrawal, or at depletion; 0 until then."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return gawa_pct_init()
+    prev = gawa_pct_fixed(t - 1)
+    fix = is_first_wd(t) | depleted_flag(t)
+    return np.where(prev > 0.0, prev, np.where(fix, gawa_pct_age(t), 0.0))  # noqa: F821
+
+
+def gawa_pp_at(t, timing):
+    """GAWA at month t read at ``BEF_PREM``, ``BEF_WD`` or ``BEF_ANNIV``."""
+    if t < 1:
+        return gawa_pp_init()
+    prev = gawa_pp(t - 1)
+    if timing == "BEF_PREM":
+        return prev
+    depleted = depleted_flag(t - 1)
+    prem = prem_to_av_pp(t)
+    g = np.where(has_wd_by(t - 1) & (prem > 0.0),                    # noqa: F821
+                 prev + gawa_pct_fixed(t - 1) * prem, prev)
+    if timing == "BEF_WD":
+        return np.where(depleted, prev, g)                           # noqa: F821
+    g = np.where(is_first_wd(t), gawa_pct_age(t) * gwb_pp_at(t, "BEF_WD"), g)  # noqa: F821
+    excess = (wd_pp(t) > 0.0) & (sum_wd_pp(t) > wd_limit_pp(t))
+    g = np.where(excess,                                             # noqa: F821
+                 np.minimum(g * excess_factor(t), gwb_pp_at(t, "BEF_ANNIV")), g)  # noqa: F821
+    if timing == "BEF_ANNIV":
+        return np.where(depleted, prev, g)                           # noqa: F821
+    raise ValueError("invalid timing")
+
+
+def gawa_pp(t):
+    """GAWA(t): the Guaranteed Annual Withdrawal Amounts at the end of month t.
+
+    After the first withdrawal the bonus and the step-up raise it to
+    ``max(g x GWB, GAWA)``; without the For Life Guarantee it is floored down to the GWB
+    at a Contract Year end.
+    """
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return gawa_pp_init()
+    anniv = is_anniv(t)
+    pct = gawa_pct_fixed(t)
+    raised = anniv & has_wd_by(t) & (pct > 0.0)
+    g = gawa_pp_at(t, "BEF_ANNIV")
+    g = np.where(raised & (bonus_pp(t) > 0.0),                       # noqa: F821
+                 np.maximum(pct * gwb_pp_aft_bonus(t), g), g)        # noqa: F821
+    g = np.where(raised & is_stepup(t),                              # noqa: F821
+                 np.maximum(pct * gwb_pp_aft_stepup(t), g), g)       # noqa: F821
+    gwb = gwb_pp(t)
+    g = np.where(anniv & ~forlife_flag() & (gwb < g), gwb, g)        # noqa: F821
+    g = np.where((g <= 0.0) & depleted_flag(t) & (pct > 0.0), pct * gwb, g)  # noqa: F821
+    return np.where(depleted_flag(t - 1), gawa_pp(t - 1), g)         # noqa: F821
+
+
+def np_pp(t):
+    """NP(t): cumulative Net Premiums, never reduced for a withdrawal."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return np_pp_init() + prem_to_av_pp(0)
+    prev = np_pp(t - 1)
+    return np.where(depleted_flag(t - 1), prev, prev + prem_to_av_pp(t))  # noqa: F821
+
+
+def rp_reduction_pp(t):
+    """The premium portions of month t's withdrawals, earnings coming out first **[std]**."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    wd = wd_pp(t)
+    rp = rp_pp(t - 1) + premium_pp(t)
+    earnings = np.maximum(0.0, av_pp_at(t, "BEF_WD") - rp)           # noqa: F821
+    return np.where(wd > 0.0, np.minimum(rp, np.maximum(0.0, wd - earnings)), 0.0)  # noqa: F821
+
+
+def rp_pp(t):
+    """RP(t): Remaining Premium, the basis the CDSC is charged on."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return rp_pp_init() + premium_pp(0)
+    prev = rp_pp(t - 1)
+    rp = np.maximum(0.0, prev + premium_pp(t) - rp_reduction_pp(t))  # noqa: F821
+    return np.where(depleted_flag(t - 1), prev, rp)                  # noqa: F821
+
+
+def rb_prior_anniv_pp(t):
+    """RB at the Contract Anniversary preceding month t, the d-f-d allowance base.
+
+    Gathered from :func:`rb_pp` at the distinct months of the preceding anniversaries.
+    """
+    u = np.maximum(0, 12 * (policy_year(t) - 1) - duration_mth_init())  # noqa: F821
+    result = np.zeros(point_count())                                 # noqa: F821
+    for v in np.unique(u):                                           # noqa: F821
+        mask = u == v
+        result[mask] = rb_pp(int(v))[mask]
+    return result
+
+
+def gmdb_allow_pp(t):
+    """The contract year's dollar-for-dollar GMDB withdrawal allowances, ``rho x RB``."""
+    return rollup_rate(t) * rb_prior_anniv_pp(t)
+
+
+def gmdb_wd_dfd_pp(t):
+    """The dollar-for-dollar portions of month t's withdrawals against the allowance."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    wd = wd_pp(t)
+    used = np.where(is_year_start(t), 0.0, gmdb_dfd_acc_pp(t - 1))   # noqa: F821
+    dfd = np.minimum(wd, np.maximum(0.0, gmdb_allow_pp(t) - used))   # noqa: F821
+    return np.where((wd > 0.0) & (gmdb_option() == "rollup"), dfd, 0.0)  # noqa: F821
+
+
+def gmdb_wd_excess_pp(t):
+    """The portions of month t's withdrawals above the GMDB d-f-d allowance."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return np.where(gmdb_option() == "rollup", wd_pp(t) - gmdb_wd_dfd_pp(t), 0.0)  # noqa: F821
+
+
+def gmdb_wd_factor(t):
+    """The proportional factors month t's excess GMDB withdrawals accrue **[std]**."""
+    excess = gmdb_wd_excess_pp(t)
+    base = av_pp_at(t, "BEF_WD") - gmdb_wd_dfd_pp(t)
+    factor = np.maximum(0.0, 1.0 - excess / np.where(base > 0.0, base, 1.0))  # noqa: F821
+    return np.where(excess <= 0.0, 1.0,                              # noqa: F821
+                    np.where(base > 0.0, factor, 0.0))               # noqa: F821
+
+
+def gmdb_dfd_acc_pp(t):
+    """The dollar-for-dollar reduction accrued so far in the contract year."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    prev = np.where(is_year_start(t), 0.0, gmdb_dfd_acc_pp(t - 1))   # noqa: F821
+    return prev + gmdb_wd_dfd_pp(t)
+
+
+def gmdb_factor_acc(t):
+    """The proportional factor accrued so far in the contract year **[std]**."""
+    if t < 1:
+        return np.ones(point_count())                                # noqa: F821
+    prev = np.where(is_year_start(t), 1.0, gmdb_factor_acc(t - 1))   # noqa: F821
+    return prev * gmdb_wd_factor(t)
+
+
+def rb_pp_at(t, timing):
+    """RB at month t read at ``BEF_PREM``, ``BEF_WD`` or ``BEF_ANNIV``.
+
+    The ``HQAV`` and ``basic`` forms reduce the base proportionally at the withdrawal;
+    the ``rollup`` form accrues its adjustment to the Contract Year end.
+    """
+    if t < 1:
+        return rb_pp_init()
+    prev = rb_pp(t - 1)
+    if timing == "BEF_PREM":
+        return prev
+    depleted = depleted_flag(t - 1)
+    r = prev + prem_to_av_pp(t)
+    if timing == "BEF_WD":
+        return np.where(depleted, prev, r)                           # noqa: F821
+    wd = wd_pp(t)
+    base = av_pp_at(t, "BEF_WD")
+    ratio = np.maximum(0.0, 1.0 - wd / np.where(base > 0.0, base, 1.0))  # noqa: F821
+    reduced = np.where(base > 0.0, r * ratio, 0.0)                   # noqa: F821
+    r = np.where((wd > 0.0) & (gmdb_option() != "rollup"), reduced, r)  # noqa: F821
+    if timing == "BEF_ANNIV":
+        return np.where(depleted, prev, r)                           # noqa: F821
+    raise ValueError("invalid timing")
+
+
+def rb_pp(t):
+    """RB(t): the GMDB Benefit Bases at the end of month t.
+
+    Growth cutoffs are **age-based**: roll-up and ratchet growth stop at the Contract
+    Anniversary preceding the oldest Covered Life's 81st birthday.
+    """
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if t == 0:
+        return rb_pp_init() + prem_to_av_pp(0)
+    option = gmdb_option()
+    if not np.isin(option, ["rollup", "HQAV", "basic"]).all():       # noqa: F821
+        raise ValueError("invalid gmdb_option")
+    r = rb_pp_at(t, "BEF_ANNIV")
+    grows = age_at_anniv(t) <= data.gmdb_growth_cutoff_age  # noqa: F821
+    rollup = np.maximum(0.0, (r - gmdb_dfd_acc_pp(t)) * gmdb_factor_acc(t))  # noqa: F821
+    rollup = np.where(grows, rollup * (1.0 + rollup_rate(t)), rollup)  # noqa: F821
+    ratchet = np.where(grows, np.maximum(r, av_pp(t)), r)            # noqa: F821
+    anniv = np.select([option == "rollup", option == "HQAV"],        # noqa: F821
+                      [rollup, ratchet], r)
+    r = np.where(is_anniv(t), anniv, r)                              # noqa: F821
+    return np.where(depleted_flag(t - 1), rb_pp(t - 1), r)           # noqa: F821
+
+
+def gmdb_guarantee_pp(t):
+    """The guarantees floored under the death benefits.
+
+    ``max(NP(t), RB(t))``, or ``RB(t)`` alone on the ``basic`` election.
+    """
+    return np.where(gmdb_option() == "basic", rb_pp(t),              # noqa: F821
+                    np.maximum(np_pp(t), rb_pp(t)))                  # noqa: F821
+
+
+def db_pp(t):
+    """DB(t) = max(AV(t), NP(t), RB(t)): the **gross** death benefits; 0 once depleted."""
+    return np.where(depleted_flag(t), 0.0,                           # noqa: F821
+                    np.maximum(av_pp(t), gmdb_guarantee_pp(t)))      # noqa: F821
+
+
+def gmdb_claim_pp(t):
+    """``max(0, max(NP, RB) - AV)``: the **net general-account strain** on death."""
+    return np.where(depleted_flag(t), 0.0,                           # noqa: F821
+                    np.maximum(0.0, gmdb_guarantee_pp(t) - av_pp(t)))  # noqa: F821
+
+
+def forlife_flag():
+    """Whether the For Life Guarantee is in effect from issue, ``age_at_entry >= 60``."""
+    return age_at_entry() >= data.forlife_age               # noqa: F821
+
+
+def depleted_flag(t):
+    """True once the contract value has reached zero with the GLWB in force; absorbing."""
+    if t < 0:
+        return np.zeros(point_count(), dtype=bool)                   # noqa: F821
+    depleted = av_pp(t) <= data.av_depletion_threshold      # noqa: F821
+    if t > 0:
+        depleted = depleted | depleted_flag(t - 1)
+    return depleted
+
+
+def glwb_payment_pp(t):
+    """The insurer-funded GLWB payments in month t once the contracts are depleted.
+
+    Paid at the BOM of the first month of each contract year **[std]**, GAWA for life
+    under the For Life Guarantee and truncated to the remaining GWB otherwise.
+    """
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    paid = (t <= proj_len()) & depleted_flag(t - 1) & is_year_start(t)
+    amount = gawa_pp(t - 1)
+    amount = np.where(forlife_flag(), amount, np.minimum(amount, gwb_pp(t - 1)))  # noqa: F821
+    return np.where(paid, amount, 0.0)                               # noqa: F821
+
+
+def mort_grid():
+    """The mortality table as a dense table by attained age and sex.
+
+    Rows run from age 0 to the last age of the table; ages the table does not cover
+    are missing.
+    """
+    table = data.mort_table()["mort_rate"].unstack("sex")            # noqa: F821
+    return table.reindex(range(int(table.index.max()) + 1))
+
+
+def mort_cols():
+    """The columns of :func:`mort_grid` for each model point's sex."""
+    return mort_grid().columns.get_indexer(sex())
+
+
+def mort_rate(t):
+    """The annual mortality rates at the attained ages, capped at the table's last age."""
+    grid = mort_grid()
+    ages = np.minimum(age(t), grid.shape[0] - 1)                     # noqa: F821
+    return grid.to_numpy()[ages, mort_cols()]
+
+
+def mort_rate_mth(t):
+    """q^d(t): the monthly mortality rates, ``1 - (1 - q_x)^(1/12)`` **[std]**."""
+    return 1.0 - (1.0 - mort_rate(t)) ** (1.0 / 12.0)
+
+
+def lapse_rate_base(t):
+    """q^w_base(y): VM-21 Table 6.3's "under 50% ITM" column **[std]**."""
+    year = policy_year(t)
+    return np.select(                                                # noqa: F821
+        [year <= data.surr_charge_years,                    # noqa: F821
+         year == data.surr_charge_years + 1],               # noqa: F821
+        [data.lapse_rate_sc, data.lapse_rate_shock],  # noqa: F821
+        data.lapse_rate_ult)                                # noqa: F821
+
+
+def moneyness_glwb(t):
+    """M_G(t) = GWB(t) / AV(t); 0 where the contract value is 0."""
+    av = av_pp(t)
+    return np.where(av > 0.0, gwb_pp(t) / np.where(av > 0.0, av, 1.0), 0.0)  # noqa: F821
+
+
+def moneyness_gmdb(t):
+    """M_D(t) = max(NP(t), RB(t)) / AV(t); 0 where the contract value is 0."""
+    av = av_pp(t)
+    return np.where(av > 0.0,                                        # noqa: F821
+                    gmdb_guarantee_pp(t) / np.where(av > 0.0, av, 1.0), 0.0)  # noqa: F821
+
+
+def lapse_dyn_mult(t):
+    """lambda*(t) = min(lambda(M_G), lambda(M_D)) [R1].
+
+    ``lambda(M) = min[U, max(L, 1 - Mult (M - D))]``, the VM-21 §7.B.1 multiplier the
+    scalar model names ``lapse_itm_mult``, applied to both moneyness ratios.
+    """
+    mult = []
+    for m in (moneyness_glwb(t), moneyness_gmdb(t)):
+        raw = 1.0 - data.lapse_itm_mult_coef * (            # noqa: F821
+            m - data.lapse_itm_threshold)                   # noqa: F821
+        mult.append(np.minimum(data.lapse_itm_upper,        # noqa: F821
+                               np.maximum(data.lapse_itm_lower, raw)))  # noqa: F821
+    return np.minimum(*mult)                                         # noqa: F821
+
+
+def lapse_wd_factor(t):
+    """kappa(t): 0.60 in any contract year with a projected withdrawal, else 1.00."""
+    return np.where(is_wd_year(t), data.lapse_wd_year_factor, 1.0)  # noqa: F821
+
+
+def lapse_rate(t):
+    """q^w_annual(t) = min[1, base x lambda* x kappa]; zero where the contract value is 0."""
+    rate = np.minimum(1.0, lapse_rate_base(t) * lapse_dyn_mult(t) * lapse_wd_factor(t))  # noqa: F821
+    return np.where(av_pp(t) <= 0.0, 0.0, rate)                      # noqa: F821
+
+
+def lapse_rate_mth(t):
+    """q^w(t): the monthly surrender rates, ``1 - (1 - q^w_annual)^(1/12)`` **[std]**."""
+    return 1.0 - (1.0 - lapse_rate(t)) ** (1.0 / 12.0)
+
+
+def pols_if(t):
+    """The in-force at the **start** of projection month t; 0 past each horizon."""
+    if t <= 0:
+        return pols_if_init()
+    return np.where(t > proj_len(), 0.0, pols_if_at(t - 1, "AFT_DECR"))  # noqa: F821
+
+
+def pols_if_at(t, timing):
+    """In-force at month t read at ``BEF_DECR``, ``BEF_LAPSE`` or ``AFT_DECR``.
+
+    Death first, then surrender **[std]**.
+    """
+    if t < 1:
+        return pols_if_init()
+    pols = pols_if(t)
+    if timing == "BEF_DECR":
+        return pols
+    pols = pols * (1.0 - mort_rate_mth(t))
+    if timing == "BEF_LAPSE":
+        return pols
+    pols = pols * (1.0 - lapse_rate_mth(t))
+    if timing == "AFT_DECR":
+        return pols
+    raise ValueError("invalid timing")
+
+
+def pols_death(t):
+    """Deaths in month t, on the contracts in force at the start of it."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return pols_if(t) * mort_rate_mth(t)
+
+
+def pols_lapse(t):
+    """Full surrenders in month t, on the survivors of mortality."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return pols_if_at(t, "BEF_LAPSE") * lapse_rate_mth(t)
+
+
+def pols_maturity(t):
+    """Survivors carried out at each contract's projection horizon; zero elsewhere."""
+    return np.where(t == proj_len(), pols_if_at(t, "AFT_DECR"), 0.0)  # noqa: F821
+
+
+def pols_decr(t, kind):
+    """The number of contracts leaving in month t by benefit ``kind``."""
+    if kind == "DEATH":
+        return pols_death(t)
+    elif kind == "LAPSE":
+        return pols_lapse(t)
+    elif kind == "MATURITY":
+        return pols_maturity(t)
+    else:
+        raise ValueError("invalid kind")
+
+
+def claim_pp(t, kind):
+    """The benefits paid per contract in month t by ``kind``."""
+    if kind == "DEATH":
+        return db_pp(t)
+    elif kind == "LAPSE":
+        return surr_benefit_pp(t)
+    elif kind == "MATURITY":
+        return surr_benefit_pp(t)
+    else:
+        raise ValueError("invalid kind")
+
+
+def claim_from_av_pp(t, kind):
+    """The contract values released per contract by a claim of ``kind``: ``AV(t)``."""
+    if kind in ("DEATH", "LAPSE", "MATURITY"):
+        return av_pp(t)
+    raise ValueError("invalid kind")
+
+
+def premiums(t):
+    """Premium income in month t, weighted by the contracts in force at the start of it."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    return premium_pp(t) * pols_if(t)
+
+
+def prem_to_av(t):
+    """Net premium credited to the contract values in month t, in-force weighted."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    return prem_to_av_pp(t) * pols_if(t)
+
+
+def asset_charges(t):
+    """Charge income from the M&E and administrative asset charge, in-force weighted."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return asset_charge_pp(t) * pols_if(t)
+
+
+def fees_glwb(t):
+    """Charge income from the GLWB rider fee, in-force weighted."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return fee_glwb_pp(t) * pols_if(t)
+
+
+def fees_gmdb(t):
+    """Charge income from the GMDB rider fee, in-force weighted."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return fee_gmdb_pp(t) * pols_if(t)
+
+
+def maint_fees(t):
+    """Charge income from the annual contract fee, in-force weighted."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return maint_fee_pp(t) * pols_if(t)
+
+
+def wd_charges(t):
+    """The CDSC collected on withdrawals, in-force weighted — a **memo line**."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return wd_charge_pp(t) * pols_if(t)
+
+
+def charge_income(t):
+    """Total insurer charge income in month t, excluding the double-counted CDSC."""
+    return asset_charges(t) + fees_glwb(t) + fees_gmdb(t) + maint_fees(t)
+
+
+def withdrawals(t):
+    """Withdrawal proceeds ``W(t) - c(t)``, weighted by :func:`pols_if` ``(t)``."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return wd_payment_pp(t) * pols_if(t)
+
+
+def glwb_payments(t):
+    """Insurer-funded post-depletion GLWB payments, weighted by ``pols_if(t)``."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return glwb_payment_pp(t) * pols_if(t)
+
+
+def claims(t, kind=None):
+    """Benefit outgo in month t, for one ``kind`` or, with ``kind=None``, all three."""
+    if kind is None:
+        return (claims(t, "DEATH") + claims(t, "LAPSE")
+                + claims(t, "MATURITY"))
+    return claim_pp(t, kind) * pols_decr(t, kind)
+
+
+def claims_from_av(t, kind):
+    """The contract value released by a claim of ``kind``, in-force weighted."""
+    return claim_from_av_pp(t, kind) * pols_decr(t, kind)
+
+
+def claims_over_av(t, kind=None):
+    """Benefit paid less the contract value released, ``claims - claims_from_av``."""
+    if kind is None:
+        return (claims_over_av(t, "DEATH") + claims_over_av(t, "LAPSE")
+                + claims_over_av(t, "MATURITY"))
+    return claims(t, kind) - claims_from_av(t, kind)
+
+
+def gmdb_claims(t):
+    """The net general-account strain on death, ``GuaranteeClaim x deaths`` — a memo."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return gmdb_claim_pp(t) * pols_death(t)
+
+
+def commissions(t):
+    """Acquisition commission; **0 in the base run [std]**."""
+    return data.comm_rate_acq * premiums(t)                 # noqa: F821
+
+
+def premium_taxes(t):
+    """Premium tax deducted from the purchase payments, 0% **[std]**."""
+    return premium_tax_rate() * premiums(t)
+
+
+def inflation_factor(t):
+    """The VM-21 §6.C.2 expense inflation factors for the contract years containing t."""
+    return (1.0 + data.inflation_rate) ** (                 # noqa: F821
+        data.valuation_year - data.expense_base_year  # noqa: F821
+        + duration(t))                                               # noqa: F821
+
+
+def expenses(t):
+    """VM-21 §6.C.2 prescribed maintenance expense, per contract and on account value."""
+    if t == 0:
+        return data.expense_acq * pols_if(0)                # noqa: F821
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    per_contract = ((data.expense_maint / 12.0)             # noqa: F821
+                    * inflation_factor(t))                           # noqa: F821
+    per_av = (data.expense_av_rate / 12.0) * av_pp(t)       # noqa: F821
+    return np.where(t > proj_len(), 0.0, (per_contract + per_av) * pols_if(t))  # noqa: F821
+
+
+def net_cf(t):
+    """The technical notes' cash flow ledger, summed with the notes' own signs."""
+    return (premiums(t) + charge_income(t)
+            - withdrawals(t) - glwb_payments(t) - claims(t)
+            - expenses(t) - commissions(t) - premium_taxes(t))
+
+
+def net_cf_ga(t):
+    """The general-account view: charge income less guarantee strain and expenses."""
+    return (charge_income(t) - gmdb_claims(t) - glwb_payments(t)
+            - expenses(t) - commissions(t) - premium_taxes(t))
+
+
+def av_at(t, timing):
+    """The in-force weighted contract values at month t; ``"EOM"`` uses ``pols_if(t + 1)``."""
+    if t < 0:
+        return np.zeros(point_count())                               # noqa: F821
+    if timing == "EOM":
+        return av_pp(t) * pols_if(t + 1)
+    return av_pp_at(t, timing) * pols_if(t)
+
+
+def inv_income(t):
+    """Investment income credited to the contract values in month t, in-force weighted."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return inv_income_pp(t) * pols_if(t)
+
+
+def wd_from_av(t):
+    """The contract values released by month t's withdrawals, gross of the charge."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return wd_pp(t) * pols_if(t)
+
+
+def charges_from_av(t):
+    """The contract values cancelled by month t's per-contract and benefit-base charges."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return charge_pp(t) * pols_if(t)
+
+
+def av_change(t):
+    """The changes in the contract values over month t, in-force weighted."""
+    return av_at(t, "EOM") - av_at(t - 1, "EOM")
+
+
+def check_av_roll_fwd_resid(t):
+    """Contract value roll-forward residuals at month t, one per model point."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    expected = (prem_to_av(t) - wd_from_av(t) + inv_income(t)
+                - charges_from_av(t)
+                - claims_from_av(t, "DEATH") - claims_from_av(t, "LAPSE")
+                - claims_from_av(t, "MATURITY"))
+    return av_change(t) - expected
+
+
+def check_av_roll_fwd():
+    """True when the contract value roll-forward closes for every model point and month.
+
+    The tolerance is 1e-6 of a currency unit, as in :mod:`.VA_US_S`.
+    """
+    return all(bool(np.all(np.abs(check_av_roll_fwd_resid(t)) < 1e-6))  # noqa: F821
+               for t in range(1, max_proj_len() + 1))
+
+
+def check_pols_roll_fwd_resid(t):
+    """In-force roll-forward residuals at month t, one per model point."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return (pols_if(t) - pols_if(t + 1) - pols_death(t)
+            - pols_lapse(t) - pols_maturity(t))
+
+
+def check_pols_roll_fwd():
+    """True when the in-force roll-forward closes for every model point and month."""
+    return all(bool(np.all(np.abs(check_pols_roll_fwd_resid(t)) < 1e-12))  # noqa: F821
+               for t in range(1, max_proj_len() + 1))
+
+
+def check_charge_split_resid(t):
+    """Residuals of the investment identity at month t, one per model point."""
+    if t < 1:
+        return np.zeros(point_count())                               # noqa: F821
+    return (gross_inv_income_pp(t) - fund_expense_pp(t)
+            - asset_charge_pp(t) - inv_income_pp(t))
+
+
+def check_charge_split():
+    """True when the investment identity closes for every model point and month."""
+    return all(bool(np.all(np.abs(check_charge_split_resid(t)) < 1e-8))  # noqa: F821
+               for t in range(1, max_proj_len() + 1))
+
+
+def result_cf():
+    """Result table of cashflows summed over the model points, indexed by t.
+
+    The columns are those of :func:`VA_US_S.Projection.result_cf`, from ``t = 0`` to
+    :func:`max_proj_len`. Each contract contributes nothing past its own horizon.
+    """
+    ts = list(range(0, max_proj_len() + 1))
+    return pd.DataFrame(                                             # noqa: F821
+        {
+            "pols_if": [pols_if(t).sum() for t in ts],
+            "premiums": [premiums(t).sum() for t in ts],
+            "asset_charges": [asset_charges(t).sum() for t in ts],
+            "fees_glwb": [fees_glwb(t).sum() for t in ts],
+            "fees_gmdb": [fees_gmdb(t).sum() for t in ts],
+            "maint_fees": [maint_fees(t).sum() for t in ts],
+            "withdrawals": [withdrawals(t).sum() for t in ts],
+            "glwb_payments": [glwb_payments(t).sum() for t in ts],
+            "claims_death": [claims(t, "DEATH").sum() for t in ts],
+            "claims_lapse": [claims(t, "LAPSE").sum() for t in ts],
+            "claims_maturity": [claims(t, "MATURITY").sum() for t in ts],
+            "expenses": [expenses(t).sum() for t in ts],
+            "commissions": [commissions(t).sum() for t in ts],
+            "premium_taxes": [premium_taxes(t).sum() for t in ts],
+            "net_cf": [net_cf(t).sum() for t in ts],
+        },
+        index=pd.Index(ts, name="t"),                                # noqa: F821
+    )
+
+
+def result_pols():
+    """Result table of in-force movements summed over the model points, indexed by t."""
+    ts = list(range(0, max_proj_len() + 1))
+    return pd.DataFrame(                                             # noqa: F821
+        {
+            "pols_if": [pols_if(t).sum() for t in ts],
+            "pols_death": [pols_death(t).sum() for t in ts],
+            "pols_lapse": [pols_lapse(t).sum() for t in ts],
+            "pols_maturity": [pols_maturity(t).sum() for t in ts],
+            "pols_if_aft_decr": [pols_if_at(t, "AFT_DECR").sum() for t in ts],
+        },
+        index=pd.Index(ts, name="t"),                                # noqa: F821
+    )
+
+
+# ---------------------------------------------------------------------------
+# References
+
+data = ("Interface", ("..", "Data"), "auto")
+
+np = ("Module", "numpy")
+
+pd = ("Module", "pandas")
\ No newline at end of file
@@ -0,0 +1,60 @@
+# modelx: pseudo-python
+# This file is part of a modelx model.
+# It can be imported as a Python module, but functions defined herein
+# are model formulas and may not be executable as standard Python.
+
+"""Vectorized edition of the U.S. variable annuity model.
+
+:mod:`~.VA_US_M` projects the same contracts as :mod:`.VA_US_S`, on the same inputs and
+with the same formulas, but projects **all the model points at once**: every cells
+parameterized by ``t`` returns an array with one element per model point, in the way
+:mod:`~basiclife.BasicTerm_M` relates to :mod:`~basiclife.BasicTerm_S` and
+:mod:`~savings.CashValue_ME` to :mod:`~savings.CashValue_SE`. The suffix ``_M`` is
+lifelib's: a monthly model over a table of model points rather than a single contract.
+
+:mod:`.VA_US_S` projects a contract month by month through some 260 scalar cells per
+``point_id``. That is the right shape for reading the mechanics against the technical
+notes, and the wrong one for thousands of contracts or thousands of scenarios, where the
+cost is dominated by the number of cells calls rather than by arithmetic. Here each cells
+is called once per month for the whole block, so the number of calls no longer grows
+with the number of model points.
+
+**The scalar model is the specification.** Product mechanics, sourcing, the
+standardizations and what is not implemented are those of :mod:`.VA_US_S` and are not
+repeated here; the two models agree on every contract, month and cash flow line to
+floating-point rounding, and a test reconciles them on every sample contract in every
+scenario. Changes to the mechanics are made in :mod:`.VA_US_S` first and carried across.
+
+**Spaces.** The model contains two:
+
+:mod:`~.VA_US_M.Data`
+    Reads the input CSVs of :mod:`.VA_US_S` from the same files, and holds the product
+    parameters of :mod:`.VA_US_S` as References.
+
+:mod:`~.VA_US_M.Projection`
+    The vectorized projection. It is **not** parameterized: the model points are the
+    rows of ``model_point()``, all of *model_point_table.csv* by default.
+
+**Scenarios.** Each model point names its ``scenario_id``, so the scenario axis is a
+model point table in which the contracts are repeated once per scenario. Such tables
+can be projected in chunks of rows with :func:`lifelib.runners.run_chunked`, which
+bounds the memory by the chunk size.
+
+Example:
+
+    >>> import modelx as mx
+    >>> model = mx.read_model("products/variable_annuity/VA_US_M")
+    >>> model.Projection.result_cf()
+"""
+
+from modelx.serialize.jsonvalues import *
+
+_name = "VA_US_M"
+
+_allow_none = False
+
+_spaces = [
+    "Data",
+    "Projection"
+]
+
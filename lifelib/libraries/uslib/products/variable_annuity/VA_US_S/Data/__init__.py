@@ -48,6 +48,26 @@ step functions of ``t`` so a flat path is one row per subaccount; ``gawa_pct_tab
 ``(cdsc_schedule, completed_years)``; and ``transaction_table`` by ``(txn_id, t)``, a
 month with no row taking neither premium nor withdrawal.
 
+Those lookups are made for every month of every contract, and searching a table for the
+row in force each time costs a scan per month. So each table also has a **compiled**
+form: a Cells taking the table's key and returning one NumPy array with an element for
+every month, year or age from 0, each holding the row in force there. It is built once
+per key on first use, and the Projection reads one element of it:
+
+==========================  ==================================================
+Cells                       Array
+==========================  ==================================================
+return_path(scn, i)         gross return by policy month, forward-filled
+rate_path(scn, name)        column ``name`` by policy month, forward-filled
+gawa_pct_path(grid)         GAWA% by attained age, forward-filled, 0 below
+cdsc_path(schedule)         CDSC rate by completed years, ``nan`` where no row
+transaction_path(id, name)  column ``name`` by policy month, 0 where no row
+==========================  ==================================================
+
+Past the end of an array its last element holds. Before their first row the step
+functions are ``nan``, where the table states no value, and the Projection raises an
+error on reading one, as it did when it searched the rows.
+
 The mortality table shipped here is an illustrative **[std]** annuitant curve, *not* a
 published basis. The prescribed basis is the 2012 IAM **Basic** Table improved to
 December 31, 2017 on Projection Scale G2 [R1][REG-R59], which may not be redistributed
@@ -153,6 +173,84 @@ def transaction_table():
         input_dir() / transaction_file, index_col=["txn_id", "t"])   # noqa: F821
 
 
+def return_path(scenario_id, sub_id):
+    """The gross return of subaccount ``sub_id`` in ``scenario_id`` by policy month."""
+    series = return_scenario().loc[(scenario_id, sub_id), "gross_return"]
+    return series.reindex(range(int(series.index.max()) + 1)).ffill().to_numpy()
+
+
+def rate_path(scenario_id, name):
+    """Column ``name`` of the rate scenario ``scenario_id`` by policy month."""
+    series = rate_scenario().loc[scenario_id, name]
+    return series.reindex(range(int(series.index.max()) + 1)).ffill().to_numpy()
+
+
+def gawa_pct_path(gawa_grid):
+    """The GAWA% of ``gawa_grid`` by attained age; 0 below the first band."""
+    series = gawa_pct_table().loc[gawa_grid, "gawa_pct"]
+    series = series.reindex(range(int(series.index.max()) + 1)).ffill()
+    return series.fillna(0.0).to_numpy()
+
+
+def cdsc_path(cdsc_schedule):
+    """The withdrawal charge rate of ``cdsc_schedule`` by completed years.
+
+    Not a step function: the scale states a rate for every completed year, so a year
+    with no row is ``nan`` and the Projection raises on reading it.
+    """
+    series = cdsc_table().loc[cdsc_schedule, "surr_charge_rate"]
+    return series.reindex(range(int(series.index.max()) + 1)).to_numpy()
+
+
+def transaction_path(txn_id, name):
+    """Column ``name`` of the transactions of ``txn_id`` by policy month.
+
+    Not a step function: a month with no row is 0, and so is every month of a ``txn_id``
+    with no rows at all.
+    """
+    table = transaction_table()
+    if txn_id not in table.index.unique("txn_id"):
+        return np.zeros(0)                                           # noqa: F821
+    series = table.loc[txn_id, name]
+    return series.reindex(range(int(series.index.max()) + 1), fill_value=0.0).to_numpy()
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "mort_table": ("mort_table_file", ["age", "sex"]),
+            "fund_table": ("fund_file", ["fund_set", "sub_id"]),
+            "return_scenario": (
+                "return_scenario_file", ["scenario_id", "sub_id", "t"]),
+            "rate_scenario": ("rate_scenario_file", ["scenario_id", "t"]),
+            "gawa_pct_table": ("gawa_pct_file", ["gawa_grid", "age_from"]),
+            "cdsc_table": ("cdsc_file", ["cdsc_schedule", "completed_years"]),
+            "transaction_table": ("transaction_file", ["txn_id", "t"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "designated_lives": "str", "tax_status": "str",
+                "premium": "int64", "pols_if_init": "int64",
+                "premium_tax_rate": "float64", "fund_set": "str", "glwb_option": "str",
+                "glwb_stepup_basis": "str", "gmdb_option": "str",
+                "cdsc_schedule": "str", "fee_reset_rule": "str", "rollup_rule": "str",
+                "wd_start_age": "int64", "wd_intensity": "float64",
+                "scenario_id": "str", "txn_id": "str", "duration_mth_init": "int64",
+                "av_init": "int64", "gwb_init": "int64", "gawa_init": "int64",
+                "gawa_pct_init": "int64", "bb_init": "int64", "rb_init": "int64",
+                "np_init": "int64", "rp_init": "int64", "adj_init": "int64",
+                "bonus_end_init": "int64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -172,4 +270,6 @@ cdsc_file = "cdsc_table.csv"
 
 transaction_file = "transaction_table.csv"
 
-pd = ("Module", "pandas")
\ No newline at end of file
+pd = ("Module", "pandas")
+
+np = ("Module", "numpy")
\ No newline at end of file
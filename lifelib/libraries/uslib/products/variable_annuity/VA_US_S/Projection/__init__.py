@@ -723,9 +723,11 @@ def inv_return_mth(t, i):
     to a crafted proxy fund, normally a linear combination of recognized market indices
     [R1]; the model takes the return series as an input rather than hard-coding one.
     """
-    sub = data.return_scenario().loc[(scenario_id(), i)]              # noqa: F821
-    months = [m for m in sub.index if m <= max(duration_mth(t), 0)]
-    return float(sub.loc[max(months), "gross_return"])
+    path = data.return_path(scenario_id(), i)                        # noqa: F821
+    value = float(path[min(max(duration_mth(t), 0), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise ValueError("no return row at or before month %d" % duration_mth(t))
+    return value
 
 
 def scenario_rate(t, name):
@@ -734,9 +736,11 @@ def scenario_rate(t, name):
     Each row of *rate_scenario.csv* states the level that holds from its own policy month
     until the next row of the same scenario, so a flat path is one row.
     """
-    sub = data.rate_scenario().loc[scenario_id()]                     # noqa: F821
-    months = [m for m in sub.index if m <= max(duration_mth(t), 0)]
-    return float(sub.loc[max(months), name])
+    path = data.rate_path(scenario_id(), name)                       # noqa: F821
+    value = float(path[min(max(duration_mth(t), 0), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise ValueError("no rate row at or before month %d" % duration_mth(t))
+    return value
 
 
 def vix_sq(k):
@@ -875,9 +879,9 @@ def prem_scheduled_pp(t):
     """The gross premium scheduled for month t in *transaction_table.csv*, else zero."""
     if t < 1:
         return 0.0
-    table = data.transaction_table()                                 # noqa: F821
-    key = (txn_id(), duration_mth(t))
-    return float(table.loc[key, "prem_amount"]) if key in table.index else 0.0
+    path = data.transaction_path(txn_id(), "prem_amount")            # noqa: F821
+    m = duration_mth(t)
+    return float(path[m]) if m < len(path) else 0.0
 
 
 def premium_pp(t):
@@ -910,9 +914,9 @@ def wd_scheduled_pp(t):
     """The gross withdrawal scheduled for month t in *transaction_table.csv*, else zero."""
     if t < 1:
         return 0.0
-    table = data.transaction_table()                                 # noqa: F821
-    key = (txn_id(), duration_mth(t))
-    return float(table.loc[key, "wd_amount"]) if key in table.index else 0.0
+    path = data.transaction_path(txn_id(), "wd_amount")              # noqa: F821
+    m = duration_mth(t)
+    return float(path[m]) if m < len(path) else 0.0
 
 
 def is_wd_month(t):
@@ -970,11 +974,8 @@ def is_wd_year(t):
 
 def gawa_pct_at_age(a):
     """g(a): the GAWA% for attained age a, from *gawa_pct_table.csv* [S3]."""
-    grid = data.gawa_pct_table().loc[glwb_option()]                  # noqa: F821
-    bands = [b for b in grid.index if b <= a]
-    if not bands:
-        return 0.0
-    return float(grid.loc[max(bands), "gawa_pct"])
+    path = data.gawa_pct_path(glwb_option())                         # noqa: F821
+    return float(path[min(a, len(path) - 1)]) if a >= 0 else 0.0
 
 
 def wd_limit_pp(t):
@@ -1136,9 +1137,11 @@ def surr_charge_rate(t):
     test; splitting the pool needs a withdrawal-ordering rule across tranches that no
     retrieved source states.
     """
-    grid = data.cdsc_table().loc[cdsc_schedule()]                    # noqa: F821
-    years = min(duration(t), int(grid.index.max()))
-    return float(grid.loc[years, "surr_charge_rate"])
+    path = data.cdsc_path(cdsc_schedule())                           # noqa: F821
+    value = float(path[min(duration(t), len(path) - 1)])
+    if math.isnan(value):                                            # noqa: F821
+        raise KeyError((cdsc_schedule(), duration(t)))
+    return value
 
 
 def wd_charge_pp(t):
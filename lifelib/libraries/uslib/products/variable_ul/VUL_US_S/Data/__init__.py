@@ -55,6 +55,11 @@ change. The shipped scenarios are deterministic: ``WE`` is the worked example's
 (+1.00% equity, -0.50% bond) followed by a level 6% a year gross path, and ``LEVEL6``
 is that level path throughout.
 
+The return of each subaccount is read for every month of every policy, so the
+scenario also has a **compiled** form, :func:`return_path`, one NumPy array per
+scenario and subaccount with an element for every policy month from 0. It is built
+once per key on first use, and the Projection reads one element of it.
+
 ``coi_rates.csv`` carries the **guaranteed maximum** monthly rate per $1,000 of net
 amount at risk; the current scale is that times
 ``Projection.coi_curr_factor``, or the model point's ``coi_rate_override``. The notes
@@ -164,6 +169,54 @@ def surr_charge_table():
     return pd.read_csv(input_dir() / surr_charge_file, index_col="surr_charge_id")  # noqa: F821
 
 
+def return_path(scenario_id, subaccount_id):
+    """The gross return of ``subaccount_id`` in ``scenario_id`` by policy month.
+
+    Element ``t`` is the row of :func:`scenario_table` for month ``t``, or ``nan`` for a
+    month with no row, such as month 0.
+    """
+    series = scenario_table().loc[(scenario_id, subaccount_id), "gross_return_mth"]
+    return series.reindex(range(int(series.index.max()) + 1)).to_numpy()
+
+
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "subaccount_table": ("subaccount_file", "subaccount_id"),
+            "scenario_table": (
+                "scenario_file", ["scenario_id", "subaccount_id", "t"], True),
+            "coi_rates": (
+                "coi_rates_file", ["sex", "rate_class", "age_at_entry", "policy_year"]),
+            "corridor_factors": ("corridor_file", "age"),
+            "mort_table": ("mort_table_file", "age"),
+            "class_factor_table": ("class_factor_file", "rate_class"),
+            "lapse_table": ("lapse_table_file", "policy_year"),
+            "prem_persistency_table": ("prem_persistency_file", "policy_year"),
+            "surr_charge_table": ("surr_charge_file", "surr_charge_id")},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "age_at_entry": "int64",
+                "sex": "str", "rate_class": "str", "sum_assured": "float64",
+                "db_option": "str", "qual_test": "str", "premium_type": "str",
+                "premium_pp_ann": "float64", "load_prem_rate": "float64",
+                "sa_pp_init_1": "float64", "sa_pp_init_2": "float64",
+                "fa_pp_init": "float64", "loan_bal_init": "float64",
+                "alloc_1": "float64", "alloc_2": "float64", "alloc_fixed": "float64",
+                "wd_pp": "float64", "pols_if_init": "float64", "duration_mth": "int64",
+                "has_surr_charge": "bool", "surr_charge_id": "str",
+                "scenario_id": "str", "corridor_override_m1": "float64",
+                "coi_rate_override_m1": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -512,11 +512,15 @@ def gross_return_mth(t, i):
 
     Gross means before the fund expense ratio and before the M&E charge; both are
     applied in :func:`inv_return_mth`.  A stochastic set is more rows in this table,
-    not a formula change.
-    """
-    tbl = data.scenario_table().loc[(scenario_id(), i)]              # noqa: F821
-    m = min(t, int(tbl.index.max()))
-    return float(tbl.loc[m, "gross_return_mth"])
+    not a formula change.  The row is read from the compiled path
+    :func:`~.VUL_US_S.Data.return_path`; a month with no row raises ``KeyError``.
+    """
+    path = data.return_path(scenario_id(), i)                        # noqa: F821
+    m = min(t, len(path) - 1)
+    value = float(path[m])
+    if math.isnan(value):                                            # noqa: F821
+        raise KeyError(m)
+    return value
 
 
 def inv_return_mth(t, i):
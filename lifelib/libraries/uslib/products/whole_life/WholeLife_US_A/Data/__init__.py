@@ -134,6 +134,37 @@ def premium_rates():
         index_col=["product", "sex", "risk_class", "issue_age"])
 
 
+def input_schema():
+    """The schema of the input CSVs, read by :func:`lifelib.runners.load_inputs`.
+
+    ``"tables"`` maps each reader Cells to its filename Reference, the ``index_col`` it
+    passes to :func:`pandas.read_csv` and ``True`` if it sorts the index, as the readers
+    above read the files. ``"dtype"`` maps the model point file to the types of its
+    columns, the types the readers infer, so a large file is parsed without inferring
+    them.
+    """
+    return {
+        "tables": {
+            "model_point_table": ("model_point_file", "point_id"),
+            "cv_table": (
+                "cv_file", ["premium_period", "sex", "issue_age", "policy_year"]),
+            "nsp_table": ("nsp_file", ["sex", "age"]),
+            "np_guar_table": ("np_guar_file", ["premium_period", "sex", "issue_age"]),
+            "mort_table": ("mort_table_file", ["sex", "age"]),
+            "premium_rates": (
+                "premium_rates_file", ["product", "sex", "risk_class", "issue_age"])},
+        "dtype": {
+            "model_point_file": {
+                "point_id": "int64", "policy_id": "str", "product": "str",
+                "premium_period": "str", "issue_age": "int64", "sex": "str",
+                "risk_class": "str", "face_amount": "float64",
+                "annual_premium": "float64", "dividend_option": "str",
+                "pua_rider_premium": "float64", "term_blend_target": "float64",
+                "loan_utilization": "float64", "pols_if_init": "float64",
+                "duration_inforce": "int64", "puaf_inforce": "float64",
+                "loan_inforce": "float64"}}}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -966,3 +966,15 @@ def test_readme_contrasts_t_zero_with_term_life_only():
     assert "Every other model in the library starts its result table at 1" not in readme
     assert ("contrast with `Term_US_A`, the model this one takes its structure from, "
             "whose result table starts at `t = 1`") in readme
+
+
+def test_compiled_paths_agree_with_the_tables(fixed_deferred_annuity):
+    """Data's per-key arrays reproduce the keyed tables, with 0 for a missing key."""
+    data = fixed_deferred_annuity.Data
+    for (schedule, year), row in data.surr_charge_table().iterrows():
+        assert data.surr_charge_path(schedule)[year] == row["surr_charge_rate"]
+    assert data.surr_charge_path("initial")[0] == 0.0
+    assert len(data.surr_charge_path("no_such_schedule")) == 0
+    withdrawals = data.withdrawal_path("anchor")
+    assert withdrawals[12] == 0.0
+    assert withdrawals[13] == 4000.0
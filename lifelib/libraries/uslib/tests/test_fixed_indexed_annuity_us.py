@@ -1233,3 +1233,18 @@ def test_model_docstring_names_the_gaps(fixed_indexed_annuity):
         assert gap in doc
     for name in ("Data", "Projection"):
         assert name in doc
+
+
+def test_compiled_paths_agree_with_the_tables(fixed_indexed_annuity):
+    """Data's per-key arrays reproduce the band and step-function tables."""
+    data = fixed_indexed_annuity.Data
+    table = data.payout_rate_table()
+    payout = data.payout_rate_path("payout_rate_single")
+    assert payout[49] == 0.0
+    for _, row in table.iterrows():
+        assert payout[int(row["age_lo"])] == row["payout_rate_single"]
+    assert len(payout) == int(table["age_hi"].iloc[-1]) + 1
+    rollup = data.rollup_path("blended")
+    assert rollup[1] == rollup[10] == 0.05
+    assert rollup[11] == rollup[20] == 0.02
+    assert rollup[21] == 0.0
@@ -1076,3 +1076,20 @@ def test_invalid_arguments_raise(anchor):
                  lambda: anchor.wd_bucket_value_pp(1, "NOPE")):
         with pytest.raises(Exception):
             call()
+
+
+def test_compiled_paths_agree_with_the_tables(rila):
+    """Data's per-key arrays hold each row until the next and are 0 past the schedule."""
+    data = rila.Data
+    for (scenario_id, t), row in data.market_scenario().iterrows():
+        assert data.market_path(scenario_id, "index_level")[t] == row["index_level"]
+    up = data.market_path("up", "index_level")
+    assert up[35] == up[0] == 100.0
+    assert up[36] == 120.0
+    lapse = data.lapse_path()
+    assert lapse[6] == lapse[7] == 0.02
+    assert lapse[8] == 0.06
+    surr = data.surr_charge_path()
+    assert list(surr) == list(data.surr_charge_table()["surr_charge_rate"])
+    assert data.withdrawal_path("worked")[35] == 0.0
+    assert data.withdrawal_path("worked")[36] == 8000.0
@@ -23,6 +23,8 @@ is asserted twice, on two model points that reach that state by different routes
 The notes' "Known modeling pitfalls" list is a test list in disguise; there is one test
 per entry below.
 """
+import math
+
 import modelx as mx
 import pytest
 
@@ -1170,3 +1172,61 @@ def test_invalid_timing_and_kind_arguments_raise(anchor):
         anchor.gwb_pp_at(12, "BEF_XYZ")
     with pytest.raises(Exception):
         anchor.claim_pp(12, "ANNUITIZATION")
+
+
+def test_compiled_paths_agree_with_the_tables(variable_annuity):
+    """The compiled arrays in Data reproduce the step-function and keyed lookups.
+
+    A row's value holds from its own month until the next row of the same key, so the
+    base path carries its month-1 return through month 12; a transaction month with no
+    row is 0; and the GAWA% is 0 below the first age band.
+    """
+    data = variable_annuity.Data
+    for (scenario_id, sub_id, t), row in data.return_scenario().iterrows():
+        assert data.return_path(scenario_id, sub_id)[t] == row["gross_return"]
+    base = data.return_path("base", 1)
+    assert base[12] == base[1] != base[13]
+    assert math.isnan(base[0])
+    excess = data.transaction_path("excess", "wd_amount")
+    assert excess[60] == 0.0
+    assert excess[61] == pytest.approx(20000.00, abs=CENT)
+    assert len(data.transaction_path("no_such_programme", "wd_amount")) == 0
+    gawa = data.gawa_pct_path("single_core")
+    assert gawa[34] == 0.0
+    assert gawa[62] == data.gawa_pct_table().loc[("single_core", 60), "gawa_pct"]
+
+
+def test_lookups_before_the_first_row_raise(variable_annuity, anchor):
+    """A step function read before its first row raises, as the search of the rows did.
+
+    The compiled array holds ``nan`` there; the Projection turns it into the error
+    instead of projecting with it.
+    """
+    data = variable_annuity.Data
+    key = (anchor.scenario_id(), 1)
+    path = data.return_path(*key).copy()
+    path[:13] = math.nan
+    data.return_path[key] = path
+    try:
+        with pytest.raises(Exception, match="no return row"):
+            anchor.inv_return_mth(12, 1)
+    finally:
+        data.return_path.clear_at(*key)
+    assert anchor.inv_return_mth(12, 1) == data.return_path(*key)[12]
+
+
+def test_a_missing_cdsc_year_raises(variable_annuity, anchor):
+    """A completed year with no row in the CDSC scale raises, as the search of the rows did.
+
+    The scale is not a step function, so the gap is not filled from the year before.
+    """
+    data = variable_annuity.Data
+    t = next(t for t in range(1, 120) if anchor.duration(t) == 3)
+    data.cdsc_table[()] = data.cdsc_table().drop(("commission_7yr", 3))
+    try:
+        assert math.isnan(data.cdsc_path("commission_7yr")[3])
+        with pytest.raises(KeyError):
+            anchor.surr_charge_rate(t)
+    finally:
+        data.cdsc_table.clear_at()
+    assert anchor.surr_charge_rate(t) == pytest.approx(0.055, abs=1e-12)
@@ -0,0 +1,196 @@
+"""Reconciliation tests for VA_US_M against VA_US_S.
+
+VA_US_M is the vectorized edition of VA_US_S and has no golden values of its own: the
+scalar model is its specification, and VA_US_M reads the same input files and holds
+the same parameters.
+So every contract of *model_point_table.csv* is run in every scenario of
+*return_scenario.csv* and projected by both, and each cash flow line, the guarantee bases
+and the in-force are compared contract by contract and month by month. The worked
+example, the pitfalls and the product behaviour are asserted once, against VA_US_S, in
+``test_variable_annuity_us.py``.
+
+VA_US_M is not registered in :data:`us_registry.MODELS`. The house-style tests there
+assume a ``Projection`` parameterized by ``point_id`` and the ``_A``/``_S`` grid suffix,
+neither of which a vectorized model has.
+"""
+import modelx as mx
+import numpy as np
+import pandas as pd
+import pytest
+
+from us_registry import LIB
+
+SCALAR_PATH = LIB / "products/variable_annuity/VA_US_S"
+VECTOR_PATH = LIB / "products/variable_annuity/VA_US_M"
+
+# Per-contract and in-force weighted cells compared between the two models.
+CELLS = [
+    "pols_if", "premiums", "asset_charges", "fees_glwb", "fees_gmdb", "maint_fees",
+    "withdrawals", "glwb_payments", "expenses", "net_cf",
+    "av_pp", "gwb_pp", "gawa_pp", "bb_pp", "rb_pp", "np_pp", "rp_pp", "lapse_rate",
+]
+
+# Reader Cells of the Data spaces of both models.
+TABLES = [
+    "model_point_table", "mort_table", "fund_table", "return_scenario",
+    "rate_scenario", "gawa_pct_table", "cdsc_table", "transaction_table",
+]
+
+REL = 1e-9
+
+
+@pytest.fixture(scope="module")
+def scalar():
+    model = mx.read_model(SCALAR_PATH)
+    yield model
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def vector():
+    model = mx.read_model(VECTOR_PATH)
+    yield model
+    model.close()
+
+
+@pytest.fixture
+def sample(scalar, vector):
+    """Every contract of the sample table in every scenario, projected by both models."""
+    table = scalar.Data.model_point_table()
+    scenarios = scalar.Data.return_scenario().index.unique("scenario_id")
+    sample = pd.concat([table.assign(scenario_id=s) for s in scenarios])
+    sample.index = pd.RangeIndex(1, len(sample) + 1, name="point_id")
+    scalar.Data.model_point_table[()] = sample
+    vector.Projection.model_point[()] = sample
+    yield sample
+    vector.Projection.model_point.clear_at()
+    scalar.Data.model_point_table.clear_at()
+
+
+def test_inputs_and_parameters_match_the_scalar_model(scalar, vector):
+    data = vector.Data
+    assert data.input_dir() == scalar.Data.input_dir()
+    for name in TABLES:
+        pd.testing.assert_frame_equal(
+            getattr(data, name)(), getattr(scalar.Data, name)(), check_like=False)
+    assert data.input_schema() == scalar.Data.input_schema()
+    params = {name: value for name, value in data.refs.items()
+              if isinstance(value, (int, float)) and not name.endswith("_file")}
+    assert len(params) == 51
+    for name, value in params.items():
+        assert scalar.Projection.refs[name] == value, name
+
+
+def test_a_parameter_change_clears_the_projection(vector):
+    data, proj = vector.Data, vector.Projection
+    expected = proj.lapse_rate(100)
+    data.lapse_rate_ult = 0.3
+    try:
+        assert (proj.lapse_rate(100) != expected).any()
+    finally:
+        data.lapse_rate_ult = 0.15
+    assert proj.lapse_rate(100) == pytest.approx(expected)
+
+
+def test_every_point_reconciles_to_the_scalar_model(scalar, vector, sample):
+    proj = vector.Projection
+    assert len(sample) == 27
+    assert set(sample["scenario_id"]) == {"base", "decline", "variant"}
+    for row, point_id in enumerate(sample.index):
+        item = scalar.Projection[point_id]
+        try:
+            ts = range(0, item.proj_len() + 1)
+            for name in CELLS:
+                expected = np.array([getattr(item, name)(t) for t in ts])
+                actual = np.array([getattr(proj, name)(t)[row] for t in ts])
+                assert actual == pytest.approx(
+                    expected, rel=REL, abs=1e-9), (point_id, name)
+            expected = np.array([item.claims(t, None) for t in ts])
+            actual = np.array([proj.claims(t)[row] for t in ts])
+            assert actual == pytest.approx(expected, rel=REL, abs=1e-9), point_id
+        finally:
+            del scalar.Projection[point_id]
+
+
+def test_nothing_flows_past_a_contracts_own_horizon(vector):
+    proj = vector.Projection
+    # Point 2 is the in-force cell and runs 26 months shorter than the others.
+    row = list(proj.model_point().index).index(2)
+    horizon = proj.proj_len()[row]
+    assert horizon < proj.max_proj_len()
+    for t in range(horizon + 1, proj.max_proj_len() + 1):
+        assert proj.pols_if(t)[row] == 0
+        assert proj.net_cf(t)[row] == 0
+
+
+def test_result_cf_is_the_sum_over_the_points(vector):
+    proj = vector.Projection
+    result = proj.result_cf()
+    assert list(result.index) == list(range(0, proj.max_proj_len() + 1))
+    for t in (0, 1, 27, 300, proj.max_proj_len()):
+        assert result.loc[t, "net_cf"] == pytest.approx(proj.net_cf(t).sum())
+
+
+def test_the_three_checks_close(vector):
+    proj = vector.Projection
+    assert proj.check_av_roll_fwd()
+    assert proj.check_pols_roll_fwd()
+    assert proj.check_charge_split()
+
+
+def test_repeated_rows_project_independently(vector):
+    """A table repeating a contract, as a scenario set does, projects row by row."""
+    proj = vector.Projection
+    table = proj.model_point()
+    expected = proj.net_cf(60)
+    proj.model_point[()] = table.iloc[[0, 0, 2]]
+    try:
+        assert proj.net_cf(60) == pytest.approx(expected[[0, 0, 2]])
+    finally:
+        proj.model_point.clear_at()
+
+
+@pytest.mark.parametrize("column, cells, args", [
+    ("scenario_id", "inv_return_mth", (1,)),
+    ("glwb_option", "gawa_pct_age", (1,))])
+def test_an_unknown_key_raises(vector, column, cells, args):
+    """A key with no rows raises instead of reading another key's row."""
+    proj = vector.Projection
+    proj.model_point[()] = proj.model_point().assign(**{column: "unknown"})
+    try:
+        with pytest.raises(Exception, match="%s not in" % column):
+            getattr(proj, cells)(*args)
+    finally:
+        proj.model_point.clear_at()
+
+
+def test_a_txn_id_with_no_rows_reconciles_to_the_scalar_model(scalar, vector):
+    """As in VA_US_S, a txn_id absent from the transaction table takes no transactions."""
+    table = scalar.Data.model_point_table().assign(txn_id="unknown")
+    scalar.Data.model_point_table[()] = table
+    vector.Projection.model_point[()] = table
+    proj = vector.Projection
+    try:
+        for row, point_id in enumerate(table.index):
+            item = scalar.Projection[point_id]
+            ts = range(0, item.proj_len() + 1)
+            for name in ("premiums", "withdrawals", "av_pp", "net_cf"):
+                expected = np.array([getattr(item, name)(t) for t in ts])
+                actual = np.array([getattr(proj, name)(t)[row] for t in ts])
+                assert actual == pytest.approx(
+                    expected, rel=REL, abs=1e-9), (point_id, name)
+    finally:
+        vector.Projection.model_point.clear_at()
+        scalar.Data.model_point_table.clear_at()
+        scalar.Projection.clear_items()
+
+
+def test_a_month_before_the_first_return_row_raises(vector):
+    """As in VA_US_S, a gap at the start of a return series is not read as 0%."""
+    data = vector.Data
+    data.return_scenario[()] = data.return_scenario().drop(("base", 1, 1))
+    try:
+        with pytest.raises(Exception, match="no return row at or before month 1"):
+            vector.Projection.inv_return_mth(1)
+    finally:
+        data.return_scenario.clear_at()
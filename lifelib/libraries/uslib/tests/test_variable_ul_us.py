@@ -690,6 +690,16 @@ def test_scenario_is_an_input_and_its_last_month_repeats(anchor):
         assert anchor.gross_return_mth(t, 2) == pytest.approx(level, abs=1e-9)
 
 
+def test_compiled_return_path_agrees_with_the_table(variable_ul, anchor):
+    """return_path holds every row of the scenario table; a month with no row raises."""
+    data = variable_ul.Data
+    for (scenario_id, subaccount_id, t), row in data.scenario_table().iterrows():
+        assert data.return_path(scenario_id, subaccount_id)[t] == row["gross_return_mth"]
+    assert math.isnan(data.return_path("WE", 1)[0])
+    with pytest.raises(Exception, match="KeyError"):
+        anchor.gross_return_mth(0, 1)
+
+
 def _rejects(message, fn, *args):
     """A formula that raises ValueError(message); modelx wraps it in a FormulaError."""
     with pytest.raises(Exception) as exc:
@@ -0,0 +1,33 @@
+"""Runners for projecting large sets of model points with lifelib models"""
+
+from lifelib.runners.chunked import (
+    run_chunked,
+    chunk_size_for_budget,
+    merge_results
+)
+from lifelib.runners.parallel import run_parallel, get_space
+from lifelib.runners.seriatim import run_seriatim, point_ids_of
+from lifelib.runners.scenario_store import (
+    ScenarioStore,
+    create_scenarios,
+    write_scenarios
+)
+from lifelib.runners.rollforward import (
+    capture_state,
+    roll_forward,
+    reconcile
+)
+from lifelib.runners.pricing import PremiumSolver, premium_grid
+from lifelib.runners.ragged import run_ragged, horizon_bands, projected_months
+from lifelib.runners.precision import precision_drift
+from lifelib.runners.rolling import run_rolling
+from lifelib.runners.sink import ResultSink, run_to_sink, cashflow_frame
+from lifelib.runners.csv_inputs import load_inputs, unload_inputs
+from lifelib.runners.sampling import (
+    sample_normals,
+    assign_normals,
+    mc_estimate,
+    mc_convergence
+)
+from lifelib.runners.guarantee import value_guarantees, compare_guarantees
+from lifelib.runners.scenario_parallel import run_scenarios, scenario_mean
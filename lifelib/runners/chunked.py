@@ -0,0 +1,213 @@
+"""Chunked execution of vectorized models
+
+The vectorized models, such as :mod:`~basiclife.BasicTerm_ME` and
+:mod:`~savings.CashValue_ME`, project all the model points
+returned by ``model_point()`` at once, and every cached Cells parameterized by ``t``
+holds a vector as long as the number of model points.
+The peak memory of a run therefore grows with
+the number of model points times the number of months
+times the number of Cells.
+
+:func:`run_chunked` splits the model points into chunks of rows,
+projects one chunk at a time, and clears the Cells cache before moving
+on to the next chunk, so the peak memory is bounded by the chunk size
+instead of the size of the entire table.
+:func:`chunk_size_for_budget` estimates the chunk size
+that fits in a given memory budget.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import run_chunked
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> results = run_chunked(model.Projection, chunk_size=2000)
+
+    >>> results["result_pv"]
+"""
+import pandas as pd
+
+
+def iter_chunks(table, chunk_size):
+    """Yield consecutive chunks of rows of ``table``
+
+    Args:
+        table: DataFrame to split, or an Index, such as
+            the scenario IDs returned by ``scen_index()``
+            in :mod:`~savings.CashValue_ME`.
+        chunk_size(:obj:`int`): Maximum number of rows in each chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    for start in range(0, len(table), chunk_size):
+        yield rows(table, start, start + chunk_size)
+
+
+def rows(table, start, stop):
+    """Return the rows from ``start`` to ``stop`` of a DataFrame or an Index"""
+    if isinstance(table, pd.Index):
+        return table[start:stop]
+    else:
+        return table.iloc[start:stop]
+
+
+def clear_cache(space):
+    """Clear the calculated values of all the Cells in ``space``
+
+    Input values are kept.
+    """
+    for cells in space.cells.values():
+        cells.clear()
+
+
+def cache_nbytes(space):
+    """Return the number of bytes held in the Cells cache of ``space``
+
+    Only the cached values that have the ``nbytes`` attribute, such as
+    Numpy arrays and pandas Series, are counted.
+    Classes, such as Numpy data types, are not counted.
+    """
+    return sum(getattr(value, "nbytes", 0)
+               for cells in space.cells.values()
+               for value in cells.values() if not isinstance(value, type))
+
+
+def merge_results(chunk_results, sums=(), concats=()):
+    """Merge the results of chunks in the order of the chunks
+
+    Args:
+        chunk_results: Sequence of dicts mapping result names to DataFrames,
+            one dict per chunk.
+        sums: Names of the results to be summed up row by row,
+            such as ``result_cf``, whose rows are time steps.
+            Chunks with shorter projections contribute 0 to
+            the rows they do not have.
+        concats: Names of the results to be concatenated,
+            such as ``result_pv``, whose rows are model points.
+    """
+    merged = {}
+    for name in sums:
+        frames = [res[name] for res in chunk_results]
+        merged[name] = pd.concat(frames).groupby(level=0, sort=True).sum()
+
+    for name in concats:
+        merged[name] = pd.concat([res[name] for res in chunk_results])
+
+    return merged
+
+
+def run_chunk(space, chunk, names, source="model_point"):
+    """Project one chunk of model points and return its results
+
+    ``chunk`` is assigned to the Cells named ``source`` in ``space``
+    as its input value, and the Cells named in ``names`` are evaluated.
+    The input value and the cache are cleared after the results
+    are taken, so the ``source`` Cells reverts to its formula.
+    """
+    source_cells = getattr(space, source)
+    source_cells[()] = chunk
+    try:
+        return {name: getattr(space, name)() for name in names}
+    finally:
+        source_cells.clear_at()
+        clear_cache(space)
+
+
+def run_chunked(space, chunk_size, sums=("result_cf",), concats=("result_pv",),
+                source="model_point"):
+    """Project the model points chunk by chunk and merge the results
+
+    The model points returned by ``model_point()`` in ``space``
+    are split into chunks of ``chunk_size`` rows.
+    Each chunk is assigned to ``model_point`` as its input value in turn,
+    the result Cells are evaluated, and the cache is cleared
+    before the next chunk. Neither ``model_point_table`` nor
+    the formula of ``model_point`` is changed, so any selection of model points
+    made in the formula is respected, and the model is left as it was
+    when the run finishes.
+
+    The results are merged by :func:`merge_results`:
+    the results in ``sums``, indexed by ``t``, are summed up and
+    the results in ``concats``, indexed by model point, are concatenated.
+    The merged results equal the results of projecting all the model
+    points at once, up to floating-point rounding.
+
+    Args:
+        space: The Projection space of a vectorized model, such as
+            ``BasicTerm_ME.Projection`` or ``CashValue_ME.Projection``.
+        chunk_size(:obj:`int`): Number of model points in each chunk.
+            Use :func:`chunk_size_for_budget` to find
+            a chunk size that fits in a memory budget.
+        sums: Names of the result Cells to be summed up.
+            Defaults to ``("result_cf",)``.
+        concats: Names of the result Cells to be concatenated.
+            Defaults to ``("result_pv",)``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points to be split. Defaults to ``"model_point"``.
+            For models in which other Cells read the model point table
+            without going through ``model_point``, name the Cells
+            they read instead, such as ``"model_point_table_ext"``
+            in :mod:`~appliedlife.IntegratedLife`.
+            To split the scenarios instead of the model points,
+            name the Cells returning the scenario IDs as an Index,
+            such as ``"scen_index"`` in :mod:`~savings.CashValue_ME`
+            with ``scen_batch`` set to ``True``.
+
+    Returns:
+        :obj:`dict` mapping the names in ``sums`` and ``concats``
+        to the merged DataFrames.
+    """
+    names = list(sums) + list(concats)
+    model_point = getattr(space, source)()
+    clear_cache(space)
+
+    chunk_results = [run_chunk(space, chunk, names, source)
+                     for chunk in iter_chunks(model_point, chunk_size)]
+
+    return merge_results(chunk_results, sums, concats)
+
+
+def chunk_size_for_budget(space, memory_budget, names=("result_cf", "result_pv"),
+                          probe_size=100, source="model_point"):
+    """Estimate the chunk size that fits in a memory budget
+
+    Projects the first ``probe_size`` model points, measures the bytes
+    held in the Cells cache by :func:`cache_nbytes`, and scales the
+    measurement linearly to the number of model points
+    whose cache fits in ``memory_budget``.
+    The estimate covers the Cells cache only, so leave headroom
+    for the inputs and the results.
+
+    Args:
+        space: The Projection space of a vectorized model.
+        memory_budget(:obj:`int`): Memory budget in bytes.
+        names: Names of the result Cells to be evaluated for the probe.
+        probe_size(:obj:`int`, optional): Number of model points to probe.
+            Defaults to 100.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+
+    Returns:
+        The estimated chunk size as an :obj:`int`, at least 1 and at most
+        the number of model points.
+    """
+    source_cells = getattr(space, source)
+    model_point = source_cells()
+    probe = rows(model_point, 0, probe_size)
+    clear_cache(space)
+
+    source_cells[()] = probe
+    try:
+        for name in names:
+            getattr(space, name)()
+        nbytes = cache_nbytes(space)
+    finally:
+        source_cells.clear_at()
+        clear_cache(space)
+
+    bytes_per_point = nbytes / len(probe)
+    size = int(memory_budget // bytes_per_point) if bytes_per_point else len(model_point)
+
+    return max(1, min(size, len(model_point)))
@@ -0,0 +1,129 @@
+"""Concurrent loading of CSV inputs with declared schemas
+
+The models in :mod:`uslib` and :mod:`uklib` read their input CSVs
+in their ``Data`` spaces. Each file is read by a reader Cells,
+such as ``model_point_table()``, calling :func:`pandas.read_csv`
+on the file named by a filename Reference, such as ``model_point_file``.
+The readers read all the columns, including the ``provenance`` columns
+of free text that the formulas do not use, with the data types inferred
+from the values, and they are evaluated one after another as the projection
+first refers to them.
+
+:func:`load_inputs` reads the files of the reader Cells
+at once on a thread pool by :func:`pandas.read_csv`,
+with the columns of each file not in ``exclude`` as ``usecols``
+and the declared types as ``dtype``.
+The tables are assigned to the reader Cells as their input values,
+so the projection uses the tables without reading the files again.
+Each ``Data`` space declares its schema in its ``input_schema()`` Cells:
+``"tables"`` maps the names of the reader Cells to the names of
+their filename References and the ``index_col`` they read the files with,
+and ``"dtype"`` maps the names of the filename References
+to the types of the columns of the files.
+The tables can also be cached in the sidecar files of
+:mod:`~lifelib.runners.input_cache`, so later loads of unchanged files
+skip parsing.
+:func:`unload_inputs` clears the input values,
+so the reader Cells read the files by their formulas again.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import load_inputs
+
+    >>> model = mx.read_model("products/term_life/Term_US_A")
+
+    >>> load_inputs(model.Data)
+
+    >>> model.Projection[1].result_cf()
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from lifelib.runners import input_cache
+
+# Columns of free text not used in the formulas
+TEXT_COLUMNS = ("provenance",)
+
+
+def load_inputs(space, tables=None, dtype=None, exclude=TEXT_COLUMNS,
+                max_workers=None, cache=False):
+    """Read the input CSVs of ``space`` concurrently with a declared schema
+
+    Each file is read on a thread pool by :func:`pandas.read_csv`
+    with the columns not in ``exclude`` and the types in ``dtype``,
+    and the table is assigned to its reader Cells as its input value.
+    The formulas of the reader Cells are not evaluated.
+
+    Args:
+        space: The ``Data`` space of a model in :mod:`uslib`
+            or :mod:`uklib`.
+        tables(:obj:`dict`, optional): Mapping of the names of the reader Cells
+            to tuples of the name of the filename Reference and
+            ``index_col`` the reader passes to :func:`pandas.read_csv`,
+            such as ``("mort_table_file", ["sex", "age"])``.
+            A third element of ``True`` sorts the index of the table,
+            for the readers calling ``sort_index()``.
+            Defaults to ``"tables"`` of ``space.input_schema()``.
+        dtype(:obj:`dict`, optional): Mapping of the names of
+            the filename References to the dicts of the columns and
+            their types passed to :func:`pandas.read_csv`.
+            Defaults to ``"dtype"`` of ``space.input_schema()``.
+        exclude(optional): Names of the columns not to read.
+            Defaults to :data:`TEXT_COLUMNS`.
+            Pass an empty tuple to read all the columns.
+        max_workers(:obj:`int`, optional): Maximum number of threads.
+            Defaults to the default of
+            :class:`~concurrent.futures.ThreadPoolExecutor`.
+        cache(:obj:`bool`, optional): Whether to read the files through
+            :func:`lifelib.runners.input_cache.read_csv`.
+            Defaults to ``False``.
+
+    Returns:
+        :obj:`dict` of the number of ``"tables"`` read
+        and their ``"nbytes"``.
+    """
+    if tables is None:
+        tables = space.input_schema()["tables"]
+    if dtype is None:
+        dtype = space.input_schema()["dtype"]
+
+    input_dir = space.input_dir()
+    read_csv = input_cache.read_csv if cache else pd.read_csv
+
+    def read(spec):
+        file, index_col, sort = (tuple(spec) + (False,))[:3]
+        path = input_dir / getattr(space, file)
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = None
+        if header.isin(exclude).any():
+            usecols = [c for c in header if c not in exclude]
+
+        table = read_csv(path, index_col=index_col, usecols=usecols,
+                         dtype=dtype.get(file))
+        return table.sort_index() if sort else table
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        result = dict(zip(tables, executor.map(read, tables.values())))
+
+    for name, table in result.items():
+        space.cells[name][()] = table
+
+    return {"tables": len(result),
+            "nbytes": int(sum(table.memory_usage(deep=True).sum()
+                              for table in result.values()))}
+
+
+def unload_inputs(space, tables=None):
+    """Clear the tables loaded by :func:`load_inputs` into ``space``
+
+    Clears the input values of the reader Cells named in ``tables``,
+    by default those in ``"tables"`` of ``space.input_schema()``,
+    so they read the files by their formulas again.
+    """
+    if tables is None:
+        tables = space.input_schema()["tables"]
+
+    for name in tables:
+        space.cells[name].clear_at()
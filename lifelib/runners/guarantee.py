@@ -0,0 +1,229 @@
+"""Closed-form valuation of minimum guarantees
+
+The savings models, such as :mod:`~savings.CashValue_ME` and
+:mod:`~savings.CashValue_ME_EX1`, pay the greater of the sum assured
+and the account value on death, and the models from
+:mod:`~savings.CashValue_ME_EX1` pay it on maturity as well.
+The value of the guarantee is the present value of the claims over
+the account value, ``claims_over_av(t, kind)``, averaged over
+the stochastic scenarios of investment returns.
+
+When the returns follow the geometric Brownian motion of
+``inv_return_table()``, the account value at ``t`` of a single premium
+policy whose charges are proportional to the account value is
+lognormal, with its mean on the path of the expected returns
+and the volatility of the returns. The guarantee paid on a claim at ``t``
+is then a put option on the account value struck at the sum assured,
+valued in closed form by :func:`black_put`.
+
+:func:`value_guarantees` projects the model once on the deterministic
+scenario of the expected returns by :func:`forward_scenario`,
+and values the guarantees of the claims at each ``t`` by :func:`black_put`
+on the account values and the numbers of the claims on that path.
+The values are exact for the models whose decrements do not
+depend on the account value and whose charges are proportional
+to the account value, such as :mod:`~savings.CashValue_ME_EX1`
+and :mod:`~savings.CashValue_ME_EX4`, and approximations otherwise,
+such as for the dynamic lapses of :mod:`~savings.CashValue_ME_EX2`
+and the level premiums.
+:func:`compare_guarantees` reports the differences
+from the values by the stochastic scenarios of the model.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import compare_guarantees
+
+    >>> model = mx.read_model("CashValue_ME_EX1")
+
+    >>> model.Projection.model_point_table = model.Projection.model_point_moneyness
+
+    >>> compare_guarantees(model.Projection)
+                  Analytic    Stochastic    Difference
+    point_id
+    1         2.711649e+04  2.658845e+04    528.043914
+    2         1.048409e+05  1.012275e+05   3613.438692
+    3         3.405594e+05  3.338084e+05   6751.032291
+    ...
+    9         1.093700e+07  1.092539e+07  11613.170065
+
+The analytic values take about 1 second, and
+the 10,000 scenarios of the model take about 7 seconds.
+"""
+import contextlib
+import math
+
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.sampling import assign_normals
+
+# Claims with the guarantees, mapped to the Cells of the numbers of
+# the claims and the timings of the account values the claims are paid on
+GUARANTEES = {
+    "DEATH": ("pols_death", "MID_MTH"),
+    "MATURITY": ("pols_maturity", "BEF_PREM")
+}
+
+
+def black_put(forward, strike, sigma, term):
+    """Undiscounted value of a put option on a lognormal value
+
+    Returns the expected value of ``max(strike - S, 0)``, where ``S``
+    is lognormal with the mean ``forward`` and the standard deviation
+    of its logarithm ``sigma`` times the square root of ``term``.
+    The arguments can be Numpy arrays.
+    """
+    forward, strike = np.broadcast_arrays(
+        np.asarray(forward, dtype=np.float64), np.asarray(strike, dtype=np.float64))
+    vol = sigma * np.sqrt(term)
+    intrinsic = np.maximum(strike - forward, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(forward / strike) + 0.5 * vol**2) / vol
+        value = strike * _norm_cdf(-(d1 - vol)) - forward * _norm_cdf(-d1)
+
+    is_lognormal = (vol > 0) & (forward > 0) & (strike > 0)
+    return np.where(is_lognormal, value, intrinsic)
+
+
+@contextlib.contextmanager
+def forward_scenario(space, sigma=0.03, dt=1 / 12):
+    """Project ``space`` on the deterministic scenario of the expected returns
+
+    A context manager assigning to ``std_norm_rand`` of ``space``
+    a single scenario of the random numbers ``0.5 * sigma * sqrt(dt)``,
+    with which the returns of ``inv_return_table()`` are
+    the expected returns ``exp(mu * dt) - 1``.
+    ``scen_id``, ``scen_batch`` and ``scen_file`` are set to project
+    the scenario if ``space`` has them.
+    ``std_norm_rand`` and the References are restored on exit.
+    """
+    is_cells = "std_norm_rand" in space.cells
+    if is_cells:
+        normals = space.std_norm_rand()
+        is_input = space.std_norm_rand.is_input()
+        scen_size = space.scen_size
+    else:
+        normals = space.std_norm_rand
+
+    steps = normals.shape[1] if normals.ndim == 2 else normals.index.levshape[1]
+    refs = {name: getattr(space, name) for name in
+            ("scen_id", "scen_batch", "scen_file") if name in space.refs}
+
+    assign_normals(space, np.full((1, steps), 0.5 * sigma * np.sqrt(dt)))
+    for name, value in {"scen_id": 1, "scen_batch": False, "scen_file": None}.items():
+        if name in refs:
+            setattr(space, name, value)
+    try:
+        yield space
+    finally:
+        for name, value in refs.items():
+            setattr(space, name, value)
+        if is_cells:
+            space.scen_size = scen_size
+            if is_input:
+                space.std_norm_rand[()] = normals
+            else:
+                space.std_norm_rand.clear_at()
+        else:
+            space.std_norm_rand = normals
+
+
+def value_guarantees(space, sigma=0.03, kinds=("DEATH", "MATURITY")):
+    """Value the guarantees of the claims in closed form
+
+    For each ``t`` from 0 to ``max_proj_len()`` less 1,
+    the guarantees of the claims of each kind in ``kinds`` are valued
+    by :func:`black_put` on the account value at the timing
+    in :data:`GUARANTEES` on the path of :func:`forward_scenario`,
+    struck at the sum assured, with the volatility ``sigma`` of
+    ``inv_return_table()``. The values are multiplied by the numbers
+    of the claims on the path and discounted by ``disc_factors``.
+    The account values paid on the death claims at the middle of
+    the month are given a quarter of the month's variance.
+
+    Pass ``kinds=("DEATH",)`` for :mod:`~savings.CashValue_ME`,
+    which has no guarantee on maturity.
+
+    Returns:
+        DataFrame of the present values of the guarantees
+        indexed with ``point_id``, with ``kinds`` and ``"Total"``
+        as its columns.
+    """
+    with forward_scenario(space, sigma):
+        index = space.model_point().index
+        if "scen_id" in index.names:
+            index = index.droplevel("scen_id")
+
+        sum_assured = np.asarray(space.sum_assured(), dtype=np.float64)
+        values = {kind: np.zeros(len(index)) for kind in kinds}
+        for t in range(space.max_proj_len()):
+            for kind in kinds:
+                pols, timing = GUARANTEES[kind]
+                term = (t + 0.25) / 12 if timing == "MID_MTH" else t / 12
+                put = black_put(np.asarray(space.av_pp_at(t, timing)),
+                                sum_assured, sigma, term)
+                values[kind] += (put * np.asarray(getattr(space, pols)(t))
+                                 * _disc_factor(space, t))
+
+    result = pd.DataFrame(values, index=index)
+    result["Total"] = result.sum(axis=1)
+    return result
+
+
+def compare_guarantees(space, sigma=0.03, kinds=("DEATH", "MATURITY")):
+    """Compare the guarantees valued in closed form and by scenarios
+
+    ``"Analytic"`` is the total of :func:`value_guarantees`.
+    ``"Stochastic"`` is the present value of ``claims_over_av(t, kind)``
+    of ``kinds`` averaged over the scenarios of ``space`` as it is.
+    ``"Difference"`` is ``"Analytic"`` less ``"Stochastic"``.
+
+    Returns:
+        DataFrame indexed with ``point_id``.
+    """
+    analytic = value_guarantees(space, sigma, kinds)["Total"]
+
+    index = space.model_point().index
+    pv = sum(np.asarray(space.claims_over_av(t, kind), dtype=np.float64)
+             * _disc_factor(space, t)
+             for t in range(space.max_proj_len()) for kind in kinds)
+    if np.ndim(pv) > 1:
+        # The scenarios by the model points in the scen_batch mode
+        pv = np.mean(pv, axis=0)
+    stochastic = pd.Series(pv, index=index)
+    if "scen_id" in index.names:
+        stochastic = stochastic.groupby(
+            level=[n for n in index.names if n != "scen_id"], sort=False).mean()
+
+    return pd.DataFrame({"Analytic": analytic,
+                         "Stochastic": stochastic,
+                         "Difference": analytic - stochastic})
+
+
+def _erfc(x):
+    # Complementary error function by the Chebyshev approximation of
+    # Numerical Recipes, with the fractional error less than 1.2e-7
+    z = np.abs(x)
+    t = 1 / (1 + 0.5 * z)
+    poly = np.polynomial.polynomial.polyval(t, (
+        -1.26551223, 1.00002368, 0.37409196, 0.09678418, -0.18628806,
+        0.27886807, -1.13520398, 1.48851587, -0.82215223, 0.17087277))
+    value = t * np.exp(-z * z + poly)
+    return np.where(x >= 0, value, 2 - value)
+
+
+try:
+    from scipy.special import ndtr as _norm_cdf
+except ImportError:
+    def _norm_cdf(x):
+        # The standard normal CDF by _erfc, not to depend on scipy
+        return 0.5 * _erfc(-np.asarray(x, dtype=np.float64) / math.sqrt(2))
+
+
+def _disc_factor(space, t):
+    if space.disc_factors.parameters:
+        return space.disc_factors(t)
+    else:
+        return space.disc_factors()[t]
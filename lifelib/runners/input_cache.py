@@ -0,0 +1,196 @@
+"""Fast-load cache of Excel and CSV input files
+
+Models such as :mod:`~appliedlife.IntegratedLife` read their parameters,
+assumptions, mortality tables and scenarios from Excel workbooks
+by :func:`pandas.read_excel` every time the model runs,
+and parsing the workbooks by openpyxl takes most of the time
+of a small run.
+
+:func:`read_excel` is a drop-in replacement for :func:`pandas.read_excel`
+that keeps what it read in a binary sidecar file.
+The first read of a sheet with a set of arguments parses the workbook
+and writes the DataFrame to a pickle file in the directory
+named :data:`CACHE_DIR` next to the workbook.
+Later reads with the same arguments load the pickle file instead.
+Pickle files keep the index, the columns and the data types
+of the DataFrames exactly as read from the workbook.
+
+The sidecar files of a workbook are named by the hash of the name of
+the workbook and the hash of the arguments, and are validated by a stamp
+of the workbook,
+its size, its modification time and the hash of its contents.
+When the size or the modification time of the workbook changes,
+its contents are hashed again, and if the hash has changed too,
+the sidecar files are deleted and the workbook is read again.
+
+If the directory is not writable, the workbook is read every time.
+:func:`read_csv` caches CSV files in the same way.
+
+The sidecar files are loaded by :func:`pandas.read_pickle`,
+which can run arbitrary code in a crafted file,
+so use the cache only for folders whose contents you trust.
+The library models do not use the cache unless asked to.
+In :mod:`~appliedlife.IntegratedLife`, assign this module to
+the ``input_cache`` Reference of the model to read the Excel files
+through the cache.
+
+Example:
+
+    >>> from lifelib.runners import input_cache
+
+    >>> df = input_cache.read_excel("model_parameters.xlsx",
+    ...                             sheet_name="RunParams", index_col="run_id")
+"""
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+
+import pandas as pd
+
+CACHE_DIR = ".lifelib_cache"
+
+STAMP_SUFFIX = ".stamp.json"
+
+
+def read_excel(io, **kwargs):
+    """Read an Excel file through the sidecar cache
+
+    Takes the same arguments as :func:`pandas.read_excel`.
+    ``io`` must be a path to a file. The arguments must be
+    printable by :func:`repr` in a form that identifies them,
+    such as strings, numbers, lists and dicts of them.
+    """
+    return read_cached(pd.read_excel, io, **kwargs)
+
+
+def read_csv(filepath_or_buffer, **kwargs):
+    """Read a CSV file through the sidecar cache
+
+    Takes the same arguments as :func:`pandas.read_csv`.
+    ``filepath_or_buffer`` must be a path to a file.
+    See :func:`read_excel` for the arguments.
+    """
+    return read_cached(pd.read_csv, filepath_or_buffer, **kwargs)
+
+
+def read_cached(reader, io, **kwargs):
+    """Read the file ``io`` by ``reader`` through the sidecar cache
+
+    ``reader`` is a function taking a path and keyword arguments,
+    such as :func:`pandas.read_excel`, and
+    the value it returns is cached by the arguments.
+    """
+    path = pathlib.Path(io)
+    cache_dir = path.parent / CACHE_DIR
+    entry = cache_dir / ("%s.%s.pkl" % (_name_digest(path), _args_digest(kwargs)))
+
+    try:
+        is_valid = _check_stamp(path, cache_dir)
+    except OSError:
+        return reader(path, **kwargs)
+
+    if is_valid and entry.exists():
+        return pd.read_pickle(entry)
+
+    result = reader(path, **kwargs)
+    try:
+        _write_atomic(entry, lambda f: pd.to_pickle(result, f))
+    except OSError:
+        pass
+
+    return result
+
+
+def clear(io):
+    """Delete the sidecar files of the file ``io``
+
+    The sidecar files of other files are kept, even if
+    their names start with the name of ``io``.
+    """
+    path = pathlib.Path(io)
+    cache_dir = path.parent / CACHE_DIR
+    for entry in cache_dir.glob(_name_digest(path) + ".*"):
+        entry.unlink()
+
+
+def stamp_path(io):
+    """Return the path to the stamp file of the file ``io``"""
+    path = pathlib.Path(io)
+    return path.parent / CACHE_DIR / (_name_digest(path) + STAMP_SUFFIX)
+
+
+def file_stamp(path, digest=None):
+    """Return the stamp of the file as a dict
+
+    The stamp has the size and the modification time of the file
+    in nanoseconds, and the hex digest of its contents.
+    ``digest`` is used as the digest if given.
+    """
+    stat = os.stat(path)
+    if digest is None:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+
+
+def _check_stamp(path, cache_dir):
+    """Return ``True`` if the sidecar files of ``path`` are valid
+
+    Deletes the sidecar files and writes a new stamp if not.
+    """
+    stamp_file = stamp_path(path)
+    stat = os.stat(path)
+
+    if stamp_file.exists():
+        with open(stamp_file, encoding="utf-8") as f:
+            stamp = json.load(f)
+        if stamp["size"] == stat.st_size and stamp["mtime_ns"] == stat.st_mtime_ns:
+            return True
+
+        new_stamp = file_stamp(path)
+        if new_stamp["hash"] == stamp["hash"]:
+            _write_stamp(stamp_file, new_stamp)
+            return True
+    else:
+        new_stamp = file_stamp(path)
+
+    cache_dir.mkdir(exist_ok=True)
+    clear(path)
+    _write_stamp(stamp_file, new_stamp)
+    return False
+
+
+def _write_stamp(stamp_file, stamp):
+    _write_atomic(stamp_file, lambda f: f.write(json.dumps(stamp).encode()))
+
+
+def _write_atomic(path, write):
+    """Write to a temporary file and move it to ``path``
+
+    Processes reading ``path`` at the same time,
+    such as the workers of :func:`~lifelib.runners.run_parallel`,
+    see either the old file or the new one.
+    """
+    fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def _name_digest(path):
+    return hashlib.blake2b(path.name.encode(), digest_size=16).hexdigest()
+
+
+def _args_digest(kwargs):
+    return hashlib.blake2b(
+        repr(sorted(kwargs.items())).encode(), digest_size=8).hexdigest()
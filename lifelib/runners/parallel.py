@@ -0,0 +1,193 @@
+"""Parallel execution of model point chunks across processes
+
+:func:`run_parallel` distributes the chunks of model points
+of a vectorized model over a pool of worker processes.
+Each worker process reads the model once when it starts,
+and then projects the chunks assigned to it one at a time
+in the same way as :func:`~lifelib.runners.run_chunked`.
+
+The chunk boundaries depend only on the chunk size, and the results
+of the chunks are merged in the order of the chunks, not in the order
+the workers finish them. The merged results are therefore identical
+regardless of the number of workers.
+
+Example:
+
+    >>> from lifelib.runners import run_parallel
+
+    >>> results = run_parallel(
+    ...     "BasicTerm_ME", "Projection", chunk_size=1000,
+    ...     refs={"engine": "grid"}, max_workers=8)
+
+    >>> results["result_pv"]
+
+Space paths can include the arguments of parameterized spaces,
+such as ``"Run[1].GMXB"`` in :mod:`~appliedlife.IntegratedLife`.
+
+On platforms that start worker processes by spawning, such as
+Windows and macOS, call :func:`run_parallel` from within
+an ``if __name__ == "__main__":`` block in scripts.
+
+Other runners, such as :func:`~lifelib.runners.run_scenarios`,
+start the same worker processes by :func:`worker_pool`,
+and submit :func:`run_slice` and their own functions
+that read the model by :func:`worker_model`
+and the tables by :func:`worker_table` in the workers.
+"""
+import ast
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from lifelib.runners.chunked import (
+    clear_cache, merge_results, rows, run_chunk)
+
+_SPACE_ITEM = re.compile(r"^(\w+)(?:\[(.*)\])?$")
+
+# State of the worker process set by init_worker
+_worker = {}
+
+
+def get_space(model, path):
+    """Return the space at ``path`` in ``model``
+
+    ``path`` is a dot-separated sequence of space names relative
+    to ``model``. Each name can be followed by arguments in square brackets
+    to select an item of a parameterized space, such as ``"Run[1].GMXB"``.
+    The arguments are read as Python literals.
+    """
+    obj = model
+    for name in path.split("."):
+        match = _SPACE_ITEM.match(name.strip())
+        if not match:
+            raise ValueError("invalid space path: %s" % path)
+
+        obj = getattr(obj, match.group(1))
+        if match.group(2) is not None:
+            args = ast.literal_eval("(" + match.group(2) + ",)")
+            obj = obj[args]
+
+    return obj
+
+
+def worker_pool(model_path, max_workers=None, mp_context=None):
+    """Return a pool of worker processes reading the model at ``model_path``
+
+    Returns a :class:`~concurrent.futures.ProcessPoolExecutor`
+    whose worker processes each read the model once
+    by :func:`init_worker` when they start.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=init_worker,
+        initargs=(str(model_path),))
+
+
+def init_worker(model_path):
+    """Read the model at ``model_path`` in the worker process"""
+    import modelx as mx
+
+    _worker.update(model=mx.read_model(model_path), tables={})
+
+
+def worker_model():
+    """Return the model read by :func:`init_worker` in the worker process"""
+    return _worker["model"]
+
+
+def worker_table(space_path, source="model_point", refs=None):
+    """Return the space at ``space_path`` and its table of ``source`` in the worker
+
+    The space is got by :func:`get_space` from :func:`worker_model`,
+    ``refs`` are set in the space, and the value of the Cells ``source``
+    is read once per worker when the space is first used,
+    and then the cache of the space is cleared.
+    Returns a tuple of the space and the table.
+    """
+    key = (space_path, source)
+    if key not in _worker["tables"]:
+        space = get_space(_worker["model"], space_path)
+        for name, value in (refs or {}).items():
+            setattr(space, name, value)
+
+        table = getattr(space, source)()
+        clear_cache(space)
+        _worker["tables"][key] = (space, table)
+
+    return _worker["tables"][key]
+
+
+def _count_rows(space_path, source, refs):
+    return len(worker_table(space_path, source, refs)[1])
+
+
+def run_slice(space_path, source, refs, start, stop, names):
+    """Project the rows from ``start`` to ``stop`` of the table in the worker
+
+    The table is the one returned by :func:`worker_table`.
+    Returns the values of the Cells in ``names``
+    as :func:`~lifelib.runners.chunked.run_chunk` does.
+    """
+    space, table = worker_table(space_path, source, refs)
+    return run_chunk(space, rows(table, start, stop), names, source)
+
+
+def run_parallel(model_path, space, chunk_size, sums=("result_cf",),
+                 concats=("result_pv",), max_workers=None, refs=None,
+                 source="model_point", mp_context=None):
+    """Project chunks of model points in parallel and merge the results
+
+    Starts a pool of worker processes, each of which reads
+    the model at ``model_path`` once, and assigns disjoint slices of
+    ``chunk_size`` model points to the workers.
+    The results of the chunks are merged by
+    :func:`~lifelib.runners.merge_results` in the order of the chunks,
+    so the merged results are the same as
+    :func:`~lifelib.runners.run_chunked` with the same ``chunk_size``
+    for any number of workers.
+
+    The model is read from the files, so changes made to
+    a model in the calling process are not seen by the workers.
+    Pass the values of References to change in ``refs``.
+
+    Args:
+        model_path: Path to the model folder.
+        space(:obj:`str`): Path to the space in the model,
+            such as ``"Projection"`` or ``"Run[1].GMXB"``.
+            See :func:`get_space`.
+        chunk_size(:obj:`int`): Number of model points in each chunk.
+        sums: Names of the result Cells to be summed up.
+            Defaults to ``("result_cf",)``.
+        concats: Names of the result Cells to be concatenated.
+            Defaults to ``("result_pv",)``.
+        max_workers(:obj:`int`, optional): Number of worker processes.
+            Defaults to the number of CPUs.
+        refs(:obj:`dict`, optional): Names and values of References
+            to be set in the space in each worker before projecting,
+            such as ``{"engine": "grid"}``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points to be split. Defaults to ``"model_point"``.
+            See :func:`~lifelib.runners.run_chunked`.
+        mp_context(optional): A multiprocessing context
+            passed to :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Returns:
+        :obj:`dict` mapping the names in ``sums`` and ``concats``
+        to the merged DataFrames.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    names = list(sums) + list(concats)
+
+    with worker_pool(model_path, max_workers, mp_context) as pool:
+
+        size = pool.submit(_count_rows, space, source, refs).result()
+        futures = [
+            pool.submit(run_slice, space, source, refs,
+                        start, min(start + chunk_size, size), names)
+            for start in range(0, size, chunk_size)]
+
+        chunk_results = [f.result() for f in futures]
+
+    return merge_results(chunk_results, sums, concats)
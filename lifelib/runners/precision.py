@@ -0,0 +1,96 @@
+"""Reduced precision of cached values
+
+The Cells cache of a vectorized model holds a vector or an array
+of 64-bit floats for each cached value of the decrements and the cashflows.
+Models with the ``precision`` reference, :mod:`~basiclife.BasicTerm_ME`,
+:mod:`~savings.CashValue_ME` and :mod:`~appliedlife.IntegratedLife`,
+hold these values as 32-bit floats when ``precision`` is ``"float32"``,
+while accumulating the present values and the totals in 64-bit floats.
+
+:func:`precision_drift` runs a model in both precisions and reports
+how far the results in reduced precision drift from those in
+full precision, together with the bytes held in the cache,
+so the saving can be weighed against the drift before
+the chunk sizes are increased.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import precision_drift
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> model.Projection.engine = "grid"
+
+    >>> drift, nbytes = precision_drift(model.Projection)
+
+    >>> drift.loc["result_pv"]
+                     max_abs_diff  max_rel_diff
+    PV Premiums          0.031226  3.911835e-09
+    PV Claims            0.061454  9.999781e-09
+    PV Expenses          0.001501  1.368438e-08
+    PV Commissions       0.009528  1.531417e-08
+    PV Net Cashflow      0.071697  3.903278e-08
+
+    >>> nbytes
+    {'float64': 336139424, 'float32': 192059424}
+"""
+import pandas as pd
+
+from lifelib.runners.chunked import cache_nbytes, clear_cache
+
+
+def precision_drift(space, names=("result_cf", "result_pv"), precision="float32"):
+    """Compare the results in reduced precision with full precision
+
+    Evaluates the result Cells named in ``names`` with the ``precision``
+    reference of ``space`` set to ``"float64"`` and then to ``precision``,
+    and measures the bytes held in the cache after each run
+    by :func:`~lifelib.runners.chunked.cache_nbytes`.
+    ``precision`` is set back to its original value,
+    and the cache is cleared when the runs finish.
+
+    The ``precision`` reference of :mod:`~appliedlife.IntegratedLife`
+    is defined in the model, and setting it deletes the product spaces
+    in ``Run``, so this function does not take the product spaces.
+
+    Args:
+        space: The Projection space of a model with the
+            ``precision`` reference, such as ``BasicTerm_ME.Projection``.
+        names: Names of the result Cells returning DataFrames.
+            Defaults to ``("result_cf", "result_pv")``.
+        precision(:obj:`str`, optional): The reduced precision.
+            Defaults to ``"float32"``.
+
+    Returns:
+        A tuple of a DataFrame and a dict. The DataFrame is
+        indexed with the names in ``names`` and their columns,
+        and has the columns ``"max_abs_diff"``, the maximum
+        absolute difference, and ``"max_rel_diff"``, the maximum absolute
+        difference divided by the maximum absolute value in full precision.
+        The dict maps the precisions to the bytes held in the cache.
+    """
+    original = space.precision
+    results = {}
+    nbytes = {}
+    try:
+        for prec in ("float64", precision):
+            clear_cache(space)
+            space.precision = prec
+            results[prec] = {name: getattr(space, name)() for name in names}
+            nbytes[prec] = cache_nbytes(space)
+    finally:
+        space.precision = original
+        clear_cache(space)
+
+    drift = {}
+    for name in names:
+        full = results["float64"][name]
+        diff = (results[precision][name] - full).abs().max()
+        scale = full.abs().max()
+        for col in full.columns:
+            drift[(name, col)] = {
+                "max_abs_diff": diff[col],
+                "max_rel_diff": diff[col] / scale[col] if scale[col] else 0.0}
+
+    return pd.DataFrame.from_dict(drift, orient="index"), nbytes
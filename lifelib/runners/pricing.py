@@ -0,0 +1,273 @@
+"""Memoized premium rate solver
+
+Premium rate tables, such as the one made by *create_premium_table.ipynb*
+in the :mod:`basiclife` library, have one premium rate per cell of a grid
+of pricing keys, such as the age at entry and the policy term.
+The rates are solved as the ratios of the present values of
+the projected cashflows, such as ``net_premium_pp()`` in
+:mod:`~basiclife.BasicTerm_M` and ``net_premium_rate()``
+in :mod:`~basiclife.BasicTermASL_ME.Pricing`.
+
+:class:`PremiumSolver` solves the rates of all the grid cells
+in one projection of a vectorized model, treating each grid cell
+as a model point. The solved rates are kept in a cache keyed by
+a fingerprint of the inputs of each grid cell, so solving the grid again
+after an assumption change projects only the grid cells whose inputs changed.
+
+The fingerprint of a grid cell is made of:
+
+* the values of the grid cell, i.e. the columns of its model point,
+* the formulas of all the Cells in the space and the values of
+  the References in the space, except for the term tables
+  and ``model_point_table``,
+* the rows of the term tables that the grid cell reads during its
+  policy term: the rows of the tables indexed by attained age,
+  such as ``mort_table``, from its age at entry to its age at maturity,
+  and the rows of the tables indexed by policy year, such as
+  ``disc_rate_ann``, from year 0 to its policy term.
+
+The term tables are declared by the caller of :class:`PremiumSolver`,
+and default to :data:`TERM_TABLES`. Tables not declared enter
+the fingerprint whole.
+
+A change in a mortality rate at age 70 therefore leaves
+the rates of the grid cells maturing before age 70 in the cache,
+while a change in a formula or a scalar assumption, such as
+``loading_prem``, solves the whole grid again.
+Input values assigned to Cells are not part of the fingerprint.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import PremiumSolver, premium_grid
+
+    >>> model = mx.read_model("BasicTermASL_ME")
+
+    >>> pricing = model.Pricing
+
+    >>> grid = premium_grid(
+    ...     age_at_entry=range(20, 60), policy_term=[10, 15, 20],
+    ...     payment_freq=[1, 2, 12], payment_term=[5, 10, 15, 20],
+    ...     sex="M", policy_count=1, sum_assured=1000,
+    ...     issue_date=pricing.date_(0) + pd.DateOffset(days=1))
+
+    >>> solver = PremiumSolver(
+    ...     pricing, "net_premium_rate",
+    ...     keys=["age_at_entry", "policy_term", "payment_freq", "payment_term"])
+
+    >>> rates = solver.solve(grid)
+
+    >>> table = pricing.mort_table.copy()
+
+    >>> table.loc[70:] *= 1.1
+
+    >>> pricing.mort_table = table
+
+    >>> rates = solver.solve(grid)
+
+    >>> solver.report
+    {'cells': 1440, 'cached': 1260, 'solved': 180}
+"""
+import hashlib
+import itertools
+import types
+
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.chunked import run_chunk
+
+# Default term tables: the tables of which only the rows in the policy term
+# of each grid cell enter its fingerprint, by the kinds of their indexes
+TERM_TABLES = {"mort_table": "age", "disc_rate_ann": "term"}
+
+_TERM_KINDS = ("age", "term")
+
+
+def premium_grid(**columns):
+    """Create a DataFrame of model points covering a grid of pricing keys
+
+    Each keyword argument gives a column of the model points.
+    The values of the arguments given as lists, ranges or arrays
+    are the keys of the grid, and a model point is created for each
+    combination of the keys. The values given as scalars,
+    such as ``sum_assured=1``, are assigned to all the model points.
+    The model points are indexed with ``point_id`` from 1.
+
+    Example:
+
+        >>> premium_grid(age_at_entry=range(20, 60), policy_term=[10, 15, 20],
+        ...              sum_assured=1)
+                  age_at_entry  policy_term  sum_assured
+        point_id
+        1                   20           10            1
+        2                   20           15            1
+        3                   20           20            1
+        ...
+    """
+    keys = {name: list(value) for name, value in columns.items()
+            if not _is_scalar(value)}
+
+    grid = pd.DataFrame(itertools.product(*keys.values()), columns=list(keys))
+    for name, value in columns.items():
+        if name not in keys:
+            grid[name] = value
+
+    grid = grid[list(columns)]
+    grid.index = pd.RangeIndex(1, len(grid) + 1, name="point_id")
+    return grid
+
+
+class PremiumSolver:
+    """Solve and cache premium rates of a grid of model points
+
+    Args:
+        space: The space of a vectorized model to solve the rates in,
+            such as ``BasicTerm_M.Projection`` or
+            ``BasicTermASL_ME.Pricing``.
+        rate(:obj:`str`): Name of the Cells returning the premium rates of
+            all the model points, such as ``"net_premium_rate"``.
+        keys(optional): Names of the columns to index the solved rates with.
+            Defaults to ``("age_at_entry", "policy_term")``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+        cache(:obj:`dict`, optional): Cache of the solved rates
+            by their fingerprints. A new dict by default.
+            Pass the :attr:`cache` of another solver to share it,
+            or a dict unpickled from a previous session.
+        term_tables(:obj:`dict`, optional): Names of the References
+            of the term tables mapped to the kinds of their indexes:
+            ``"age"`` for tables indexed by attained age, and
+            ``"term"`` for tables indexed by policy year.
+            Defaults to :data:`TERM_TABLES`.
+        age(:obj:`str`, optional): Name of the column of the age at entry.
+            Defaults to ``"age_at_entry"``.
+        term(:obj:`str`, optional): Name of the column of the policy term.
+            Defaults to ``"policy_term"``.
+    """
+
+    def __init__(self, space, rate, keys=("age_at_entry", "policy_term"),
+                 source="model_point", cache=None, term_tables=None,
+                 age="age_at_entry", term="policy_term"):
+        term_tables = dict(TERM_TABLES if term_tables is None else term_tables)
+        for name, kind in term_tables.items():
+            if kind not in _TERM_KINDS:
+                raise ValueError("invalid kind of term table %s: %s" % (name, kind))
+
+        self.space = space
+        self.rate = rate
+        self.keys = list(keys)
+        self.source = source
+        self.cache = {} if cache is None else cache
+        self.term_tables = term_tables
+        self.age = age
+        self.term = term
+        self.report = {}
+
+    def fingerprint(self):
+        """Return the digest of the formulas and References of the space
+
+        The term tables and ``model_point_table`` are excluded.
+        Modules are identified by their names.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for name, cells in sorted(self.space.cells.items()):
+            h.update(name.encode())
+            h.update(cells.formula.source.encode())
+
+        for name, value in sorted(self.space.refs.items()):
+            if (name in self.term_tables
+                    or name in ("model_point_table", "__builtins__")):
+                continue
+            h.update(name.encode())
+            h.update(_digest(value))
+
+        return h.digest()
+
+    def cell_keys(self, grid):
+        """Return the fingerprints of the grid cells as a list of bytes"""
+        base = self.fingerprint()
+        if self.term_tables:
+            ages = grid[self.age].to_numpy()
+            terms = grid[self.term].to_numpy()
+        slices = [_term_rows(getattr(self.space, name, None), kind, ages, terms)
+                  for name, kind in self.term_tables.items()]
+
+        result = []
+        for i, row in enumerate(grid.itertuples(index=False, name=None)):
+            h = hashlib.blake2b(base, digest_size=16)
+            h.update(repr(row).encode())
+            for rows in slices:
+                h.update(rows(i))
+            result.append(h.digest())
+
+        return result
+
+    def solve(self, grid):
+        """Return the premium rates of the model points in ``grid``
+
+        The rates of the grid cells not in :attr:`cache` are solved
+        in one projection by assigning their model points to
+        the ``source`` Cells as its input value. The input value
+        and the calculated values are cleared after the projection.
+
+        :attr:`report` gives the numbers of the grid cells,
+        the cells found in the cache and the cells solved.
+
+        Returns:
+            A Series of the premium rates indexed with ``keys``.
+        """
+        cell_keys = self.cell_keys(grid)
+        is_stale = np.array([key not in self.cache for key in cell_keys],
+                            dtype=bool)
+
+        if is_stale.any():
+            values = run_chunk(self.space, grid[is_stale], [self.rate],
+                               source=self.source)[self.rate]
+            for key, value in zip(itertools.compress(cell_keys, is_stale),
+                                  np.asarray(values, dtype=float)):
+                self.cache[key] = value
+
+        self.report = {"cells": len(grid),
+                       "cached": int((~is_stale).sum()),
+                       "solved": int(is_stale.sum())}
+
+        return pd.Series([self.cache[key] for key in cell_keys],
+                         index=pd.MultiIndex.from_frame(grid[self.keys]),
+                         name=self.rate)
+
+
+def _is_scalar(value):
+    return isinstance(value, str) or np.ndim(value) == 0
+
+
+def _digest(value):
+    if isinstance(value, types.ModuleType):
+        return value.__name__.encode()
+    elif isinstance(value, pd.DataFrame):
+        return (pd.util.hash_pandas_object(value).to_numpy().tobytes()
+                + repr(value.columns).encode())
+    elif isinstance(value, pd.Series):
+        return (pd.util.hash_pandas_object(value).to_numpy().tobytes()
+                + repr(value.name).encode())
+    elif isinstance(value, np.ndarray):
+        return value.tobytes() + repr(value.shape).encode()
+    else:
+        return repr(value).encode()
+
+
+def _term_rows(table, kind, ages, terms):
+    """Return a function returning the digest of the rows of the ith cell"""
+    if table is None:
+        return lambda i: b""
+
+    hashes = pd.util.hash_pandas_object(table).to_numpy()
+    index = table.index.to_numpy()
+    if kind == "age":
+        start = np.searchsorted(index, ages, side="left")
+        stop = np.searchsorted(index, ages + terms, side="right")
+    else:
+        start = np.zeros(len(terms), dtype=int)
+        stop = np.searchsorted(index, terms, side="right")
+
+    return lambda i: hashes[start[i]:stop[i]].tobytes()
@@ -0,0 +1,176 @@
+"""Ragged projection horizons
+
+The vectorized models, such as :mod:`~basiclife.BasicTerm_ME`,
+:mod:`~savings.CashValue_ME` and the product spaces of
+:mod:`~appliedlife.IntegratedLife`, project all the model points
+from ``t=0`` to ``max_proj_len()``, the longest of the projection lengths
+returned by ``proj_len()``. A model point with a 10-year term projected
+together with 20-year terms is calculated for 240 months,
+and the months after its maturity are calculated as zeros.
+
+:func:`run_ragged` sorts the model points into bands of similar
+projection lengths by :func:`horizon_bands`, and projects each band
+separately, so each band is projected only up to its own longest
+projection length. The results are merged by
+:func:`~lifelib.runners.chunked.merge_results`, and the results
+by model point are put back in the order of the model points.
+
+:func:`horizon_bands` chooses the bands so that the total number of
+projected model point months is the least for the number of bands.
+:func:`projected_months` gives the number for a set of bands.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import run_ragged, horizon_bands, projected_months
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> lengths = model.Projection.proj_len()
+
+    >>> projected_months(lengths, horizon_bands(lengths, 4))
+    {'full': 2770000, 'ragged': 1430298, 'ratio': 0.5163530685920578}
+
+    >>> results = run_ragged(model.Projection, max_bands=4)
+
+    >>> results["result_pv"]
+"""
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.chunked import clear_cache, merge_results, run_chunk
+
+
+def horizon_bands(lengths, max_bands=4):
+    """Split model points into bands of similar projection lengths
+
+    The model points are sorted by ``lengths``, and split into
+    at most ``max_bands`` bands of consecutive lengths so that
+    the sum over the bands of the number of model points
+    times the longest length in the band is the least.
+
+    Args:
+        lengths: Projection lengths of the model points,
+            such as the values returned by ``proj_len()``.
+        max_bands(:obj:`int`): Maximum number of bands.
+
+    Returns:
+        A list of Numpy arrays of the row positions of the model points
+        in each band, from the band of the shortest lengths
+        to the band of the longest. The positions in each band are in
+        ascending order.
+    """
+    if max_bands < 1:
+        raise ValueError("max_bands must be a positive integer")
+
+    lengths = np.asarray(lengths)
+    values, inverse, counts = np.unique(
+        lengths, return_inverse=True, return_counts=True)
+    cum = np.concatenate([[0], np.cumsum(counts)])
+    n_value = len(values)
+
+    # cost[j]: the least months to project the first j distinct lengths
+    cost = np.full(n_value + 1, np.inf)
+    cost[0] = 0
+    starts = []
+    for _ in range(min(max_bands, n_value)):
+        next_cost = np.full(n_value + 1, np.inf)
+        start = np.zeros(n_value + 1, dtype=int)
+        for j in range(1, n_value + 1):
+            total = cost[:j] + (cum[j] - cum[:j]) * values[j - 1]
+            start[j] = np.argmin(total)
+            next_cost[j] = total[start[j]]
+        cost = next_cost
+        starts.append(start)
+
+    bands = []
+    stop = n_value
+    for start in reversed(starts):
+        if stop == 0:
+            break
+        first = start[stop]
+        bands.append(np.flatnonzero((inverse >= first) & (inverse < stop)))
+        stop = first
+
+    return bands[::-1]
+
+
+def projected_months(lengths, bands):
+    """Return the numbers of model point months projected with and without bands
+
+    Returns a dict of ``"full"``, the number of model points times
+    the longest length, ``"ragged"``, the sum over ``bands``
+    of the number of model points times the longest length in the band,
+    and ``"ratio"``, ``"ragged"`` divided by ``"full"``.
+    """
+    lengths = np.asarray(lengths)
+    full = int(len(lengths) * lengths.max()) if len(lengths) else 0
+    ragged = sum(int(len(band) * lengths[band].max()) for band in bands if len(band))
+
+    return {"full": full, "ragged": ragged,
+            "ratio": ragged / full if full else 1.0}
+
+
+def run_ragged(space, max_bands=4, sums=("result_cf",), concats=("result_pv",),
+               source="model_point"):
+    """Project the model points in bands of projection lengths
+
+    The model points returned by the Cells named ``source`` are split
+    by :func:`horizon_bands` on the projection lengths
+    returned by ``proj_len()`` in ``space``.
+    Each band is assigned to ``source`` as its input value in turn,
+    as :func:`~lifelib.runners.run_chunked` does for each chunk,
+    so ``max_proj_len()`` is the longest length in the band.
+
+    The results in ``sums``, indexed by ``t``, are summed up, and
+    the bands with shorter projections contribute 0 to the later months.
+    The results in ``concats`` are concatenated and sorted back into
+    the order of the model points. Their rows are matched
+    with the model points by the first level of their index,
+    so results indexed with model points and scenarios, such as
+    ``result_pv`` in :mod:`~appliedlife.IntegratedLife`, are also sorted.
+
+    Args:
+        space: The Projection space of a vectorized model.
+        max_bands(:obj:`int`): Maximum number of bands.
+        sums: Names of the result Cells to be summed up.
+            Defaults to ``("result_cf",)``.
+        concats: Names of the result Cells to be concatenated.
+            Defaults to ``("result_pv",)``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+            Name ``"model_point_table_ext"`` for
+            :mod:`~appliedlife.IntegratedLife`.
+
+    Returns:
+        :obj:`dict` mapping the names in ``sums`` and ``concats``
+        to the merged DataFrames.
+    """
+    names = list(sums) + list(concats)
+    model_point = getattr(space, source)()
+    lengths = space.proj_len()
+    clear_cache(space)
+
+    if isinstance(lengths, pd.Series):
+        lengths = lengths.reindex(model_point.index).fillna(0)
+
+    chunk_results = [
+        run_chunk(space, model_point.iloc[band], names, source)
+        for band in horizon_bands(lengths, max_bands)]
+
+    merged = merge_results(chunk_results, sums, concats)
+    for name in concats:
+        merged[name] = restore_order(merged[name], model_point.index)
+
+    return merged
+
+
+def restore_order(result, ids):
+    """Sort the rows of ``result`` in the order of ``ids``
+
+    The rows are matched with ``ids`` by the first level
+    of the index of ``result``.
+    Rows with the same ID keep their order.
+    """
+    pos = ids.get_indexer(result.index.get_level_values(0))
+    return result.iloc[np.argsort(pos, kind="stable")]
@@ -0,0 +1,332 @@
+"""Incremental roll-forward of vectorized models
+
+From one monthly valuation to the next, most of the model points
+of :mod:`~basiclife.BasicTerm_ME` are the same policies one month older:
+their ``duration_mth`` is incremented by 1, and only their ``policy_count``
+reflects the actual decrements. Their rates and survival factors at ``t``
+in the new run are those at ``t+1`` in the previous run,
+and their numbers of policies and cashflows at ``t`` are those at ``t+1``
+in the previous run scaled to the new ``policy_count``,
+so rerunning the model from scratch recalculates them for nothing.
+
+:func:`roll_forward` takes the state of the previous run captured by
+:func:`capture_state`, compares the previous model points with the new ones,
+and recalculates the Cells in :data:`ROLL_CELLS` only for the model points
+that are new or changed. The rows of the other model points are shifted
+by one month from the previous state, and assigned to the Cells
+as their input values together with the recalculated rows.
+The Cells in :data:`SCALED_CELLS` are the numbers of policies
+and the cashflows proportional to them. Their shifted rows are scaled
+by the ratio of the new ``policy_count`` to the number of policies
+the previous run projected for the month.
+
+The expenses, which are inflated from the valuation date,
+the net cashflows and the present values are calculated
+by the model's own formulas from these arrays for all the model points,
+so inflation and discounting follow the new valuation date.
+
+The Cells in :data:`ROLL_CELLS` belong to the ``"grid"`` engine of
+:mod:`~basiclife.BasicTerm_ME`, and they are not used by
+the ``"recursive"`` engine. :func:`capture_state` and :func:`roll_forward`
+raise an error unless the space's ``engine`` is ``"grid"``.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import capture_state, roll_forward
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> proj = model.Projection
+
+    >>> proj.engine = "grid"
+
+    >>> proj.result_pv()        # The run at the previous month end
+
+    >>> state = capture_state(proj)
+
+    >>> results, state, report = roll_forward(proj, state, new_table)
+
+    >>> report["rolled_ratio"]
+    0.97
+"""
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.chunked import clear_cache
+
+ROLL_CELLS = (
+    ("mort_rate_grid", ()),
+    ("mort_rate_mth_grid", ()),
+    ("lapse_rate_grid", ()),
+    ("pols_surv_grid", ()),
+    ("pols_if_at_grid", ("BEF_MAT",)),
+    ("pols_if_at_grid", ("BEF_NB",)),
+    ("pols_if_at_grid", ("BEF_DECR",)),
+    ("pols_maturity_grid", ()),
+    ("pols_new_biz_grid", ()),
+    ("pols_death_grid", ()),
+    ("pols_lapse_grid", ()),
+    ("premiums_grid", ()),
+    ("claims_grid", ()),
+    ("commissions_grid", ())
+)
+
+# Cells proportional to policy_count, whose shifted rows are scaled
+SCALED_CELLS = (
+    "pols_if_at_grid",
+    "pols_maturity_grid",
+    "pols_new_biz_grid",
+    "pols_death_grid",
+    "pols_lapse_grid",
+    "premiums_grid",
+    "claims_grid",
+    "commissions_grid"
+)
+
+# Columns that change from one month to the next for the same policies
+ROLL_COLUMNS = ("duration_mth", "policy_count")
+
+
+class RollForwardState:
+    """State of a run to roll forward from
+
+    Holds the model points of the run and the values of the Cells
+    in :data:`ROLL_CELLS` as 2-D arrays whose rows are the model points,
+    keyed by the pairs of the names and the arguments of the Cells.
+    Created by :func:`capture_state` and :func:`roll_forward`.
+    """
+
+    def __init__(self, model_point, grids):
+        self.model_point = model_point
+        self.grids = grids
+
+
+def capture_state(space, source="model_point"):
+    """Capture the state of the run of ``space`` to roll forward from
+
+    Evaluates the Cells in :data:`ROLL_CELLS` of ``space``
+    and returns a :class:`RollForwardState`.
+    The ``engine`` of ``space`` must be ``"grid"``.
+
+    Args:
+        space: The Projection space of :mod:`~basiclife.BasicTerm_ME`.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+    """
+    check_engine(space)
+    return RollForwardState(
+        getattr(space, source)().copy(),
+        {key: get_grid(space, key) for key in ROLL_CELLS})
+
+
+def get_grid(space, key):
+    """Return the value of the Cells of ``space`` keyed by ``key`` in :data:`ROLL_CELLS`"""
+    name, args = key
+    return getattr(space, name)(*args)
+
+
+def check_engine(space):
+    """Raise an error unless ``space`` uses the ``"grid"`` engine"""
+    if not space.use_grid():
+        raise ValueError(
+            "the grid engine is required to roll forward, not %s" % space.engine)
+
+
+def classify_points(prev, new, roll_columns=ROLL_COLUMNS):
+    """Classify model points by how they changed from the previous run
+
+    Returns a dict of pandas Indexes of the model point IDs:
+
+    ``"rolled"``
+        IDs in both ``prev`` and ``new``, whose ``duration_mth``
+        is incremented by 1 and whose columns other than ``roll_columns``
+        are unchanged.
+
+    ``"changed"``
+        The other IDs in both ``prev`` and ``new``.
+
+    ``"new"``
+        IDs only in ``new``.
+
+    ``"exited"``
+        IDs only in ``prev``.
+
+    The IDs are in the order of ``new``, except for ``"exited"``.
+    """
+    common = new.index[new.index.isin(prev.index)]
+    before = prev.loc[common]
+    after = new.loc[common]
+
+    fixed = [c for c in new.columns if c not in roll_columns]
+    is_rolled = (after["duration_mth"] == before["duration_mth"] + 1) & (
+        after[fixed] == before[fixed]).all(axis=1)
+
+    return {
+        "rolled": common[is_rolled.values],
+        "changed": common[~is_rolled.values],
+        "new": new.index[~new.index.isin(prev.index)],
+        "exited": prev.index[~prev.index.isin(new.index)]
+    }
+
+
+def shift_rows(grid, rows, proj_len, scale=None):
+    """Shift rows of ``grid`` by one month and fit them to ``proj_len`` months
+
+    Each shifted row is multiplied by the element of ``scale``
+    if ``scale`` is given. The months beyond the previous projection
+    repeat the last month, which is after the model points mature,
+    or are 0 if ``scale`` is given and the rows are numbers of policies
+    or cashflows.
+    """
+    result = grid[rows, 1:]
+    if scale is None:
+        return fit_columns(result, proj_len)
+    else:
+        return fit_columns(result * scale[:, None], proj_len, mode="constant")
+
+
+def fit_columns(grid, proj_len, mode="edge"):
+    """Cut or extend the columns of ``grid`` to ``proj_len``
+
+    The columns are extended by :func:`numpy.pad` with ``mode``,
+    by the last column by default.
+    """
+    if grid.shape[1] >= proj_len:
+        return grid[:, :proj_len]
+    else:
+        return np.pad(grid, ((0, 0), (0, proj_len - grid.shape[1])), mode=mode)
+
+
+def roll_forward(space, state, model_point, results=("result_cf", "result_pv"),
+                 source="model_point"):
+    """Project new model points reusing the state of the previous run
+
+    The model points in ``model_point`` are classified against
+    ``state.model_point`` by :func:`classify_points`.
+    The Cells in :data:`ROLL_CELLS` are calculated only for
+    the new and changed model points, by assigning them to the Cells
+    named ``source`` as its input value.
+    The rows of the rolled model points are shifted by one month
+    from ``state`` by :func:`shift_rows`. The survival factors
+    are rebased so that the factor at the new ``t=0`` is 1,
+    and the Cells in :data:`SCALED_CELLS` are scaled by the ratio of
+    the new ``policy_count`` to the previous ``policy_count`` times
+    the previous survival factor at ``t=1``. The rolled model points
+    for which the denominator is 0 are recalculated, as their rows
+    cannot be scaled.
+
+    All the model points are then assigned to ``source``,
+    the combined arrays are assigned to the Cells in :data:`ROLL_CELLS`,
+    and the result Cells named in ``results`` are evaluated.
+    The input values are cleared when the results are taken.
+    The ``engine`` of ``space`` must be ``"grid"``.
+
+    Args:
+        space: The Projection space of :mod:`~basiclife.BasicTerm_ME`.
+        state: :class:`RollForwardState` of the previous run.
+        model_point: DataFrame of the model points of the new run,
+            indexed with the model point IDs.
+        results: Names of the result Cells to evaluate.
+            Defaults to ``("result_cf", "result_pv")``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+
+    Returns:
+        A tuple of three objects: a dict mapping the names in ``results``
+        to their values, the :class:`RollForwardState` of the new run
+        to roll forward from next time, and a dict reporting
+        the numbers of ``"rolled"``, ``"changed"``, ``"new"`` and
+        ``"exited"`` model points, and the ``"rolled_ratio"``,
+        the ratio of the rolled model points to all the model points.
+        The rows of the Cells in :data:`ROLL_CELLS` are shifted
+        for the rolled model points, while the expenses, the net cashflows
+        and the present values are calculated for all the model points.
+    """
+    check_engine(space)
+    groups = classify_points(state.model_point, model_point)
+
+    prev_rows = state.model_point.index.get_indexer(groups["rolled"])
+    prev_surv = state.grids[("pols_surv_grid", ())][prev_rows, 1]
+    prev_pols = state.model_point["policy_count"].values[prev_rows] * prev_surv
+    is_reusable = prev_pols > 0
+    rolled = groups["rolled"][is_reusable]
+    prev_rows = prev_rows[is_reusable]
+
+    pols_scale = model_point.loc[rolled, "policy_count"].values / prev_pols[is_reusable]
+    surv_scale = 1 / prev_surv[is_reusable]
+
+    calc = model_point.index[~model_point.index.isin(rolled)]
+
+    source_cells = getattr(space, source)
+    clear_cache(space)
+    try:
+        if len(calc):
+            source_cells[()] = model_point.loc[calc]
+            calc_grids = {key: get_grid(space, key) for key in ROLL_CELLS}
+            clear_cache(space)
+
+        source_cells[()] = model_point
+        proj_len = space.max_proj_len()
+
+        rolled_pos = model_point.index.get_indexer(rolled)
+        calc_pos = model_point.index.get_indexer(calc)
+
+        grids = {}
+        for key in ROLL_CELLS:
+            name, args = key
+            prev = state.grids[key]
+            if name in SCALED_CELLS:
+                scale, mode = pols_scale, "constant"
+                dtype = np.result_type(prev.dtype, np.float32)
+            elif name == "pols_surv_grid":
+                scale, mode, dtype = surv_scale, "edge", prev.dtype
+            else:
+                scale, mode, dtype = None, "edge", prev.dtype
+
+            grid = np.empty((len(model_point), proj_len), dtype=dtype)
+            grid[rolled_pos] = shift_rows(prev, prev_rows, proj_len, scale)
+            if len(calc):
+                grid[calc_pos] = fit_columns(calc_grids[key], proj_len, mode=mode)
+            getattr(space, name)[args] = grid
+            grids[key] = grid
+
+        values = {name: getattr(space, name)() for name in results}
+
+    finally:
+        for name, args in ROLL_CELLS:
+            getattr(space, name).clear_at(*args)
+        source_cells.clear_at()
+        clear_cache(space)
+
+    report = {key: len(ids) for key, ids in groups.items()}
+    report["rolled"] = len(rolled)
+    report["changed"] += len(groups["rolled"]) - len(rolled)
+    report["rolled_ratio"] = len(rolled) / len(model_point) if len(model_point) else 0.0
+
+    return values, RollForwardState(model_point.copy(), grids), report
+
+
+def reconcile(space, model_point, values, source="model_point"):
+    """Compare the results of :func:`roll_forward` with a full rerun
+
+    Projects all the model points in ``model_point`` from scratch
+    with the ``engine`` of ``space``, and returns a Series of
+    the maximum absolute differences from ``values``
+    by the name of the result.
+    """
+    source_cells = getattr(space, source)
+    clear_cache(space)
+    source_cells[()] = model_point
+    try:
+        diffs = {}
+        for name, value in values.items():
+            expected = getattr(space, name)()
+            diffs[name] = np.abs(
+                np.asarray(value, dtype=float) - np.asarray(expected, dtype=float)
+            ).max()
+    finally:
+        source_cells.clear_at()
+        clear_cache(space)
+
+    return pd.Series(diffs, name="max_abs_diff")
@@ -0,0 +1,218 @@
+"""Rolling-window evaluation of recursive models
+
+The Cells parameterized by ``t`` in the recursive models, such as
+``pols_if_at(t, timing)`` in :mod:`~basiclife.BasicTerm_ME` and
+``av_pp_at(t, timing)`` in :mod:`~savings.CashValue_ME`,
+refer to their values at ``t-1``, so a projection evaluates
+them forward from ``t=0``. Every value stays in the cache until the
+cache is cleared, so the peak memory of a run grows with the number of
+model points times the number of months times the number of Cells,
+although only the last month is needed to calculate the next.
+
+:func:`run_rolling` evaluates the output Cells one month at a time,
+adds their values up into the result tables, and evicts
+the values of the Cells parameterized by ``t`` older than
+the last ``window`` months before moving on to the next month.
+The peak memory is then bounded by the number of model points times
+``window`` instead of the length of the projection.
+
+modelx clears the values calculated from a value when the value is cleared,
+so the values in the window would be cleared together
+with the older values. :func:`run_rolling` therefore assigns
+the values in the window back to the Cells as their input values
+before clearing the older values one by one.
+The input values assigned by the user before the run are
+neither evicted nor changed, and the Cells are given back
+only those input values when the run finishes.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import run_rolling
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> results, report = run_rolling(model.Projection)
+
+    >>> results["result_pv"]
+                   Premiums         Claims  ...   Commissions   Net Cashflow
+    policy_id                               ...
+    1          7.083922e+05  474813.509031  ...  85875.091718  108625.005624
+    2          9.951015e+04  109613.960713  ...      0.000000  -18339.113005
+    3          1.104633e+06  802454.869486  ...      0.000000  265915.612121
+    ...
+
+    >>> report
+    {'steps': 277, 'peak_nbytes': 3449424}
+"""
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.chunked import cache_nbytes, clear_cache
+
+# Output columns of result_cf in BasicTerm_ME and the Cells they add up
+OUTPUTS = {
+    "Premiums": "premiums",
+    "Claims": "claims",
+    "Expenses": "expenses",
+    "Commissions": "commissions",
+    "Net Cashflow": "net_cf"
+}
+
+
+def run_rolling(space, outputs=None, window=1, disc="disc_factors",
+                source="model_point"):
+    """Project the model points evicting the months no longer needed
+
+    For each ``t`` from 0 to ``max_proj_len()`` less 1,
+    the Cells in ``outputs`` are evaluated at ``t``.
+    Their sums over the model points are the rows of ``"result_cf"``,
+    and their values discounted by the Cells named ``disc``
+    are added up into ``"result_pv"``.
+    The values of the Cells parameterized by ``t`` before
+    the last ``window`` months are then evicted from the cache.
+
+    ``window`` should cover the months the formulas refer back to.
+    The formulas of :mod:`~basiclife.BasicTerm_ME`
+    and :mod:`~savings.CashValue_ME` refer back only to ``t-1``,
+    so the default ``window`` of 1 is enough.
+    A value referred to after it is evicted is calculated again,
+    so the results are the same for any ``window``, only slower.
+
+    If ``space`` has ``proj_shape()``, such as ``CashValue_ME.Projection``,
+    the values are broadcast to the shape before they are added up.
+    When the shape has a scenario axis, as in the ``scen_batch`` mode
+    of :mod:`~savings.CashValue_ME`, the sums in ``"result_cf"`` are
+    over the scenarios and the model points,
+    and ``"result_pv"`` is indexed with ``model_point_index()``,
+    in the same layout as ``result_pv()`` of the space.
+
+    The input values of the Cells parameterized by ``t``, if any,
+    are kept during the run. When the run finishes,
+    the cache is cleared and the Cells have only those input values.
+
+    Args:
+        space: The Projection space of a model with recursive Cells,
+            such as ``BasicTerm_ME.Projection`` or
+            ``CashValue_ME.Projection``.
+        outputs(:obj:`dict`, optional): Mapping of column labels to
+            the names of the Cells to add up. A Cells taking
+            arguments after ``t`` is given by a tuple of its name and
+            the arguments, such as ``("claims", "DEATH")`` for
+            ``claims(t, "DEATH")`` in :mod:`~savings.CashValue_ME`.
+            Defaults to :data:`OUTPUTS`.
+        window(:obj:`int`, optional): Number of the last months kept
+            in the cache. Defaults to 1.
+        disc(:obj:`str`, optional): Name of the Cells returning the
+            discount factors by ``t``. Defaults to ``"disc_factors"``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points, whose index is the index of ``"result_pv"``
+            unless the shape has a scenario axis.
+            Defaults to ``"model_point"``.
+
+    Returns:
+        A tuple of a dict and a dict. The first maps ``"result_cf"``
+        to a DataFrame of the sums indexed by ``t`` and
+        ``"result_pv"`` to a DataFrame of the present values
+        indexed by model point, both with the labels in ``outputs``
+        as their columns. The second reports the number of ``"steps"``
+        and ``"peak_nbytes"``, the largest number of bytes held
+        in the cache by :func:`~lifelib.runners.chunked.cache_nbytes`
+        during the run.
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer")
+
+    outputs = parse_outputs(OUTPUTS if outputs is None else outputs)
+    t_cells = [cells for cells in space.cells.values()
+               if cells.parameters and cells.parameters[0] == "t"]
+    inputs = {cells.name: {key: value for key, value in cells.items()
+                           if cells.is_input(*_args(key))}
+              for cells in t_cells}
+
+    try:
+        index = getattr(space, source)().index
+        shape = space.proj_shape() if "proj_shape" in space.cells else (len(index),)
+        if len(shape) > 1:
+            index = space.model_point_index()
+        proj_len = space.max_proj_len()
+        disc_factors = getattr(space, disc)()
+
+        sums = {label: np.zeros(proj_len) for label in outputs}
+        pvs = {label: np.zeros(shape) for label in outputs}
+        peak_nbytes = 0
+
+        for t in range(proj_len):
+            for label, (name, args) in outputs.items():
+                value = np.broadcast_to(
+                    np.asarray(getattr(space, name)(t, *args), dtype=np.float64), shape)
+                sums[label][t] = value.sum()
+                pvs[label] += value * disc_factors[t]
+
+            peak_nbytes = max(peak_nbytes, cache_nbytes(space))
+            evict_steps(t_cells, t - window + 1, inputs)
+
+    finally:
+        for cells in t_cells:
+            cells.clear_all()
+            for key, value in inputs[cells.name].items():
+                cells[key] = value
+        clear_cache(space)
+
+    results = {
+        "result_cf": pd.DataFrame(sums, index=range(proj_len)),
+        "result_pv": pd.DataFrame(
+            {label: pv.T.ravel() for label, pv in pvs.items()}, index=index)
+    }
+    return results, {"steps": proj_len, "peak_nbytes": peak_nbytes}
+
+
+def evict_steps(t_cells, start, inputs=None):
+    """Evict the values of ``t_cells`` at ``t`` before ``start``
+
+    The calculated values at ``start`` and later are kept
+    as the input values of the Cells, and the values before ``start``
+    are cleared one by one.
+    ``inputs`` maps the names of the Cells to dicts whose keys are
+    the arguments of the values to leave as they are,
+    such as the input values assigned by the user.
+    """
+    inputs = inputs or {}
+    kept = []
+    stale = []
+    for cells in t_cells:
+        fixed = inputs.get(cells.name, {})
+        for key, value in cells.items():
+            if key in fixed:
+                continue
+            elif _step(key) < start:
+                stale.append((cells, key))
+            elif not cells.is_input(*_args(key)):
+                kept.append((cells, key, value))
+
+    if stale:
+        for cells, key, value in kept:
+            cells[key] = value
+        for cells, key in stale:
+            cells.clear_at(*_args(key))
+
+
+def parse_outputs(outputs):
+    """Return a dict mapping the labels in ``outputs`` to tuples of
+    the names of the Cells and the tuples of their arguments after ``t``
+    """
+    result = {}
+    for label, spec in outputs.items():
+        if isinstance(spec, str):
+            result[label] = (spec, ())
+        else:
+            result[label] = (spec[0], tuple(spec[1:]))
+    return result
+
+
+def _args(key):
+    return key if isinstance(key, tuple) else (key,)
+
+
+def _step(key):
+    return key[0] if isinstance(key, tuple) else key
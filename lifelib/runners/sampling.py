@@ -0,0 +1,318 @@
+"""Variance-reduced sampling of stochastic scenarios
+
+The stochastic savings models, such as :mod:`~savings.CashValue_ME`
+and :mod:`~savings.CashValue_ME_EX4`, turn the random numbers in
+``std_norm_rand`` drawn from the standard normal distribution
+into lognormal investment returns by ``inv_return_table()``,
+and the time value of options and guarantees (TVOG) is the mean
+of the present values of the claims over the account value
+across the scenarios. Its Monte Carlo error shrinks only with
+the square root of the number of scenarios.
+
+:func:`sample_normals` draws the random numbers by one of :data:`METHODS`:
+
+``"plain"``
+    Independent draws by :func:`numpy.random.default_rng`.
+    With the default seed and 242 steps, these are the random numbers
+    of :mod:`~savings.CashValue_ME_EX4`.
+
+``"antithetic"``
+    The first half of the scenarios are independent draws and
+    the second half are their negatives, so the scenarios
+    ``i`` and ``i + scen_size // 2`` are antithetic pairs.
+
+``"moment"``
+    Independent draws shifted and scaled at each step,
+    so their mean is 0 and their standard deviation is 1
+    across the scenarios.
+
+``"sobol"``
+    Scrambled Sobol points by :class:`scipy.stats.qmc.Sobol`
+    turned into normal draws, with the steps as the dimensions.
+    The number of scenarios should be a power of 2.
+
+:func:`assign_normals` assigns the random numbers to a model,
+and :func:`steps_of` returns the number of the steps of the random
+numbers the model has.
+:func:`scenario_frame` arranges the values of a model by model point
+and scenario. In :mod:`~savings.CashValue_ME_EX4`, the rows of
+``model_point()`` are the model points in each scenario.
+In :mod:`~savings.CashValue_ME`, ``scen_batch`` must be ``True``,
+and the values are arrays of ``proj_shape()``, whose rows are
+the scenarios, indexed by ``model_point_index()``.
+:func:`put_control` returns the discounted payoffs in each scenario
+of the put option valued in closed form by ``formula_option_put(t)``,
+which :func:`mc_estimate` uses as a control variate.
+:func:`mc_convergence` reports the standard errors of the estimates
+by the number of scenarios, measured over independent replications.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import mc_convergence
+
+    >>> model = mx.read_model("CashValue_ME_EX4")
+
+    >>> model.Projection.model_point_table = model.Projection.model_point_1
+
+    >>> mc_convergence(model.Projection,
+    ...                lambda space: space.pv_claims_over_av("MATURITY"),
+    ...                scen_sizes=[256, 1024], method="sobol")
+                                 mean        stderr
+    scen_size poind_id
+    256       1         327607.182026  36785.123054
+    1024      1         336873.785226  15885.804480
+
+    With ``method="plain"``, the standard errors are 61210.8 and 25831.9.
+    The present values of the claims over the account value of
+    the model point are the payoffs of the put option, so with
+    ``control_t=120`` the estimates are the value of
+    ``formula_option_put(120)``, 340559.417898.
+"""
+import numpy as np
+import pandas as pd
+
+METHODS = ("plain", "antithetic", "moment", "sobol")
+
+
+def sample_normals(scen_size, steps=242, method="plain", seed=1234):
+    """Draw random numbers from the standard normal distribution
+
+    Returns a Numpy array of the shape (``scen_size``, ``steps``)
+    drawn by ``method``, one of :data:`METHODS`.
+    The same ``seed`` gives the same random numbers.
+    """
+    if method == "plain":
+        return np.random.default_rng(seed).standard_normal((scen_size, steps))
+
+    elif method == "antithetic":
+        if scen_size % 2:
+            raise ValueError("scen_size must be even for antithetic variates")
+        half = np.random.default_rng(seed).standard_normal(
+            (scen_size // 2, steps))
+        return np.concatenate([half, -half])
+
+    elif method == "moment":
+        rnd = np.random.default_rng(seed).standard_normal((scen_size, steps))
+        return (rnd - rnd.mean(axis=0)) / rnd.std(axis=0)
+
+    elif method == "sobol":
+        from scipy.stats import norm, qmc
+        points = qmc.Sobol(d=steps, scramble=True, seed=seed).random(scen_size)
+        return norm.ppf(points)
+
+    else:
+        raise ValueError("invalid method: %s" % method)
+
+
+def assign_normals(space, normals):
+    """Assign random numbers to ``std_norm_rand`` of ``space``
+
+    ``normals`` is an array of the shape (scenarios, steps),
+    such as the one returned by :func:`sample_normals`.
+    If ``std_norm_rand`` is a Cells, as in
+    :mod:`~savings.CashValue_ME_EX4`, ``scen_size`` is set to the number
+    of scenarios, and the random numbers are assigned as the input
+    in the form the formula returns, an array or a Series.
+    If ``std_norm_rand`` is a Reference, as in :mod:`~savings.CashValue_ME`,
+    the random numbers are assigned as a Series
+    indexed with ``scen_id`` from 1 and ``t``,
+    and ``scen_file`` must be ``None``.
+    """
+    normals = np.asarray(normals)
+    scen_size, steps = normals.shape
+    series = pd.Series(normals.ravel(), index=pd.MultiIndex.from_product(
+        [range(1, scen_size + 1), range(steps)], names=["scen_id", "t"]))
+
+    if "std_norm_rand" in space.cells:
+        is_series = isinstance(space.std_norm_rand(), pd.Series)
+        space.scen_size = scen_size
+        space.std_norm_rand[()] = series if is_series else normals
+    else:
+        if space.scen_file is not None:
+            raise ValueError("scen_file must be None to assign std_norm_rand")
+        space.std_norm_rand = series
+
+
+def steps_of(space):
+    """Return the number of the steps of ``std_norm_rand`` of ``space``
+
+    The number of the columns of the array, such as 242 in
+    :mod:`~savings.CashValue_ME_EX4`, or the number of ``t``
+    in the index of the Series, such as 1801 in :mod:`~savings.CashValue_ME`.
+    """
+    if "std_norm_rand" in space.cells:
+        rnd = space.std_norm_rand()
+    else:
+        rnd = space.std_norm_rand
+
+    if isinstance(rnd, (pd.Series, pd.DataFrame)):
+        return len(rnd.index.unique("t"))
+    else:
+        return np.shape(rnd)[1]
+
+
+def scenario_frame(space, values):
+    """Return values by model point and scenario as a DataFrame
+
+    ``values`` is an array of the values of the rows of
+    ``model_point()``, such as the one returned by
+    ``pv_claims_over_av("MATURITY")`` in :mod:`~savings.CashValue_ME_EX4`,
+    or an array of ``proj_shape()`` whose rows are the scenarios,
+    such as the one returned by ``pv_claims()`` in
+    :mod:`~savings.CashValue_ME` with ``scen_batch`` set to ``True``.
+    Values by model point only are broadcast to ``proj_shape()``.
+    The DataFrame returned is indexed by model point
+    and its columns are ``scen_id``.
+
+    Raises:
+        ValueError: If ``space`` has ``proj_shape()``
+            and ``scen_batch`` is not ``True``.
+    """
+    values = np.asarray(values)
+    if "proj_shape" in space.cells:
+        if not space.scen_batch:
+            raise ValueError("scen_batch must be True")
+        index = space.model_point_index()
+        values = np.broadcast_to(values, space.proj_shape()).T.ravel()
+    else:
+        index = space.model_point().index
+
+    return pd.Series(values, index=index).unstack("scen_id")
+
+
+def put_control(space, t):
+    """Return the payoffs of the put option of ``formula_option_put(t)``
+
+    ``formula_option_put(t)`` values in closed form the put option
+    maturing at ``t`` on the account value at time 0 struck at
+    the sum assured of the policies maturing, for the model points
+    maturing at ``t``. This function returns the payoffs of the option
+    in each scenario, discounted by ``disc_factors(t)``, as a DataFrame
+    indexed with ``point_id`` with ``scen_id`` as its columns,
+    and their expected values by ``formula_option_put(t)``
+    as a Series indexed with ``point_id``.
+
+    The account value grows by ``inv_return_mth`` in each scenario,
+    whose mean return is the discount rate,
+    so the means of the payoffs converge to the expected values.
+
+    Raises:
+        ValueError: If ``space`` does not have ``formula_option_put``,
+            as in :mod:`~savings.CashValue_ME`.
+    """
+    if "formula_option_put" not in space.cells:
+        raise ValueError("formula_option_put not in space")
+
+    index = space.model_point().index
+    point_ids = index.droplevel("scen_id").unique()
+    scen_ids = index.unique("scen_id")
+    is_maturing = np.asarray(
+        space.model_point_table_ext()["policy_term"] * 12 == t)
+
+    def by_point(values):
+        return np.asarray(values).reshape(len(point_ids), -1)[:, 0][is_maturing]
+
+    S = by_point(space.av_at(0, "BEF_FEE"))
+    X = by_point(space.sum_assured() * space.pols_maturity(t))
+    growth = np.prod([1 + np.asarray(space.inv_return_mth(i)).reshape(
+        -1, len(scen_ids))[0] for i in range(t)], axis=0)
+
+    payoffs = np.maximum(X[:, None] - S[:, None] * growth, 0) * np.asarray(
+        space.disc_factors(t)).ravel()[0]
+    maturing = point_ids[is_maturing]
+
+    return (pd.DataFrame(payoffs, index=maturing, columns=scen_ids),
+            pd.Series(np.asarray(space.formula_option_put(t)), index=maturing))
+
+
+def mc_estimate(values, method="plain", controls=None, expected=None):
+    """Estimate the means of values over scenarios with their standard errors
+
+    ``values`` is a DataFrame indexed by model point
+    whose columns are the scenarios, as returned by :func:`scenario_frame`.
+    If ``controls`` and ``expected`` are given, such as
+    by :func:`put_control`, the values of the model points in
+    ``controls`` are adjusted by the control variates::
+
+        values - b * (controls - expected)
+
+        b = Cov(values, controls) / Var(controls)
+
+    If ``method`` is ``"antithetic"``, the values of the antithetic pairs
+    of scenarios drawn by :func:`sample_normals` are averaged first.
+
+    The standard errors are the standard deviations of the values
+    over the square roots of the numbers of scenarios, or of the pairs.
+    For ``"moment"`` and ``"sobol"``, the scenarios are not independent,
+    and the standard errors overstate the errors. Use
+    :func:`mc_convergence` to measure them.
+
+    Returns:
+        DataFrame indexed with ``point_id`` with the columns
+        ``"mean"`` and ``"stderr"``.
+    """
+    values = values.astype(np.float64)
+    if controls is not None:
+        y = values.loc[controls.index].to_numpy()
+        c = controls.to_numpy() - expected.to_numpy()[:, None]
+        c_dev = c - c.mean(axis=1, keepdims=True)
+        var = (c_dev**2).sum(axis=1)
+        cov = ((y - y.mean(axis=1, keepdims=True)) * c_dev).sum(axis=1)
+        b = np.divide(cov, var, out=np.zeros_like(var), where=var > 0)
+        values.loc[controls.index] = y - b[:, None] * c
+
+    data = values.to_numpy()
+    if method == "antithetic":
+        half = data.shape[1] // 2
+        data = (data[:, :half] + data[:, half:2 * half]) / 2
+
+    return pd.DataFrame({"mean": data.mean(axis=1),
+                         "stderr": data.std(axis=1, ddof=1) / np.sqrt(data.shape[1])},
+                        index=values.index)
+
+
+def mc_convergence(space, value, scen_sizes, method="plain", control_t=None,
+                   replications=8, steps=None, seed=1234):
+    """Measure the standard errors of Monte Carlo estimates by scenario count
+
+    For each number of scenarios in ``scen_sizes``, ``replications``
+    independent sets of random numbers are drawn by
+    :func:`sample_normals` with ``method`` and the seeds from ``seed``,
+    with ``steps`` steps, or by default the steps of the random numbers
+    of ``space`` returned by :func:`steps_of`, and assigned to ``space`` by :func:`assign_normals` in turn.
+    For each set, ``value`` is called with ``space``
+    and its return value, arranged by :func:`scenario_frame`,
+    is estimated by :func:`mc_estimate`,
+    with the control variates of :func:`put_control` at ``control_t``
+    if ``control_t`` is given.
+
+    The standard error of the estimates with a number of scenarios is
+    the standard deviation of the estimates over the replications,
+    which is valid for all the methods.
+    The random numbers drawn last are left assigned to ``space``.
+
+    Returns:
+        DataFrame indexed with ``scen_size`` and ``point_id``
+        with the columns ``"mean"`` and ``"stderr"``.
+    """
+    if steps is None:
+        steps = steps_of(space)
+
+    frames = []
+    for scen_size in scen_sizes:
+        estimates = []
+        for i in range(replications):
+            assign_normals(space, sample_normals(scen_size, steps, method, seed + i))
+            values = scenario_frame(space, value(space))
+            if control_t is None:
+                estimates.append(mc_estimate(values, method)["mean"])
+            else:
+                estimates.append(mc_estimate(
+                    values, method, *put_control(space, control_t))["mean"])
+
+        estimates = pd.concat(estimates, axis=1)
+        frames.append(pd.DataFrame({"mean": estimates.mean(axis=1),
+                                    "stderr": estimates.std(axis=1, ddof=1)}))
+
+    return pd.concat(frames, keys=list(scen_sizes), names=["scen_size"])
@@ -0,0 +1,165 @@
+"""Parallel execution of the scenarios of IntegratedLife runs
+
+In :mod:`~appliedlife.IntegratedLife`, ``Run[run_id]`` has
+a product space for each product, such as ``GMXB`` and ``GLWB``,
+and each product space projects all its model points in all
+the scenarios of ``scen_index()`` at once.
+The run definitions, such as the model point file, the scenarios and
+the assumptions, are read from ``run_params()`` and ``space_params()``
+in :mod:`~appliedlife.IntegratedLife.BaseData`.
+
+:func:`run_scenarios` shards a run by product space and by range of
+scenarios, and projects the shards on a pool of worker processes.
+The worker processes are the same as those of
+:func:`~lifelib.runners.run_parallel`.
+Each worker process reads the model once when it starts, and projects
+the shards assigned to it one at a time, by assigning the scenario IDs
+of the shard to ``scen_index`` of the product space
+as its input value, in the same way as
+:func:`~lifelib.runners.run_parallel` with ``source="scen_index"``.
+The run definitions are not changed, so any run in ``run_params()``
+can be projected.
+
+The results of the shards are merged in the order of the scenarios,
+so the merged results are the same regardless of the number of workers.
+:func:`scenario_mean` averages the results by model point
+over the scenarios.
+
+Example:
+
+    >>> from lifelib.runners import run_scenarios
+
+    >>> results = run_scenarios("IntegratedLife", 2, shard_size=25,
+    ...                         spaces=["GMXB"])
+
+    >>> results["GMXB"]["result_pv_mean"]
+              Premiums         Death  ...  Change in AV  Net Cashflow
+    point_id                          ...
+    1              0.0  4.625844e+06  ... -4.624858e+07  2.306482e+06
+    2              0.0  3.431315e+06  ... -4.443341e+07  2.179292e+06
+    3              0.0  3.746751e+06  ... -4.377767e+07  1.333755e+06
+    ...
+    8              0.0  3.229786e+06  ... -3.070767e+07 -7.282687e+06
+
+    [8 rows x 9 columns]
+
+The model points and scenarios of the sample runs are few,
+so starting the worker processes takes longer than the projection.
+The shards pay off for runs with many model points and scenarios.
+
+On platforms that start worker processes by spawning, such as
+Windows and macOS, call :func:`run_scenarios` from within
+an ``if __name__ == "__main__":`` block in scripts.
+"""
+import pandas as pd
+
+from lifelib.runners.chunked import merge_results
+from lifelib.runners.parallel import (
+    run_slice, worker_model, worker_pool, worker_table)
+
+
+def _product_spaces(run_id, spaces):
+    model = worker_model()
+    if run_id not in model.BaseData.run_params().index:
+        raise ValueError("run_id not in run_params: %s" % run_id)
+
+    run = model.Run[run_id]
+    if spaces is None:
+        spaces = [name for name in run.spaces
+                  if name in model.BaseData.space_params().index]
+
+    return {name: worker_table(_space_path(run_id, name), "scen_index")[1]
+            for name in spaces}
+
+
+def _space_path(run_id, name):
+    return "Run[%r].%s" % (run_id, name)
+
+
+def scenario_mean(result, level="scen"):
+    """Average results by model point over the scenarios
+
+    ``result`` is a DataFrame indexed with model point and scenario,
+    such as ``result_pv()`` of a product space. The rows are
+    grouped by the levels of the index other than ``level``,
+    in the order of the model points.
+    """
+    others = [n for n in result.index.names if n != level]
+    return result.groupby(level=others, sort=False).mean()
+
+
+def run_scenarios(model_path, run_id, shard_size, spaces=None,
+                  sums=("result_cf",), concats=("result_pv",),
+                  max_workers=None, mp_context=None):
+    """Project the scenarios of a run in parallel and merge the results
+
+    Starts a pool of worker processes, each of which reads
+    the model at ``model_path`` once, and splits the scenarios in
+    ``scen_index()`` of each product space of ``Run[run_id]`` into
+    shards of ``shard_size`` scenarios.
+    The shards of all the product spaces are distributed over the workers.
+
+    For each product space, the results of its shards are merged
+    by :func:`~lifelib.runners.merge_results`: the results in ``sums``
+    are summed up, and the results in ``concats`` are concatenated
+    and put in the order of ``model_point_index()``,
+    by model point and then by scenario.
+    The means of the results in ``concats``
+    over the scenarios are also returned by :func:`scenario_mean`.
+
+    The model is read from the files, so changes made to
+    a model in the calling process are not seen by the workers.
+
+    Args:
+        model_path: Path to the model folder of
+            :mod:`~appliedlife.IntegratedLife`.
+        run_id(:obj:`int`): ID of the run in ``run_params()``.
+        shard_size(:obj:`int`): Number of scenarios in each shard.
+        spaces(optional): Names of the product spaces to project.
+            Defaults to the product spaces of ``Run[run_id]``
+            listed in ``space_params()``.
+        sums: Names of the result Cells to be summed up.
+            Defaults to ``("result_cf",)``.
+        concats: Names of the result Cells to be concatenated,
+            indexed with model point and scenario.
+            Defaults to ``("result_pv",)``.
+        max_workers(:obj:`int`, optional): Number of worker processes.
+            Defaults to the number of CPUs.
+        mp_context(optional): A multiprocessing context
+            passed to :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Returns:
+        :obj:`dict` mapping the names of the product spaces to
+        :obj:`dict` objects, which map the names in ``sums`` and ``concats``
+        to the merged DataFrames, and the names in ``concats``
+        suffixed with ``"_mean"`` to the means over the scenarios.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be a positive integer")
+
+    names = list(sums) + list(concats)
+
+    with worker_pool(model_path, max_workers, mp_context) as pool:
+
+        scen_ids = pool.submit(_product_spaces, run_id, spaces).result()
+        futures = {
+            name: [pool.submit(run_slice, _space_path(run_id, name), "scen_index",
+                               None, start, min(start + shard_size, len(ids)), names)
+                   for start in range(0, len(ids), shard_size)]
+            for name, ids in scen_ids.items()}
+
+        shard_results = {name: [f.result() for f in fs]
+                         for name, fs in futures.items()}
+
+    results = {}
+    for name, shards in shard_results.items():
+        merged = merge_results(shards, sums, concats)
+        for key in concats:
+            index = merged[key].index
+            merged[key] = merged[key].reindex(pd.MultiIndex.from_product(
+                [index.unique(0), scen_ids[name]], names=index.names))
+            merged[key + "_mean"] = scenario_mean(
+                merged[key], level=index.names[-1])
+        results[name] = merged
+
+    return results
@@ -0,0 +1,287 @@
+"""On-disk store of economic scenarios
+
+Stochastic models read their scenarios as pandas objects held wholly
+in memory, such as ``std_norm_rand`` in :mod:`~savings.CashValue_ME`
+and ``log_return_mth()`` in :mod:`~appliedlife.IntegratedLife.Scenarios`.
+A set of 10,000 scenarios of monthly returns over 50 years
+takes gigabytes as a long-format DataFrame.
+
+A scenario store keeps the values on disk instead, in a directory
+of two files:
+
+``header.json``
+    A small metadata header giving the number of scenarios,
+    the number of steps, the scenario IDs, the first step,
+    the names of the index levels and the column names.
+
+``values.npy``
+    The values as a Numpy array of the shape
+    (scenarios, steps, columns), read through a memory map.
+    The values of each scenario are contiguous on disk,
+    so reading a block of scenarios reads a contiguous range of the file.
+
+:class:`ScenarioStore` opens a store and reads blocks of scenarios
+or the values at a single step, so a model pages in only
+the scenarios it projects.
+:func:`write_scenarios` writes a store from a long-format
+Series or DataFrame, and :func:`create_scenarios` creates an empty store
+to be filled block by block, for scenario sets too large to
+build in memory at once.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners.scenario_store import write_scenarios
+
+    >>> model = mx.read_model("CashValue_ME")
+
+    >>> write_scenarios("std_norm_rand", model.Projection.std_norm_rand)
+    <ScenarioStore path='std_norm_rand' shape=(10, 1801, 1)>
+
+    >>> model.Projection.scen_file = "std_norm_rand"
+"""
+import json
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+HEADER_FILE = "header.json"
+VALUES_FILE = "values.npy"
+FORMAT_NAME = "lifelib-scenarios"
+FORMAT_VERSION = 1
+
+
+class ScenarioStore:
+    """Scenarios stored on disk
+
+    Args:
+        path: Path to the directory of the store.
+        mode(:obj:`str`): ``"r"`` to read the values (default),
+            or ``"r+"`` to also write them.
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = pathlib.Path(path)
+        with open(self.path / HEADER_FILE, encoding="utf-8") as f:
+            self.header = json.load(f)
+
+        if self.header.get("format") != FORMAT_NAME:
+            raise ValueError("invalid scenario store: %s" % self.path)
+
+        self.values = np.load(self.path / VALUES_FILE, mmap_mode=mode)
+
+    def __repr__(self):
+        return "<ScenarioStore path='%s' shape=%s>" % (self.path, self.shape)
+
+    @property
+    def shape(self):
+        """The tuple of the numbers of scenarios, steps and columns"""
+        return self.values.shape
+
+    @property
+    def scen_count(self):
+        """The number of scenarios"""
+        return self.header["scen_count"]
+
+    @property
+    def step_count(self):
+        """The number of steps in each scenario"""
+        return self.header["step_count"]
+
+    @property
+    def index_names(self):
+        """The names of the scenario and step index levels"""
+        return self.header["index_names"]
+
+    @property
+    def scen_ids(self):
+        """The scenario IDs as a pandas Index"""
+        return pd.Index(self.header["scen_ids"], name=self.index_names[0])
+
+    @property
+    def steps(self):
+        """The steps as a pandas RangeIndex"""
+        start = self.header["step_start"]
+        return pd.RangeIndex(start, start + self.step_count,
+                             name=self.index_names[1])
+
+    @property
+    def columns(self):
+        """The column names, or ``None`` if the store holds a Series"""
+        columns = self.header["columns"]
+        return None if columns is None else pd.Index(columns)
+
+    def rows(self, scen_ids):
+        """Return the row positions of ``scen_ids``"""
+        rows = self.scen_ids.get_indexer(scen_ids)
+        if (rows < 0).any():
+            raise ValueError("scen_ids not in the store")
+        return rows
+
+    def block(self, start, stop):
+        """Return the values of the scenarios from ``start`` to ``stop``
+
+        ``start`` and ``stop`` are row positions, not scenario IDs.
+        The values are read into memory as an array of the shape
+        (scenarios, steps, columns).
+        """
+        return np.array(self.values[start:stop])
+
+    def iter_blocks(self, block_size):
+        """Yield the scenario IDs and values of consecutive blocks of scenarios"""
+        if block_size < 1:
+            raise ValueError("block_size must be a positive integer")
+
+        for start in range(0, self.scen_count, block_size):
+            stop = start + block_size
+            yield self.scen_ids[start:stop], self.block(start, stop)
+
+    def take(self, scen_ids):
+        """Return the values of ``scen_ids``
+
+        The values are read into memory as an array of the shape
+        (scenarios, steps, columns).
+        """
+        return self.values[self.rows(scen_ids)]
+
+    def at_step(self, step, scen_ids=None):
+        """Return the values at ``step`` as an array of (scenarios, columns)
+
+        All the scenarios are read if ``scen_ids`` is not given.
+        """
+        pos = step - self.header["step_start"]
+        if not 0 <= pos < self.step_count:
+            raise ValueError("step out of range")
+
+        if scen_ids is None:
+            return np.array(self.values[:, pos])
+        else:
+            return self.values[self.rows(scen_ids), pos]
+
+    def to_frame(self, scen_ids=None):
+        """Return the values as a long-format Series or DataFrame
+
+        The result is indexed with the scenario IDs and the steps,
+        in the same form as the data the store was written from.
+        All the scenarios are read if ``scen_ids`` is not given.
+        """
+        if scen_ids is None:
+            scen_ids = self.scen_ids
+            values = self.values
+        else:
+            scen_ids = pd.Index(scen_ids, name=self.index_names[0])
+            values = self.take(scen_ids)
+
+        index = pd.MultiIndex.from_product([scen_ids, self.steps])
+        values = np.asarray(values).reshape(len(index), -1)
+
+        if self.columns is None:
+            return pd.Series(values[:, 0], index=index, name=self.header["name"])
+        else:
+            return pd.DataFrame(values, index=index, columns=self.columns)
+
+    def flush(self):
+        """Write the changes to the values to disk"""
+        self.values.flush()
+
+
+def create_scenarios(path, scen_ids, step_count, columns=None, *,
+                     index_names=("scen_id", "t"), step_start=0,
+                     name=None, dtype="float64"):
+    """Create an empty scenario store to fill block by block
+
+    Returns a :class:`ScenarioStore` opened for writing, whose values
+    are zeros. Assign the values of each block of scenarios to
+    ``values`` and call :meth:`~ScenarioStore.flush`::
+
+        >>> store = create_scenarios("returns", range(1, 10001), 600)
+
+        >>> for start in range(0, 10000, 1000):
+        ...     store.values[start:start + 1000, :, 0] = generate(start)
+
+        >>> store.flush()
+
+    Args:
+        path: Path to the directory to create.
+        scen_ids: Scenario IDs.
+        step_count(:obj:`int`): The number of steps in each scenario.
+        columns(optional): Column names. ``None`` to store a Series.
+        index_names: The names of the scenario and step index levels.
+        step_start(:obj:`int`): The first step.
+        name(optional): The name of the Series if ``columns`` is ``None``.
+        dtype: The data type of the values.
+    """
+    scen_ids = [_to_json(i) for i in scen_ids]
+    if columns is not None:
+        columns = [_to_json(c) for c in columns]
+
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    header = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "scen_count": len(scen_ids),
+        "step_count": int(step_count),
+        "step_start": int(step_start),
+        "index_names": list(index_names),
+        "scen_ids": scen_ids,
+        "columns": columns,
+        "name": name,
+        "dtype": np.dtype(dtype).str
+    }
+    shape = (len(scen_ids), int(step_count),
+             1 if columns is None else len(columns))
+    np.lib.format.open_memmap(
+        path / VALUES_FILE, mode="w+", dtype=dtype, shape=shape).flush()
+
+    with open(path / HEADER_FILE, "w", encoding="utf-8") as f:
+        json.dump(header, f, indent=2)
+
+    return ScenarioStore(path, mode="r+")
+
+
+def write_scenarios(path, data, dtype=None):
+    """Write a long-format Series or DataFrame to a scenario store
+
+    ``data`` should be indexed with a MultiIndex of two levels,
+    the scenario IDs and the steps, such as ``std_norm_rand``
+    in :mod:`~savings.CashValue_ME`, and have a value
+    for every step from the first step to the last in every scenario.
+
+    Returns a :class:`ScenarioStore` to read the written values.
+
+    Args:
+        path: Path to the directory to create.
+        data: Series or DataFrame to write.
+        dtype(optional): The data type of the values.
+            The type of ``data`` by default.
+    """
+    if data.index.nlevels != 2:
+        raise ValueError("data must be indexed with scenario IDs and steps")
+
+    scen_ids = data.index.unique(0)
+    t = data.index.unique(1)
+    steps = pd.RangeIndex(t.min(), t.max() + 1)
+    if not data.index.equals(pd.MultiIndex.from_product([scen_ids, steps])):
+        raise ValueError("data must have a value for every scenario and step")
+
+    is_series = isinstance(data, pd.Series)
+    values = data.to_numpy() if is_series else data.to_numpy(dtype=dtype)
+    store = create_scenarios(
+        path, scen_ids, len(steps),
+        columns=None if is_series else data.columns,
+        index_names=data.index.names,
+        step_start=steps.start,
+        name=data.name if is_series else None,
+        dtype=dtype or values.dtype)
+
+    store.values[:] = values.reshape(store.shape)
+    store.flush()
+
+    return ScenarioStore(path)
+
+
+def _to_json(value):
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,101 @@
+"""Batch execution of seriatim models
+
+Seriatim models, such as the models in :mod:`uslib` and :mod:`uklib`
+and :mod:`~basiclife.BasicTerm_SE`, define ``Projection`` as a space
+parameterized by ``point_id``. ``Projection[1]``, ``Projection[2]`` and so on
+are ItemSpaces, each of which projects one model point
+and holds its own Cells cache.
+The ItemSpaces stay alive once created, so projecting many model points
+in a row accumulates the caches of all of them.
+
+:func:`run_seriatim` projects the model points one at a time,
+takes the results from each ItemSpace, and deletes the ItemSpace
+before moving on to the next model point, so only one ItemSpace
+is alive at a time.
+The results of all the model points are collected into
+long-format DataFrames keyed by ``point_id``.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import run_seriatim
+
+    >>> model = mx.read_model("products/variable_annuity/VA_US_S")
+
+    >>> results = run_seriatim(model.Projection)
+
+    >>> results["result_cf"]
+                pols_if      premiums  ...
+    point_id t
+    1        0  1.000000  100000.0  ...
+             1  1.000000       0.0  ...
+    ...
+"""
+import pandas as pd
+
+
+def point_ids_of(space):
+    """Return the IDs of all the model points of a seriatim model
+
+    The IDs are the index of the model point table, read from
+    ``data.model_point_table()`` if ``space`` has the ``data`` Reference
+    as in :mod:`uslib` and :mod:`uklib`, or from ``model_point_table``
+    otherwise.
+    """
+    if "data" in space.refs:
+        table = space.data.model_point_table()
+    else:
+        table = space.model_point_table
+
+    return table.index
+
+
+def run_seriatim(space, point_ids=None, results=("result_cf",), keep_items=False):
+    """Project model points one by one and collect the results
+
+    For each ID in ``point_ids``, the ItemSpace ``space[point_id]``
+    is created, the result Cells named in ``results`` are evaluated,
+    and the ItemSpace is deleted unless ``keep_items`` is ``True``.
+    ItemSpaces that existed before the call are not deleted.
+
+    Args:
+        space: The space parameterized by ``point_id``,
+            such as ``VA_US_S.Projection``.
+        point_ids(optional): IDs of the model points to project.
+            Defaults to all the model points returned by :func:`point_ids_of`.
+        results: Names of the result Cells to collect.
+            Each must return a DataFrame. Defaults to ``("result_cf",)``.
+        keep_items(:obj:`bool`, optional): Whether to keep the ItemSpaces
+            created. Defaults to ``False``.
+
+    Returns:
+        :obj:`dict` mapping the names in ``results``
+        to DataFrames made by concatenating the results of all the model points.
+        Their indexes are the results' own indexes prefixed with a level
+        named ``point_id``.
+
+    Raises:
+        ValueError: If ``point_ids`` is empty.
+    """
+    if point_ids is None:
+        point_ids = point_ids_of(space)
+
+    if not len(point_ids):
+        raise ValueError("point_ids must not be empty")
+
+    # The ItemSpaces are compared by identity, as point_ids can be
+    # of other types than the keys of the ItemSpaces, such as numpy integers
+    existing = {id(item) for item in space.itemspaces.values()}
+    collected = {name: [] for name in results}
+
+    for point_id in point_ids:
+        item = space[point_id]
+        try:
+            for name in results:
+                collected[name].append(getattr(item, name)())
+        finally:
+            if not keep_items and id(item) not in existing:
+                del space[point_id]
+
+    return {name: pd.concat(frames, keys=list(point_ids), names=["point_id"])
+            for name, frames in collected.items()}
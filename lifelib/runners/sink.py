@@ -0,0 +1,312 @@
+"""Partitioned files of results
+
+The result Cells of the vectorized models, such as ``result_cf()`` and
+``result_pv()`` in :mod:`~basiclife.BasicTerm_ME`, build
+their DataFrames in memory, and the results of all the chunks of
+a chunked run are concatenated in memory by
+:func:`~lifelib.runners.chunked.merge_results` before they are exported.
+
+A :class:`ResultSink` writes results to files in a directory as they are
+calculated, one file per partition. The partitions are given by
+keyword arguments, such as the product, the chunk and the scenario,
+and the files are laid out in the directories named after them::
+
+    results/
+        cashflows/
+            product=TERM/
+                chunk=0/
+                    part.parquet
+                chunk=1/
+                    part.parquet
+        result_pv/
+            product=TERM/
+                chunk=0/
+                    part.parquet
+                ...
+
+This is the layout of partitioned datasets read by
+pyarrow, Spark and DuckDB as well as by :meth:`ResultSink.read`.
+The files are written in :data:`FORMATS`: Parquet and Feather files
+require pyarrow, and pickle files, the default, are written by pandas
+without it.
+
+:func:`run_to_sink` projects the model points chunk by chunk,
+and writes the cashflows of each model point at each ``t``
+in the long format of :func:`cashflow_frame`, together with
+the result Cells, to the sink as each chunk is projected.
+Only the Cells requested are written.
+
+Example:
+
+    >>> import modelx as mx
+    >>> from lifelib.runners import ResultSink, run_to_sink
+
+    >>> model = mx.read_model("BasicTerm_ME")
+
+    >>> sink = ResultSink("results", format="parquet")
+
+    >>> run_to_sink(model.Projection, sink, chunk_size=2000, product="TERM")
+    {'chunks': 5, 'files': 10}
+
+    >>> sink.read("cashflows", columns=["policy_id", "t", "Premiums", "Claims"],
+    ...           chunk=0)
+       policy_id  t     Premiums       Claims product  chunk
+    0          1  0  8156.240000  2939.548223    TERM      0
+    1          1  1  8084.497031  2913.691711    TERM      0
+    2          1  2  8013.385119  2888.062635    TERM      0
+    ...
+"""
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+from lifelib.runners.chunked import clear_cache, iter_chunks
+from lifelib.runners.rolling import OUTPUTS, parse_outputs
+
+# File formats by extension, with the names of the DataFrame methods
+# writing them and the pandas functions reading them
+FORMATS = {
+    "parquet": ("to_parquet", pd.read_parquet),
+    "feather": ("to_feather", pd.read_feather),
+    "pickle": ("to_pickle", pd.read_pickle)
+}
+
+
+class ResultSink:
+    """Directory of results written in partitions
+
+    Args:
+        path: Path to the directory. Created if it does not exist.
+        format(:obj:`str`, optional): Format of the files,
+            one of the keys of :data:`FORMATS`.
+            Defaults to ``"pickle"``, which needs no package
+            other than pandas.
+    """
+
+    def __init__(self, path, format="pickle"):
+        if format not in FORMATS:
+            raise ValueError("invalid format: %s" % format)
+
+        self.path = pathlib.Path(path)
+        self.format = format
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return "<ResultSink path='%s' format='%s'>" % (self.path, self.format)
+
+    def file_path(self, name, **partition):
+        """Return the path to the file of ``name`` in ``partition``"""
+        path = self.path / name
+        for key, value in partition.items():
+            path = path / ("%s=%s" % (key, value))
+
+        return path / ("part." + self.format)
+
+    def write(self, name, frame, **partition):
+        """Write ``frame`` to the file of ``name`` in ``partition``
+
+        The index of ``frame`` is written as columns, and
+        the partition is not, as it is given by the directories.
+        The file of the same partition is overwritten.
+
+        Returns:
+            The path to the file written.
+        """
+        path = self.file_path(name, **partition)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame = frame.reset_index()
+        frame.columns = [str(c) for c in frame.columns]
+        getattr(frame, FORMATS[self.format][0])(path)
+
+        return path
+
+    def partitions(self, name):
+        """Return the partitions of ``name`` as a list of dicts"""
+        return [_parse_partition(path.parent.relative_to(self.path / name))
+                for path in sorted((self.path / name).glob("**/part." + self.format))]
+
+    def read(self, name, columns=None, **partition):
+        """Read the files of ``name`` into one DataFrame
+
+        Only the files of the partitions matching
+        the keyword arguments are read. If ``columns`` is given,
+        only the columns in ``columns`` are read. Include the columns
+        from the index of the written DataFrames, such as ``"policy_id"``
+        and ``"t"``, in ``columns`` to read them.
+        The keys of the partitions are added as columns.
+        """
+        reader = FORMATS[self.format][1]
+        frames = []
+        for path in sorted((self.path / name).glob("**/part." + self.format)):
+            keys = _parse_partition(path.parent.relative_to(self.path / name))
+            if any(str(keys.get(k)) != str(v) for k, v in partition.items()):
+                continue
+
+            if self.format == "pickle":
+                frame = reader(path)
+                if columns is not None:
+                    frame = frame[list(columns)]
+            else:
+                frame = reader(path, columns=columns)
+
+            frames.append(frame.assign(**keys))
+
+        if not frames:
+            raise ValueError("no partitions of %s found" % name)
+
+        return pd.concat(frames, ignore_index=True)
+
+
+def cashflow_frame(space, outputs=None, source="model_point"):
+    """Return the values of the Cells in ``outputs`` of all the model points
+
+    Evaluates the Cells in ``outputs`` at each ``t`` from 0 to
+    ``max_proj_len()`` less 1, and returns them in a DataFrame
+    in the long format, indexed with the index of the model points
+    returned by the Cells named ``source`` and ``t``.
+    ``outputs`` has the same format as in
+    :func:`~lifelib.runners.run_rolling`, and defaults to
+    :data:`~lifelib.runners.rolling.OUTPUTS`.
+
+    If ``use_grid()`` in ``space`` returns ``True``, the values of
+    the Cells that have 2-D counterparts suffixed with ``_grid``,
+    such as ``premiums_grid()`` in :mod:`~basiclife.BasicTerm_ME`,
+    are taken from the counterparts at all ``t`` at once.
+
+    If ``space`` has ``proj_shape()``, such as ``CashValue_ME.Projection``,
+    the values at each ``t`` are broadcast to the shape.
+    When the shape has a scenario axis, as in the ``scen_batch`` mode
+    of :mod:`~savings.CashValue_ME`, the DataFrame has a row for
+    each model point, scenario and ``t``, indexed with
+    ``model_point_index()`` and ``t``.
+    """
+    outputs = parse_outputs(OUTPUTS if outputs is None else outputs)
+    index = getattr(space, source)().index
+    shape = space.proj_shape() if "proj_shape" in space.cells else (len(index),)
+    if len(shape) > 1:
+        index = space.model_point_index()
+    t_len = range(space.max_proj_len())
+    use_grid = "use_grid" in space.cells and space.use_grid()
+
+    data = {}
+    for label, (name, args) in outputs.items():
+        if use_grid and name + "_grid" in space.cells:
+            values = np.asarray(space.cells[name + "_grid"](*args))
+        else:
+            cells = getattr(space, name)
+            values = np.stack(
+                [np.broadcast_to(cells(t, *args), shape) for t in t_len], axis=-1)
+            # Scenarios by points by t to points by scenarios by t
+            values = np.moveaxis(values, 0, len(shape) - 1)
+        data[label] = values.ravel()
+
+    points = index.repeat(len(t_len))
+    arrays = [points.get_level_values(i) for i in range(index.nlevels)]
+    arrays.append(np.tile(np.arange(len(t_len)), len(index)))
+
+    return pd.DataFrame(data, index=pd.MultiIndex.from_arrays(
+        arrays, names=list(index.names) + ["t"]))
+
+
+def run_to_sink(space, sink, chunk_size, outputs=None, results=("result_pv",),
+                source="model_point", cashflows="cashflows", **partition):
+    """Project the model points chunk by chunk writing the results to a sink
+
+    The model points returned by the Cells named ``source``
+    are split into chunks of ``chunk_size`` rows, and each chunk is
+    assigned to ``source`` as its input value in turn,
+    as :func:`~lifelib.runners.run_chunked` does.
+    For each chunk, the cashflows in ``outputs`` returned by
+    :func:`cashflow_frame` are written to ``sink`` under ``cashflows``,
+    and the values of the result Cells in ``results`` are written
+    under their names, in the partition of ``partition``
+    and ``chunk``, the position of the chunk from 0.
+    The cache is cleared before the next chunk, so no results are
+    held in memory across chunks.
+
+    When ``proj_shape()`` of ``space`` has a scenario axis,
+    as in the ``scen_batch`` mode of :mod:`~savings.CashValue_ME`,
+    the DataFrames indexed with the model points and the scenarios,
+    such as the cashflows and ``result_pv()``, are split by scenario,
+    and each scenario is written to its own partition
+    keyed by the name of ``scen_index()``, such as ``scen_id=2``.
+    The other DataFrames, such as ``result_cf()`` summed over
+    the scenarios, are written as they are.
+
+    Args:
+        space: The Projection space of a vectorized model.
+        sink: :class:`ResultSink` to write to.
+        chunk_size(:obj:`int`): Number of model points in each chunk.
+        outputs(:obj:`dict`, optional): The Cells to write
+            the cashflows of, in the format of
+            :func:`~lifelib.runners.run_rolling`.
+            Defaults to :data:`~lifelib.runners.rolling.OUTPUTS`.
+            The cashflows are not written if ``cashflows`` is ``None``.
+        results: Names of the result Cells returning DataFrames
+            to write. Defaults to ``("result_pv",)``.
+        source(:obj:`str`, optional): Name of the Cells returning the
+            model points. Defaults to ``"model_point"``.
+        cashflows(:obj:`str`, optional): Name to write the cashflows
+            under. Defaults to ``"cashflows"``.
+        partition: Keys of the partition to write to,
+            such as ``product="TERM"`` and ``scen_id=1``.
+
+    Returns:
+        :obj:`dict` of the numbers of ``"chunks"`` and ``"files"`` written.
+    """
+    model_point = getattr(space, source)()
+    source_cells = getattr(space, source)
+    clear_cache(space)
+
+    n_chunks = n_files = 0
+    for i, chunk in enumerate(iter_chunks(model_point, chunk_size)):
+        source_cells[()] = chunk
+        try:
+            level = _scen_level(space)
+            if cashflows is not None:
+                n_files += _write_by_scen(
+                    sink, cashflows, cashflow_frame(space, outputs, source),
+                    level, dict(partition, chunk=i))
+            for name in results:
+                n_files += _write_by_scen(
+                    sink, name, getattr(space, name)(), level, dict(partition, chunk=i))
+        finally:
+            source_cells.clear_at()
+            clear_cache(space)
+        n_chunks += 1
+
+    return {"chunks": n_chunks, "files": n_files}
+
+
+def _scen_level(space):
+    """Return the name of the scenario level, or ``None`` if no scenario axis"""
+    if "proj_shape" in space.cells and len(space.proj_shape()) > 1:
+        return space.scen_index().name
+    else:
+        return None
+
+
+def _write_by_scen(sink, name, frame, level, partition):
+    """Write ``frame`` in one partition per scenario if indexed by ``level``
+
+    Returns the number of files written.
+    """
+    if level is None or frame.index.nlevels < 2 or level not in frame.index.names:
+        sink.write(name, frame, **partition)
+        return 1
+
+    n_files = 0
+    for scen, part in frame.groupby(level=level, sort=False):
+        sink.write(name, part.droplevel(level), **partition, **{level: scen})
+        n_files += 1
+
+    return n_files
+
+
+def _parse_partition(relpath):
+    keys = {}
+    for part in relpath.parts:
+        key, _, value = part.partition("=")
+        keys[key] = int(value) if value.lstrip("-").isdigit() else value
+    return keys
@@ -0,0 +1,69 @@
+"""Reconcile the path Cells of economic/BasicHullWhite.
+
+``short_rate_paths``, ``accum_short_rate_paths`` and ``disc_factor_paths``
+generate all the scenarios for all the time steps as matrices,
+and should reproduce the recursive Cells ``short_rate``,
+``accum_short_rate``, ``accum_short_rate2`` and ``disc_factor``
+step by step.
+"""
+import pathlib
+
+import numpy as np
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+BASICHULLWHITE = LIBRARIES / "economic" / "BasicHullWhite"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICHULLWHITE)
+    space = model.HullWhite
+    space.scen_size = 100
+    space.step_size = 60
+    space.time_len = 5
+    yield model
+    model.close()
+
+
+def recursive(cells, space):
+    return np.array([cells(i) for i in range(space.step_size + 1)]).transpose()
+
+
+def test_short_rate_paths(model):
+    space = model.HullWhite
+    np.testing.assert_allclose(space.short_rate_paths(),
+                               recursive(space.short_rate, space),
+                               rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("method, cells", [
+    ("discrete", "accum_short_rate"), ("joint", "accum_short_rate2")])
+def test_accum_short_rate_paths(model, method, cells):
+    space = model.HullWhite
+    space.accum_method = method
+    try:
+        np.testing.assert_allclose(space.accum_short_rate_paths(),
+                                   recursive(getattr(space, cells), space),
+                                   rtol=1e-12, atol=1e-14)
+    finally:
+        space.accum_method = "discrete"
+
+
+def test_disc_factor_paths(model):
+    space = model.HullWhite
+    np.testing.assert_allclose(space.disc_factor_paths(),
+                               recursive(space.disc_factor, space), rtol=1e-12)
+
+
+def test_invalid_accum_method(model):
+    space = model.HullWhite
+    space.accum_method = "invalid"
+    try:
+        with pytest.raises(Exception, match="invalid accum_method"):
+            space.accum_short_rate_paths()
+    finally:
+        space.accum_method = "discrete"
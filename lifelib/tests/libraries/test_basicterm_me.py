@@ -0,0 +1,77 @@
+"""Reconcile the engines of basiclife/BasicTerm_ME.
+
+The ``"grid"`` engine computes every model point and every month as 2-D
+arrays in one pass, while the default ``"recursive"`` engine rolls the
+``(t)`` Cells forward one step at a time. The two should agree on the
+shipped 10,000-point ``model_point_table`` to floating-point tolerance.
+The integer-indexed mortality lookups should pick up the same rates
+as reindexing ``mort_table_reindexed`` with the ages and durations.
+"""
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    yield model
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def recursive_results(model):
+    proj = model.Projection
+    proj.engine = "recursive"
+    return proj.result_cf(), proj.result_pv(), proj.result_pols()
+
+
+@pytest.mark.parametrize("idx, name", [
+    (0, "result_cf"), (1, "result_pv"), (2, "result_pols")])
+def test_grid_engine_reconciles(model, recursive_results, idx, name):
+    proj = model.Projection
+    proj.engine = "grid"
+    expected = recursive_results[idx]
+    actual = getattr(proj, name)()
+
+    assert actual.index.equals(expected.index)
+    assert list(actual.columns) == list(expected.columns)
+    np.testing.assert_allclose(actual.values, expected.values,
+                               rtol=1e-10, atol=1e-6)
+
+
+def test_grid_engine_pols_if_at(model):
+    proj = model.Projection
+    proj.engine = "grid"
+    for timing in ["BEF_MAT", "BEF_NB", "BEF_DECR"]:
+        for t in [0, 1, 12, 120, proj.max_proj_len() - 1]:
+            np.testing.assert_allclose(
+                proj.pols_if_at_grid(timing)[:, t],
+                proj.pols_if_at(t, timing).values, rtol=1e-10, atol=1e-10)
+
+
+def test_invalid_engine(model):
+    proj = model.Projection
+    proj.engine = "none"
+    try:
+        with pytest.raises(Exception, match="invalid engine"):
+            proj.pv_net_cf()
+    finally:
+        proj.engine = "recursive"
+
+
+def test_mort_rate_lookup(model):
+    proj = model.Projection
+    for t in [0, 1, 12, 120, proj.max_proj_len() - 1]:
+        mi = pd.MultiIndex.from_arrays([proj.age(t), np.minimum(proj.duration(t), 5)])
+        expected = proj.mort_table_reindexed().reindex(mi, fill_value=0).values
+        np.testing.assert_array_equal(proj.mort_rate(t).values, expected)
+        np.testing.assert_array_equal(proj.mort_rate_grid()[:, t], expected)
@@ -0,0 +1,50 @@
+"""Check the integer calendar of basiclife/BasicTermASL_ME.
+
+``duration_m`` and ``last_part`` are calculated from the integers
+in ``calendar`` and ``step_month``, and should equal the values
+calculated by date arithmetic on ``issue_date`` and ``next_anniversary``.
+"""
+import pathlib
+
+import numpy as np
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+BASICTERMASL_ME = LIBRARIES / "basiclife" / "BasicTermASL_ME"
+
+
+@pytest.fixture(scope="module")
+def space():
+    model = modelx.read_model(BASICTERMASL_ME)
+    space = model.Projection
+    space.model_point[()] = space.model_point_table.iloc[:500]
+    yield space
+    model.close()
+
+
+@pytest.mark.parametrize("i", [0, 1, 59, 60, 61, 80])
+def test_duration_m(space, i):
+    iss = space.issue_date()
+    date = space.date_(i)
+    expected = date.year * 12 + date.month - iss.dt.year * 12 - iss.dt.month
+    np.testing.assert_array_equal(space.duration_m(i), expected)
+
+
+@pytest.mark.parametrize("freq_id", ["ANV", "PREM"])
+@pytest.mark.parametrize("i", [0, 1, 59, 60, 61, 80])
+def test_last_part(space, i, freq_id):
+    anv = space.next_anniversary(i, freq_id)
+    date = space.date_(i)
+    diff_m = anv.dt.year * 12 + anv.dt.month - date.year * 12 - date.month
+    stub_m = (anv.dt.day - 1) / anv.dt.days_in_month
+    expected = (diff_m - 1 + stub_m).mask(
+        space.date_(i + 1) < anv, space.months_in_step(i))
+
+    np.testing.assert_array_equal(space.last_part(i, freq_id), expected)
+
+
+def test_pay_count(space):
+    assert space.check_pay_count()
@@ -0,0 +1,151 @@
+"""Reconcile the scenario-batched run of savings/CashValue_ME.
+
+With ``scen_batch`` set to ``True``, the model projects every model point
+in every scenario of ``scen_index()`` in one pass. Each scenario's rows
+should equal a run with ``scen_id`` set to that scenario.
+The model points are not repeated for each scenario,
+so only the Cells depending on the scenarios have a scenario axis.
+The model points are limited to the two term products
+to keep the projections short.
+Reading the random numbers from a scenario store
+should not change the results.
+The integer-indexed surrender charge lookups should pick up the same
+rates as reindexing ``surr_charge_table_stacked`` with the IDs and durations.
+"""
+import pathlib
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners import run_chunked, write_scenarios
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+CASHVALUE_ME = LIBRARIES / "savings" / "CashValue_ME"
+
+SCENARIOS = [2, 5, 9]
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(CASHVALUE_ME)
+    proj = model.Projection
+    proj.model_point_table = proj.model_point_table.loc[[1, 2]]
+    yield model
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def scenario_results(model):
+    proj = model.Projection
+    proj.scen_batch = False
+    results = {}
+    for scen_id in SCENARIOS:
+        proj.scen_id = scen_id
+        results[scen_id] = proj.result_pv()
+    proj.scen_id = 1
+    return results
+
+
+@pytest.fixture
+def batched(model, scenario_results):
+    proj = model.Projection
+    proj.scen_batch = True
+    proj.scen_index[()] = pd.Index(SCENARIOS, name="scen_id")
+    yield proj
+    proj.scen_index.clear_at()
+    proj.scen_batch = False
+
+
+def test_batched_rows_match_single_scenarios(batched, scenario_results):
+    result = batched.result_pv()
+    assert result.index.names[-1] == "scen_id"
+    for scen_id, expected in scenario_results.items():
+        actual = result.xs(scen_id, level="scen_id")
+        np.testing.assert_allclose(actual.values, expected.values, rtol=1e-12)
+
+
+def test_batched_broadcasts_scenarios(batched):
+    assert len(batched.model_point()) == 2
+    assert batched.proj_shape() == (len(SCENARIOS), 2)
+    assert batched.mort_rate(12).shape == (2,)
+    assert batched.pols_if_at(12, "BEF_DECR").shape == (2,)
+    assert batched.av_pp_at(12, "BEF_FEE").shape == batched.proj_shape()
+    assert batched.result_pv().index.equals(batched.model_point_index())
+    assert batched.check_av_roll_fwd()
+    assert batched.check_margin()
+    assert batched.check_pv_net_cf()
+
+
+def test_result_pv_scen_sums_points(batched, scenario_results):
+    result = batched.result_pv_scen()
+    assert result.index.tolist() == SCENARIOS
+    for scen_id, expected in scenario_results.items():
+        np.testing.assert_allclose(
+            result.loc[scen_id].values, expected.sum().values, rtol=1e-12)
+
+
+def test_scenario_chunks_match_one_pass(batched):
+    expected = batched.result_pv_scen()
+    results = run_chunked(batched, chunk_size=2, source="scen_index",
+                          concats=("result_pv_scen",))
+    assert results["result_pv_scen"].index.equals(expected.index)
+    np.testing.assert_allclose(
+        results["result_pv_scen"].values, expected.values, rtol=1e-12)
+
+
+def test_result_pv_scen_without_batch(model):
+    proj = model.Projection
+    result = proj.result_pv_scen()
+    assert result.index.tolist() == [proj.scen_id]
+    np.testing.assert_allclose(result.values[0], proj.result_pv().sum().values)
+
+
+def test_scenario_store(model, batched, scenario_results, tmp_path):
+    store = write_scenarios(tmp_path / "std_norm_rand", model.Projection.std_norm_rand)
+    batched.scen_file = str(store.path)
+    try:
+        batched.scen_index.clear_at()
+        assert batched.scen_index().equals(store.scen_ids)
+        batched.scen_index[()] = pd.Index(SCENARIOS, name="scen_id")
+        assert len(batched.std_norm_rand_data()) == len(SCENARIOS) * store.step_count
+
+        result = batched.result_pv()
+        for scen_id, expected in scenario_results.items():
+            actual = result.xs(scen_id, level="scen_id")
+            np.testing.assert_allclose(actual.values, expected.values, rtol=1e-12)
+
+        batched.scen_batch = False
+        batched.scen_id = SCENARIOS[0]
+        np.testing.assert_allclose(batched.result_pv().values,
+                                   scenario_results[SCENARIOS[0]].values, rtol=1e-12)
+    finally:
+        batched.scen_file = None
+        batched.scen_id = 1
+
+
+def test_surr_charge_rate_lookup(model):
+    proj = model.Projection
+    table = proj.model_point_table
+    proj.model_point_table = proj.model_point_samples
+    try:
+        for t in [0, 1, 12, 120, proj.max_proj_len() - 1]:
+            mi = pd.MultiIndex.from_arrays(
+                [proj.surr_charge_id().where(proj.has_surr_charge()),
+                 np.minimum(proj.duration(t), proj.surr_charge_max_idx())])
+            expected = proj.surr_charge_table_stacked().reindex(mi, fill_value=0).values
+            np.testing.assert_array_equal(proj.surr_charge_rate(t).values, expected)
+    finally:
+        proj.model_point_table = table
+
+
+def test_model_loads_without_runners():
+    code = ("import sys; sys.modules['lifelib.runners'] = None; "
+            "import modelx as mx; m = mx.read_model(sys.argv[1]); "
+            "m.Projection.result_pv()")
+    subprocess.run([sys.executable, "-c", code, str(CASHVALUE_ME)], check=True)
@@ -0,0 +1,177 @@
+"""Reconcile proj_state in savings/CashValue_ME_EX2.
+
+:func:`proj_state` advances the account values, charges, lapse rates and
+numbers of policies of all the model points in all the scenarios
+in one step per month. The Cells reading from it should give
+the same results as the per-cell formulas they replaced,
+which are restored here from :data:`PER_CELL_FORMULAS`.
+The results are compared for every simulation in ``sim_param_table``
+on the moneyness model points with fewer scenarios.
+"""
+import pathlib
+
+import numpy as np
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+CASHVALUE_ME_EX2 = LIBRARIES / "savings" / "CashValue_ME_EX2"
+
+SCEN_SIZE = 100
+
+RESULTS = ["monte_carlo", "result_pv", "result_cf", "result_pols"]
+
+# The formulas of the Cells before proj_state was introduced
+PER_CELL_FORMULAS = {
+    "av_pp_at": '''
+def av_pp_at(t, timing):
+    if timing == "BEF_PREM":
+        if t == 0:
+            return av_pp_init()
+        else:
+            return av_pp_at(t-1, "BEF_INV") + inv_income_pp(t-1)
+
+    elif timing == "BEF_FEE":
+        return av_pp_at(t, "BEF_PREM") + prem_to_av_pp(t)
+
+    elif timing == "BEF_INV":
+        return av_pp_at(t, "BEF_FEE") - maint_fee_pp(t) - coi_pp(t)
+
+    elif timing == "MID_MTH":
+        return av_pp_at(t, "BEF_INV") + 0.5 * inv_income_pp(t)
+
+    else:
+        raise ValueError("invalid timing")
+''',
+    "coi_pp": '''
+def coi_pp(t):
+    return coi_rate(t) * net_amt_at_risk(t)
+''',
+    "csv_pp": '''
+def csv_pp(t):
+    return (1 - surr_charge_rate(t)) * av_pp_at(t, 'MID_MTH')
+''',
+    "inv_income_pp": '''
+def inv_income_pp(t):
+    return inv_return_mth(t) * av_pp_at(t, "BEF_INV")
+''',
+    "lapse_rate": '''
+def lapse_rate(t):
+    if has_lapse():
+
+        if is_lapse_dynamic():
+            factor = csv_pp(t) / sum_assured()
+        else:
+            factor = 1
+
+        return factor * np.maximum(0.1 - 0.01 * duration(t), 0.02)
+    else:
+        return pd.Series(0, index=model_point().index)
+''',
+    "maint_fee_pp": '''
+def maint_fee_pp(t):
+    return maint_fee_rate() * av_pp_at(t, "BEF_FEE")
+''',
+    "net_amt_at_risk": '''
+def net_amt_at_risk(t):
+    return np.maximum(sum_assured() - av_pp_at(t, 'BEF_FEE'), 0)
+''',
+    "pols_death": '''
+def pols_death(t):
+    return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
+''',
+    "pols_if_at": '''
+def pols_if_at(t, timing):
+    if timing == "BEF_MAT":
+
+        if t == 0:
+            return pols_if_init()
+        else:
+            return pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)
+
+    elif timing == "BEF_NB":
+
+        return pols_if_at(t, "BEF_MAT") - pols_maturity(t)
+
+    elif timing == "BEF_DECR":
+
+        return pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+
+    else:
+        raise ValueError("invalid timing")
+''',
+    "pols_lapse": '''
+def pols_lapse(t):
+    return (pols_if_at(t, "BEF_DECR") - pols_death(t)) * (1-(1 - lapse_rate(t))**(1/12))
+''',
+    "pols_maturity": '''
+def pols_maturity(t):
+    return (duration_mth(t) == policy_term() * 12) * pols_if_at(t, "BEF_MAT")
+'''
+}
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(CASHVALUE_ME_EX2)
+    proj = model.Projection
+    proj.scen_size = SCEN_SIZE
+    proj.model_point_table = proj.model_point_moneyness
+    yield model
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def per_cell_results(model):
+    proj = model.Projection
+    formulas = {name: proj.cells[name].formula for name in PER_CELL_FORMULAS}
+    try:
+        for name, source in PER_CELL_FORMULAS.items():
+            proj.cells[name].formula = source
+
+        results = {}
+        for sim_id in proj.sim_param_table.index:
+            proj.sim_id = sim_id
+            results[sim_id] = {name: proj.cells[name]() for name in RESULTS}
+
+    finally:
+        for name, formula in formulas.items():
+            proj.cells[name].formula = formula
+        proj.sim_id = 1
+
+    return results
+
+
+@pytest.mark.parametrize("sim_id", [1, 2, 3, 4, 5])
+def test_proj_state_matches_per_cell(model, per_cell_results, sim_id):
+    proj = model.Projection
+    proj.sim_id = sim_id
+    try:
+        assert len(proj.model_point()) == 9 * SCEN_SIZE
+        for name, expected in per_cell_results[sim_id].items():
+            actual = proj.cells[name]()
+            assert actual.index.equals(expected.index)
+            assert actual.columns.equals(expected.columns)
+            np.testing.assert_allclose(actual.values, expected.values, rtol=1e-12)
+    finally:
+        proj.sim_id = 1
+
+
+def test_proj_state_views(model):
+    proj = model.Projection
+    proj.sim_id = 5
+    try:
+        state = proj.proj_state(12)
+        for timing in ("BEF_PREM", "BEF_FEE", "BEF_INV", "MID_MTH"):
+            np.testing.assert_array_equal(
+                proj.av_pp_at(12, timing).values, state["av_pp_at"][timing])
+        for timing in ("BEF_MAT", "BEF_NB", "BEF_DECR"):
+            np.testing.assert_array_equal(
+                proj.pols_if_at(12, timing).values, state["pols_if_at"][timing])
+        for name in ("maint_fee_pp", "net_amt_at_risk", "coi_pp", "csv_pp", "lapse_rate"):
+            assert proj.cells[name](12).index.equals(proj.model_point().index)
+            np.testing.assert_array_equal(proj.cells[name](12).values, state[name])
+    finally:
+        proj.sim_id = 1
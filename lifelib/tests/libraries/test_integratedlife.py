@@ -0,0 +1,124 @@
+"""Check the scenario broadcasting of appliedlife/IntegratedLife.
+
+ProductBase keeps one row per model point in ``model_point()`` and
+broadcasts the scenario-dependent values against the model points as
+2-D arrays of scenarios by model points. The results are laid out in
+rows by model point and scenario, so projecting subsets of the model
+points separately should give the same rows.
+Reading the returns from a scenario store should give the same results
+as generating them, and scenarios or funds not in the scenarios should raise.
+The assumptions and surrender charges looked up by integer positions
+should equal the stacked tables reindexed with the ``_key`` Cells.
+"""
+import pathlib
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from lifelib.runners import run_chunked, write_scenarios
+
+modelx = pytest.importorskip("modelx")
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+INTEGRATEDLIFE = LIBRARIES / "appliedlife" / "IntegratedLife"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(INTEGRATEDLIFE)
+    yield model
+    model.close()
+
+
+def test_model_points_are_not_repeated(model):
+    space = model.Run[2].GMXB
+    n_scen, n_point = space.proj_shape()
+    assert n_scen == len(space.scen_index()) > 1
+    assert n_point == len(space.model_point_table_ext()) == len(space.model_point())
+    assert space.age(0).shape == (n_point,)
+    assert space.inv_return_mth(0).shape == (n_scen, n_point)
+
+
+def test_results_by_point_and_scenario(model):
+    space = model.Run[2].GMXB
+    result = space.result_pv()
+    assert result.index.equals(space.model_point_index())
+
+    point_id, scen = result.index[-3]
+    sample = space.result_sample(point_id, scen)
+    t_len = len(sample)
+    pv_prem = sum(sample["premiums"] * [space.disc_factors(t) for t in range(t_len)])
+    assert pv_prem == pytest.approx(result.loc[(point_id, scen), "Premiums"])
+
+
+def test_chunks_of_points_match_one_pass(model):
+    space = model.Run[2].GMXB
+    expected = space.result_pv()
+    results = run_chunked(space, 3, source="model_point_table_ext")
+    assert results["result_pv"].index.equals(expected.index)
+    np.testing.assert_allclose(
+        results["result_pv"].values, expected.values, rtol=1e-12)
+
+
+def test_scenario_store(model, tmp_path):
+    space = model.Run[2].GMXB
+    expected = space.result_pv()
+    sens = space.fixed_params()["sens_int_rate"]
+    scens = model.Scenarios[space.date_id(), sens]
+    store = write_scenarios(
+        tmp_path / f"index_{scens.date_id}_{scens.sens_id}", scens.log_return_mth())
+
+    model.Scenarios.scen_file = str(tmp_path / "index_{date_id}_{sens_id}")
+    try:
+        space = model.Run[2].GMXB
+        assert space.scen_index().equals(store.scen_ids)
+        np.testing.assert_allclose(space.result_pv().values, expected.values, rtol=1e-12)
+    finally:
+        model.Scenarios.scen_file = None
+
+
+def test_unknown_scenarios_and_funds_raise(model):
+    space = model.Run[2].GMXB
+    scen_index = space.scen_index()
+    space.scen_index[()] = scen_index.append(scen_index[-1:] + 1)
+    try:
+        with pytest.raises(Exception, match="scen_index not in the scenarios"):
+            space.inv_return_mth(0)
+    finally:
+        space.scen_index.clear_at()
+
+    space.model_point[()] = space.model_point().assign(fund_index="unknown")
+    try:
+        with pytest.raises(Exception, match="fund_index not in the scenarios"):
+            space.inv_return_mth(0)
+    finally:
+        space.model_point.clear_at()
+
+
+@pytest.mark.parametrize("t", [0, 1, 60, 200])
+def test_assumption_lookups(model, t):
+    space = model.Run[2].GMXB
+    asmp = space.asmp_data(space.asmp_id())
+    np.testing.assert_array_equal(
+        space.base_mort_rate(t),
+        space.mort_data.unified_table().reindex(space.mort_rate_key(t)).values)
+    np.testing.assert_array_equal(
+        space.base_lapse_rate(t),
+        asmp.stacked_lapse_tables().reindex(space.lapse_rate_key(t)).values)
+    np.testing.assert_array_equal(
+        space.mort_scalar(t),
+        asmp.stacked_mort_scalar_tables().reindex(space.mort_scalar_key(t)).values)
+    np.testing.assert_array_equal(
+        space.surr_charge_rate(t),
+        space.base_data.stacked_surr_charge_tables().reindex(
+            space.surr_charge_key(t), fill_value=0).values)
+
+
+def test_model_loads_without_runners():
+    code = ("import sys; sys.modules['lifelib.runners'] = None; "
+            "import modelx as mx; m = mx.read_model(sys.argv[1]); "
+            "m.Run[1].GMXB.result_pv()")
+    subprocess.run([sys.executable, "-c", code, str(INTEGRATEDLIFE)], check=True)
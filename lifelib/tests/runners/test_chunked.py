@@ -0,0 +1,72 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners.chunked import (
+    run_chunked, chunk_size_for_budget, merge_results, iter_chunks)
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    model.Projection.engine = "grid"
+    yield model
+    model.close()
+
+
+def test_iter_chunks():
+    table = pd.DataFrame({"x": range(7)})
+    assert [len(c) for c in iter_chunks(table, 3)] == [3, 3, 1]
+
+    with pytest.raises(ValueError):
+        list(iter_chunks(table, 0))
+
+
+def test_merge_results_pads_shorter_chunks():
+    cf1 = pd.DataFrame({"cf": [1.0, 2.0, 3.0]})
+    cf2 = pd.DataFrame({"cf": [10.0, 20.0]})
+    pv1 = pd.DataFrame({"pv": [1.0]}, index=pd.Index([1], name="point_id"))
+    pv2 = pd.DataFrame({"pv": [2.0]}, index=pd.Index([2], name="point_id"))
+
+    merged = merge_results(
+        [{"cf": cf1, "pv": pv1}, {"cf": cf2, "pv": pv2}],
+        sums=["cf"], concats=["pv"])
+
+    assert merged["cf"]["cf"].tolist() == [11.0, 22.0, 3.0]
+    assert merged["pv"].index.tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("chunk_size", [3000, 10000])
+def test_run_chunked_matches_full_run(model, chunk_size):
+    proj = model.Projection
+    expected_cf = proj.result_cf()
+    expected_pv = proj.result_pv()
+
+    results = run_chunked(proj, chunk_size)
+
+    assert results["result_cf"].index.equals(expected_cf.index)
+    assert results["result_pv"].index.equals(expected_pv.index)
+    np.testing.assert_allclose(results["result_cf"].values, expected_cf.values,
+                               rtol=1e-12)
+    np.testing.assert_allclose(results["result_pv"].values, expected_pv.values,
+                               rtol=1e-12)
+
+    # The model is left as it was
+    assert len(proj.model_point()) == len(proj.model_point_table)
+    assert not proj.model_point.is_input()
+
+
+def test_chunk_size_for_budget(model):
+    proj = model.Projection
+    small = chunk_size_for_budget(proj, 2**20)
+    large = chunk_size_for_budget(proj, 2**30)
+
+    assert 1 <= small < large <= len(proj.model_point_table)
+    assert len(proj.model_point()) == len(proj.model_point_table)
@@ -0,0 +1,104 @@
+import pathlib
+import shutil
+
+import pandas as pd
+import pytest
+
+from lifelib.runners import input_cache
+from lifelib.runners.csv_inputs import load_inputs, unload_inputs
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+TERM_LIFE = LIBRARIES / "uslib" / "products" / "term_life"
+
+
+@pytest.fixture
+def model():
+    model = modelx.read_model(TERM_LIFE / "Term_US_A")
+    yield model
+    model.close()
+
+
+def test_load_inputs(model):
+    data = model.Data
+    tables = data.input_schema()["tables"]
+    expected_tables = {name: getattr(data, name)() for name in tables}
+    expected = model.Projection[1].result_cf()
+    model.clear_all()
+
+    report = load_inputs(data, dtype={
+        "model_point_file": {"age_at_entry": "int16", "sex": "category"}})
+
+    assert report["tables"] == 5
+    assert report["nbytes"] > 0
+    assert all(data.cells[name].is_input() for name in tables)
+    assert data.model_point_table()["age_at_entry"].dtype == "int16"
+    assert data.model_point_table()["sex"].dtype == "category"
+    assert "provenance" not in data.mort_table().columns
+    pd.testing.assert_frame_equal(
+        data.mort_table(),
+        expected_tables["mort_table"].drop(columns="provenance"))
+    pd.testing.assert_frame_equal(
+        data.premium_rates(),
+        expected_tables["premium_rates"].drop(columns="provenance"))
+
+    pd.testing.assert_frame_equal(model.Projection[1].result_cf(), expected)
+
+    unload_inputs(data)
+    assert not any(len(data.cells[name]) for name in tables)
+    assert data.model_point_table()["age_at_entry"].dtype == "int64"
+    pd.testing.assert_frame_equal(data.mort_table(), expected_tables["mort_table"])
+
+
+def test_load_inputs_schema(model):
+    data = model.Data
+    expected = {name: getattr(data, name)() for name in data.input_schema()["tables"]}
+    model.clear_all()
+
+    load_inputs(data)
+    for name, table in expected.items():
+        pd.testing.assert_frame_equal(getattr(data, name)(), table.drop(
+            columns="provenance", errors="ignore"))
+    unload_inputs(data)
+
+
+def test_load_inputs_sort(model):
+    data = model.Data
+    tables = {"premium_rates": data.input_schema()["tables"]["premium_rates"] + (True,)}
+    load_inputs(data, tables, exclude=())
+
+    assert data.premium_rates().index.is_monotonic_increasing
+    unload_inputs(data, tables)
+
+
+def test_load_inputs_cache(tmp_path, monkeypatch):
+    shutil.copytree(TERM_LIFE, tmp_path / "term_life",
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    model = modelx.read_model(tmp_path / "term_life" / "Term_US_A")
+    try:
+        data = model.Data
+        expected = model.Projection[1].result_cf()
+        model.clear_all()
+
+        load_inputs(data, cache=True)
+        assert input_cache.stamp_path(tmp_path / "term_life" / "mort_table.csv").exists()
+        unload_inputs(data)
+
+        with monkeypatch.context() as m:
+            m.setattr(pd, "read_csv", _header_only(pd.read_csv))
+            report = load_inputs(data, cache=True)
+
+        assert report["tables"] == 5
+        assert "provenance" not in data.mort_table().columns
+        pd.testing.assert_frame_equal(model.Projection[1].result_cf(), expected)
+    finally:
+        model.close()
+
+
+def _header_only(read_csv):
+    def read(*args, **kwargs):
+        if kwargs.get("nrows") != 0:
+            raise AssertionError("read_csv called")
+        return read_csv(*args, **kwargs)
+    return read
@@ -0,0 +1,119 @@
+import math
+import pathlib
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+modelx = pytest.importorskip("modelx")
+norm = pytest.importorskip("scipy.stats").norm
+
+from lifelib.runners.guarantee import (
+    black_put,
+    forward_scenario,
+    value_guarantees,
+    compare_guarantees,
+    _erfc
+)
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+CASHVALUE_ME_EX4 = LIBRARIES / "savings" / "CashValue_ME_EX4"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(CASHVALUE_ME_EX4)
+    model.Projection.model_point_table = model.Projection.model_point_moneyness
+    yield model
+    model.close()
+
+
+def test_black_put():
+    np.testing.assert_allclose(
+        black_put([90, 100, 110], 100, 0.2, 0), [10, 0, 0])
+    np.testing.assert_allclose(black_put(0, 100, 0.2, 1), 100)
+
+    # Put-call parity on the forward
+    forward, strike, sigma, term = 105.0, 100.0, 0.2, 2.0
+    vol = sigma * np.sqrt(term)
+    d1 = (np.log(forward / strike) + 0.5 * vol**2) / vol
+    call = forward * norm.cdf(d1) - strike * norm.cdf(d1 - vol)
+    assert black_put(forward, strike, sigma, term) == pytest.approx(
+        call - forward + strike)
+
+
+def test_import_without_scipy():
+    code = ("import sys; sys.modules['scipy'] = None; "
+            "import lifelib.runners; from lifelib.runners import value_guarantees")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_forward_scenario(model):
+    space = model.Projection
+    normals = space.std_norm_rand().copy()
+
+    with forward_scenario(space):
+        assert space.scen_size == 1
+        returns = np.asarray(space.inv_return_mth(0))
+        np.testing.assert_allclose(returns, np.exp(0.02 / 12) - 1)
+
+    assert space.scen_size == len(normals)
+    np.testing.assert_array_equal(space.std_norm_rand(), normals)
+    assert not space.std_norm_rand.is_input()
+
+
+def test_value_guarantees(model):
+    space = model.Projection
+    result = value_guarantees(space)
+    assert list(result.columns) == ["DEATH", "MATURITY", "Total"]
+
+    # The single premium points pay the put option at maturity
+    single = [1, 2, 5, 6, 9]
+    np.testing.assert_allclose(
+        result.loc[single, "MATURITY"].to_numpy(),
+        np.asarray(space.formula_option_put(120))[np.array(single) - 1])
+
+
+def test_compare_guarantees(model):
+    space = model.Projection
+    result = compare_guarantees(space)
+    np.testing.assert_allclose(result["Analytic"], value_guarantees(space)["Total"])
+    np.testing.assert_allclose(
+        result["Difference"], result["Analytic"] - result["Stochastic"])
+
+    # Within the Monte Carlo error of 1000 scenarios
+    large = [5, 6, 9]
+    assert (abs(result.loc[large, "Difference"])
+            < 0.02 * result.loc[large, "Analytic"]).all()
+
+
+def test_compare_guarantees_batched():
+    model = modelx.read_model(LIBRARIES / "savings" / "CashValue_ME")
+    try:
+        space = model.Projection
+        space.model_point_table = space.model_point_table.loc[[1, 2]]
+        kinds = ("DEATH",)
+
+        expected = []
+        for scen_id in [2, 5, 9]:
+            space.scen_id = scen_id
+            expected.append(compare_guarantees(space, kinds=kinds))
+
+        space.scen_batch = True
+        space.scen_index[()] = pd.Index([2, 5, 9], name="scen_id")
+        result = compare_guarantees(space, kinds=kinds)
+
+        assert result.index.equals(expected[0].index)
+        np.testing.assert_allclose(result["Analytic"], expected[0]["Analytic"])
+        np.testing.assert_allclose(
+            result["Stochastic"],
+            np.mean([e["Stochastic"] for e in expected], axis=0))
+    finally:
+        model.close()
+
+
+def test_norm_cdf_without_scipy():
+    x = np.linspace(-8, 8, 1001)
+    np.testing.assert_allclose(_erfc(x), [math.erfc(v) for v in x], rtol=2e-7)
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+import pytest
+
+from lifelib.runners import input_cache
+
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "params.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"value": [1.5, 2.5]}, index=pd.Index(["a", "b"], name="key")
+                     ).to_excel(writer, sheet_name="Params")
+        pd.DataFrame({"id": ["001", "002"], "rate": [0.1, 0.2]}
+                     ).to_excel(writer, sheet_name="Rates", index=False)
+    return path
+
+
+def read_from_cache(path, monkeypatch, **kwargs):
+    def fail(*args, **kwargs):
+        raise AssertionError("workbook read")
+
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_excel", fail)
+        return input_cache.read_excel(path, **kwargs)
+
+
+def test_read_excel(workbook, monkeypatch):
+    expected = pd.read_excel(workbook, sheet_name="Params", index_col="key")
+    first = input_cache.read_excel(workbook, sheet_name="Params", index_col="key")
+    pd.testing.assert_frame_equal(first, expected)
+
+    cache_dir = workbook.parent / input_cache.CACHE_DIR
+    assert input_cache.stamp_path(workbook).exists()
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    cached = read_from_cache(workbook, monkeypatch,
+                             sheet_name="Params", index_col="key")
+    pd.testing.assert_frame_equal(cached, expected)
+
+    # Other arguments are cached separately
+    rates = input_cache.read_excel(workbook, sheet_name="Rates", dtype={"id": object})
+    assert rates["id"].tolist() == ["001", "002"]
+    pd.testing.assert_frame_equal(
+        read_from_cache(workbook, monkeypatch, sheet_name="Rates", dtype={"id": object}),
+        rates)
+
+
+def test_invalidation(workbook, monkeypatch):
+    input_cache.read_excel(workbook, sheet_name="Params", index_col="key")
+
+    # Touched but unchanged
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    read_from_cache(workbook, monkeypatch, sheet_name="Params", index_col="key")
+
+    # Changed
+    with pd.ExcelWriter(workbook) as writer:
+        pd.DataFrame({"value": [3.5]}, index=pd.Index(["c"], name="key")
+                     ).to_excel(writer, sheet_name="Params")
+
+    updated = input_cache.read_excel(workbook, sheet_name="Params", index_col="key")
+    assert updated["value"].tolist() == [3.5]
+    assert read_from_cache(workbook, monkeypatch, sheet_name="Params",
+                           index_col="key")["value"].tolist() == [3.5]
+
+    input_cache.clear(workbook)
+    assert not list((workbook.parent / input_cache.CACHE_DIR).iterdir())
+
+
+def test_clear_keeps_other_files(workbook):
+    backup = workbook.with_name(workbook.name + ".bak.xlsx")
+    backup.write_bytes(workbook.read_bytes())
+
+    input_cache.read_excel(workbook, sheet_name="Params", index_col="key")
+    input_cache.read_excel(backup, sheet_name="Params", index_col="key")
+    cache_dir = workbook.parent / input_cache.CACHE_DIR
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+    input_cache.clear(workbook)
+    assert not input_cache.stamp_path(workbook).exists()
+    assert input_cache.stamp_path(backup).exists()
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
@@ -0,0 +1,64 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from lifelib.runners.parallel import run_parallel, get_space
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+INTEGRATEDLIFE = LIBRARIES / "appliedlife" / "IntegratedLife"
+
+
+@pytest.fixture(scope="module")
+def expected():
+    model = modelx.read_model(BASICTERM_ME)
+    try:
+        proj = model.Projection
+        proj.engine = "grid"
+        yield proj.result_cf(), proj.result_pv()
+    finally:
+        model.close()
+
+
+def test_get_space():
+    model = modelx.new_model()
+    try:
+        base = model.new_space("Base", formula=lambda i, s="A": None)
+        base.new_space("Child")
+        assert get_space(model, "Base") is base
+        assert get_space(model, "Base[1].Child") is base[1].Child
+        assert get_space(model, "Base[2, 'B']") is base[2, "B"]
+
+        with pytest.raises(ValueError):
+            get_space(model, "Base[1].")
+    finally:
+        model.close()
+
+
+def test_run_parallel_is_independent_of_workers(expected):
+    one, two = [run_parallel(BASICTERM_ME, "Projection", chunk_size=2500,
+                             refs={"engine": "grid"}, max_workers=n)
+                for n in (1, 2)]
+
+    for name, exp in zip(["result_cf", "result_pv"], expected):
+        assert one[name].equals(two[name])
+        assert one[name].index.equals(exp.index)
+        np.testing.assert_allclose(one[name].values, exp.values, rtol=1e-12)
+
+
+def test_run_parallel_index_source():
+    model = modelx.read_model(INTEGRATEDLIFE)
+    try:
+        expected = model.Run[2].GMXB.result_cf()
+    finally:
+        model.close()
+
+    result = run_parallel(INTEGRATEDLIFE, "Run[2].GMXB", chunk_size=30,
+                          concats=(), source="scen_index", max_workers=2)
+
+    assert result["result_cf"].index.equals(expected.index)
+    np.testing.assert_allclose(
+        result["result_cf"].values, expected.values, rtol=1e-12)
@@ -0,0 +1,104 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from lifelib.runners.chunked import clear_cache
+from lifelib.runners.precision import precision_drift
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+CASHVALUE_ME = LIBRARIES / "savings" / "CashValue_ME"
+INTEGRATEDLIFE = LIBRARIES / "appliedlife" / "IntegratedLife"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    model.Projection.model_point_table = model.Projection.model_point_table.iloc[:500]
+    yield model
+    model.close()
+
+
+@pytest.mark.parametrize("engine", ["grid", "recursive"])
+def test_precision_drift(model, engine):
+    space = model.Projection
+    space.engine = engine
+    drift, nbytes = precision_drift(space, names=("result_cf", "result_pv", "result_pols"))
+
+    assert space.precision == "float64"
+    assert (drift["max_rel_diff"] < 1e-6).all()
+    assert drift.loc[("result_pols", "pols_new_biz"), "max_abs_diff"] == 0
+    assert nbytes["float32"] < nbytes["float64"] * 0.75
+    if engine == "grid":
+        assert nbytes["float32"] < nbytes["float64"] * 0.6
+
+
+def test_value_dtype(model):
+    space = model.Projection
+    space.engine = "grid"
+    clear_cache(space)
+    space.precision = "float32"
+    try:
+        assert space.value_dtype() is np.float32
+        for name in ["pols_surv_grid", "pols_new_biz_grid", "mort_rate_mth_grid",
+                     "claims_grid", "premiums_grid", "expenses_grid"]:
+            assert getattr(space, name)().dtype == np.float32
+        assert space.pols_if_at_grid("BEF_DECR").dtype == np.float32
+        assert space.mort_rate_grid().dtype == np.float64
+        assert space.duration_mth_grid().dtype == np.int32
+        assert space.age_grid().dtype == np.int32
+        assert (space.result_pv().dtypes == np.float64).all()
+
+        space.precision = "float16"
+        with pytest.raises(Exception, match="invalid precision"):
+            space.value_dtype()
+    finally:
+        space.precision = "float64"
+        clear_cache(space)
+
+    assert space.policy_count().dtype == np.int64
+    assert space.duration_mth_grid().dtype == np.int64
+    assert space.pols_new_biz_grid().dtype == np.int64
+
+
+def test_precision_drift_cashvalue():
+    model = modelx.read_model(CASHVALUE_ME)
+    space = model.Projection
+    try:
+        drift, nbytes = precision_drift(
+            space, names=("result_cf", "result_pv", "result_pols"))
+
+        assert space.precision == "float64"
+        assert (drift["max_rel_diff"] < 1e-5).all()
+        assert nbytes["float32"] < nbytes["float64"]
+
+        space.precision = "float32"
+        assert space.pols_if_at(1, "BEF_DECR").dtype == np.float32
+        assert space.claims(1).dtype == np.float32
+        assert space.av_pp_at(1, "BEF_FEE").dtype == np.float64
+        assert (space.result_pv().dtypes == np.float64).all()
+    finally:
+        space.precision = "float64"
+        model.close()
+
+
+def test_precision_integratedlife():
+    model = modelx.read_model(INTEGRATEDLIFE)
+    try:
+        results = {}
+        for precision in ("float64", "float32"):
+            model.precision = precision
+            space = model.Run[1].GMXB
+            results[precision] = space.result_pv()
+
+        assert space.pols_lapse(1).dtype == np.float32
+        assert space.av_pp_at(1, "BEF_FEE").dtype == np.float64
+        full = results["float64"]
+        assert (results["float32"].dtypes == np.float64).all()
+        assert ((results["float32"] - full).abs().max()
+                <= 1e-5 * full.abs().max()).all()
+    finally:
+        model.close()
@@ -0,0 +1,118 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+from lifelib.runners.chunked import run_chunk
+from lifelib.runners.pricing import PremiumSolver, premium_grid
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICLIFE = LIBRARIES / "basiclife"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICLIFE / "BasicTerm_M")
+    yield model
+    model.close()
+
+
+@pytest.fixture
+def grid():
+    return premium_grid(age_at_entry=range(20, 60), policy_term=[10, 15, 20],
+                        sum_assured=1)
+
+
+def test_premium_grid(grid):
+    assert len(grid) == 120
+    assert list(grid.columns) == ["age_at_entry", "policy_term", "sum_assured"]
+    assert grid.index[0] == 1 and grid.index.name == "point_id"
+    assert (grid["sum_assured"] == 1).all()
+
+
+def test_premium_rates(model, grid):
+    """The solved rates equal the rates of create_premium_table.ipynb"""
+    space = model.Projection
+    rates = PremiumSolver(space, "net_premium_pp").solve(grid)
+
+    expected = run_chunk(space, grid, ["net_premium_pp"])["net_premium_pp"]
+    assert rates.index.names == ["age_at_entry", "policy_term"]
+    np.testing.assert_allclose(rates.values, expected, rtol=1e-12)
+
+
+def test_cache(model, grid):
+    space = model.Projection
+    solver = PremiumSolver(space, "net_premium_pp")
+    rates = solver.solve(grid)
+    assert solver.report == {"cells": 120, "cached": 0, "solved": 120}
+
+    assert solver.solve(grid).equals(rates)
+    assert solver.report["solved"] == 0
+
+    mort_table = space.mort_table
+    table = mort_table.copy()
+    table.loc[70:] *= 1.1
+    space.mort_table = table
+    try:
+        updated = solver.solve(grid)
+        affected = grid["age_at_entry"] + grid["policy_term"] >= 70
+        assert solver.report["solved"] == affected.sum()
+
+        expected = PremiumSolver(space, "net_premium_pp").solve(grid)
+        np.testing.assert_allclose(updated.values, expected.values, rtol=1e-12)
+        assert (updated.values[~affected.values] == rates.values[~affected.values]).all()
+        # Mortality at the age of maturity is read but not applied
+        applied = (grid["age_at_entry"] + grid["policy_term"] > 70).values
+        assert (updated.values[applied] > rates.values[applied]).all()
+    finally:
+        space.mort_table = mort_table
+
+
+def test_term_tables(model, grid):
+    """Tables not declared as term tables enter the fingerprints whole"""
+    space = model.Projection
+    solver = PremiumSolver(space, "net_premium_pp", term_tables={})
+    solver.solve(grid)
+
+    mort_table = space.mort_table
+    table = mort_table.copy()
+    table.loc[70:] *= 1.1
+    space.mort_table = table
+    try:
+        solver.solve(grid)
+        assert solver.report["solved"] == len(grid)
+    finally:
+        space.mort_table = mort_table
+
+    renamed = grid.rename(columns={"age_at_entry": "age", "policy_term": "term"})
+    solver = PremiumSolver(space, "net_premium_pp", keys=["age", "term"],
+                           term_tables={"mort_table": "age"}, age="age", term="term")
+    assert solver.cell_keys(renamed) == PremiumSolver(
+        space, "net_premium_pp", term_tables={"mort_table": "age"}).cell_keys(grid)
+
+    with pytest.raises(ValueError):
+        PremiumSolver(space, "net_premium_pp", term_tables={"mort_table": "year"})
+
+
+def test_pricing_grid_of_policies():
+    """Rates of unique keys equal the rates of the policies"""
+    model = modelx.read_model(BASICLIFE / "BasicTermASL_ME")
+    try:
+        space = model.Pricing
+        keys = ["age_at_entry", "policy_term", "payment_freq", "payment_term"]
+        policies = space.model_point().iloc[:200]
+        policies = policies[policies["policy_count"] > 0]
+
+        grid = policies.drop_duplicates(keys).assign(
+            sex="M", policy_count=1, sum_assured=1000)
+        rates = PremiumSolver(space, "net_premium_rate", keys=keys).solve(grid)
+
+        expected = run_chunk(space, policies, ["net_premium_rate"])["net_premium_rate"]
+        np.testing.assert_allclose(
+            rates.reindex(pd.MultiIndex.from_frame(policies[keys])).values,
+            expected, rtol=1e-10)
+    finally:
+        model.close()
@@ -0,0 +1,64 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners.ragged import (
+    horizon_bands, projected_months, restore_order, run_ragged)
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    model.Projection.engine = "grid"
+    yield model
+    model.close()
+
+
+def test_horizon_bands():
+    lengths = np.array([241, 121, 181, 121, 241, 1, 121])
+
+    bands = horizon_bands(lengths, 3)
+    assert [band.tolist() for band in bands] == [[5], [1, 3, 6], [0, 2, 4]]
+    assert projected_months(lengths, bands) == {
+        "full": 7 * 241, "ragged": 1 + 3 * 121 + 3 * 241,
+        "ratio": (1 + 3 * 121 + 3 * 241) / (7 * 241)}
+
+    assert [band.tolist() for band in horizon_bands(lengths, 10)] == [
+        [5], [1, 3, 6], [2], [0, 4]]
+    assert [band.tolist() for band in horizon_bands(lengths, 1)] == [
+        list(range(7))]
+
+    with pytest.raises(ValueError):
+        horizon_bands(lengths, 0)
+
+
+def test_restore_order():
+    index = pd.MultiIndex.from_tuples(
+        [(3, 1), (3, 2), (1, 1), (1, 2), (2, 1)], names=["point_id", "scen_id"])
+    result = pd.DataFrame({"pv": range(5)}, index=index)
+
+    restored = restore_order(result, pd.Index([1, 2, 3], name="point_id"))
+    assert restored["pv"].tolist() == [2, 3, 4, 0, 1]
+
+
+@pytest.mark.parametrize("max_bands", [1, 4])
+def test_run_ragged_matches_full_run(model, max_bands):
+    proj = model.Projection
+    expected_cf = proj.result_cf()
+    expected_pv = proj.result_pv()
+
+    results = run_ragged(proj, max_bands)
+
+    assert results["result_cf"].index.equals(expected_cf.index)
+    assert results["result_pv"].index.equals(expected_pv.index)
+    np.testing.assert_allclose(results["result_cf"].values, expected_cf.values,
+                               rtol=1e-12)
+    np.testing.assert_allclose(results["result_pv"].values, expected_pv.values,
+                               rtol=1e-12)
@@ -0,0 +1,85 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+from lifelib.runners.rollforward import (
+    capture_state, classify_points, roll_forward, reconcile)
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    yield model
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def tables(model):
+    """Model points of two month ends
+
+    Of the first 1000 model points, 20 exit, 10 change their sum assured,
+    and the rest are one month older with fewer policies.
+    200 model points are added as new business.
+    """
+    table = model.Projection.model_point_table
+    prev = table.iloc[:1000]
+
+    new = prev.iloc[20:].copy()
+    new["duration_mth"] += 1
+    new["policy_count"] *= 0.99
+    new.loc[new.index[:10], "sum_assured"] += 1000
+    new = new[new["duration_mth"] <= new["policy_term"] * 12]
+
+    return prev, pd.concat([new, table.iloc[1000:1200]])
+
+
+def test_classify_points(tables):
+    prev, new = tables
+    groups = classify_points(prev, new)
+
+    assert set(groups["exited"]) == set(prev.index) - set(new.index)
+    assert prev.index[:20].isin(groups["exited"]).all()
+    assert len(groups["changed"]) == 10
+    assert len(groups["new"]) == 200
+    assert len(groups["rolled"]) + 10 + 200 == len(new)
+
+
+def test_roll_forward_reconciles(model, tables):
+    prev, new = tables
+    proj = model.Projection
+    with pytest.raises(ValueError):
+        capture_state(proj)
+
+    proj.engine = "grid"
+    proj.model_point[()] = prev
+    try:
+        state = capture_state(proj)
+    finally:
+        proj.model_point.clear_at()
+
+    try:
+        values, next_state, report = roll_forward(
+            proj, state, new, results=("result_cf", "result_pols", "result_pv"))
+        diffs = reconcile(proj, new, values)
+    finally:
+        proj.engine = "recursive"
+
+    with pytest.raises(ValueError):
+        roll_forward(proj, state, new)
+
+    # Rolled model points without policies cannot be scaled and are recalculated
+    empty = (prev["policy_count"].reindex(new.index) == 0).sum()
+    assert report["new"] == 200 and report["changed"] == 10 + empty
+    assert report["rolled_ratio"] == pytest.approx(report["rolled"] / len(new))
+    assert next_state.model_point.index.equals(new.index)
+
+    assert values["result_pv"].index.equals(new.index)
+    for name, value in values.items():
+        assert diffs[name] <= 1e-10 * np.abs(value.values).max()
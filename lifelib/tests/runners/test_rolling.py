@@ -0,0 +1,119 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners.chunked import cache_nbytes, clear_cache
+from lifelib.runners.rolling import run_rolling
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+CASHVALUE_ME = LIBRARIES / "savings" / "CashValue_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    model.Projection.model_point_table = model.Projection.model_point_table.iloc[:500]
+    yield model
+    model.close()
+
+
+@pytest.mark.parametrize("window", [1, 3])
+def test_run_rolling(model, window):
+    space = model.Projection
+    expected_pv = space.result_pv()
+    expected_cf = space.result_cf()
+    full_nbytes = cache_nbytes(space)
+    clear_cache(space)
+
+    results, report = run_rolling(space, window=window)
+
+    np.testing.assert_allclose(
+        results["result_pv"].values, expected_pv.values, rtol=1e-12, atol=1e-6)
+    np.testing.assert_allclose(
+        results["result_cf"].values, expected_cf.values, rtol=1e-12, atol=1e-6)
+    assert list(results["result_cf"].columns) == list(expected_cf.columns)
+    assert results["result_pv"].index.equals(expected_pv.index)
+
+    assert report["steps"] == len(expected_cf)
+    assert report["peak_nbytes"] < full_nbytes / 10
+    assert cache_nbytes(space) == 0
+    assert not any(len(cells) for cells in space.cells.values()
+                   if cells.parameters and cells.parameters[0] == "t")
+
+
+def test_run_rolling_keeps_inputs(model):
+    space = model.Projection
+    value = space.mort_rate(3) * 2
+    clear_cache(space)
+    space.mort_rate[3] = value
+    try:
+        expected_pv = space.result_pv()
+        clear_cache(space)
+
+        results, _ = run_rolling(space)
+
+        np.testing.assert_allclose(
+            results["result_pv"].values, expected_pv.values, rtol=1e-12, atol=1e-6)
+        assert list(space.mort_rate.keys()) == [3]
+        assert space.mort_rate.is_input(3)
+        assert space.mort_rate(3) is value
+    finally:
+        space.mort_rate.clear_at(3)
+
+
+def test_run_rolling_with_args():
+    model = modelx.read_model(CASHVALUE_ME)
+    try:
+        space = model.Projection
+        expected = space.result_pv()
+        clear_cache(space)
+
+        outputs = {"Premiums": "premiums",
+                   "Death": ("claims", "DEATH"),
+                   "Surrender": ("claims", "LAPSE"),
+                   "Change in AV": "av_change"}
+        results, _ = run_rolling(space, outputs)
+
+        np.testing.assert_allclose(
+            results["result_pv"].values, expected[list(outputs)].values,
+            rtol=1e-12, atol=1e-6)
+    finally:
+        model.close()
+
+
+def test_run_rolling_batched():
+    model = modelx.read_model(CASHVALUE_ME)
+    space = model.Projection
+    space.model_point_table = space.model_point_table.loc[[1, 2]]
+    space.scen_batch = True
+    space.scen_index[()] = pd.Index([2, 5, 9], name="scen_id")
+    try:
+        expected_pv = space.result_pv()
+        expected_cf = space.result_cf()
+        clear_cache(space)
+
+        outputs = {"Premiums": "premiums",
+                   "Death": ("claims", "DEATH"),
+                   "Investment Income": "inv_income",
+                   "Change in AV": "av_change"}
+        results, _ = run_rolling(space, outputs)
+
+        assert results["result_pv"].index.equals(expected_pv.index)
+        np.testing.assert_allclose(
+            results["result_pv"].values, expected_pv[list(outputs)].values,
+            rtol=1e-12, atol=1e-6)
+        np.testing.assert_allclose(
+            results["result_cf"]["Premiums"].values, expected_cf["Premiums"].values,
+            rtol=1e-12, atol=1e-6)
+    finally:
+        model.close()
+
+
+def test_window(model):
+    with pytest.raises(ValueError):
+        run_rolling(model.Projection, window=0)
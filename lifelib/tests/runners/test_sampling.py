@@ -0,0 +1,134 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from lifelib.runners.sampling import (
+    METHODS,
+    sample_normals,
+    assign_normals,
+    steps_of,
+    scenario_frame,
+    put_control,
+    mc_estimate,
+    mc_convergence
+)
+
+modelx = pytest.importorskip("modelx")
+pytest.importorskip("scipy")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+CASHVALUE_ME_EX4 = LIBRARIES / "savings" / "CashValue_ME_EX4"
+CASHVALUE_ME = LIBRARIES / "savings" / "CashValue_ME"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(CASHVALUE_ME_EX4)
+    yield model
+    model.close()
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_sample_normals(method):
+    rnd = sample_normals(256, 242, method=method)
+    assert rnd.shape == (256, 242)
+    np.testing.assert_array_equal(rnd, sample_normals(256, 242, method=method))
+    assert abs(rnd.mean()) < 0.05
+    assert abs(rnd.std() - 1) < 0.05
+
+    if method == "antithetic":
+        np.testing.assert_array_equal(rnd[:128], -rnd[128:])
+    elif method == "moment":
+        np.testing.assert_allclose(rnd.mean(axis=0), 0, atol=1e-12)
+        np.testing.assert_allclose(rnd.std(axis=0), 1)
+
+
+def test_sample_normals_errors():
+    with pytest.raises(ValueError):
+        sample_normals(255, method="antithetic")
+    with pytest.raises(ValueError):
+        sample_normals(256, method="latin")
+
+
+def test_assign_normals(model):
+    space = model.Projection
+    space.model_point_table = space.model_point_1
+    expected = space.pv_claims_over_av("MATURITY").copy()
+
+    assign_normals(space, sample_normals(space.scen_size))
+    np.testing.assert_array_equal(space.pv_claims_over_av("MATURITY"), expected)
+
+    assign_normals(space, sample_normals(64, method="antithetic"))
+    values = scenario_frame(space, space.pv_claims_over_av("MATURITY"))
+    assert values.shape == (1, 64)
+
+    plain = mc_estimate(values)
+    paired = mc_estimate(values, method="antithetic")
+    assert plain["mean"].iloc[0] == pytest.approx(paired["mean"].iloc[0])
+
+
+def test_put_control(model):
+    space = model.Projection
+    space.model_point_table = space.model_point_moneyness
+    assign_normals(space, sample_normals(128))
+
+    controls, expected = put_control(space, 120)
+    np.testing.assert_allclose(
+        expected.to_numpy(), np.asarray(space.formula_option_put(120)))
+
+    values = scenario_frame(space, space.pv_claims_over_av("MATURITY"))
+    result = mc_estimate(values, controls=controls, expected=expected)
+    plain = mc_estimate(values)
+    assert (result["stderr"] <= plain["stderr"] + 1e-6).all()
+
+
+def test_mc_convergence(model):
+    space = model.Projection
+    space.model_point_table = space.model_point_moneyness
+
+    def value(space):
+        return space.pv_claims_over_av("MATURITY")
+
+    plain = mc_convergence(space, value, [64, 256], replications=4)
+    assert list(plain.index.unique("scen_size")) == [64, 256]
+
+    # Point 9 is far out of the money, so its value is nearly linear in the returns
+    for method in ["antithetic", "moment", "sobol"]:
+        result = mc_convergence(space, value, [256], method=method, replications=4)
+        assert result.loc[(256, 9), "stderr"] < plain.loc[(256, 9), "stderr"] / 2
+
+    # The single premium points pay the put option at maturity
+    controlled = mc_convergence(space, value, [64], control_t=120, replications=2)
+    single = [1, 2, 5, 6, 9]
+    np.testing.assert_allclose(
+        controlled.loc[64, "mean"].loc[single].to_numpy(),
+        np.asarray(space.formula_option_put(120))[np.array(single) - 1])
+
+
+def test_mc_convergence_scen_batch():
+    model = modelx.read_model(CASHVALUE_ME)
+    space = model.Projection
+    space.model_point_table = space.model_point_table.loc[[1, 2]]
+    try:
+        assert steps_of(space) == 1801
+        with pytest.raises(ValueError):
+            scenario_frame(space, space.pv_claims())
+
+        space.scen_batch = True
+        assign_normals(space, sample_normals(16, steps_of(space)))
+        assert space.proj_shape() == (16, 2)
+        values = scenario_frame(space, space.pv_claims())
+        assert values.shape == (2, 16)
+        assert list(values.columns) == list(range(1, 17))
+        np.testing.assert_array_equal(values.to_numpy(), space.pv_claims().T)
+
+        result = mc_convergence(space, lambda s: s.pv_claims(), [16],
+                                replications=2)
+        assert list(result.index.unique("point_id")) == [1, 2]
+        assert (result["stderr"] > 0).all()
+
+        with pytest.raises(ValueError):
+            put_control(space, 120)
+    finally:
+        model.close()
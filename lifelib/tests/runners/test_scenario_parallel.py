@@ -0,0 +1,54 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from lifelib.runners.scenario_parallel import run_scenarios, scenario_mean
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+INTEGRATEDLIFE = LIBRARIES / "appliedlife" / "IntegratedLife"
+
+
+@pytest.fixture(scope="module")
+def expected():
+    model = modelx.read_model(INTEGRATEDLIFE)
+    try:
+        space = model.Run[2].GMXB
+        yield space.result_cf(), space.result_pv()
+    finally:
+        model.close()
+
+
+def test_run_scenarios_is_independent_of_workers(expected):
+    one, two = [run_scenarios(INTEGRATEDLIFE, 2, shard_size=30,
+                              spaces=["GMXB"], max_workers=n)["GMXB"]
+                for n in (1, 2)]
+
+    result_cf, result_pv = expected
+    for name in ["result_cf", "result_pv", "result_pv_mean"]:
+        assert one[name].equals(two[name])
+
+    assert one["result_pv"].index.equals(result_pv.index)
+    np.testing.assert_array_equal(one["result_pv"].values, result_pv.values)
+    np.testing.assert_allclose(one["result_cf"].values, result_cf.values, rtol=1e-12)
+
+    mean = one["result_pv_mean"]
+    assert mean.index.equals(result_pv.index.unique("point_id"))
+    np.testing.assert_allclose(
+        mean.values, result_pv.groupby(level="point_id").mean().values)
+
+
+def test_scenario_mean(expected):
+    _, result_pv = expected
+    mean = scenario_mean(result_pv)
+    np.testing.assert_allclose(
+        mean.loc[1].values, result_pv.xs(1, level="point_id").mean().values)
+
+
+def test_run_scenarios_errors():
+    with pytest.raises(ValueError):
+        run_scenarios(INTEGRATEDLIFE, 2, shard_size=0)
+    with pytest.raises(ValueError):
+        run_scenarios(INTEGRATEDLIFE, 99, shard_size=30, max_workers=1)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners.scenario_store import (
+    ScenarioStore, create_scenarios, write_scenarios)
+
+
+@pytest.fixture
+def returns():
+    index = pd.MultiIndex.from_product(
+        [[3, 1, 2], range(1, 5)], names=["scen", "t"])
+    values = np.arange(24, dtype=float).reshape(12, 2)
+    return pd.DataFrame(values, index=index, columns=["FUND1", "FUND2"])
+
+
+def test_round_trip_frame(tmp_path, returns):
+    store = write_scenarios(tmp_path / "returns", returns)
+    assert store.shape == (3, 4, 2)
+    assert store.scen_ids.tolist() == [3, 1, 2]
+    assert store.steps.tolist() == [1, 2, 3, 4]
+    assert store.to_frame().equals(returns)
+    assert store.to_frame([2, 3]).equals(returns.loc[[2, 3]])
+
+
+def test_round_trip_series(tmp_path, returns):
+    series = returns["FUND1"].rename_axis(["scen_id", "t"])
+    write_scenarios(tmp_path / "rand", series)
+
+    store = ScenarioStore(tmp_path / "rand")
+    assert store.columns is None
+    assert store.to_frame().equals(series)
+
+
+def test_blocks_and_steps(tmp_path, returns):
+    store = write_scenarios(tmp_path / "returns", returns)
+
+    blocks = list(store.iter_blocks(2))
+    assert [ids.tolist() for ids, _ in blocks] == [[3, 1], [2]]
+    np.testing.assert_array_equal(
+        np.concatenate([b for _, b in blocks]).reshape(12, 2), returns.values)
+
+    np.testing.assert_array_equal(
+        store.at_step(2), returns.xs(2, level="t").values)
+    np.testing.assert_array_equal(
+        store.at_step(4, [2, 1]), returns.xs(4, level="t").loc[[2, 1]].values)
+
+    with pytest.raises(ValueError):
+        store.at_step(0)
+    with pytest.raises(ValueError):
+        store.take([4])
+
+
+def test_fill_by_block(tmp_path):
+    store = create_scenarios(tmp_path / "rand", range(1, 6), 3, name="x")
+    for start in range(0, 5, 2):
+        store.values[start:start + 2, :, 0] = start
+    store.flush()
+
+    result = ScenarioStore(tmp_path / "rand").to_frame()
+    assert result.name == "x"
+    assert result.index.names == ["scen_id", "t"]
+    assert result.tolist() == [0.0] * 6 + [2.0] * 6 + [4.0] * 3
+
+
+def test_incomplete_data(tmp_path, returns):
+    with pytest.raises(ValueError):
+        write_scenarios(tmp_path / "returns", returns.drop((1, 2)))
@@ -0,0 +1,65 @@
+import pathlib
+
+import pytest
+
+modelx = pytest.importorskip("modelx")
+
+from lifelib.runners import run_seriatim, point_ids_of
+
+HERE = pathlib.Path(__file__).resolve()
+LIBRARIES = HERE.parents[2] / "libraries"
+TERM_US_A = LIBRARIES / "uslib" / "products" / "term_life" / "Term_US_A"
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(TERM_US_A)
+    yield model
+    model.close()
+
+
+def test_run_seriatim(model):
+    proj = model.Projection
+    point_ids = point_ids_of(proj)
+    results = run_seriatim(proj)
+
+    assert not proj.itemspaces
+    for name, result in results.items():
+        assert result.index.names == ["point_id", "t"]
+        assert list(result.index.unique("point_id")) == list(point_ids)
+
+    for point_id in point_ids:
+        expected = proj[point_id].result_cf()
+        assert results["result_cf"].loc[point_id].equals(expected)
+        del proj[point_id]
+
+
+def test_run_seriatim_keeps_existing_items(model):
+    proj = model.Projection
+    first = proj[1]
+    try:
+        result = run_seriatim(proj, point_ids=[1, 2])["result_cf"]
+        assert list(proj.itemspaces.keys()) == [1]
+        assert result.loc[1].equals(first.result_cf())
+
+        run_seriatim(proj, point_ids=[2], keep_items=True)
+        assert 2 in proj.itemspaces.keys()
+    finally:
+        proj.clear_items()
+
+
+def test_run_seriatim_keeps_existing_items_numpy_ids(model):
+    np = pytest.importorskip("numpy")
+    proj = model.Projection
+    first = proj[1]
+    try:
+        run_seriatim(proj, point_ids=np.array([1, 2], dtype="int64"))
+        assert len(proj.itemspaces) == 1
+        assert proj[1] is first
+    finally:
+        proj.clear_items()
+
+
+def test_run_seriatim_empty(model):
+    with pytest.raises(ValueError):
+        run_seriatim(model.Projection, point_ids=[])
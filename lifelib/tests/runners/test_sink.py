@@ -0,0 +1,138 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib.runners.chunked import clear_cache
+from lifelib.runners.sink import ResultSink, cashflow_frame, run_to_sink
+
+modelx = pytest.importorskip("modelx")
+
+LIBRARIES = pathlib.Path(__file__).resolve().parents[2] / "libraries"
+BASICTERM_ME = LIBRARIES / "basiclife" / "BasicTerm_ME"
+CASHVALUE_ME = LIBRARIES / "savings" / "CashValue_ME"
+
+COLUMNS = ["Premiums", "Claims", "Expenses", "Commissions", "Net Cashflow"]
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = modelx.read_model(BASICTERM_ME)
+    model.Projection.model_point_table = model.Projection.model_point_table.iloc[:300]
+    model.Projection.engine = "grid"
+    yield model
+    model.close()
+
+
+def test_cashflow_frame(model):
+    space = model.Projection
+    try:
+        frame = cashflow_frame(space, {"Premiums": "premiums"})
+        assert frame.index.names == ["policy_id", "t"]
+        assert list(frame.columns) == ["Premiums"]
+        assert len(frame) == 300 * space.max_proj_len()
+        assert not len(space.premiums)
+        np.testing.assert_allclose(
+            frame.loc[(5, 3), "Premiums"], space.premiums(3).loc[5], rtol=1e-12)
+    finally:
+        space.clear_all()
+
+
+def test_cashflow_frame_recursive(model):
+    space = model.Projection
+    try:
+        grid = cashflow_frame(space, {"Premiums": "premiums",
+                                      "Policies": ("pols_if_at", "BEF_DECR")})
+        space.engine = "recursive"
+        recursive = cashflow_frame(space, {"Premiums": "premiums",
+                                           "Policies": ("pols_if_at", "BEF_DECR")})
+        assert len(space.premiums)
+        assert recursive.index.equals(grid.index)
+        np.testing.assert_allclose(recursive.values, grid.values, rtol=1e-12)
+    finally:
+        space.engine = "grid"
+        space.clear_all()
+
+
+def write_and_check(model, sink):
+    space = model.Projection
+    expected_pv = space.result_pv()
+    expected_cf = space.result_cf()
+    space.clear_all()
+
+    report = run_to_sink(space, sink, chunk_size=100, product="TERM")
+    assert report == {"chunks": 3, "files": 6}
+    assert sink.partitions("result_pv") == [
+        {"product": "TERM", "chunk": i} for i in range(3)]
+
+    pv = sink.read("result_pv").set_index("policy_id")
+    np.testing.assert_allclose(pv[expected_pv.columns].values, expected_pv.values)
+    assert (pv["product"] == "TERM").all()
+
+    cf = sink.read("cashflows").groupby("t")[COLUMNS].sum()
+    np.testing.assert_allclose(cf.values, expected_cf.values, rtol=1e-12, atol=1e-6)
+
+    chunk = sink.read("cashflows", columns=["policy_id", "t", "Claims"], chunk=1)
+    assert list(chunk.columns) == ["policy_id", "t", "Claims", "product", "chunk"]
+    assert chunk["policy_id"].unique().tolist() == list(range(101, 201))
+
+    with pytest.raises(ValueError):
+        sink.read("result_pv", product="UL")
+
+
+def test_run_to_sink(model, tmp_path):
+    sink = ResultSink(tmp_path)
+    assert sink.format == "pickle"
+    write_and_check(model, sink)
+
+
+def test_run_to_sink_parquet(model, tmp_path):
+    pytest.importorskip("pyarrow")
+    write_and_check(model, ResultSink(tmp_path, format="parquet"))
+
+
+def test_run_to_sink_batched(tmp_path):
+    model = modelx.read_model(CASHVALUE_ME)
+    space = model.Projection
+    space.model_point_table = space.model_point_table.loc[[1, 2]]
+    space.scen_batch = True
+    space.scen_index[()] = pd.Index([2, 5, 9], name="scen_id")
+    try:
+        expected_pv = space.result_pv()
+        expected_cf = space.result_cf()
+        outputs = {"Premiums": "premiums", "Claims": "claims"}
+
+        frame = cashflow_frame(space, outputs)
+        assert frame.index.names == list(expected_pv.index.names) + ["t"]
+        assert len(frame) == 2 * 3 * space.max_proj_len()
+        np.testing.assert_allclose(
+            frame.loc[(2, 5, 3), "Claims"], space.claims(3)[1, 1], rtol=1e-12)
+        np.testing.assert_allclose(
+            frame.loc[(2, 5, 3), "Premiums"], space.premiums(3).loc[2], rtol=1e-12)
+        clear_cache(space)
+
+        sink = ResultSink(tmp_path)
+        report = run_to_sink(space, sink, chunk_size=1, outputs=outputs,
+                             results=("result_pv", "result_cf"))
+        assert report == {"chunks": 2, "files": 2 * (3 + 3 + 1)}
+        assert {"chunk": 1, "scen_id": 9} in sink.partitions("result_pv")
+
+        pv = sink.read("result_pv").set_index(list(expected_pv.index.names))
+        pv = pv.loc[expected_pv.index, expected_pv.columns]
+        np.testing.assert_allclose(pv.values, expected_pv.values, rtol=1e-12)
+
+        cf = sink.read("cashflows").groupby("t")[list(outputs)].sum()
+        np.testing.assert_allclose(
+            cf.values, expected_cf[list(outputs)].values, rtol=1e-12, atol=1e-6)
+
+        scen = sink.read("cashflows", scen_id=5)
+        assert (scen["scen_id"] == 5).all()
+        assert scen["chunk"].unique().tolist() == [0, 1]
+    finally:
+        model.close()
+
+
+def test_invalid_format(tmp_path):
+    with pytest.raises(ValueError):
+        ResultSink(tmp_path, format="xlsx")